@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Measures the time taken to import sigProfilerPlotting in a new interpreter.
+
+Each measurement starts a fresh Python process, so the timings include the
+module compilation (when no bytecode cache exists) and all dependency imports,
+as for a short-lived CLI invocation.
+
+Usage:
+        python benchmarks/import_time.py [--repeat N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "package": "import sigProfilerPlotting",
+    "cli": "from sigProfilerPlotting import sigProfilerPlotting_CLI",
+    "plotting module": "from sigProfilerPlotting import plotSBS",
+}
+
+
+def time_import(statement, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="The number of runs per statement."
+    )
+    args = parser.parse_args()
+
+    # the first run also writes the bytecode cache, so it is not timed
+    for statement in STATEMENTS.values():
+        subprocess.run([sys.executable, "-c", statement], check=True)
+    baseline = statistics.median(time_import("pass", args.repeat))
+    print("interpreter startup: " + format(baseline * 1000, ".0f") + " ms")
+    for name, statement in STATEMENTS.items():
+        median = statistics.median(time_import(statement, args.repeat))
+        print(name + ": " + format((median - baseline) * 1000, ".0f") + " ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""Measures the throughput of the plotting functions on generated matrices.
+
+Every case plots a matrix of random counts, generated from the mutation types
+of the reference formats, with one plotting function, plot type, output
+format and number of samples. Each case runs in a new Python process so that
+its peak resident set size (RSS) is measured on its own, and the plot
+templates are built before the first case so that no case pays for them.
+
+The results are written as JSON with --output. Given a --baseline file from an
+earlier run, every case that is slower or uses more memory than its baseline
+by more than --threshold is reported as a regression and the exit status is 1.
+
+With --memory, every case is run once more with its memory traced by
+tracemalloc (see sigProfilerPlotting.PlotTimings), and its results include the
+peak traced memory of the call and of the matrix, parsed matrix, figures and
+output stages. A --ceilings file sets the largest memory allowed in the cases
+of a context, for example {"plotSBS/96": {"peak_rss_mb": 400, "figures": 50}},
+where a key applies to the cases whose names start with it and the most
+specific key wins. Cases over a ceiling are reported and the exit status is 1.
+
+The full suite plots 10,000 samples in every context and format and takes
+hours. Use --functions, --plot_types, --formats and --sizes to select cases.
+
+Usage:
+        python benchmarks/plot_throughput.py [--sizes 1 100] [--formats png]
+                [--output results.json] [--baseline baseline.json]
+                [--memory] [--ceilings ceilings.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+PROJECT = "benchmark"
+
+FORMATS = ("pdf", "png", "PIL_Image")
+
+# Plot types of plotSBS, plotID and plotDBS, and the output formats their
+# renderers write. The other renderers only write PDF files.
+MATRIX_PLOT_TYPES = {
+    "plotSBS": {
+        "6": ("pdf",),
+        "24": ("pdf",),
+        "96": FORMATS,
+        "288": FORMATS,
+        "384": ("pdf",),
+        "1536": ("pdf",),
+        "4608": ("pdf",),
+    },
+    "plotID": {"28": ("pdf",), "83": FORMATS, "415": ("pdf",)},
+    "plotDBS": {"78": FORMATS, "186": ("pdf",)},
+}
+
+# Reference format of each plot type
+REFERENCE_FORMATS = {
+    ("plotSBS", "6"): "SBS6",
+    ("plotSBS", "24"): "SBS24",
+    ("plotSBS", "96"): "SBS96",
+    ("plotSBS", "288"): "SBS288",
+    ("plotSBS", "384"): "SBS384",
+    ("plotSBS", "1536"): "SBS1536",
+    ("plotSBS", "4608"): "SBS4608",
+    ("plotID", "28"): "ID28",
+    ("plotID", "83"): "ID83",
+    ("plotID", "415"): "ID415",
+    ("plotDBS", "78"): "DBS78",
+    ("plotDBS", "186"): "DBS186",
+    ("plotSV", "32"): "SV32",
+    ("plotCNV", "48"): "CNV48",
+}
+
+# Matrices read by samplePortrait, in output/<directory>/<project>.<context>.all
+PORTRAIT_CONTEXTS = {
+    "SBS": ("SBS6", "SBS24", "SBS96", "SBS384", "SBS1536"),
+    "ID": ("ID28", "ID83", "ID415"),
+    "DBS": ("DBS78", "DBS186"),
+}
+
+# Functions that record the memory of their stages in a PlotTimings
+INSTRUMENTED = ("plotSBS", "plotID", "plotDBS", "plotSV", "plotCNV", "samplePortrait")
+
+# Memory metrics, in MB, that a ceiling can limit besides the groups of
+# PlotTimings.memory_groups()
+MEMORY_METRICS = ("peak_rss_mb", "traced_peak_mb")
+
+SIGNATURES = ("SBS1", "SBS2", "SBS3", "SBS5", "SBS8", "SBS13", "SBS17a", "SBS18")
+
+
+def benchmark_cases(functions, plot_types, formats, sizes):
+    """Returns the cases to run as dictionaries of the case arguments."""
+    cases = []
+    plot_types_of = dict(MATRIX_PLOT_TYPES)
+    plot_types_of["plotSV"] = {"32": FORMATS}
+    plot_types_of["plotCNV"] = {"48": FORMATS}
+    plot_types_of["samplePortrait"] = {"portrait": ("pdf",)}
+    plot_types_of["plotActivity"] = {"activity": ("pdf",)}
+    plot_types_of["plotTMB"] = {"tmb": ("pdf", "png")}
+    for function in functions:
+        for plot_type, case_formats in plot_types_of[function].items():
+            if plot_types and plot_type not in plot_types:
+                continue
+            for savefig_format in case_formats:
+                if savefig_format not in formats:
+                    continue
+                for n_samples in sizes:
+                    cases.append(
+                        {
+                            "function": function,
+                            "plot_type": plot_type,
+                            "format": savefig_format,
+                            "samples": n_samples,
+                        }
+                    )
+    return cases
+
+
+def case_name(case):
+    return "/".join(
+        [case["function"], case["plot_type"], case["format"], str(case["samples"])]
+    )
+
+
+def generate_matrix(context, n_samples, file_path, seed=0):
+    # Random counts for the mutation types of a reference format. Samples
+    # differ in their mutation burden, as in a real cohort.
+    from sigProfilerPlotting.sigProfilerPlotting import SPP_REFERENCE
+
+    labels = pd.read_csv(
+        os.path.join(SPP_REFERENCE, context + ".txt"), sep="\t", header=None
+    ).iloc[:, 0]
+    rng = np.random.default_rng(seed)
+    burden = rng.lognormal(3, 1, n_samples)
+    counts = rng.poisson(burden, (len(labels), n_samples))
+    matrix = pd.DataFrame(
+        counts,
+        index=pd.Index(labels, name="MutationType"),
+        columns=[f"Sample{i}" for i in range(n_samples)],
+    )
+    matrix.to_csv(file_path, sep="\t")
+
+
+def prepare_input(case, data_dir):
+    """Writes the input of a case into data_dir, unless it is already there.
+
+    Returns the path of the input.
+    """
+    function, n_samples = case["function"], case["samples"]
+    if function == "samplePortrait":
+        path = os.path.join(data_dir, f"portrait_{n_samples}")
+        for directory, contexts in PORTRAIT_CONTEXTS.items():
+            os.makedirs(os.path.join(path, "output", directory), exist_ok=True)
+            for context in contexts:
+                file_path = os.path.join(
+                    path, "output", directory, f"{PROJECT}.{context}.all"
+                )
+                if not os.path.exists(file_path):
+                    generate_matrix(context, n_samples, file_path)
+        return path + os.sep
+
+    if function in ("plotActivity", "plotTMB"):
+        path = os.path.join(data_dir, f"{function}_{n_samples}.txt")
+        if not os.path.exists(path):
+            rng = np.random.default_rng(0)
+            if function == "plotActivity":
+                activities = pd.DataFrame(
+                    rng.poisson(200, (n_samples, len(SIGNATURES))),
+                    index=pd.Index(
+                        [f"Sample{i}" for i in range(n_samples)], name="Samples"
+                    ),
+                    columns=SIGNATURES,
+                )
+                activities.to_csv(path, sep="\t")
+            else:
+                burdens = pd.DataFrame(
+                    {
+                        "Types": [f"Cancer{i % 10}" for i in range(n_samples)],
+                        "Mut_burden": rng.lognormal(8, 1.5, n_samples).round() + 1,
+                    }
+                )
+                burdens.to_csv(path, sep="\t", index=False)
+        return path
+
+    context = REFERENCE_FORMATS[(function, case["plot_type"])]
+    path = os.path.join(data_dir, f"{PROJECT}.{context}.{n_samples}.all")
+    if not os.path.exists(path):
+        generate_matrix(context, n_samples, path)
+    return path
+
+
+def run_case(case):
+    """Plots one case in this process and returns its measurements."""
+    import sigProfilerPlotting as sigPlt
+
+    function, plot_type = case["function"], case["plot_type"]
+    input_path, output_path = case["input"], case["output"]
+    savefig_format = case["format"]
+    timings = None
+    kwargs = {}
+    if case.get("memory"):
+        timings = sigPlt.PlotTimings(memory=True)
+        if function in INSTRUMENTED:
+            kwargs["timings"] = timings
+        else:
+            tracemalloc.start()
+    start = time.perf_counter()
+    if function in MATRIX_PLOT_TYPES:
+        getattr(sigPlt, function)(
+            input_path,
+            output_path,
+            PROJECT,
+            plot_type,
+            savefig_format=savefig_format,
+            **kwargs,
+        )
+    elif function in ("plotSV", "plotCNV"):
+        getattr(sigPlt, function)(
+            input_path, output_path, PROJECT, savefig_format=savefig_format, **kwargs
+        )
+    elif function == "samplePortrait":
+        from sigProfilerPlotting import sample_portrait
+
+        sample_portrait.samplePortrait(input_path, output_path, PROJECT, **kwargs)
+    elif function == "plotActivity":
+        from sigProfilerPlotting import plotActivity
+
+        plotActivity.plotActivity(
+            input_path, output_file=os.path.join(output_path, "Activity.pdf")
+        )
+    else:
+        from sigProfilerPlotting import tmbplot
+
+        tmbplot.plotTMB(
+            pd.read_csv(input_path, sep="\t"),
+            "genome",
+            output=os.path.join(output_path, "TMB_plot." + savefig_format),
+        )
+    seconds = time.perf_counter() - start
+    result = {"seconds": seconds, "peak_rss_mb": peak_rss_mb()}
+    if timings is not None:
+        if kwargs:
+            traced_peak = timings.memory["total"]["peak"]
+            result["memory"] = {
+                group: usage["peak"] / 2**20
+                for group, usage in timings.memory_groups().items()
+            }
+        else:
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        result["traced_peak_mb"] = traced_peak / 2**20
+    return result
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        # the resource module is not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        peak /= 1024
+    return peak / 1024
+
+
+def run_in_process(case):
+    """Runs a case in a new Python process and returns its measurements."""
+    output_path = tempfile.mkdtemp(prefix="spp_benchmark_") + os.sep
+    try:
+        process = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--case",
+                json.dumps(dict(case, output=output_path)),
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+    finally:
+        shutil.rmtree(output_path, ignore_errors=True)
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def measure(case, data_dir, repeat, memory=False):
+    """Runs a case repeat times in new processes and returns its result.
+
+    With memory, the case is run once more with its memory traced, which is
+    too slow to time.
+    """
+    case = dict(case, input=prepare_input(case, data_dir))
+    timings, peaks = [], []
+    for _ in range(repeat):
+        result = run_in_process(case)
+        timings.append(result["seconds"])
+        peaks.append(result["peak_rss_mb"])
+    seconds = statistics.median(timings)
+    measurement = {
+        "case": case_name(case),
+        "seconds": seconds,
+        "samples_per_second": case["samples"] / seconds,
+        "peak_rss_mb": None if None in peaks else max(peaks),
+    }
+    if memory:
+        traced = run_in_process(dict(case, memory=True))
+        measurement["traced_peak_mb"] = traced["traced_peak_mb"]
+        if "memory" in traced:
+            measurement["memory"] = traced["memory"]
+    return measurement
+
+
+def find_regressions(results, baseline, threshold):
+    """Returns a message for each result worse than its baseline by more than
+    threshold (ie. 0.2 for 20%)."""
+    baseline_results = {result["case"]: result for result in baseline["results"]}
+    messages = []
+    for result in results:
+        previous = baseline_results.get(result["case"])
+        if previous is None:
+            continue
+        for metric in ("seconds", "peak_rss_mb"):
+            if result[metric] is None or not previous[metric]:
+                continue
+            ratio = result[metric] / previous[metric]
+            if ratio > 1 + threshold:
+                messages.append(
+                    f"{result['case']}: {metric} {previous[metric]:.3f} -> "
+                    f"{result[metric]:.3f} (+{(ratio - 1) * 100:.0f}%)"
+                )
+    return messages
+
+
+def check_ceilings(results, ceilings):
+    """Returns a message for each memory metric of a result that is over its
+    ceiling. The ceilings of a result are those of the longest key of
+    ceilings that its case name starts with."""
+    messages = []
+    for result in results:
+        keys = [key for key in ceilings if result["case"].startswith(key)]
+        if not keys:
+            continue
+        for metric, ceiling in ceilings[max(keys, key=len)].items():
+            if metric in MEMORY_METRICS:
+                value = result.get(metric)
+            else:
+                value = result.get("memory", {}).get(metric)
+            if value is None:
+                messages.append(f"{result['case']}: {metric} was not measured")
+            elif value > ceiling:
+                messages.append(
+                    f"{result['case']}: {metric} {value:.1f} MB is over the "
+                    f"ceiling of {ceiling} MB"
+                )
+    return messages
+
+
+def environment():
+    import matplotlib
+
+    import sigProfilerPlotting
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "sigProfilerPlotting": sigProfilerPlotting.__version__,
+        "matplotlib": matplotlib.__version__,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--functions",
+        nargs="+",
+        default=[
+            "plotSBS",
+            "plotID",
+            "plotDBS",
+            "plotSV",
+            "plotCNV",
+            "samplePortrait",
+            "plotActivity",
+            "plotTMB",
+        ],
+        help="The plotting functions to benchmark.",
+    )
+    parser.add_argument(
+        "--plot_types",
+        nargs="+",
+        help="Only benchmark these plot types (ie. 96 83). Defaults to all.",
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=list(FORMATS),
+        choices=FORMATS,
+        help="The output formats to benchmark.",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[1, 100, 10000],
+        help="The numbers of samples to benchmark.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="The number of runs per case."
+    )
+    parser.add_argument(
+        "--data",
+        help="Directory to keep the generated matrices in between runs. "
+        "Defaults to a temporary directory.",
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--baseline", help="Compare the results to this earlier JSON output."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Report cases slower or larger than the baseline by more than "
+        "this fraction.",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also run every case with its memory traced.",
+    )
+    parser.add_argument(
+        "--ceilings",
+        help="JSON file of the largest memory, in MB, allowed in the cases of "
+        "each context. Implies --memory.",
+    )
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case is not None:
+        print(json.dumps(run_case(json.loads(args.case))))
+        return 0
+
+    import sigProfilerPlotting as sigPlt
+
+    sigPlt.build_templates()
+    cases = benchmark_cases(args.functions, args.plot_types, args.formats, args.sizes)
+    data_dir = args.data or tempfile.mkdtemp(prefix="spp_benchmark_data_")
+    os.makedirs(data_dir, exist_ok=True)
+    results = []
+    try:
+        for case in cases:
+            result = measure(
+                case, data_dir, args.repeat, args.memory or bool(args.ceilings)
+            )
+            results.append(result)
+            peak = result["peak_rss_mb"]
+            traced = result.get("traced_peak_mb")
+            print(
+                f"{result['case']}: {result['seconds']:.2f} s, "
+                f"{result['samples_per_second']:.1f} samples/s, "
+                + ("peak RSS n/a" if peak is None else f"peak RSS {peak:.0f} MB")
+                + ("" if traced is None else f", traced peak {traced:.1f} MB"),
+                flush=True,
+            )
+    finally:
+        if args.data is None:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    report = {"environment": environment(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+
+    exit_status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for message in regressions:
+            print("REGRESSION " + message)
+        if regressions:
+            exit_status = 1
+    if args.ceilings:
+        with open(args.ceilings) as f:
+            ceilings = json.load(f)
+        over_ceilings = check_ceilings(results, ceilings)
+        for message in over_ceilings:
+            print("CEILING " + message)
+        if over_ceilings:
+            exit_status = 1
+    return exit_status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
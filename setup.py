@@ -57,15 +57,17 @@ setup(
         "sigProfilerPlotting.reference_formats",
         "sigProfilerPlotting.fonts",
         "sigProfilerPlotting.controllers",
+        "sigProfilerPlotting.renderers",
     ],
     python_requires=">=3.9",
     install_requires=[
         "matplotlib>=3.4.3",
         "pandas>=2.0.0",
-        "scikit-learn>=1.1.3",
         "pillow>=10.0.0",
     ],
     extras_require={
+        "arrow": ["pyarrow"],
+        "pdf": ["pypdf"],
         "tests": [
             "pytest",
             "scikit-image>=0.21.0",
@@ -1,2 +1,54 @@
-from .sigProfilerPlotting import *
+import importlib
+import importlib.util
+
 from .version import short_version as __version__
+
+# The public names of the plotting module, bound by "from sigProfilerPlotting
+# import *" through __getattr__
+__all__ = [
+    "BarCollection",
+    "DRAW_BUDGETS",
+    "FigureWriter",
+    "PlotTimings",
+    "TEMPLATE_CONTEXTS",
+    "build_templates",
+    "clear_plotting_memory",
+    "clear_template_cache",
+    "get_context_reference",
+    "get_default_96labels",
+    "get_reference_format",
+    "getxlabels",
+    "getylabels",
+    "load_custom_fonts",
+    "load_matrix",
+    "make_pickle_file",
+    "output_results",
+    "plotCNV",
+    "plotDBS",
+    "plotID",
+    "plotSBS",
+    "plotSV",
+    "process_input",
+    "profile_keys",
+    "reindex_sbs288",
+    "reindex_sbs96",
+]
+
+
+def __getattr__(name):
+    # The plotting module imports matplotlib and pandas, so it is only loaded
+    # when one of its public names is first used (ie. sigProfilerPlotting.plotSBS)
+    if not name.startswith("_"):
+        if importlib.util.find_spec("." + name, __name__) is not None:
+            return importlib.import_module("." + name, __name__)
+        module = importlib.import_module(".sigProfilerPlotting", __name__)
+        if hasattr(module, name):
+            globals()[name] = getattr(module, name)
+            return globals()[name]
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+
+
+def __dir__():
+    module = importlib.import_module(".sigProfilerPlotting", __name__)
+    names = {name for name in vars(module) if not name.startswith("_")}
+    return sorted(names | set(globals()))
@@ -2,6 +2,11 @@ import argparse
 from typing import List
 import sigProfilerPlotting as sigPlt
 
+MATRIX_PATH_HELP = (
+    "The path to the input matrix file: a tab-separated text file, a Parquet or "
+    "Feather file (requires pyarrow), or a .npy file with a .labels file."
+)
+
 
 def str2bool(v):
     if isinstance(v, bool):
@@ -14,9 +19,71 @@ def str2bool(v):
         raise argparse.ArgumentTypeError("Boolean value expected.")
 
 
+def instrumentation_arguments(parser):
+    parser.add_argument(
+        "--timings",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+        help="Print the time spent in each stage of plotting.",
+    )
+    parser.add_argument(
+        "--memory",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+        help="Print the time and the peak and retained memory of each stage of "
+        "plotting. Tracing the memory slows plotting down.",
+    )
+    parser.add_argument(
+        "--complexity",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+        help="Print the timings and the largest number of artists, patches, texts "
+        "and path vertices of the figures of each context.",
+    )
+    parser.add_argument(
+        "--draw_budget",
+        choices=["warn", "error"],
+        help="Warn about, or fail on, figures with more artists, patches, texts "
+        "or path vertices than the draw budget of their context allows.",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="TRACE_FILE",
+        help="Write the stages of plotting to this JSON file in the Chrome trace "
+        "event format, to open in chrome://tracing or Perfetto.",
+    )
+
+
+def plot_timings(parsed_args):
+    if (
+        parsed_args.timings
+        or parsed_args.memory
+        or parsed_args.complexity
+        or parsed_args.draw_budget
+    ):
+        return sigPlt.PlotTimings(
+            memory=parsed_args.memory,
+            complexity=parsed_args.complexity,
+            budget=sigPlt.DRAW_BUDGETS if parsed_args.draw_budget else None,
+            on_budget=parsed_args.draw_budget or "warn",
+        )
+    return None
+
+
+def print_timings(timings):
+    if timings is not None:
+        print(timings.summary())
+
+
 # Common parser setup for shared arguments
 def common_plotting_arguments(parser):
-    parser.add_argument("matrix_path", help="The path to the input matrix file.")
+    parser.add_argument("matrix_path", help=MATRIX_PATH_HELP)
     parser.add_argument(
         "output_path", help="The directory where the plots will be saved."
     )
@@ -52,6 +119,40 @@ def common_plotting_arguments(parser):
         default=100,
         help="The resolution of the plot in dots per inch.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of processes used to render the samples (-1 uses all cores).",
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        help="Read and render the samples in column chunks of this size.",
+    )
+    parser.add_argument(
+        "--samples",
+        nargs="+",
+        help="The names of the samples to plot, in the order given.",
+    )
+    parser.add_argument(
+        "--sample_regex",
+        help="Only plot the samples whose name matches this regular expression.",
+    )
+    parser.add_argument(
+        "--top_k_by_total",
+        type=int,
+        help="Only plot this many samples with the most mutations.",
+    )
+    parser.add_argument(
+        "--incremental",
+        type=str2bool,
+        nargs="?",
+        const=True,
+        default=False,
+        help="Only render the samples that changed since the last incremental run.",
+    )
+    instrumentation_arguments(parser)
 
 
 def parse_arguments_sbs(args: List[str]) -> argparse.Namespace:
@@ -82,7 +183,7 @@ def parse_arguments_sv(args: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="SigProfilerPlotting plotSV", description="Generate SV plots."
     )
-    parser.add_argument("matrix_path", help="The path to the input matrix file.")
+    parser.add_argument("matrix_path", help=MATRIX_PATH_HELP)
     parser.add_argument(
         "output_path", help="The directory where the plots will be saved."
     )
@@ -115,6 +216,7 @@ def parse_arguments_sv(args: List[str]) -> argparse.Namespace:
         default=100,
         help="The resolution of the plot in dots per inch.",
     )
+    instrumentation_arguments(parser)
     return parser.parse_args(args)
 
 
@@ -122,7 +224,7 @@ def parse_arguments_cnv(args: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="SigProfilerPlotting plotCNV", description="Generate CNV plots."
     )
-    parser.add_argument("matrix_path", help="The path to the input matrix file.")
+    parser.add_argument("matrix_path", help=MATRIX_PATH_HELP)
     parser.add_argument(
         "output_path", help="The directory where the plots will be saved."
     )
@@ -163,10 +265,29 @@ def parse_arguments_cnv(args: List[str]) -> argparse.Namespace:
         default=100,
         help="The resolution of the plot in dots per inch.",
     )
+    instrumentation_arguments(parser)
+    return parser.parse_args(args)
+
+
+def parse_arguments_build_templates(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="SigProfilerPlotting build-templates",
+        description="Build the plot templates ahead of plotting.",
+    )
+    parser.add_argument(
+        "--volume", help="The directory where the templates will be saved."
+    )
+    parser.add_argument(
+        "--contexts",
+        nargs="+",
+        choices=sigPlt.TEMPLATE_CONTEXTS,
+        help="The contexts to build templates for (all contexts by default).",
+    )
     return parser.parse_args(args)
 
 
 def dispatch_plot_sbs(parsed_args: argparse.Namespace) -> None:
+    timings = plot_timings(parsed_args)
     sigPlt.plotSBS(
         matrix_path=parsed_args.matrix_path,
         output_path=parsed_args.output_path,
@@ -179,10 +300,20 @@ def dispatch_plot_sbs(parsed_args: argparse.Namespace) -> None:
         savefig_format=parsed_args.savefig_format,
         volume=parsed_args.volume,
         dpi=parsed_args.dpi,
+        n_jobs=parsed_args.jobs,
+        chunk_size=parsed_args.chunk_size,
+        samples=parsed_args.samples,
+        sample_regex=parsed_args.sample_regex,
+        top_k_by_total=parsed_args.top_k_by_total,
+        incremental=parsed_args.incremental,
+        timings=timings,
+        trace_file=parsed_args.trace,
     )
+    print_timings(timings)
 
 
 def dispatch_plot_id(parsed_args: argparse.Namespace) -> None:
+    timings = plot_timings(parsed_args)
     sigPlt.plotID(
         matrix_path=parsed_args.matrix_path,
         output_path=parsed_args.output_path,
@@ -195,10 +326,20 @@ def dispatch_plot_id(parsed_args: argparse.Namespace) -> None:
         savefig_format=parsed_args.savefig_format,
         volume=parsed_args.volume,
         dpi=parsed_args.dpi,
+        n_jobs=parsed_args.jobs,
+        chunk_size=parsed_args.chunk_size,
+        samples=parsed_args.samples,
+        sample_regex=parsed_args.sample_regex,
+        top_k_by_total=parsed_args.top_k_by_total,
+        incremental=parsed_args.incremental,
+        timings=timings,
+        trace_file=parsed_args.trace,
     )
+    print_timings(timings)
 
 
 def dispatch_plot_dbs(parsed_args: argparse.Namespace) -> None:
+    timings = plot_timings(parsed_args)
     sigPlt.plotDBS(
         matrix_path=parsed_args.matrix_path,
         output_path=parsed_args.output_path,
@@ -211,10 +352,20 @@ def dispatch_plot_dbs(parsed_args: argparse.Namespace) -> None:
         savefig_format=parsed_args.savefig_format,
         volume=parsed_args.volume,
         dpi=parsed_args.dpi,
+        n_jobs=parsed_args.jobs,
+        chunk_size=parsed_args.chunk_size,
+        samples=parsed_args.samples,
+        sample_regex=parsed_args.sample_regex,
+        top_k_by_total=parsed_args.top_k_by_total,
+        incremental=parsed_args.incremental,
+        timings=timings,
+        trace_file=parsed_args.trace,
     )
+    print_timings(timings)
 
 
 def dispatch_plot_sv(parsed_args: argparse.Namespace) -> None:
+    timings = plot_timings(parsed_args)
     sigPlt.plotSV(
         matrix_path=parsed_args.matrix_path,
         output_path=parsed_args.output_path,
@@ -223,10 +374,14 @@ def dispatch_plot_sv(parsed_args: argparse.Namespace) -> None:
         aggregate=parsed_args.aggregate,
         savefig_format=parsed_args.savefig_format,
         dpi=parsed_args.dpi,
+        timings=timings,
+        trace_file=parsed_args.trace,
     )
+    print_timings(timings)
 
 
 def dispatch_plot_cnv(parsed_args: argparse.Namespace) -> None:
+    timings = plot_timings(parsed_args)
     sigPlt.plotCNV(
         matrix_path=parsed_args.matrix_path,
         output_path=parsed_args.output_path,
@@ -236,7 +391,18 @@ def dispatch_plot_cnv(parsed_args: argparse.Namespace) -> None:
         read_from_file=parsed_args.read_from_file,
         savefig_format=parsed_args.savefig_format,
         dpi=parsed_args.dpi,
+        timings=timings,
+        trace_file=parsed_args.trace,
+    )
+    print_timings(timings)
+
+
+def dispatch_build_templates(parsed_args: argparse.Namespace) -> None:
+    paths = sigPlt.build_templates(
+        volume=parsed_args.volume, contexts=parsed_args.contexts
     )
+    for path in paths:
+        print(path)
 
 
 class CliController:
@@ -256,9 +422,12 @@ class CliController:
         elif "plotCNV" in user_args:
             parsed_args = parse_arguments_cnv(user_args[1:])
             dispatch_plot_cnv(parsed_args)
+        elif "build-templates" in user_args:
+            parsed_args = parse_arguments_build_templates(user_args[1:])
+            dispatch_build_templates(parsed_args)
         else:
             print(
-                "Unknown command. Available commands: plotSBS, plotID, plotDBS, plotSV, plotCNV."
+                "Unknown command. Available commands: plotSBS, plotID, plotDBS, plotSV, plotCNV, build-templates."
             )
 
 
@@ -0,0 +1,564 @@
+"""Opt-in instrumentation of plotting calls.
+
+A plotting call made with a PlotTimings object (the timings argument of
+plotSBS, plotID, plotDBS, plotSV and plotCNV) records how long each stage of
+the call takes, and a call made with a trace_file writes its stages as a
+Chrome trace. A PlotTimings created with memory=True also traces the memory
+allocated in each stage with tracemalloc, and one created with complexity=True
+or a draw budget counts the artists of every figure it writes. Nothing is
+recorded, and the stage() blocks cost a single check, when no call is
+instrumented.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+
+# Stages recorded by the plotting functions, in the order of a plotting call
+STAGES = (
+    "process_input",
+    "read_matrix",
+    "template",
+    "artists",
+    "draw",
+    "encode",
+    "pdf",
+)
+
+# Stages recorded inside another stage, which already includes their time
+NESTED_STAGES = {"read_matrix": "process_input"}
+
+# What the memory of each stage is spent on, in the report of memory_groups()
+MEMORY_GROUPS = {
+    "matrix": ("read_matrix",),
+    "parsed": ("process_input",),
+    "figures": ("template", "artists", "draw"),
+    "output": ("encode", "pdf"),
+}
+
+# Draw complexity counted for each figure by figure_complexity()
+COMPLEXITY_METRICS = ("artists", "patches", "texts", "vertices")
+
+# Largest draw complexity of a figure of each context (the prefix of its
+# output files), with about a quarter of headroom over the current layouts
+DRAW_BUDGETS = {
+    "CNV_48": {"artists": 320, "patches": 90, "texts": 100, "vertices": 550},
+    "DBS_186": {"artists": 180, "patches": 30, "texts": 70, "vertices": 580},
+    "DBS_78": {"artists": 280, "patches": 20, "texts": 130, "vertices": 600},
+    "ID_83": {"artists": 240, "patches": 50, "texts": 70, "vertices": 760},
+    "ID_TSB": {"artists": 260, "patches": 60, "texts": 80, "vertices": 1310},
+    "ID_simple": {"artists": 150, "patches": 60, "texts": 70, "vertices": 280},
+    "SBS_1536": {"artists": 1090, "patches": 180, "texts": 870, "vertices": 15230},
+    "SBS_24": {"artists": 90, "patches": 30, "texts": 30, "vertices": 130},
+    "SBS_288": {"artists": 670, "patches": 50, "texts": 420, "vertices": 880},
+    "SBS_384": {"artists": 690, "patches": 30, "texts": 390, "vertices": 1340},
+    "SBS_384_extended": {
+        "artists": 690,
+        "patches": 30,
+        "texts": 390,
+        "vertices": 1950,
+    },
+    "SBS_4608": {"artists": 1200, "patches": 210, "texts": 900, "vertices": 15430},
+    "SBS_6": {"artists": 70, "patches": 20, "texts": 30, "vertices": 70},
+    "SBS_96": {"artists": 550, "patches": 20, "texts": 390, "vertices": 690},
+    "SV_32": {"artists": 230, "patches": 60, "texts": 70, "vertices": 380},
+    "sample_portrait": {
+        "artists": 3470,
+        "patches": 1160,
+        "texts": 1340,
+        "vertices": 20190,
+    },
+}
+
+# The PlotTimings of the plotting call running in this process, if any
+_ACTIVE = None
+
+
+class PlotTimings:
+    """Durations of the stages of a plotting call.
+
+    The stages are:
+            process_input: Reading and validating the input matrix.
+            read_matrix: Reading a matrix file, as part of process_input.
+            template: Loading the plot template in make_pickle_file.
+            artists: Building and updating the artists of each sample's figure.
+            draw: Drawing a figure with Agg for png and PIL_Image output.
+            encode: Encoding png images. Figures without a raster background
+                    are drawn and encoded in this stage.
+            pdf: Drawing and writing PDF pages.
+            total: The whole plotting call.
+
+    Stages recorded in the worker processes of a parallel run are merged into
+    the PlotTimings of the call. The workers run at the same time, so their
+    stages can add up to more than the total of the call.
+
+    With memory=True, the memory allocated by Python in each stage is traced
+    with tracemalloc, which slows the call down (by two to three times). The
+    memory of a stage is a dictionary of:
+            peak: The highest memory in use during the stage, in bytes above
+                    the memory in use when the stage started.
+            retained: The memory still in use when the stage ended, in bytes
+                    above the memory in use when the stage started.
+            blocks: The change in the number of allocated memory blocks.
+    A stage recorded several times has the highest of its peaks, and the sum
+    of its retained bytes and blocks. The memory of worker processes is
+    traced in each worker, and the peak of a stage is that of the worker in
+    which it was highest.
+
+    With complexity=True, or a budget, the draw complexity of every figure
+    written (see figure_complexity) is recorded in figures. A figure of a
+    context with more artists, patches, texts or path vertices than the
+    budget of that context allows is reported in over_budget, and warned
+    about or raised as an error depending on on_budget.
+
+    Args:
+            callback: Called with the stage, its duration in seconds and the
+                    sample name (or None) every time a stage is recorded.
+            memory: Trace the memory allocated in each stage.
+            complexity: Count the artists of every figure written.
+            budget: The largest complexity of a figure of each context, as a
+                    dictionary of metric limits keyed by context (ie.
+                    {"SBS_96": {"artists": 2000}}). DRAW_BUDGETS has the
+                    budgets of the plots of this package.
+            on_budget: "warn" to warn about figures over budget, "error" to
+                    raise a RuntimeError once the plotting call has written
+                    its output, or None to only record them.
+
+    Attributes:
+            stages: Total seconds of each stage.
+            samples: Seconds of each stage of each sample, keyed by sample name.
+            events: (stage, start, end, sample, process id) of every recorded
+                    stage, with time.perf_counter() start and end times.
+            memory: The memory of each stage, or None without memory tracing.
+            sample_memory: The memory of each stage of each sample, keyed by
+                    sample name.
+            peak_rss: The peak resident set size of the process in bytes at
+                    the end of the call, when it is known.
+            figures: The context, sample and complexity of every figure
+                    written, as dictionaries, or None without complexity.
+            over_budget: A message for each figure over budget.
+    """
+
+    def __init__(
+        self,
+        callback=None,
+        memory=False,
+        complexity=False,
+        budget=None,
+        on_budget="warn",
+    ):
+        if on_budget not in ("warn", "error", None):
+            raise ValueError('on_budget must be "warn", "error" or None.')
+        self.callback = callback
+        self.stages = {}
+        self.samples = {}
+        self.events = []
+        self.memory = {} if memory else None
+        self.sample_memory = {}
+        self.peak_rss = None
+        self.budget = budget
+        self.on_budget = on_budget
+        self.figures = [] if complexity or budget is not None else None
+        self.over_budget = []
+        # end of the last stage recorded in this process
+        self.last_end = None
+        # sample names of the matrix being rendered, for the pages of
+        # renderers that do not name the sample of a PDF page
+        self.page_samples = None
+        # [traced bytes, allocated blocks, peak traced bytes] at the start of
+        # the open stages, and at the end of the last stage of this process
+        self._memory_marks = []
+        self._last_mark = None
+
+    def options(self):
+        """Returns the arguments of a PlotTimings that records the same
+        measurements, for the worker processes of a parallel run. Figures over
+        budget are warned about once they are merged into this PlotTimings."""
+        return {
+            "memory": self.memory is not None,
+            "complexity": self.figures is not None,
+            "budget": self.budget,
+            "on_budget": None,
+        }
+
+    def record_figure(self, context, sample, fig):
+        """Records the complexity of fig, the figure of sample in context."""
+        if self.figures is None:
+            return
+        figure = dict(context=context, sample=sample, **figure_complexity(fig))
+        self.figures.append(figure)
+        self._check_budget(figure)
+
+    def _check_budget(self, figure):
+        limits = (self.budget or {}).get(figure["context"], {})
+        exceeded = [
+            f"{metric} {figure[metric]} > {limit}"
+            for metric, limit in limits.items()
+            if figure[metric] > limit
+        ]
+        if not exceeded:
+            return
+        message = (
+            f"The {figure['context']} figure of {figure['sample']} is over its "
+            "draw budget: " + ", ".join(exceeded)
+        )
+        self.over_budget.append(message)
+        if self.on_budget == "warn":
+            warnings.warn(message, stacklevel=2)
+
+    def __getstate__(self):
+        # sent back from the worker processes of a parallel run
+        state = dict(self.__dict__)
+        state["callback"] = None
+        return state
+
+    def record(self, stage, start, end, sample=None, pid=None):
+        seconds = end - start
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        if sample is not None:
+            sample_stages = self.samples.setdefault(sample, {})
+            sample_stages[stage] = sample_stages.get(stage, 0.0) + seconds
+        if pid is None:
+            pid = os.getpid()
+            self.last_end = end
+        self.events.append((stage, start, end, sample, pid))
+        if self.callback is not None:
+            self.callback(stage, seconds, sample)
+
+    def record_since_last(self, stage, sample=None):
+        # Records the time since the last stage of this process ended, which
+        # is spent in the plotting code between two recorded stages
+        now = time.perf_counter()
+        if self.last_end is not None:
+            if self._last_mark is not None:
+                self._record_memory(stage, self._last_mark, sample)
+            self.record(stage, self.last_end, now, sample)
+
+    def start_stage(self):
+        """Returns the mark passed to end_stage when the stage ends."""
+        if self.memory is None:
+            return time.perf_counter(), None
+        self._fold_peak()
+        mark = _memory_mark()
+        self._memory_marks.append(mark)
+        return time.perf_counter(), mark
+
+    def end_stage(self, stage, mark, sample=None):
+        """Records a stage started with start_stage."""
+        end = time.perf_counter()
+        start, memory_mark = mark
+        if memory_mark is not None:
+            self._record_memory(stage, memory_mark, sample)
+            self._memory_marks.remove(memory_mark)
+        self.record(stage, start, end, sample)
+
+    def _fold_peak(self):
+        # Adds the peak since the last reset to the open stages, so that the
+        # peak can be reset for a new stage
+        peak = tracemalloc.get_traced_memory()[1]
+        for mark in self._memory_marks + [self._last_mark]:
+            if mark is not None and peak > mark[2]:
+                mark[2] = peak
+        tracemalloc.reset_peak()
+
+    def _record_memory(self, stage, mark, sample):
+        self._fold_peak()
+        end_mark = _memory_mark()
+        usage = {
+            "peak": mark[2] - mark[0],
+            "retained": end_mark[0] - mark[0],
+            "blocks": end_mark[1] - mark[1],
+        }
+        _add_memory(self.memory, stage, usage)
+        if sample is not None:
+            _add_memory(self.sample_memory.setdefault(sample, {}), stage, usage)
+        self._last_mark = end_mark
+
+    def merge(self, other):
+        """Adds the stages recorded by the PlotTimings of a worker process."""
+        for event in other.events:
+            self.record(*event)
+        if self.memory is not None and other.memory is not None:
+            for stage, usage in other.memory.items():
+                _add_memory(self.memory, stage, usage)
+            for sample, memory in other.sample_memory.items():
+                for stage, usage in memory.items():
+                    _add_memory(self.sample_memory.setdefault(sample, {}), stage, usage)
+            if other.peak_rss is not None:
+                self.peak_rss = max(self.peak_rss or 0, other.peak_rss)
+        if self.figures is not None and other.figures is not None:
+            self.figures.extend(other.figures)
+            for message in other.over_budget:
+                self.over_budget.append(message)
+                if self.on_budget == "warn":
+                    warnings.warn(message, stacklevel=2)
+
+    def summary(self):
+        """Returns a table of the stage durations and the slowest samples."""
+        total = self.stages.get("total", sum(self.stages.values()))
+        header = f"{'stage':<15}{'seconds':>10}{'share':>8}"
+        if self.memory is not None:
+            header += f"{'peak MB':>10}{'retained MB':>13}"
+        lines = [header]
+        names = [stage for stage in STAGES if stage in self.stages]
+        names += sorted(set(self.stages).difference(STAGES, ["total"]))
+        for stage in names + ["total"]:
+            seconds = self.stages.get(stage, 0.0)
+            share = seconds / total * 100 if total else 0.0
+            label = "  " + stage if stage in NESTED_STAGES else stage
+            line = f"{label:<15}{seconds:>10.3f}{share:>7.1f}%"
+            if self.memory is not None and stage in self.memory:
+                usage = self.memory[stage]
+                line += f"{usage['peak'] / 2**20:>10.1f}"
+                line += f"{usage['retained'] / 2**20:>13.1f}"
+            lines.append(line)
+        if self.peak_rss is not None:
+            lines.append(f"peak RSS {self.peak_rss / 2**20:.1f} MB")
+        if self.samples:
+            sample_totals = {
+                sample: sum(stages.values()) for sample, stages in self.samples.items()
+            }
+            slowest = max(sample_totals, key=sample_totals.get)
+            mean = sum(sample_totals.values()) / len(sample_totals)
+            lines.append(
+                f"{len(sample_totals)} samples, {mean:.3f} s per sample, slowest "
+                f"{slowest} ({sample_totals[slowest]:.3f} s)"
+            )
+        if self.figures:
+            lines.append(
+                f"{'context':<22}{'figures':>8}"
+                + "".join(f"{'max ' + metric:>14}" for metric in COMPLEXITY_METRICS)
+            )
+            for context, figures in self.complexity_by_context().items():
+                lines.append(
+                    f"{context:<22}{figures['figures']:>8}"
+                    + "".join(f"{figures[metric]:>14}" for metric in COMPLEXITY_METRICS)
+                )
+        for message in self.over_budget:
+            lines.append("over budget: " + message)
+        return "\n".join(lines)
+
+    def complexity_by_context(self):
+        """Returns the number of figures and the highest complexity of a
+        figure of each context."""
+        contexts = {}
+        for figure in self.figures or ():
+            totals = contexts.setdefault(
+                figure["context"],
+                dict({"figures": 0}, **dict.fromkeys(COMPLEXITY_METRICS, 0)),
+            )
+            totals["figures"] += 1
+            for metric in COMPLEXITY_METRICS:
+                totals[metric] = max(totals[metric], figure[metric])
+        return contexts
+
+    def memory_groups(self):
+        """Returns the peak and retained bytes of the memory spent on the
+        matrix file, the parsed matrix, the figures and the output.
+
+        The stages of each group are in MEMORY_GROUPS. The parsed matrix is
+        read in process_input, whose memory includes that of read_matrix.
+        """
+        if self.memory is None:
+            return None
+        groups = {}
+        for group, stages in MEMORY_GROUPS.items():
+            usages = [self.memory[stage] for stage in stages if stage in self.memory]
+            groups[group] = {
+                "peak": max((usage["peak"] for usage in usages), default=0),
+                "retained": sum(usage["retained"] for usage in usages),
+            }
+        return groups
+
+    def chrome_trace(self):
+        """Returns the recorded stages in the Chrome trace event format.
+
+        Each stage is a complete event ("ph": "X") on the row of the process
+        that ran it, with its sample in args. The result can be written as
+        JSON and opened in chrome://tracing or Perfetto.
+        """
+        if not self.events:
+            return {"traceEvents": [], "displayTimeUnit": "ms"}
+        origin = min(event[1] for event in self.events)
+        main_pid = os.getpid()
+        trace_events = []
+        pids = []
+        for stage, start, end, sample, pid in self.events:
+            if pid not in pids:
+                pids.append(pid)
+            trace_event = {
+                "name": stage,
+                "cat": "plotting",
+                "ph": "X",
+                "ts": (start - origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": pid,
+            }
+            if sample is not None:
+                trace_event["args"] = {"sample": str(sample)}
+            trace_events.append(trace_event)
+        worker = 0
+        for pid in pids:
+            if pid == main_pid:
+                name = "main"
+            else:
+                worker += 1
+                name = f"worker {worker}"
+            trace_events.append(
+                {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}}
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, file_path):
+        """Writes chrome_trace() to file_path as JSON."""
+        with open(file_path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def figure_complexity(fig):
+    """Returns the number of visible artists, patches and texts of fig, and
+    the number of path vertices drawn for its patches, lines and collections.
+    """
+    from matplotlib.collections import Collection
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+    from matplotlib.text import Text
+
+    counts = dict.fromkeys(COMPLEXITY_METRICS, 0)
+    for artist in fig.findobj():
+        if not artist.get_visible():
+            continue
+        counts["artists"] += 1
+        if isinstance(artist, Text):
+            counts["texts"] += 1
+        elif isinstance(artist, (Patch, Line2D)):
+            if isinstance(artist, Patch):
+                counts["patches"] += 1
+            counts["vertices"] += len(artist.get_path().vertices)
+        elif isinstance(artist, Collection):
+            paths = artist.get_paths()
+            vertices = sum(len(path.vertices) for path in paths)
+            # a collection draws its paths once at each of its offsets
+            n_offsets = len(artist.get_offsets())
+            if paths and n_offsets > len(paths):
+                vertices = vertices * n_offsets // len(paths)
+            counts["vertices"] += vertices
+    return counts
+
+
+def _memory_mark():
+    traced = tracemalloc.get_traced_memory()[0]
+    return [traced, sys.getallocatedblocks(), traced]
+
+
+def _add_memory(memory, stage, usage):
+    if stage not in memory:
+        memory[stage] = dict(usage)
+        return
+    totals = memory[stage]
+    totals["peak"] = max(totals["peak"], usage["peak"])
+    totals["retained"] += usage["retained"]
+    totals["blocks"] += usage["blocks"]
+
+
+def peak_rss():
+    """Returns the peak resident set size of this process in bytes, or None
+    where the resource module is not available (ie. on Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def active():
+    """Returns the PlotTimings of the running plotting call, or None."""
+    return _ACTIVE
+
+
+@contextlib.contextmanager
+def activate(timings):
+    """Records the stages run inside the block into timings.
+
+    Starts tracemalloc for the block when timings traces memory and
+    tracemalloc is not already tracing.
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = timings
+    started_tracing = False
+    if timings.memory is not None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+        timings._last_mark = _memory_mark()
+    timings.last_end = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        _ACTIVE = previous
+        if timings.memory is not None:
+            timings._last_mark = None
+            rss = peak_rss()
+            if rss is not None:
+                timings.peak_rss = max(timings.peak_rss or 0, rss)
+            if started_tracing:
+                tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def stage(name, sample=None):
+    """Records the duration of the block as stage name of the running call.
+
+    Can also be used as a function decorator.
+    """
+    timings = _ACTIVE
+    if timings is None:
+        yield
+        return
+    mark = timings.start_stage()
+    try:
+        yield
+    finally:
+        timings.end_stage(name, mark, sample)
+
+
+def instrumented(plot_function):
+    """Records the stages of plot_function when it is called with timings or
+    a trace_file.
+
+    Nested calls, such as the calls for each chunk of a chunked run, are
+    recorded into the timings of the outermost call. The trace is written
+    once the call returns, or fails, and the figures over a draw budget
+    raise an error once the call returns.
+    """
+
+    @functools.wraps(plot_function)
+    def wrapper(*args, **kwargs):
+        timings = kwargs.get("timings")
+        trace_file = kwargs.get("trace_file")
+        if (timings is None and trace_file is None) or _ACTIVE is not None:
+            return plot_function(*args, **kwargs)
+        if timings is None:
+            timings = PlotTimings()
+        over_budget = len(timings.over_budget)
+        try:
+            with activate(timings), stage("total"):
+                result = plot_function(*args, **kwargs)
+        finally:
+            if trace_file is not None:
+                timings.write_trace(trace_file)
+        if timings.on_budget == "error" and len(timings.over_budget) > over_budget:
+            raise RuntimeError("\n".join(timings.over_budget[over_budget:]))
+        return result
+
+    return wrapper
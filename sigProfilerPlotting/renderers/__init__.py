@@ -0,0 +1,79 @@
+"""Renderers of each plot type, imported the first time they are used.
+
+Each renderer module has a render function with the arguments of its plotting
+function, and the modules that own a plot template have a build_template
+function that make_pickle_file calls to build it.
+"""
+
+import importlib
+
+# Renderer module of each plot_type accepted by plotSBS, plotID and plotDBS
+PLOT_TYPES = {
+    "SBS": {
+        "96": "sbs96",
+        "192": "sbs384",
+        "96SB": "sbs384",
+        "384": "sbs384",
+        "192_extended": "sbs384_extended",
+        "96SB_extended": "sbs384_extended",
+        "384_extended": "sbs384_extended",
+        "6": "sbs6",
+        "12": "sbs24",
+        "6SB": "sbs24",
+        "24": "sbs24",
+        "1536": "sbs1536",
+        "4608": "sbs4608",
+        "288": "sbs288",
+        "288_Normalized": "sbs288_normalized",
+    },
+    "ID": {
+        "94": "id83",
+        "ID94": "id83",
+        "94ID": "id83",
+        "83": "id83",
+        "INDEL_simple": "id28",
+        "simple_INDEL": "id28",
+        "ID_simple": "id28",
+        "simple_ID": "id28",
+        "28": "id28",
+        "IDSB": "id415",
+        "415": "id415",
+    },
+    "DBS": {
+        "78": "dbs78",
+        "78DBS": "dbs78",
+        "DBS78": "dbs78",
+        "312": "dbs186",
+        "78SB": "dbs186",
+        "SB78": "dbs186",
+        "186": "dbs186",
+    },
+}
+
+# Renderer modules that parse a tab-separated matrix file line by line. Other
+# inputs are written to a temporary text file for them.
+TEXT_INPUT = {"dbs186", "id28", "id415", "sbs288_normalized"}
+
+# Renderer module that builds the template of each make_pickle_file context
+TEMPLATES = {
+    "SBS96": "sbs96",
+    "SBS288": "sbs288",
+    "SBS6": "sbs6",
+    "SBS24": "sbs24",
+    "SBS384": "sbs384",
+    "SBS384_extended": "sbs384",
+    "SBS1536": "sbs1536",
+    "SBS4608": "sbs4608",
+    "DBS78": "dbs78",
+    "DBS186": "dbs186",
+    "ID83": "id83",
+    "ID28": "id28",
+    "ID415": "id415",
+    "SV32": "sv32",
+    "CNV48": "cnv48",
+}
+
+
+def load(name):
+    """Imports the renderer module called name (ie. sbs96)."""
+    return importlib.import_module("." + name, __name__)
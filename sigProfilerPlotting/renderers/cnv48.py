@@ -0,0 +1,519 @@
+"""CNV48 plots of plotCNV and the CNV48 plot template."""
+
+import errno
+import os
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as ticker
+import matplotlib.transforms as transforms
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    FigureWriter,
+    clear_plotting_memory,
+    make_pickle_file,
+    process_input,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    percentage,
+    aggregate,
+    read_from_file,
+    savefig_format,
+    dpi,
+    volume,
+):
+    if read_from_file and not os.path.exists(matrix_path):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), matrix_path)
+
+    # To reindex the input data
+    df = process_input(matrix_path, "48")
+    df.reset_index(inplace=True)
+    label = df.columns[0]
+    labels = df[label]
+
+    # index order will be: homdel, LOH, then het
+    order = [
+        i
+        for cnv_type in ("homdel", "LOH", "het")
+        for i in range(len(labels))
+        if labels[i].split(":")[1] == cnv_type
+    ]
+
+    color_mapping = {
+        "0:0-100kb": "#F0F8FF",
+        "0:100kb-1Mb": "#787CE6",
+        "0:>1Mb": "#0000CD",
+        "1:0-100kb": "#EBEBEB",
+        "1:100kb-1Mb": "#C5C5C5",
+        "1:1Mb-10Mb": "#9F9F9F",
+        "1:10Mb-40Mb": "#797979",
+        "1:>40Mb": "#545454",
+        "2:0-100kb": "#F5FFFA",
+        "2:100kb-1Mb": "#C0E2C3",
+        "2:1Mb-10Mb": "#8BC48E",
+        "2:10Mb-40Mb": "#56A858",
+        "2:>40Mb": "#228B22",
+        "3-4:0-100kb": "#FFF0F5",
+        "3-4:100kb-1Mb": "#DEBDEB",
+        "3-4:1Mb-10Mb": "#BE8BE1",
+        "3-4:10Mb-40Mb": "#9D58D7",
+        "3-4:>40Mb": "#7D26CD",
+        "5-8:0-100kb": "#FFFAF0",
+        "5-8:100kb-1Mb": "#F2DCB3",
+        "5-8:1Mb-10Mb": "#E6BF78",
+        "5-8:10Mb-40Mb": "#D9A23C",
+        "5-8:>40Mb": "#CD8500",
+        "9+:0-100kb": "#FFE4E1",
+        "9+:100kb-1Mb": "#E2ADBC",
+        "9+:1Mb-10Mb": "#C47798",
+        "9+:10Mb-40Mb": "#A84074",
+        "9+:>40Mb": "#8B0A50",
+    }
+
+    plt.style.use("ggplot")
+    plt.rcParams["axes.facecolor"] = "white"
+    fig = make_pickle_file(context="CNV48", return_plot_template=True, volume=volume)
+    ax = fig.axes[0]
+    plt.rcParams["axes.linewidth"] = 1
+    trans = transforms.blended_transform_factory(ax.transData, ax.transAxes)
+
+    bars = []
+    for i, label_index in enumerate(order):
+        categories = labels[label_index].split(":")
+        cnv_class = categories[0]
+        size_class = categories[2]
+        bar = ax.bar(
+            i,
+            0,
+            color=color_mapping[cnv_class + ":" + size_class],
+            edgecolor="black",
+            align="center",
+        )
+        bars.append(bar[0])
+
+    # y-axis title
+    if aggregate and not percentage:
+        ax.set_ylabel(
+            "Number of Events Per Sample",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+    elif not aggregate and percentage:
+        ax.set_ylabel(
+            "Percentage of Copy Number Segments",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+    elif not aggregate and not percentage:
+        ax.set_ylabel(
+            "Number of Events",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+    elif aggregate and percentage:
+        ax.set_ylabel(
+            "Percentage of Copy Number Segments",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+
+    # Add the sample name
+    title = ax.text(
+        3,
+        0.90,
+        "",
+        fontsize=20,
+        fontname="Arial",
+        fontweight="bold",
+        color="black",
+        transform=trans,
+    )
+
+    # inner function to update the plot with the counts of a sample
+    def plot(counts, sample):
+        counts = [float(counts[i]) for i in order]
+        for bar, count in zip(bars, counts):
+            bar.set_height(count)
+
+        ax.yaxis.set_major_locator(ticker.LinearLocator(5))
+        tmp_max = max(counts)
+        # give buffer of space for title at top left of plot
+        ax.set_ylim(0, 1.25 * tmp_max)
+
+        # format the y-axis labels
+        if percentage:
+            tmp_y_labels = [
+                "{0:0.1f}%".format(round(x, 1)) for x in ax.get_yticks().tolist()
+            ]
+        else:
+            tmp_y_labels = [round(x, 1) for x in ax.get_yticks().tolist()]
+
+        # set the y-axis ticks and labels
+        ax.set_yticks(ax.get_yticks())
+        ax.set_yticklabels(
+            tmp_y_labels, fontname="Arial", weight="bold", fontsize=16, color="black"
+        )
+
+        title.set_text(sample)
+        return fig
+
+    writer = FigureWriter(savefig_format, output_path, project, "CNV_48", dpi=dpi)
+    if aggregate:
+        num_samples = len(df.columns) - 1
+        df["total_count"] = df.sum(axis=1) / num_samples  # NORMALIZE BY # of SAMPLES
+        counts = list(df["total_count"])
+        if percentage and sum(counts) != 0:
+            counts = [(x / sum(counts)) * 100 for x in counts]
+        sample = ""
+        writer.write(sample, plot(counts, sample))
+    else:
+        # each column vector in dataframe contains counts for a specific sample
+        samples = list(df)[1:]
+        for i, (col, sample) in enumerate(zip(df.columns[1:], samples)):
+            counts = list(df[col])
+            if percentage and sum(counts) != 0:
+                counts = [(x / sum(counts)) * 100 for x in counts]
+            assert len(counts) == 48
+            assert len(labels) == 48
+            writer.write(sample, plot(counts, sample))
+
+    plt.close(fig)
+    results = writer.close()
+    clear_plotting_memory()
+    return results
+
+
+def build_template(context):
+    hom_del_class = ["0 - 100kb", "100kb - 1Mb", ">1Mb"]
+    x_labels = ["0 - 100kb", "100kb - 1Mb", "1Mb - 10Mb", "10Mb - 40Mb", ">40Mb"]
+    colors = ["#0000CD", "#545454", "#228B22", "#7D26CD", "#CD8500", "#8B0A50"]
+    N = 48
+    ticks = np.arange(N)
+
+    plt.style.use("ggplot")
+    plt.rcParams["axes.facecolor"] = "white"
+
+    # create the subplot
+    plot1, ax = plt.subplots(figsize=(16, 10))
+    # Create the plot layout (axis and grid lines)
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    plt.rcParams["axes.linewidth"] = 1
+    ax.yaxis.set_major_locator(ticker.LinearLocator(5))
+    ax.spines["bottom"].set_color("black")
+    ax.spines["top"].set_color("black")
+    ax.spines["right"].set_color("black")
+    ax.spines["left"].set_color("black")
+    # Add light gray horizontal lines at y-ticks
+    ax.grid(linestyle="-", linewidth=1, color="#EDEDED", axis="y")
+    plt.xlim(xmin=-0.5, xmax=N - 0.5)
+
+    # ADD PATCHES AND TEXT
+    patch_height = 0.05
+    patch_width = 2.8
+    loh_width = 2.5
+    loh_len = 4.85
+
+    # add vertical black lines
+    ax.axvline(x=2.5, color="black", linewidth=1)
+    ax.axvline(x=patch_width + loh_len * 5.09, color="black", linewidth=1)
+
+    trans = transforms.blended_transform_factory(ax.transData, ax.transAxes)
+
+    # homdel patch
+    ax.add_patch(
+        plt.Rectangle(
+            (-0.5, 1.065),
+            2.925,
+            patch_height,
+            clip_on=False,
+            facecolor="#a9a9a9",
+            transform=trans,
+        )
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (-0.5, 1.01),
+            2.925,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[0],
+            transform=trans,
+        )
+    )
+    plt.text(
+        0.65,
+        1.02,
+        "0",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    plt.text(
+        0.15,
+        1.075,
+        "HD",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+
+    # LOH Patches
+    ax.add_patch(
+        plt.Rectangle(
+            (2.575, 1.065),
+            24.825,
+            patch_height,
+            clip_on=False,
+            facecolor="#a9a9a9",
+            transform=trans,
+        )
+    )
+    plt.text(
+        patch_width + loh_len * 2.25,
+        1.075,
+        "LOH",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (2.575, 1.01),
+            loh_len - 0.025,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[1],
+            transform=trans,
+        )
+    )
+    plt.text(
+        4.725,
+        1.02,
+        "1",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (7.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[2],
+            transform=trans,
+        )
+    )
+    plt.text(
+        9.725,
+        1.02,
+        "2",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (12.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[3],
+            transform=trans,
+        )
+    )
+    plt.text(
+        14,
+        1.02,
+        "3-4",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (17.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[4],
+            transform=trans,
+        )
+    )
+    plt.text(
+        19.025,
+        1.02,
+        "5-8",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (22.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[5],
+            transform=trans,
+        )
+    )
+    plt.text(
+        24.375,
+        1.02,
+        "9+",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+
+    # Heterozygous patches
+    ax.add_patch(
+        plt.Rectangle(
+            (27.55, 1.065),
+            loh_len * 4.0938,
+            patch_height,
+            clip_on=False,
+            facecolor="#a9a9a9",
+            transform=trans,
+        )
+    )
+    plt.text(
+        33.25,
+        1.075,
+        "Heterozygous",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (27.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[2],
+            transform=trans,
+        )
+    )
+    plt.text(
+        29.75,
+        1.02,
+        "2",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (32.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[3],
+            transform=trans,
+        )
+    )
+    plt.text(
+        34.25,
+        1.02,
+        "3-4",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (37.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[4],
+            transform=trans,
+        )
+    )
+    plt.text(
+        39.175,
+        1.02,
+        "5-8",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (42.55, 1.01),
+            loh_len,
+            patch_height,
+            clip_on=False,
+            facecolor=colors[5],
+            transform=trans,
+        )
+    )
+    plt.text(
+        44.525,
+        1.02,
+        "9+",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+
+    # This is the x-axis
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(
+        hom_del_class + x_labels * 9,
+        rotation=90,
+        weight="bold",
+        fontsize=16,
+        fontname="Arial",
+        color="black",
+    )
+    ax.tick_params(labelleft=True, left=False, bottom=False)
+    ax.tick_params(axis="y", which="major", pad=0, labelsize=60)
+
+    return plot1
@@ -0,0 +1,399 @@
+"""DBS186 plots of plotDBS and the DBS186 plot template."""
+
+import os
+import sys
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    BarCollection,
+    _parse_text_matrix,
+    _pdf_pages,
+    getylabels,
+    make_pickle_file,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    sig_probs = False
+    with open(matrix_path) as f:
+        next(f)
+        first_line = f.readline()
+        first_line = first_line.strip().split()
+        mutation_type = first_line[0]
+        if len(mutation_type) != 7 and mutation_type[1] != ":":
+            sys.exit(
+                "The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
+            )
+
+    file_path = os.path.join(output_path, f"DBS_186_plots_{project}.pdf")
+    pp = _pdf_pages(file_path)
+
+    dinucs = [
+        "TT>GG",
+        "TT>CG",
+        "TT>AG",
+        "TT>GC",
+        "TT>CC",
+        "TT>AC",
+        "TT>GA",
+        "TT>CA",
+        "TT>AA",
+        "CT>AA",
+        "CT>AC",
+        "CT>AG",
+        "CT>GA",
+        "CT>GC",
+        "CT>GG",
+        "CT>TG",
+        "CT>TC",
+        "CT>TA",
+        "CC>AA",
+        "CC>AG",
+        "CC>AT",
+        "CC>GA",
+        "CC>GG",
+        "CC>GT",
+        "CC>TA",
+        "CC>TG",
+        "CC>TT",
+        "TC>GT",
+        "TC>CT",
+        "TC>AT",
+        "TC>GG",
+        "TC>CG",
+        "TC>AG",
+        "TC>GA",
+        "TC>CA",
+        "TC>AA",
+    ]
+
+    revcompl = lambda x: "".join(
+        [{"A": "T", "C": "G", "G": "C", "T": "A", ">": ">"}[B] for B in x][::-1]
+    )
+    mutations = OrderedDict()
+
+    try:
+        with _parse_text_matrix(matrix_path) as f:
+            first_line = f.readline()
+            samples = first_line.strip().split("\t")
+            samples = samples[1:]
+            for sample in samples:
+                mutations[sample] = OrderedDict()
+                mutations[sample]["CC"] = OrderedDict()
+                mutations[sample]["CT"] = OrderedDict()
+                mutations[sample]["TC"] = OrderedDict()
+                mutations[sample]["TT"] = OrderedDict()
+
+            for lines in f:
+                line = lines.strip().split()
+                mut = line[0][2:]
+                nuc = line[0][5:]
+                mut_type = line[0][2:4]
+                bias = line[0][0]
+                if bias == "N" or bias == "B" or bias == "Q":
+                    continue
+                else:
+                    if mut not in dinucs:
+                        if revcompl(mut) not in dinucs:
+                            continue
+                        nuc = revcompl(nuc)
+                        mut_type = revcompl(mut_type)
+                    sample_index = 1
+
+                    for sample in samples:
+                        if percentage:
+                            mutCount = float(line[sample_index])
+                            if mutCount < 1 and mutCount > 0:
+                                sig_probs = True
+                        else:
+                            # mutCount = int(line[sample_index])
+                            try:
+                                mutCount = int(line[sample_index])
+                            except:
+                                print(
+                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
+                                    end="",
+                                )
+
+                        if nuc not in mutations[sample][mut_type]:
+                            mutations[sample][mut_type][nuc] = [0, 0]
+                        if bias == "T":
+                            mutations[sample][mut_type][nuc][0] = mutCount
+                        else:
+                            mutations[sample][mut_type][nuc][1] = mutCount
+                        sample_index += 1
+
+        plt.rcParams["axes.linewidth"] = 2
+        plt.rc("axes", edgecolor="lightgray")
+        plot1 = make_pickle_file(
+            context="DBS186", return_plot_template=True, volume=volume
+        )
+        panel1 = plot1.axes[0]
+        # the background patches of the four dinucleotide classes
+        backgrounds = [patch for patch in panel1.patches if patch.get_zorder() == 0]
+
+        # every sample lists the same dinucleotides
+        contexts = next(iter(mutations.values()))
+        xlabels = []
+        cells = []
+        bar_x = []
+        x = 0.3
+        for key in contexts:
+            muts = contexts[key].keys()
+            muts = sorted(muts)
+            for seq in muts:
+                xlabels.append(seq)
+                cells.append((key, seq))
+                bar_x.append(x)
+                x += 0.2
+                bar_x.append(x)
+                x += 0.8
+        bars = BarCollection(
+            panel1,
+            bar_x,
+            0.2,
+            [[1 / 256, 70 / 256, 102 / 256], [228 / 256, 41 / 256, 38 / 256]]
+            * len(cells),
+            legend_boxes=True,
+        )
+
+        labs = np.arange(0.55, 36.44, 1)
+        panel1.set_xticks(labs)
+        panel1.set_xticklabels(
+            xlabels,
+            rotation="vertical",
+            fontsize=30,
+            color="grey",
+            fontname="Courier New",
+            verticalalignment="top",
+            fontweight="bold",
+        )
+
+        sample_text = panel1.text(
+            0.08,
+            0.8,
+            "",
+            fontsize=35,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=plot1.transFigure,
+        )
+        panel1.legend(
+            handles=bars.legend_handles(
+                "Genic-transcribed Strand", "Genic-untranscribed Strand"
+            ),
+            prop={"size": 30},
+        )
+
+        if percentage:
+            panel1.set_ylabel(
+                "Percentage of Double Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_ylabel(
+                "Number of Double Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        for sample in mutations.keys():
+            total_count = sum(
+                sum(sum(tsb) for tsb in nuc.values())
+                for nuc in mutations[sample].values()
+            )
+            # the transcribed and untranscribed bar of each dinucleotide, in turn
+            heights = np.array(
+                [tsb for key, seq in cells for tsb in mutations[sample][key][seq]],
+                dtype=float,
+            )
+            if percentage:
+                if total_count > 0:
+                    heights = heights / total_count * 100
+                else:
+                    heights = np.zeros(len(heights))
+            bars.set_heights(heights)
+            ymax = max(0, np.max(heights))
+
+            y = int(ymax * 1.25)
+
+            if y <= 4:
+                y += 4
+
+            while y % 4 != 0:
+                y += 1
+            ytick_offest = int(y / 4)
+
+            for background in backgrounds:
+                background.set_height(y)
+
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                if ytick_offest == 0:
+                    ytick_offest = 1
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample
+                    + ": "
+                    + "{:,}".format(int(total_count))
+                    + " transcribed double subs"
+                )
+
+            if not percentage:
+                ylabels = getylabels(ylabels)
+
+            panel1.set_ylim([0, y])
+            panel1.set_yticks(ylabs)
+            panel1.set_yticklabels(ylabels, fontsize=25)
+
+            [i.set_color("black") for i in panel1.get_yticklabels()]
+            [i.set_color("grey") for i in panel1.get_xticklabels()]
+
+            pp.savefig(plot1)
+        plt.close(plot1)
+        pp.close()
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "DBS_186_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
+
+
+def build_template(context):
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(21, 9.92))
+    plt.rc("axes", edgecolor="lightgray")
+    panel1 = plt.axes([0.07, 0.09, 0.92, 0.77])
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [3 / 256, 102 / 256, 204 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [1 / 256, 102 / 256, 1 / 256],
+        [255 / 256, 153 / 256, 153 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [255 / 256, 178 / 256, 102 / 256],
+        [255 / 256, 128 / 256, 1 / 256],
+        [204 / 256, 153 / 256, 255 / 256],
+        [76 / 256, 1 / 256, 153 / 256],
+    ]
+
+    y3 = 0.87
+    for x, color in ((0.075, 0), (0.302, 2), (0.532, 4), (0.765, 7)):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y3),
+                0.218,
+                0.05,
+                facecolor=colors[color],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+
+    yText = y3 + 0.06
+    for x, label in (
+        (0.13, "CC>NN"),
+        (0.37, "CT>NN"),
+        (0.59, "TC>NN"),
+        (0.83, "TT>NN"),
+    ):
+        plt.text(
+            x,
+            yText,
+            label,
+            fontsize=40,
+            fontweight="bold",
+            fontname="Arial",
+            transform=plt.gcf().transFigure,
+        )
+
+    # the height of the background patches is set for each sample
+    x_shaded = 0
+    for width, color in ((8.9, 0), (9, 2), (9, 4), (9.1, 7)):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x_shaded, 0),
+                width,
+                0,
+                facecolor=colors[color],
+                zorder=0,
+                alpha=0.25,
+                edgecolor="grey",
+            )
+        )
+        x_shaded += width
+
+    panel1.set_xlim([0, 36])
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=True,
+        left=True,
+        labelleft=True,
+        right=True,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="lightgray",
+        width=2,
+    )
+
+    return plot1
@@ -0,0 +1,663 @@
+"""DBS78 plots of plotDBS and the DBS78 plot template."""
+
+import os
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    BarCollection,
+    FigureWriter,
+    getylabels,
+    make_pickle_file,
+    process_input,
+    profile_keys,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    plot_custom_text = False
+    sig_probs = False
+    data = process_input(matrix_path, plot_type)
+
+    dinucs = [
+        "TT>GG",
+        "TT>CG",
+        "TT>AG",
+        "TT>GC",
+        "TT>CC",
+        "TT>AC",
+        "TT>GA",
+        "TT>CA",
+        "TT>AA",
+        "AC>CA",
+        "AC>CG",
+        "AC>CT",
+        "AC>GA",
+        "AC>GG",
+        "AC>GT",
+        "AC>TA",
+        "AC>TG",
+        "AC>TT",
+        "CT>AA",
+        "CT>AC",
+        "CT>AG",
+        "CT>GA",
+        "CT>GC",
+        "CT>GG",
+        "CT>TG",
+        "CT>TC",
+        "CT>TA",
+        "AT>CA",
+        "AT>CC",
+        "AT>CG",
+        "AT>GA",
+        "AT>GC",
+        "AT>TA",
+        "TG>GT",
+        "TG>CT",
+        "TG>AT",
+        "TG>GC",
+        "TG>CC",
+        "TG>AC",
+        "TG>GA",
+        "TG>CA",
+        "TG>AA",
+        "CC>AA",
+        "CC>AG",
+        "CC>AT",
+        "CC>GA",
+        "CC>GG",
+        "CC>GT",
+        "CC>TA",
+        "CC>TG",
+        "CC>TT",
+        "CG>AT",
+        "CG>GC",
+        "CG>GT",
+        "CG>TC",
+        "CG>TA",
+        "CG>TT",
+        "TC>GT",
+        "TC>CT",
+        "TC>AT",
+        "TC>GG",
+        "TC>CG",
+        "TC>AG",
+        "TC>GA",
+        "TC>CA",
+        "TC>AA",
+        "GC>AA",
+        "GC>AG",
+        "GC>AT",
+        "GC>CA",
+        "GC>CG",
+        "GC>TA",
+        "TA>GT",
+        "TA>CT",
+        "TA>AT",
+        "TA>GG",
+        "TA>CG",
+        "TA>GC",
+    ]
+
+    revcompl = lambda x: "".join(
+        [{"A": "T", "C": "G", "G": "C", "T": "A"}[B] for B in x][::-1]
+    )
+    mutations = OrderedDict()
+
+    try:
+        vals = set(list(data.index)) - set(dinucs)
+        vals = sorted(list(vals))
+        for ech in vals:
+            ech_mod = ech.split(">")[0] + ">" + revcompl(ech.split(">")[1])
+            data.rename(index={ech: ech_mod}, inplace=True)
+
+        data = data.sort_index()
+        ctx = data.index
+        xlabels = [dn.split(">")[1] for dn in ctx]
+        colors = [
+            [3 / 256, 189 / 256, 239 / 256],
+            [3 / 256, 102 / 256, 204 / 256],
+            [162 / 256, 207 / 256, 99 / 256],
+            [1 / 256, 102 / 256, 1 / 256],
+            [255 / 256, 153 / 256, 153 / 256],
+            [228 / 256, 41 / 256, 38 / 256],
+            [255 / 256, 178 / 256, 102 / 256],
+            [255 / 256, 128 / 256, 1 / 256],
+            [204 / 256, 153 / 256, 255 / 256],
+            [76 / 256, 1 / 256, 153 / 256],
+        ]
+        mainlist = [dn.split(">")[0] for dn in ctx]
+        # the first bases are numbered in sorted order
+        colors_idxs = np.unique(mainlist, return_inverse=True)[1]
+        colors_flat_list = [colors[i] for i in colors_idxs]
+        sample_count = 0
+
+        writer = FigureWriter(savefig_format, output_path, project, "DBS_78", dpi=dpi)
+        fig = make_pickle_file(
+            context="DBS78", return_plot_template=True, volume=volume
+        )
+        panel1 = fig.axes[0]
+
+        # the bars and text of the template are created once and updated
+        # for every sample instead of being drawn on a new figure
+        bars = BarCollection(
+            panel1, np.asarray(range(len(ctx))) + 0.4, 0.4, colors_flat_list
+        )
+        sample_text = panel1.text(
+            0.045,
+            0.75,
+            "",
+            fontsize=60,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=fig.transFigure,
+        )
+        custom_text = panel1.text(
+            0.98,
+            0.78,
+            "",
+            fontsize=35,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=fig.transFigure,
+            ha="right",
+        )
+
+        labs = np.arange(0.44, 78.44, 1)
+        panel1.set_xlim([0, 78])
+        panel1.set_xticks(labs)
+        panel1.set_xticklabels(
+            xlabels,
+            rotation="vertical",
+            fontsize=30,
+            color="grey",
+            fontname="Courier New",
+            verticalalignment="top",
+            fontweight="bold",
+        )
+        panel1.yaxis.grid(True)
+        panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+        panel1.set_xlabel("")
+
+        if percentage:
+            panel1.set_ylabel(
+                "Percentage of Double Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_ylabel(
+                "Number of Double Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        panel1.tick_params(
+            axis="both",
+            which="both",
+            bottom=False,
+            labelbottom=True,
+            left=True,
+            labelleft=True,
+            right=True,
+            labelright=False,
+            top=False,
+            labeltop=False,
+            direction="in",
+            length=25,
+            colors="lightgray",
+            width=2,
+        )
+        [i.set_color("grey") for i in panel1.get_xticklabels()]
+
+        writer.set_raster_background(
+            fig,
+            [
+                panel1.yaxis,
+                *panel1.spines.values(),
+                sample_text,
+                custom_text,
+                bars.collection,
+            ],
+            cache_key=("DBS78", volume),
+            label_artists=[sample_text, custom_text],
+        )
+        profiles = profile_keys(data)
+        for sample in data.columns:
+            total_count = np.sum(
+                data[sample].values
+            )  # sum(sum(nuc.values()) for nuc in mutations[sample].values())
+
+            x = 0.4
+            muts = data[sample].values
+            heights = np.zeros(len(ctx))
+            if percentage:
+                if total_count > 0:
+                    heights = muts / total_count * 100
+                    ymax = np.max(heights)
+                sig_probs = True
+            else:
+                heights = muts
+                ymax = np.max(muts)
+            bars.set_heights(heights)
+            # for i in range(len(xlabels)):
+            #     print(xlabels[i],muts[i])
+
+            x = 0.043
+            y3 = 0.87
+            y = int(ymax * 1.25)
+            y2 = y + 2
+            i = 0
+
+            if y <= 4:
+                y += 4
+
+            while y % 4 != 0:
+                y += 1
+            ytick_offest = int(y / 4)
+
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample + ": " + "{:,}".format(int(total_count)) + " double subs"
+                )
+
+            custom_text_upper_plot = ""
+            custom_text.set_text("")
+            try:
+                custom_text_upper[sample_count]
+            except:
+                custom_text_upper = False
+            try:
+                custom_text_middle[sample_count]
+            except:
+                custom_text_middle = False
+            try:
+                custom_text_bottom[sample_count]
+            except:
+                custom_text_bottom = False
+
+            if custom_text_upper:
+                plot_custom_text = True
+                if len(custom_text_upper[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+            if custom_text_bottom:
+                if len(custom_text_bottom[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+
+            if plot_custom_text:
+                x_pos_custom = 0.98
+                if custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = (
+                        custom_text_upper[sample_count]
+                        + "\n"
+                        + custom_text_middle[sample_count]
+                    )
+                    if custom_text_bottom:
+                        custom_text_upper_plot += (
+                            "\n" + custom_text_bottom[sample_count]
+                        )
+
+                if custom_text_upper and not custom_text_middle:
+                    custom_text_upper_plot = custom_text_upper[sample_count]
+                    custom_text.set_text(custom_text_upper_plot)
+                    custom_text.set_y(0.78)
+
+                elif custom_text_upper and custom_text_middle:
+                    if not custom_text_bottom:
+                        custom_text.set_text(custom_text_upper_plot)
+                        custom_text.set_y(0.75)
+                    else:
+                        custom_text.set_text(custom_text_upper_plot)
+                        custom_text.set_y(0.7)
+
+                elif not custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = custom_text_middle[sample_count]
+                    custom_text.set_text(custom_text_upper_plot)
+                    custom_text.set_y(0.78)
+
+            if not percentage:
+                ylabels = getylabels(ylabels)
+
+            panel1.set_ylim([0, y])
+            panel1.set_yticks(ylabs)
+            panel1.set_yticklabels(ylabels, fontsize=25)
+            [i.set_color("black") for i in panel1.get_yticklabels()]
+            writer.write(sample, fig, profile=profiles[sample_count])
+            sample_count += 1
+
+        plt.close(fig)
+        return writer.close()
+
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "DBS_78_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
+
+
+def build_template(context):
+    plot_custom_text = False
+    pcawg = False
+    sig_probs = False
+    plt.rcParams["axes.linewidth"] = 4
+    plot1 = plt.figure(figsize=(43.93, 9.92))
+    plt.rc("axes", edgecolor="grey")
+    panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
+    xlabels = []
+
+    x = 0.4
+    ymax = 0
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [3 / 256, 102 / 256, 204 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [1 / 256, 102 / 256, 1 / 256],
+        [255 / 256, 153 / 256, 153 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [255 / 256, 178 / 256, 102 / 256],
+        [255 / 256, 128 / 256, 1 / 256],
+        [204 / 256, 153 / 256, 255 / 256],
+        [76 / 256, 1 / 256, 153 / 256],
+    ]
+
+    x = 0.043
+    y3 = 0.87
+    y = int(ymax * 1.25)
+    y2 = y + 2
+    i = 0
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.043, y3),
+            0.101,
+            0.05,
+            facecolor=colors[0],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.151, y3),
+            0.067,
+            0.05,
+            facecolor=colors[1],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.225, y3),
+            0.102,
+            0.05,
+            facecolor=colors[2],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.334, y3),
+            0.067,
+            0.05,
+            facecolor=colors[3],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.408, y3),
+            0.102,
+            0.05,
+            facecolor=colors[4],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.517, y3),
+            0.067,
+            0.05,
+            facecolor=colors[5],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.591, y3),
+            0.067,
+            0.05,
+            facecolor=colors[6],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.665, y3),
+            0.102,
+            0.05,
+            facecolor=colors[7],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.774, y3),
+            0.102,
+            0.05,
+            facecolor=colors[8],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (0.883, y3),
+            0.102,
+            0.05,
+            facecolor=colors[9],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+
+    yText = y3 + 0.06
+    plt.text(
+        0.07,
+        yText,
+        "AC>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.163,
+        yText,
+        "AT>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.255,
+        yText,
+        "CC>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.345,
+        yText,
+        "CG>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.435,
+        yText,
+        "CT>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.527,
+        yText,
+        "GC>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.6,
+        yText,
+        "TA>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.69,
+        yText,
+        "TC>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.8,
+        yText,
+        "TG>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.915,
+        yText,
+        "TT>NN",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+
+    if y <= 4:
+        y += 4
+
+    while y % 4 != 0:
+        y += 1
+    ytick_offest = int(y / 4)
+
+    labs = np.arange(0.44, 78.44, 1)
+    panel1.set_xlim([0, 78])
+    panel1.set_ylim([0, y])
+    panel1.set_xticks(labs)
+    panel1.set_xticklabels(
+        xlabels,
+        rotation="vertical",
+        fontsize=30,
+        color="grey",
+        fontname="Courier New",
+        verticalalignment="top",
+        fontweight="bold",
+    )
+
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=True,
+        left=True,
+        labelleft=True,
+        right=True,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="lightgray",
+        width=2,
+    )
+
+    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+    [i.set_color("grey") for i in plt.gca().get_xticklabels()]
+    return plot1
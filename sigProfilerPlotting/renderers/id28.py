@@ -0,0 +1,575 @@
+"""ID28 plots of plotID and the ID28 plot template."""
+
+import os
+import sys
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    _parse_text_matrix,
+    _pdf_pages,
+    getylabels,
+    make_pickle_file,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    sig_probs = False
+    with open(matrix_path) as f:
+        next(f)
+        first_line = f.readline()
+        first_line = first_line.strip().split()
+        mutation_type = first_line[0]
+        mutation_type_list = mutation_type.split(":")
+        if len(mutation_type_list) != 4:
+            sys.exit(
+                "The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
+            )
+    file_path = os.path.join(output_path, f"ID_simple_plots_{project}.pdf")
+    pp = _pdf_pages(file_path)
+
+    indel_types = [
+        "1:Del:C:1",
+        "1:Del:C:2",
+        "1:Del:C:3",
+        "1:Del:C:4",
+        "1:Del:C:5",
+        "1:Del:C:6" "1:Del:T:1",
+        "1:Del:T:2",
+        "1:Del:T:3",
+        "1:Del:T:4",
+        "1:Del:T:5",
+        "1:Del:T:6" "1:Ins:C:0",
+        "1:Ins:C:1",
+        "1:Ins:C:2",
+        "1:Ins:C:3",
+        "1:Ins:C:4",
+        "1:Ins:C:5",
+        "1:Ins:T:0",
+        "1:Ins:T:1",
+        "1:Ins:T:2",
+        "1:Ins:T:3",
+        "1:Ins:T:4",
+        "1:Ins:T:5",
+        "long_Del",
+        "long_Ins",
+        "MH",
+        "complex",
+    ]
+
+    mutations = OrderedDict()
+
+    try:
+        with _parse_text_matrix(matrix_path) as f:
+            first_line = f.readline()
+            samples = first_line.strip().split("\t")
+            samples = samples[1:]
+            for sample in samples:
+                mutations[sample] = OrderedDict()
+                mutations[sample]["1DelC"] = [0, 0, 0, 0, 0, 0]
+                mutations[sample]["1DelT"] = [0, 0, 0, 0, 0, 0]
+                mutations[sample]["1InsC"] = [0, 0, 0, 0, 0, 0]
+                mutations[sample]["1InsT"] = [0, 0, 0, 0, 0, 0]
+                mutations[sample]["long_Del"] = [0]
+                mutations[sample]["long_Ins"] = [0]
+                mutations[sample]["MH"] = [0]
+                mutations[sample]["complex"] = [0]
+
+            for lines in f:
+                line = lines.strip().split()
+                categories = line[0].split(":")
+                if len(categories) < 2:
+                    mut_type = categories[0]
+                    repeat_size = 0
+                else:
+                    mut_type = categories[0] + categories[1] + categories[2]
+                    repeat_size = int(categories[3])
+                sample_index = 1
+
+                for sample in samples:
+                    # if mut_type in mutations[sample].keys():
+                    if percentage:
+                        mutCount = float(line[sample_index])
+                        if mutCount < 1 and mutCount > 0:
+                            sig_probs = True
+                    else:
+                        try:
+                            mutCount = int(line[sample_index])
+                        except:
+                            print(
+                                "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
+                                end="",
+                            )
+
+                        # mutCount = int(line[sample_index])
+                    mutations[sample][mut_type][repeat_size] = mutCount
+
+                    # else:
+                    #   if percentage:
+                    #       mutCount = float(line[sample_index])
+                    #   else:
+                    #       mutCount = int(line[sample_index])
+                    #   if int(mut_type[0]) > 1:
+                    #       repeat_size = 0
+                    #       if categories[2] == 'M':
+                    #           mut_type = 'MH'
+                    #           mutations[sample][mut_type][repeat_size] += mutCount
+                    #       else:
+                    #           if categories[1] == 'Del':
+                    #               mut_type = 'Del'
+                    #               mutations[sample][mut_type][repeat_size] += mutCount
+                    #           else:
+                    #               mut_type = 'Ins'
+                    #               mutations[sample][mut_type][repeat_size] += mutCount
+
+                    # continue
+                    sample_index += 1
+
+        plt.rcParams["axes.linewidth"] = 2
+        plt.rc("axes", edgecolor="black")
+        plot1 = make_pickle_file(
+            context="ID28", return_plot_template=True, volume=volume
+        )
+        panel1 = plot1.axes[0]
+        bars = panel1.patches[:28]
+        sample_text = panel1.text(
+            0.13,
+            0.85,
+            "",
+            fontsize=40,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=plot1.transFigure,
+        )
+
+        if percentage:
+            panel1.set_ylabel(
+                "Percentage of Indels",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_ylabel(
+                "Number of Indels",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        for sample in mutations:
+            total_count = sum(sum(nuc) for nuc in mutations[sample].values())
+            ymax = 0
+            bar = 0
+            for key in mutations[sample]:
+                for seq in mutations[sample][key]:
+                    if percentage:
+                        if total_count > 0:
+                            height = seq / total_count * 100
+                        else:
+                            height = 0
+                    else:
+                        height = seq
+                    bars[bar].set_height(height)
+                    if height > ymax:
+                        ymax = height
+                    bar += 1
+            y = int(ymax * 1.25)
+
+            if y <= 4:
+                y += 4
+
+            while y % 4 != 0:
+                y += 1
+            ytick_offest = int(y / 4)
+
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            if not percentage:
+                ylabels = getylabels(ylabels)
+
+            panel1.set_ylim([0, y])
+            panel1.set_yticks(ylabs)
+
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample + ": " + "{:,}".format(int(total_count)) + " indels"
+                )
+
+            panel1.set_yticklabels(ylabels, fontsize=30)
+            [i.set_color("black") for i in panel1.get_yticklabels()]
+
+            pp.savefig(plot1)
+        plt.close(plot1)
+        pp.close()
+
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "ID_simple_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
+
+
+def build_template(context):
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(15, 13))
+    plt.rc("axes", edgecolor="black")
+    panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
+    colors = [
+        [253 / 256, 190 / 256, 111 / 256],
+        [255 / 256, 128 / 256, 2 / 256],
+        [176 / 256, 221 / 256, 139 / 256],
+        [54 / 256, 161 / 256, 46 / 256],
+        [23 / 256, 100 / 256, 171 / 256],
+        [98 / 256, 64 / 256, 155 / 256],
+        [98 / 256, 64 / 256, 155 / 256],
+    ]
+
+    # the heights of the bars are set for each sample
+    x = 0.4
+    i = 0
+    for repeats in [6, 6, 6, 6, 1, 1, 1, 1]:
+        for l in range(0, repeats, 1):
+            plt.bar(
+                x,
+                0,
+                width=0.4,
+                color=colors[i],
+                align="center",
+                zorder=1000,
+            )
+            x += 1
+        if i < 4:
+            i += 1
+
+    x = 0.126
+    y_top = 0.9
+    y_bottom = 0.075
+
+    for i in range(0, 4, 1):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y_top),
+                0.154,
+                0.037,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y_bottom),
+                0.154,
+                0.037,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        x += 0.1715
+
+    x -= 0.001
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_top),
+            0.098,
+            0.037,
+            facecolor=colors[i + 1],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_bottom),
+            0.098,
+            0.037,
+            facecolor=colors[i + 1],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+
+    yText = y_top + 0.0055
+    plt.text(
+        0.185,
+        yText,
+        "C",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.36,
+        yText,
+        "T",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.53,
+        yText,
+        "C",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.705,
+        yText,
+        "T",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+
+    yText_labels_top = yText + 0.045
+    yText_labels_bottom = y_bottom - 0.03
+    yText_labels_bottom_sec = yText_labels_bottom - 0.025
+
+    plt.text(
+        0.2,
+        yText_labels_top,
+        "1bp Deletion",
+        fontsize=35,
+        fontname="Times New Roman",
+        weight="bold",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.54,
+        yText_labels_top,
+        "1bp Insertion",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.155,
+        yText_labels_bottom_sec,
+        "Homopolymer Length",
+        fontsize=30,
+        fontname="Times New Roman",
+        weight="bold",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.505,
+        yText_labels_bottom_sec,
+        "Homopolymer Length",
+        fontsize=30,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.827,
+        yText_labels_top,
+        ">1bp",
+        fontsize=30,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.83,
+        yText_labels_bottom_sec,
+        "Type",
+        fontsize=30,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+
+    x = 0.127
+    yText_labels_bottom = y_bottom - 0.025
+
+    for l in range(0, 4, 1):
+        if l < 2:
+            for i in range(1, 6, 1):
+                plt.text(
+                    x,
+                    yText_labels_bottom,
+                    str(i),
+                    fontsize=25,
+                    fontweight="bold",
+                    fontname="Times New Roman",
+                    color="black",
+                    transform=plt.gcf().transFigure,
+                )
+                x += 0.028
+            x -= 0.005
+            plt.text(
+                x,
+                yText_labels_bottom,
+                "6+",
+                fontsize=25,
+                fontweight="bold",
+                fontname="Times New Roman",
+                color="black",
+                transform=plt.gcf().transFigure,
+            )
+            x += 0.037
+        else:
+            if l == 2:
+                x += 0
+            for i in range(0, 5, 1):
+                plt.text(
+                    x,
+                    yText_labels_bottom,
+                    str(i),
+                    fontsize=25,
+                    fontweight="bold",
+                    fontname="Times New Roman",
+                    color="black",
+                    transform=plt.gcf().transFigure,
+                )
+                x += 0.028
+            x -= 0.005
+            plt.text(
+                x,
+                yText_labels_bottom,
+                "5+",
+                fontsize=25,
+                fontweight="bold",
+                fontname="Times New Roman",
+                color="black",
+                transform=plt.gcf().transFigure,
+            )
+            x += 0.037
+
+    yText_labels_bottom += 0.0
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "Del",
+        fontsize=17,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+        rotation="vertical",
+    )
+    x += 0.026
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "Ins",
+        fontsize=17,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+        rotation="vertical",
+    )
+    x += 0.0295
+    yText_labels_bottom -= 0.001
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "MH",
+        fontsize=17,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+        rotation="vertical",
+    )
+    x += 0.0295
+    yText_labels_bottom -= 0.002
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "COMP",
+        fontsize=10,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+        rotation="vertical",
+    )
+
+    panel1.set_xlim([0, 28])
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=False,
+        labelleft=True,
+        right=False,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="gray",
+        width=2,
+    )
+
+    return plot1
@@ -0,0 +1,1091 @@
+"""ID415 plots of plotID and the ID415 plot template."""
+
+import os
+import sys
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    BarCollection,
+    _parse_text_matrix,
+    _pdf_pages,
+    getylabels,
+    make_pickle_file,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    plot_custom_text = False
+    sig_probs = False
+    pcawg = False
+    with open(matrix_path) as f:
+        next(f)
+        first_line = f.readline()
+        first_line = first_line.strip().split("\t")
+        mutation_type = first_line[0]
+        mutation_type_list = mutation_type.split(":")
+        if len(mutation_type_list) != 5:
+            print(mutation_type_list)
+            sys.exit(
+                "The matrix does not match the correct ID-96 format. Please check you formatting and rerun this plotting function."
+            )
+
+    file_path = os.path.join(output_path, f"ID_TSB_plots_{project}.pdf")
+    pp = _pdf_pages(file_path)
+
+    indel_types_tsb = []
+    tsb_I = ["T", "U", "N", "B", "Q"]
+    indel_types = [
+        "1:Del:C:0",
+        "1:Del:C:1",
+        "1:Del:C:2",
+        "1:Del:C:3",
+        "1:Del:C:4",
+        "1:Del:C:5",
+        "1:Del:T:0",
+        "1:Del:T:1",
+        "1:Del:T:2",
+        "1:Del:T:3",
+        "1:Del:T:4",
+        "1:Del:T:5",
+        "1:Ins:C:0",
+        "1:Ins:C:1",
+        "1:Ins:C:2",
+        "1:Ins:C:3",
+        "1:Ins:C:4",
+        "1:Ins:C:5",
+        "1:Ins:T:0",
+        "1:Ins:T:1",
+        "1:Ins:T:2",
+        "1:Ins:T:3",
+        "1:Ins:T:4",
+        "1:Ins:T:5",
+        # >1bp INDELS
+        "2:Del:R:0",
+        "2:Del:R:1",
+        "2:Del:R:2",
+        "2:Del:R:3",
+        "2:Del:R:4",
+        "2:Del:R:5",
+        "3:Del:R:0",
+        "3:Del:R:1",
+        "3:Del:R:2",
+        "3:Del:R:3",
+        "3:Del:R:4",
+        "3:Del:R:5",
+        "4:Del:R:0",
+        "4:Del:R:1",
+        "4:Del:R:2",
+        "4:Del:R:3",
+        "4:Del:R:4",
+        "4:Del:R:5",
+        "5:Del:R:0",
+        "5:Del:R:1",
+        "5:Del:R:2",
+        "5:Del:R:3",
+        "5:Del:R:4",
+        "5:Del:R:5",
+        "2:Ins:R:0",
+        "2:Ins:R:1",
+        "2:Ins:R:2",
+        "2:Ins:R:3",
+        "2:Ins:R:4",
+        "2:Ins:R:5",
+        "3:Ins:R:0",
+        "3:Ins:R:1",
+        "3:Ins:R:2",
+        "3:Ins:R:3",
+        "3:Ins:R:4",
+        "3:Ins:R:5",
+        "4:Ins:R:0",
+        "4:Ins:R:1",
+        "4:Ins:R:2",
+        "4:Ins:R:3",
+        "4:Ins:R:4",
+        "4:Ins:R:5",
+        "5:Ins:R:0",
+        "5:Ins:R:1",
+        "5:Ins:R:2",
+        "5:Ins:R:3",
+        "5:Ins:R:4",
+        "5:Ins:R:5",
+        # MicroHomology INDELS
+        "2:Del:M:1",
+        "3:Del:M:1",
+        "3:Del:M:2",
+        "4:Del:M:1",
+        "4:Del:M:2",
+        "4:Del:M:3",
+        "5:Del:M:1",
+        "5:Del:M:2",
+        "5:Del:M:3",
+        "5:Del:M:4",
+        "5:Del:M:5",
+    ]
+
+    for indels in indel_types:
+        for tsbs in tsb_I:
+            indel_types_tsb.append(tsbs + ":" + indels)
+
+    sig_probs = False
+    mutations = OrderedDict()
+    try:
+        with _parse_text_matrix(matrix_path) as f:
+            first_line = f.readline()
+            if pcawg:
+                samples = first_line.strip().split(",")
+                samples = samples[4:]
+                samples = [x.replace('"', "") for x in samples]
+            else:
+                samples = first_line.strip().split("\t")
+                samples = samples[1:]
+            for sample in samples:
+                mutations[sample] = OrderedDict()
+                mutations[sample]["1DelC"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["1DelT"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["1InsC"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["1InsT"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["2DelR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["3DelR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["4DelR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["5DelR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["2InsR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["3InsR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["3InsR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["4InsR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["5InsR"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+                mutations[sample]["2DelM"] = [[0, 0]]
+                mutations[sample]["3DelM"] = [[0, 0], [0, 0]]
+                mutations[sample]["4DelM"] = [[0, 0], [0, 0], [0, 0]]
+                mutations[sample]["5DelM"] = [
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                    [0, 0],
+                ]
+
+            for lines in f:
+                if pcawg:
+                    line = lines.strip().split(",")
+                    line = [x.replace('"', "") for x in line]
+                    if line[1] == "repeats":
+                        mut_type = (
+                            line[2][0]
+                            + line[0][0]
+                            + line[0][1].lower()
+                            + line[0][2].lower()
+                            + "R"
+                        )
+                    else:
+                        mut_type = (
+                            line[2][0]
+                            + line[0][0]
+                            + line[0][1].lower()
+                            + line[0][2].lower()
+                            + line[1][0]
+                        )
+                    try:
+                        repeat_size = int(line[3])
+                    except:
+                        repeat_size = int(line[3][0])
+                    if line[1] == "MH":
+                        repeat_size -= 1
+                    sample_index = 4
+                else:
+                    line = lines.strip().split()
+                    if line[0] not in indel_types_tsb:
+                        continue
+                    categories = line[0].split(":")
+                    bias = categories[0]
+                    if bias == "B" or bias == "N" or bias == "Q":
+                        continue
+                    mut_type = categories[1] + categories[2] + categories[3]
+
+                    repeat_size = int(categories[4])
+                    if categories[3] == "M":
+                        repeat_size -= 1
+                    sample_index = 1
+
+                for sample in samples:
+                    if mut_type in mutations[sample].keys():
+                        if percentage:
+                            mutCount = float(line[sample_index])
+                            if mutCount < 1 and mutCount > 0:
+                                sig_probs = True
+                        else:
+                            try:
+                                mutCount = int(line[sample_index])
+                            except:
+                                print(
+                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
+                                    end="",
+                                )
+
+                            # mutCount = int(line[sample_index])
+                        if bias == "T":
+                            mutations[sample][mut_type][repeat_size][0] = mutCount
+                        else:
+                            mutations[sample][mut_type][repeat_size][1] = mutCount
+                    else:
+                        continue
+                    sample_index += 1
+
+        sample_count = 0
+        plt.rcParams["axes.linewidth"] = 2
+        plt.rc("axes", edgecolor="black")
+        plot1 = make_pickle_file(
+            context="ID415", return_plot_template=True, volume=volume
+        )
+        panel1 = plot1.axes[0]
+        bar_x = []
+        x = 0.4
+        for i in range(0, 83, 1):
+            bar_x.append(x)
+            x += 0.2
+            bar_x.append(x)
+            x += 0.799
+        bars = BarCollection(
+            panel1,
+            bar_x,
+            0.2,
+            [[1 / 256, 70 / 256, 102 / 256], [228 / 256, 41 / 256, 38 / 256]] * 83,
+            legend_boxes=True,
+        )
+        panel1.legend(
+            handles=bars.legend_handles(
+                "Genic-transcribed Strand", "Genic-untranscribed Strand"
+            ),
+            prop={"size": 30},
+        )
+        sample_text = panel1.text(
+            0.0475,
+            0.75,
+            "",
+            fontsize=60,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=plot1.transFigure,
+        )
+        custom_text = None
+
+        if percentage:
+            panel1.set_ylabel(
+                "Percentage of Indels",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_ylabel(
+                "Number of Indels",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        for sample in mutations.keys():
+            total_count = sum(
+                sum(sum(tsb) for tsb in nuc) for nuc in mutations[sample].values()
+            )
+            # the transcribed and untranscribed bar of each indel, in turn
+            heights = np.array(
+                [
+                    tsb
+                    for nuc in mutations[sample].values()
+                    for seq in nuc
+                    for tsb in seq
+                ],
+                dtype=float,
+            )
+            if percentage:
+                if total_count > 0:
+                    heights = heights / total_count * 100
+                else:
+                    heights = np.zeros(len(heights))
+            bars.set_heights(heights)
+            ymax = max(0, np.max(heights))
+            y = int(ymax * 1.25)
+
+            if y <= 4:
+                y += 4
+
+            while y % 4 != 0:
+                y += 1
+            ytick_offest = int(y / 4)
+
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            if not percentage:
+                ylabels = getylabels(ylabels)
+
+            panel1.set_ylim([0, y])
+            panel1.set_yticks(ylabs)
+
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample + ": " + "{:,}".format(int(total_count)) + " indels"
+                )
+
+            if custom_text is not None:
+                custom_text.remove()
+                custom_text = None
+            custom_text_upper_plot = ""
+            try:
+                custom_text_upper[sample_count]
+            except:
+                custom_text_upper = False
+            try:
+                custom_text_middle[sample_count]
+            except:
+                custom_text_middle = False
+            try:
+                custom_text_bottom[sample_count]
+            except:
+                custom_text_bottom = False
+
+            if custom_text_upper:
+                plot_custom_text = True
+                if len(custom_text_upper[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+            if custom_text_middle:
+                if len(custom_text_middle[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+
+            if plot_custom_text:
+                x_pos_custom = 0.95
+                if custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = (
+                        custom_text_upper[sample_count]
+                        + "\n"
+                        + custom_text_middle[sample_count]
+                    )
+                    if custom_text_bottom:
+                        custom_text_upper_plot += (
+                            "\n" + custom_text_bottom[sample_count]
+                        )
+
+                if custom_text_upper and not custom_text_middle:
+                    custom_text_upper_plot = custom_text_upper[sample_count]
+                    custom_text = panel1.text(
+                        x_pos_custom,
+                        0.78,
+                        custom_text_upper_plot,
+                        fontsize=35,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plot1.transFigure,
+                        ha="right",
+                    )
+
+                elif custom_text_upper and custom_text_middle:
+                    if not custom_text_bottom:
+                        custom_text = panel1.text(
+                            x_pos_custom,
+                            0.72,
+                            custom_text_upper_plot,
+                            fontsize=35,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plot1.transFigure,
+                            ha="right",
+                        )
+                    else:
+                        custom_text = panel1.text(
+                            x_pos_custom,
+                            0.68,
+                            custom_text_upper_plot,
+                            fontsize=35,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plot1.transFigure,
+                            ha="right",
+                        )
+
+                elif not custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = custom_text_middle[sample_count]
+                    custom_text = panel1.text(
+                        x_pos_custom,
+                        0.78,
+                        custom_text_upper_plot,
+                        fontsize=35,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plot1.transFigure,
+                        ha="right",
+                    )
+
+            panel1.set_yticklabels(ylabels, fontsize=30)
+            [i.set_color("black") for i in panel1.get_yticklabels()]
+
+            pp.savefig(plot1)
+            sample_count += 1
+        plt.close(plot1)
+        pp.close()
+
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "ID_TSB_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
+
+
+def build_template(context):
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(43.93, 12))
+    plt.rc("axes", edgecolor="black")
+    panel1 = plt.axes([0.045, 0.17, 0.92, 0.65])
+
+    colors = [
+        [253 / 256, 190 / 256, 111 / 256],
+        [255 / 256, 128 / 256, 2 / 256],
+        [176 / 256, 221 / 256, 139 / 256],
+        [54 / 256, 161 / 256, 46 / 256],
+        [253 / 256, 202 / 256, 181 / 256],
+        [252 / 256, 138 / 256, 106 / 256],
+        [241 / 256, 68 / 256, 50 / 256],
+        [188 / 256, 25 / 256, 26 / 256],
+        [208 / 256, 225 / 256, 242 / 256],
+        [148 / 256, 196 / 256, 223 / 256],
+        [74 / 256, 152 / 256, 201 / 256],
+        [23 / 256, 100 / 256, 171 / 256],
+        [226 / 256, 226 / 256, 239 / 256],
+        [182 / 256, 182 / 256, 216 / 256],
+        [134 / 256, 131 / 256, 189 / 256],
+        [98 / 256, 64 / 256, 155 / 256],
+    ]
+
+    x = 0.0475
+    y_top = 0.827
+    y_bottom = 0.114
+    for i in range(0, 12, 1):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y_top),
+                0.0595,
+                0.05,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y_bottom),
+                0.0595,
+                0.05,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        x += 0.0665
+
+    panel1.add_patch(
+        plt.Rectangle(
+            (x - 0.001, y_top),
+            0.006,
+            0.05,
+            facecolor=colors[12],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x - 0.001, y_bottom),
+            0.006,
+            0.05,
+            facecolor=colors[12],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    x += 0.011
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_top),
+            0.0155,
+            0.05,
+            facecolor=colors[13],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_bottom),
+            0.0155,
+            0.05,
+            facecolor=colors[13],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    x += 0.022
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_top),
+            0.027,
+            0.05,
+            facecolor=colors[14],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_bottom),
+            0.027,
+            0.05,
+            facecolor=colors[14],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    x += 0.0335
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_top),
+            0.049,
+            0.05,
+            facecolor=colors[15],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_bottom),
+            0.049,
+            0.05,
+            facecolor=colors[15],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+
+    yText = y_top + 0.01
+    plt.text(
+        0.072,
+        yText,
+        "C",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.1385,
+        yText,
+        "T",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.205,
+        yText,
+        "C",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.2715,
+        yText,
+        "T",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.338,
+        yText,
+        "2",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.4045,
+        yText,
+        "3",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.471,
+        yText,
+        "4",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.5375,
+        yText,
+        "5+",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.604,
+        yText,
+        "2",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.6705,
+        yText,
+        "3",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.737,
+        yText,
+        "4",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.8035,
+        yText,
+        "5+",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.844,
+        yText,
+        "2",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.861,
+        yText,
+        "3",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.888,
+        yText,
+        "4",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.93,
+        yText,
+        "5+",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+
+    yText_labels_top = yText + 0.075
+    yText_labels_bottom = y_bottom - 0.03
+    yText_labels_bottom_sec = yText_labels_bottom - 0.045
+
+    plt.text(
+        0.08,
+        yText_labels_top,
+        "1bp Deletion",
+        fontsize=40,
+        fontname="Times New Roman",
+        weight="bold",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.21,
+        yText_labels_top,
+        "1bp Insertion",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.375,
+        yText_labels_top,
+        ">1bp Deletion at Repeats\n      (Deletion Length)",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.64,
+        yText_labels_top,
+        ">1bp Insertion at Repeats\n       (Insertion Length)",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.85,
+        yText_labels_top,
+        " Microhomology\n(Deletion Length)",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+
+    plt.text(
+        0.058,
+        yText_labels_bottom_sec,
+        "Homopolymer Length",
+        fontsize=35,
+        fontname="Times New Roman",
+        weight="bold",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.19,
+        yText_labels_bottom_sec,
+        "Homopolymer Length",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.39,
+        yText_labels_bottom_sec,
+        "Number of Repeat Units",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.65,
+        yText_labels_bottom_sec,
+        "Number of Repeat Units",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.85,
+        yText_labels_bottom_sec,
+        "Microhomology Length",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+
+    x = 0.0477
+    for i in range(0, 8, 1):
+        if i != 2 and i != 3:
+            plt.text(
+                x,
+                yText_labels_bottom,
+                "1  2  3  4  5  6+",
+                fontsize=32,
+                fontweight="bold",
+                fontname="Times New Roman",
+                color="black",
+                transform=plt.gcf().transFigure,
+            )
+        else:
+            plt.text(
+                x,
+                yText_labels_bottom,
+                "0  1  2  3  4  5+",
+                fontsize=32,
+                fontweight="bold",
+                fontname="Times New Roman",
+                color="black",
+                transform=plt.gcf().transFigure,
+            )
+
+        x += 0.0665
+
+    for i in range(0, 4, 1):
+        plt.text(
+            x,
+            yText_labels_bottom,
+            "0  1  2  3  4  5+",
+            fontsize=32,
+            fontweight="bold",
+            fontname="Times New Roman",
+            color="black",
+            transform=plt.gcf().transFigure,
+        )
+        x += 0.0665
+
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    x += 0.011
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1  2",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    x += 0.022
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1  2  3",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    x += 0.0335
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1  2  3  4  5+",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+
+    labs = np.arange(0.375, 83.375, 1)
+    panel1.set_xlim([0, 83])
+    panel1.set_xticks(labs)
+
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=False,
+        labelleft=True,
+        right=False,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="gray",
+        width=2,
+    )
+
+    return plot1
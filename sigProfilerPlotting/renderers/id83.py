@@ -0,0 +1,829 @@
+"""ID83 plots of plotID and the ID83 plot template."""
+
+import copy
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    BarCollection,
+    FigureWriter,
+    getylabels,
+    make_pickle_file,
+    process_input,
+    profile_keys,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    plot_custom_text = False
+    sig_probs = False
+    data = process_input(matrix_path, plot_type)
+
+    try:
+        sample_count = 0
+        writer = FigureWriter(savefig_format, output_path, project, "ID_83", dpi=dpi)
+        fig = make_pickle_file(context="ID83", return_plot_template=True, volume=volume)
+        panel1 = fig.axes[0]
+        colors = [
+            [253 / 256, 190 / 256, 111 / 256],
+            [255 / 256, 128 / 256, 2 / 256],
+            [176 / 256, 221 / 256, 139 / 256],
+            [54 / 256, 161 / 256, 46 / 256],
+            [253 / 256, 202 / 256, 181 / 256],
+            [252 / 256, 138 / 256, 106 / 256],
+            [241 / 256, 68 / 256, 50 / 256],
+            [188 / 256, 25 / 256, 26 / 256],
+            [208 / 256, 225 / 256, 242 / 256],
+            [148 / 256, 196 / 256, 223 / 256],
+            [74 / 256, 152 / 256, 201 / 256],
+            [23 / 256, 100 / 256, 171 / 256],
+            [226 / 256, 226 / 256, 239 / 256],
+            [182 / 256, 182 / 256, 216 / 256],
+            [134 / 256, 131 / 256, 189 / 256],
+            [98 / 256, 64 / 256, 155 / 256],
+        ]
+        ctx = data.index
+        xlabels = [
+            i.split(":")[0] + i.split(":")[1] + i.split(":")[2] for i in ctx.to_list()
+        ]
+        xlables_set = [
+            "1DelC",
+            "1DelT",
+            "1InsC",
+            "1InsT",
+            "2DelR",
+            "3DelR",
+            "4DelR",
+            "5DelR",
+            "2InsR",
+            "3InsR",
+            "4InsR",
+            "5InsR",
+            "2DelM",
+            "3DelM",
+            "4DelM",
+            "5DelM",
+        ]
+        colors_idx = copy.deepcopy(xlabels)
+        for ii in range(0, len(xlables_set)):
+            colors_idx = [ii if x == xlables_set[ii] else x for x in colors_idx]
+
+        colors_flat_list = [colors[i] for i in colors_idx]
+
+        # the bars and text of the template are created once and updated
+        # for every sample instead of being drawn on a new figure
+        bars = BarCollection(panel1, np.arange(len(ctx)) + 0.4, 0.4, colors_flat_list)
+        sample_text = panel1.text(
+            0.0475,
+            0.75,
+            "",
+            fontsize=60,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=fig.transFigure,
+        )
+        custom_text = panel1.text(
+            0.95,
+            0.78,
+            "",
+            fontsize=35,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=fig.transFigure,
+            ha="right",
+        )
+
+        labs = np.arange(0.375, 83.375, 1)
+        panel1.set_xlim([0, 83])
+        panel1.set_xticks(labs)
+        panel1.yaxis.grid(True)
+        panel1.grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
+        panel1.set_xlabel("")
+
+        if percentage:
+            panel1.set_ylabel(
+                "Percentage of Indels",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_ylabel(
+                "Number of Indels",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        panel1.tick_params(
+            axis="both",
+            which="both",
+            bottom=False,
+            labelbottom=False,
+            left=False,
+            labelleft=True,
+            right=False,
+            labelright=False,
+            top=False,
+            labeltop=False,
+            direction="in",
+            length=25,
+            colors="gray",
+            width=2,
+        )
+
+        writer.set_raster_background(
+            fig,
+            [
+                panel1.yaxis,
+                *panel1.spines.values(),
+                sample_text,
+                custom_text,
+                bars.collection,
+            ],
+            cache_key=("ID83", volume),
+            label_artists=[sample_text, custom_text],
+        )
+        profiles = profile_keys(data)
+        for sample in data.columns:  # mutations.keys():
+            muts = data[sample].values
+            total_count = np.sum(muts)
+            x = 0.4
+
+            heights = np.zeros(len(ctx))
+            if percentage:
+                if total_count > 0:
+                    heights = muts / total_count * 100
+                    ymax = np.max(heights)
+                sig_probs = True
+            else:
+                heights = muts
+                ymax = np.max(muts)
+            bars.set_heights(heights)
+
+            x = 0.0475
+            y_top = 0.827
+            y_bottom = 0.114
+            y = int(ymax * 1.25)
+            y2 = y + 2
+
+            if y <= 4:
+                y += 4
+
+            while y % 4 != 0:
+                y += 1
+            ytick_offest = int(y / 4)
+
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            if not percentage:
+                ylabels = getylabels(ylabels)
+
+            panel1.set_ylim([0, y])
+            panel1.set_yticks(ylabs)
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample + ": " + "{:,}".format(int(total_count)) + " indels"
+                )
+
+            custom_text_upper_plot = ""
+            custom_text.set_text("")
+            try:
+                custom_text_upper[sample_count]
+            except:
+                custom_text_upper = False
+            try:
+                custom_text_middle[sample_count]
+            except:
+                custom_text_middle = False
+            try:
+                custom_text_bottom[sample_count]
+            except:
+                custom_text_bottom = False
+
+            if custom_text_upper:
+                plot_custom_text = True
+                if len(custom_text_upper[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+            if custom_text_middle:
+                if len(custom_text_middle[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+
+            if plot_custom_text:
+                x_pos_custom = 0.95
+                if custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = (
+                        custom_text_upper[sample_count]
+                        + "\n"
+                        + custom_text_middle[sample_count]
+                    )
+                    if custom_text_bottom:
+                        custom_text_upper_plot += (
+                            "\n" + custom_text_bottom[sample_count]
+                        )
+
+                if custom_text_upper and not custom_text_middle:
+                    custom_text_upper_plot = custom_text_upper[sample_count]
+                    custom_text.set_text(custom_text_upper_plot)
+                    custom_text.set_y(0.78)
+
+                elif custom_text_upper and custom_text_middle:
+                    if not custom_text_bottom:
+                        custom_text.set_text(custom_text_upper_plot)
+                        custom_text.set_y(0.72)
+                    else:
+                        custom_text.set_text(custom_text_upper_plot)
+                        custom_text.set_y(0.68)
+
+                elif not custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = custom_text_middle[sample_count]
+                    custom_text.set_text(custom_text_upper_plot)
+                    custom_text.set_y(0.78)
+
+            panel1.set_yticklabels(ylabels, fontsize=30)
+            [i.set_color("black") for i in panel1.get_yticklabels()]
+            writer.write(sample, fig, profile=profiles[sample_count])
+            sample_count += 1
+
+        plt.close(fig)
+        return writer.close()
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "ID_83_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
+
+
+def build_template(context):
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(43.93, 12))
+    plt.rc("axes", edgecolor="black")
+    panel1 = plt.axes([0.045, 0.17, 0.92, 0.65])
+    xlabels = []
+
+    x = 0.4
+    ymax = 0
+    colors = [
+        [253 / 256, 190 / 256, 111 / 256],
+        [255 / 256, 128 / 256, 2 / 256],
+        [176 / 256, 221 / 256, 139 / 256],
+        [54 / 256, 161 / 256, 46 / 256],
+        [253 / 256, 202 / 256, 181 / 256],
+        [252 / 256, 138 / 256, 106 / 256],
+        [241 / 256, 68 / 256, 50 / 256],
+        [188 / 256, 25 / 256, 26 / 256],
+        [208 / 256, 225 / 256, 242 / 256],
+        [148 / 256, 196 / 256, 223 / 256],
+        [74 / 256, 152 / 256, 201 / 256],
+        [23 / 256, 100 / 256, 171 / 256],
+        [226 / 256, 226 / 256, 239 / 256],
+        [182 / 256, 182 / 256, 216 / 256],
+        [134 / 256, 131 / 256, 189 / 256],
+        [98 / 256, 64 / 256, 155 / 256],
+    ]
+
+    x = 0.0475
+    y_top = 0.827
+    y_bottom = 0.114
+    y = int(ymax * 1.25)
+    y2 = y + 2
+    for i in range(0, 12, 1):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y_top),
+                0.0595,
+                0.05,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y_bottom),
+                0.0595,
+                0.05,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        x += 0.0665
+
+    panel1.add_patch(
+        plt.Rectangle(
+            (x - 0.001, y_top),
+            0.006,
+            0.05,
+            facecolor=colors[12],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x - 0.001, y_bottom),
+            0.006,
+            0.05,
+            facecolor=colors[12],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    x += 0.011
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_top),
+            0.0155,
+            0.05,
+            facecolor=colors[13],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_bottom),
+            0.0155,
+            0.05,
+            facecolor=colors[13],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    x += 0.022
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_top),
+            0.027,
+            0.05,
+            facecolor=colors[14],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_bottom),
+            0.027,
+            0.05,
+            facecolor=colors[14],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    x += 0.0335
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_top),
+            0.049,
+            0.05,
+            facecolor=colors[15],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+    panel1.add_patch(
+        plt.Rectangle(
+            (x, y_bottom),
+            0.049,
+            0.05,
+            facecolor=colors[15],
+            clip_on=False,
+            transform=plt.gcf().transFigure,
+        )
+    )
+
+    yText = y_top + 0.01
+    plt.text(
+        0.072,
+        yText,
+        "C",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.1385,
+        yText,
+        "T",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.205,
+        yText,
+        "C",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.2715,
+        yText,
+        "T",
+        fontsize=40,
+        fontname="Times New Roman",
+        fontweight="bold",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.338,
+        yText,
+        "2",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.4045,
+        yText,
+        "3",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.471,
+        yText,
+        "4",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.5375,
+        yText,
+        "5+",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.604,
+        yText,
+        "2",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.6705,
+        yText,
+        "3",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.737,
+        yText,
+        "4",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.8035,
+        yText,
+        "5+",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.844,
+        yText,
+        "2",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.861,
+        yText,
+        "3",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.888,
+        yText,
+        "4",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.93,
+        yText,
+        "5+",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="white",
+        transform=plt.gcf().transFigure,
+    )
+
+    yText_labels_top = yText + 0.075
+    yText_labels_bottom = y_bottom - 0.03
+    yText_labels_bottom_sec = yText_labels_bottom - 0.045
+
+    plt.text(
+        0.08,
+        yText_labels_top,
+        "1bp Deletion",
+        fontsize=40,
+        fontname="Times New Roman",
+        weight="bold",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.21,
+        yText_labels_top,
+        "1bp Insertion",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.375,
+        yText_labels_top,
+        ">1bp Deletion at Repeats\n      (Deletion Length)",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.64,
+        yText_labels_top,
+        ">1bp Insertion at Repeats\n       (Insertion Length)",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.85,
+        yText_labels_top,
+        " Microhomology\n(Deletion Length)",
+        fontsize=40,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+
+    plt.text(
+        0.058,
+        yText_labels_bottom_sec,
+        "Homopolymer Length",
+        fontsize=35,
+        fontname="Times New Roman",
+        weight="bold",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.19,
+        yText_labels_bottom_sec,
+        "Homopolymer Length",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.39,
+        yText_labels_bottom_sec,
+        "Number of Repeat Units",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.65,
+        yText_labels_bottom_sec,
+        "Number of Repeat Units",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.85,
+        yText_labels_bottom_sec,
+        "Microhomology Length",
+        fontsize=35,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+
+    x = 0.0477
+    for i in range(0, 8, 1):
+        if i != 2 and i != 3:
+            plt.text(
+                x,
+                yText_labels_bottom,
+                "1  2  3  4  5  6+",
+                fontsize=32,
+                fontweight="bold",
+                fontname="Times New Roman",
+                color="black",
+                transform=plt.gcf().transFigure,
+            )
+        else:
+            plt.text(
+                x,
+                yText_labels_bottom,
+                "0  1  2  3  4  5+",
+                fontsize=32,
+                fontweight="bold",
+                fontname="Times New Roman",
+                color="black",
+                transform=plt.gcf().transFigure,
+            )
+
+        x += 0.0665
+
+    for i in range(0, 4, 1):
+        plt.text(
+            x,
+            yText_labels_bottom,
+            "0  1  2  3  4  5+",
+            fontsize=32,
+            fontweight="bold",
+            fontname="Times New Roman",
+            color="black",
+            transform=plt.gcf().transFigure,
+        )
+        x += 0.0665
+
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    x += 0.011
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1  2",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    x += 0.022
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1  2  3",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+    x += 0.0335
+    plt.text(
+        x,
+        yText_labels_bottom,
+        "1  2  3  4  5+",
+        fontsize=32,
+        fontweight="bold",
+        fontname="Times New Roman",
+        color="black",
+        transform=plt.gcf().transFigure,
+    )
+
+    labs = np.arange(0.375, 83.375, 1)
+    panel1.set_xlim([0, 83])
+    panel1.set_ylim([0, y])
+    panel1.set_xticks(labs)
+
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=False,
+        labelleft=True,
+        right=False,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="gray",
+        width=2,
+    )
+
+    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+
+    return plot1
@@ -0,0 +1,755 @@
+"""SBS1536 plots of plotSBS and the SBS1536 plot template."""
+
+import os
+import sys
+
+import matplotlib.patches as mplpatches
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    _pdf_pages,
+    getylabels,
+    load_matrix,
+    make_pickle_file,
+)
+
+CLASSES = ["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"]
+FLANKS = [five + three for five in "TGCA" for three in "TGCA"]
+
+# Colors of the five count levels of the heatmaps
+HEAT_COLORS = np.array(
+    [
+        np.linspace(56 / 255, 255 / 255, 5),
+        np.linspace(66 / 255, 225 / 255, 5),
+        np.linspace(157 / 255, 40 / 255, 5),
+    ]
+).T
+
+_CELL_CODES = [Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY]
+
+
+def pentanucleotide_counts(labels, values):
+    """
+    Sums the rows of an SBS1536 matrix into the cells of the SBS1536 plot.
+
+    Parameters:
+        labels: pandas Index of SBS1536 labels (ie. AA[C>A]AA)
+        values: array with one row per label and one column per sample
+
+    Returns:
+        tris: the trinucleotide flanks in the order of the input rows
+        counts: the pentanucleotide counts, with shape
+            (samples, substitutions, 5' and 3' flanks, trinucleotide flanks)
+        counts_96: the trinucleotide counts, with shape
+            (samples, substitutions, trinucleotide flanks)
+        counts_5: the counts of each outer 5' base, with shape
+            (samples, substitutions, 5' bases, trinucleotide flanks)
+        counts_3: the counts of each outer 3' base, shaped like counts_5
+    """
+    tris = list(dict.fromkeys(labels.str[1] + labels.str[-2]))
+    class_index = {mut_type: i for i, mut_type in enumerate(CLASSES)}
+    flank_index = {flank: i for i, flank in enumerate(FLANKS)}
+    tri_index = {tri: i for i, tri in enumerate(tris)}
+    rows = (
+        [class_index[mut_type] for mut_type in labels.str[3:6]],
+        [flank_index[flank] for flank in labels.str[0] + labels.str[-1]],
+        [tri_index[tri] for tri in labels.str[1] + labels.str[-2]],
+    )
+    samples = values.shape[1]
+    counts = np.zeros((len(CLASSES), len(FLANKS), len(tris), samples), values.dtype)
+    counts_96 = np.zeros((len(CLASSES), len(tris), samples), values.dtype)
+    # the rows are added in input order, and rows of the same context (ie. the
+    # strands of an SBS4608 matrix) add up
+    np.add.at(counts, rows, values)
+    np.add.at(counts_96, rows[::2], values)
+    counts = counts.transpose(3, 0, 1, 2)
+    by_flank = counts.reshape(samples, len(CLASSES), 4, 4, len(tris))
+    return (
+        tris,
+        counts,
+        counts_96.transpose(2, 0, 1),
+        by_flank.sum(axis=3),
+        by_flank.sum(axis=2),
+    )
+
+
+def heatmap_cells(rows):
+    """
+    Returns the lower left corners of the cells of a heatmap with rows rows
+    per substitution class, from the top row of C>A to the bottom row of T>G.
+    The cells of a class are 16 columns wide, with one empty column between
+    classes.
+    """
+    return np.array(
+        [
+            (x_pos, y_pos)
+            for i in range(len(CLASSES))
+            for y_pos in range(rows - 1, -1, -1)
+            for x_pos in range(i * 17, i * 17 + 16)
+        ],
+        dtype=float,
+    )
+
+
+def heat_levels(counts, total_count_sample, ratio):
+    """
+    Returns the color level of the heatmap cell of each count: the count
+    relative to the largest count (ratio * total_count_sample), in fifths.
+    Counts that cannot be scaled (ie. NaN) are level 0.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scaled = np.round(
+            np.asarray(counts, dtype=float) / total_count_sample / ratio * 100
+        )
+    levels = np.trunc(np.where(np.isfinite(scaled), scaled, 0) / 20).astype(int)
+    # levels index the colors as a list does
+    return levels % len(HEAT_COLORS)
+
+
+def heatmap_paths(cells, levels):
+    """
+    Returns one path per color level that covers the unit cells, given by
+    their lower left corners, of that level.
+    """
+    corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=float)
+    paths = []
+    for level in range(len(HEAT_COLORS)):
+        level_cells = cells[levels == level]
+        vertices = (level_cells[:, None, :] + corners).reshape(-1, 2)
+        paths.append(Path(vertices, _CELL_CODES * len(level_cells)))
+    return paths
+
+
+def heatmap(panel, paths):
+    """
+    Adds a heatmap, drawn as one filled path per color level, to panel.
+    The paths are snapped to the pixel grid like the edges of rectangles.
+    """
+    collection = PathCollection(
+        paths,
+        facecolors=HEAT_COLORS,
+        edgecolors="none",
+        linewidths=0,
+        snap=True,
+        transform=panel.transData,
+    )
+    panel.add_collection(collection, autolim=False)
+    return collection
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    plot_custom_text = False
+    data = load_matrix(matrix_path, plot_type, percentage)
+    label = data.index[0]
+    if len(label) < 7 or label[6] != "]":
+        sys.exit(
+            "The matrix does not match the correct SBS1536 format. Please check you formatting and rerun this plotting function."
+        )
+
+    file_path = os.path.join(output_path, f"SBS_1536_plots_{project}.pdf")
+    pp = _pdf_pages(file_path)
+
+    values = data.to_numpy()
+    tris, counts, counts_96, counts_5, counts_3 = pentanucleotide_counts(
+        data.index, values
+    )
+    sig_probs = percentage and bool(((values > 0) & (values < 1)).any())
+
+    try:
+        sample_count = 0
+        plt.rcParams["axes.linewidth"] = 2
+        plt.rc("axes", edgecolor="lightgray")
+        plot1 = make_pickle_file(
+            context="SBS1536", return_plot_template=True, volume=volume
+        )
+        panel1, panel2, panel3, panel4 = plot1.axes
+        colors = [
+            [3 / 256, 189 / 256, 239 / 256],
+            [1 / 256, 1 / 256, 1 / 256],
+            [228 / 256, 41 / 256, 38 / 256],
+            [203 / 256, 202 / 256, 202 / 256],
+            [162 / 256, 207 / 256, 99 / 256],
+            [236 / 256, 199 / 256, 197 / 256],
+        ]
+        heatmap_1536 = panel1.collections[0]
+        heatmap_3 = panel3.collections[0]
+        heatmap_5 = panel4.collections[0]
+        cells = heatmap_cells(len(FLANKS))
+        cells_flank = heatmap_cells(4)
+        # the scale numbers of the bottom, top and middle heatmaps
+        scale_labels = [text for text in panel4.texts if text.get_text() == ""]
+
+        xlabels = [tri[0] + "-" + tri[1] for tri in tris] * len(FLANKS) * len(CLASSES)
+        bars = []
+        x = 0.5
+        for i in range(len(CLASSES)):
+            for _ in tris:
+                bar = panel2.bar(
+                    x,
+                    0,
+                    width=0.5,
+                    color=colors[i],
+                    align="center",
+                    zorder=1000,
+                )
+                bars.append(bar[0])
+                x += 1
+            x += 1
+
+        m = 0
+        count = 0
+        x_letter = 0
+        for i in range(0, 96, 1):
+            # Bottom and top labels
+            for y_letter in (0.04, 0.64):
+                panel4.text(
+                    x_letter / 101 + 0.032,
+                    y_letter,
+                    xlabels[i][0],
+                    fontsize=25,
+                    color="black",
+                    rotation="vertical",
+                    verticalalignment="center",
+                    fontname="Courier New",
+                    transform=plot1.transFigure,
+                )
+                panel4.text(
+                    x_letter / 101 + 0.032,
+                    y_letter + 0.01,
+                    xlabels[i][1],
+                    fontsize=25,
+                    color="black",
+                    rotation="vertical",
+                    verticalalignment="center",
+                    fontname="Courier New",
+                    fontweight="bold",
+                    transform=plot1.transFigure,
+                )
+                panel4.text(
+                    x_letter / 101 + 0.032,
+                    y_letter + 0.02,
+                    xlabels[i][2],
+                    fontsize=25,
+                    color="black",
+                    rotation="vertical",
+                    verticalalignment="center",
+                    fontname="Courier New",
+                    transform=plot1.transFigure,
+                )
+            count += 1
+            x_letter += 0.92
+            if (i + 1) % 16 == 0 and i != 0:
+                x_letter += 0.92
+            if count == 16:
+                count = 0
+                m += 1
+
+        sample_text = panel2.text(
+            0.04,
+            0.875,
+            "",
+            fontsize=60,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=plot1.transFigure,
+        )
+        custom_text = None
+
+        if percentage:
+            panel2.set_ylabel(
+                "Percentage of Single Base Substitutions",
+                fontsize=28,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel2.set_ylabel(
+                "Number of Single Base Substitutions",
+                fontsize=28,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        for sample, sample_counts, sample_5, sample_3, sample_96 in zip(
+            data.columns,
+            counts.reshape(len(data.columns), -1).tolist(),
+            counts_5.reshape(len(data.columns), -1).tolist(),
+            counts_3.reshape(len(data.columns), -1).tolist(),
+            counts_96.tolist(),
+        ):
+            total_count_sample = sum(sum(tris) for tris in sample_96)
+            if total_count_sample == 0:
+                continue
+            total_count = max(0, *sample_counts) * 1.1
+            ratio = total_count / total_count_sample
+
+            # Color the 1536 matrix
+            heatmap_1536.set_paths(
+                heatmap_paths(
+                    cells, heat_levels(sample_counts, total_count_sample, ratio)
+                )
+            )
+
+            # Color the 5' and 3' context matrices
+            total_count_5 = max(0, *sample_5) * 1.1
+            total_count_3 = max(0, *sample_3) * 1.1
+            ratio_5 = total_count_5 / total_count_sample
+            ratio_3 = total_count_3 / total_count_sample
+            ratio_total = max(ratio_5, ratio_3)
+            heatmap_5.set_paths(
+                heatmap_paths(
+                    cells_flank,
+                    heat_levels(sample_5, total_count_sample, ratio_total),
+                )
+            )
+            heatmap_3.set_paths(
+                heatmap_paths(
+                    cells_flank,
+                    heat_levels(sample_3, total_count_sample, ratio_total),
+                )
+            )
+
+            # Update the 96 bar plot
+            ymax = 0
+            for bar, count in zip(
+                bars, (count for tris in sample_96 for count in tris)
+            ):
+                if percentage:
+                    height = count / total_count_sample * 100
+                else:
+                    height = count
+                bar.set_height(height)
+                if height > ymax:
+                    ymax = height
+
+            for scale_label, value in zip(
+                scale_labels,
+                [ratio / 2, ratio] + [ratio_total / 2, ratio_total] * 2,
+            ):
+                scale_label.set_text(str(value)[:5])
+
+            # Set up the parameters for the yscale ticks and labels
+            y = ymax / 1.025
+            ytick_offest = float(y / 3)
+
+            ylabels_96 = []
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels_96 = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels_96 = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            # Adjust fontsize if required due to large numbers on y-axis
+            font_label_size = 25
+            if not percentage:
+                if int(ylabels_96[3]) >= 1000:
+                    font_label_size = 20
+
+            if percentage:
+                if len(ylabels_96) > 2:
+                    font_label_size = 20
+
+            if not percentage:
+                ylabels_96 = getylabels(ylabels_96)
+
+            # the bar plot is autoscaled to the sample and then widened to its ticks
+            panel2.relim()
+            panel2.autoscale_view(scalex=False)
+            panel2.set_yticks(ylabs)
+
+            # Set up all parameters for custom text in upper righthand corner
+            if custom_text is not None:
+                custom_text.remove()
+                custom_text = None
+            custom_text_upper_plot = ""
+            try:
+                custom_text_upper[sample_count]
+            except:
+                custom_text_upper = False
+            try:
+                custom_text_middle[sample_count]
+            except:
+                custom_text_middle = False
+            try:
+                custom_text_bottom[sample_count]
+            except:
+                custom_text_bottom = False
+
+            if custom_text_upper:
+                plot_custom_text = True
+                if len(custom_text_upper[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+            if custom_text_middle:
+                if len(custom_text_middle[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+
+            if plot_custom_text:
+                x_pos_custom = 0.94
+                if custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = (
+                        custom_text_upper[sample_count]
+                        + "\n"
+                        + custom_text_middle[sample_count]
+                    )
+                    if custom_text_bottom:
+                        custom_text_upper_plot += (
+                            "\n" + custom_text_bottom[sample_count]
+                        )
+
+                if custom_text_upper and not custom_text_middle:
+                    custom_text_upper_plot = custom_text_upper[sample_count]
+                    custom_text = panel2.text(
+                        x_pos_custom,
+                        0.78,
+                        custom_text_upper_plot,
+                        fontsize=40,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plot1.transFigure,
+                        ha="right",
+                    )
+
+                elif custom_text_upper and custom_text_middle:
+                    if not custom_text_bottom:
+                        custom_text = panel2.text(
+                            x_pos_custom,
+                            0.86,
+                            custom_text_upper_plot,
+                            fontsize=40,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plot1.transFigure,
+                            ha="right",
+                        )
+                    else:
+                        custom_text = panel2.text(
+                            x_pos_custom,
+                            0.835,
+                            custom_text_upper_plot,
+                            fontsize=40,
+                            weight="bold",
+                            color="black",
+                            fontname="Arial",
+                            transform=plot1.transFigure,
+                            ha="right",
+                        )
+
+                elif not custom_text_upper and custom_text_middle:
+                    custom_text_upper_plot = custom_text_middle[sample_count]
+                    custom_text = panel2.text(
+                        x_pos_custom,
+                        0.78,
+                        custom_text_upper_plot,
+                        fontsize=40,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plot1.transFigure,
+                        ha="right",
+                    )
+
+            # Plot the sample name in upper left corner of plot
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample + ": " + "{:,}".format(int(total_count_sample)) + " subs"
+                )
+
+            # Change axis depending if percentage parameter is selected
+            if percentage:
+                panel2.set_yticklabels(
+                    ylabels_96, fontsize=font_label_size - 1, color="black"
+                )
+            else:
+                panel2.set_yticklabels(
+                    ylabels_96, fontsize=font_label_size, color="black"
+                )
+
+            pp.savefig(plot1)
+            sample_count += 1
+        plt.close(plot1)
+        pp.close()
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "SBS_1536_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
+
+
+def build_template(context):
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(43.93, 22.5))
+    plt.rc("axes", edgecolor="lightgray")
+    panel1 = plt.axes([0.03, 0.0677, 0.92, 0.267])  # 1536 context panel
+    panel2 = plt.axes([0.03, 0.67, 0.92, 0.247])  # 96 context panel
+    panel3 = plt.axes([0.03, 0.35, 0.92, 0.1335])  # 3' context
+    panel4 = plt.axes([0.03, 0.5, 0.92, 0.1335])  # 5' context
+
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [1 / 256, 1 / 256, 1 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [203 / 256, 202 / 256, 202 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [236 / 256, 199 / 256, 197 / 256],
+    ]
+    colors_heat = [
+        np.linspace(56 / 255, 255 / 255, 5),
+        np.linspace(66 / 255, 225 / 255, 5),
+        np.linspace(157 / 255, 40 / 255, 5),
+    ]
+    pentas = [
+        five + three for five in ["T", "G", "C", "A"] for three in ["T", "G", "C", "A"]
+    ]
+
+    # the heatmap paths are replaced for each sample
+    heatmap(panel1, heatmap_paths(heatmap_cells(16), np.zeros(1536, dtype=int)))
+    for panel in (panel4, panel3):
+        heatmap(panel, heatmap_paths(heatmap_cells(4), np.zeros(384, dtype=int)))
+
+    # scale bars for the bottom, top and middle heatmaps
+    for y_start, height in ((0.0677, 0.267), (0.5, 0.1335), (0.35, 0.1335)):
+        y_grad = height / len(colors_heat[0])
+        for l in range(0, len(colors_heat[0]), 1):
+            rectangle = mplpatches.Rectangle(
+                (0.96, y_start),
+                0.02,
+                y_grad,
+                linewidth=1,
+                facecolor=(
+                    colors_heat[0][l],
+                    colors_heat[1][l],
+                    colors_heat[2][l],
+                ),
+                transform=plt.gcf().transFigure,
+                clip_on=False,
+                edgecolor=(
+                    colors_heat[0][l],
+                    colors_heat[1][l],
+                    colors_heat[2][l],
+                ),
+            )
+            panel1.add_patch(rectangle)
+            y_start += y_grad
+
+    # scale numbers; the empty ones are set for each sample
+    for y_pos, fontsize, label in (
+        (0.0677, 15, "0"),
+        (0.2012, 15, ""),
+        (0.325, 15, ""),
+        (0.5, 20, "0"),
+        (0.56675, 15, ""),
+        (0.625, 15, ""),
+        (0.35, 20, "0"),
+        (0.41675, 15, ""),
+        (0.475, 15, ""),
+    ):
+        plt.text(
+            0.9825,
+            y_pos,
+            label,
+            fontsize=fontsize,
+            fontweight="bold",
+            transform=plt.gcf().transFigure,
+        )
+
+    x = 0.033
+    y3 = 0.92
+    for i in range(0, 6, 1):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y3),
+                0.143,
+                0.03,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        x += 0.154
+
+    # Plot the labels for above the SBS96 bar plot
+    yText = 0.96
+    for x, label in (
+        (0.085, "C>A"),
+        (0.24, "C>G"),
+        (0.395, "C>T"),
+        (0.552, "T>A"),
+        (0.705, "T>C"),
+        (0.86, "T>G"),
+    ):
+        plt.text(
+            x,
+            yText,
+            label,
+            fontsize=55,
+            fontweight="bold",
+            fontname="Arial",
+            transform=plt.gcf().transFigure,
+        )
+
+    panel1.set_xlim([0, 101])
+    panel1.set_ylim([0, 16])
+    panel2.set_xlim([0, 101])
+    panel1.set_yticks([])
+    panel1.set_xticks([])
+    panel2.set_xticks([])
+    panel4.set_xlim([0, 101])
+    panel4.set_ylim([0, 4])
+    panel3.set_xlim([0, 101])
+    panel3.set_ylim([0, 4])
+    panel4.set_yticks([])
+    panel3.set_yticks([])
+    panel3.set_xticks([])
+    panel4.set_xticks([])
+
+    # y-axis labels of the bottom, top and middle heatmaps
+    for y_letter, y_step, ylabels in (
+        (5.2, 0.2675, [penta[0] + "---" + penta[1] for penta in pentas]),
+        (9.85, 0.53, [five + "---N" for five in ["T", "G", "C", "A"]]),
+        (7.45, 0.53, ["N---" + three for three in ["T", "G", "C", "A"]]),
+    ):
+        for ylabel in ylabels:
+            plt.text(
+                0.003,
+                y_letter / 16,
+                ylabel[0],
+                fontsize=25,
+                color="black",
+                verticalalignment="center",
+                fontname="Courier New",
+                transform=plt.gcf().transFigure,
+            )
+            plt.text(
+                0.008,
+                y_letter / 16 + 0,
+                ylabel[1:4],
+                fontsize=25,
+                color="black",
+                verticalalignment="center",
+                fontname="Courier New",
+                fontweight="bold",
+                transform=plt.gcf().transFigure,
+            )
+            plt.text(
+                0.022,
+                y_letter / 16 + 0,
+                ylabel[4],
+                fontsize=25,
+                color="black",
+                verticalalignment="center",
+                fontname="Courier New",
+                transform=plt.gcf().transFigure,
+            )
+            y_letter -= y_step
+
+    panel2.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+    panel1.set_yticklabels([])
+    panel1.set_xticklabels([])
+    panel2.set_xticklabels([])
+
+    panel1.axis("off")
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=False,
+        labelleft=False,
+        right=False,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="white",
+        width=2,
+    )
+    panel2.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=True,
+        labelleft=True,
+        right=True,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="white",
+        width=2,
+    )
+    for panel in (panel3, panel4):
+        panel.axis("off")
+        panel.tick_params(
+            axis="both",
+            which="both",
+            bottom=False,
+            labelbottom=False,
+            left=False,
+            labelleft=False,
+            right=True,
+            labelright=False,
+            top=False,
+            labeltop=False,
+            direction="in",
+            length=25,
+            colors="white",
+            width=2,
+        )
+
+    return plot1
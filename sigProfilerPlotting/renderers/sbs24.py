@@ -0,0 +1,233 @@
+"""SBS24 plots of plotSBS and the SBS24 plot template."""
+
+import os
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    _pdf_pages,
+    load_matrix,
+    make_pickle_file,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    data = load_matrix(matrix_path, plot_type, percentage)
+    label = data.index[0]
+    if label[1] != ":" or len(label) != 5:
+        sys.exit(
+            "The matrix does not match the correct SBS192 format. Please check you formatting and rerun this plotting function."
+        )
+    file_path = os.path.join(output_path, f"SBS_24_plots_{project}.pdf")
+    pp = _pdf_pages(file_path)
+
+    # the transcribed and untranscribed counts of the six substitution
+    # classes, with shape (samples, classes, strands)
+    classes = ["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"]
+    counts = np.stack(
+        [
+            data.reindex([strand + ":" + key for key in classes], fill_value=0)
+            for strand in ("T", "U")
+        ],
+        axis=-1,
+    ).transpose(1, 0, 2)
+    sig_probs = percentage and bool(((counts > 0) & (counts < 1)).any())
+
+    try:
+        plt.rcParams["axes.linewidth"] = 2
+        plot1 = make_pickle_file(
+            context="SBS24", return_plot_template=True, volume=volume
+        )
+        panel1 = plot1.axes[0]
+        bars = []
+        y = 12.485
+        for i in range(6):
+            trans = panel1.barh(
+                y,
+                0,
+                height=0.75,
+                color=[1 / 256, 70 / 256, 102 / 256],
+                align="center",
+                zorder=1000,
+                label="Genic-transcribed Strand",
+            )
+            y -= 0.75
+            untrans = panel1.barh(
+                y,
+                0,
+                height=0.75,
+                color=[228 / 256, 41 / 256, 38 / 256],
+                align="center",
+                zorder=1000,
+                label="Genic-untranscribed Strand",
+            )
+            y -= 0.2475
+            y -= 1
+            bars.append((trans[0], untrans[0]))
+        sample_text = panel1.text(
+            0.125,
+            0.9,
+            "",
+            fontsize=40,
+            fontweight="bold",
+            fontname="Arial",
+            transform=plot1.transFigure,
+        )
+        if percentage:
+            panel1.set_xlabel(
+                "Percentage of Single Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_xlabel(
+                "Number of Single Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        panel1.legend(handles=[trans, untrans], prop={"size": 25})
+
+        for sample, sample_counts in zip(data.columns, counts.tolist()):
+            total_count = sum(sum(tsb) for tsb in sample_counts)
+            xmax = 0
+            for (trans_bar, untrans_bar), tsb in zip(bars, sample_counts):
+                if percentage:
+                    if total_count > 0:
+                        widths = [count / total_count * 100 for count in tsb]
+                    else:
+                        widths = [0, 0]
+                else:
+                    widths = tsb
+                trans_bar.set_width(widths[0])
+                untrans_bar.set_width(widths[1])
+                xmax = max(xmax, *widths)
+
+            x = int(xmax * 1.1)
+
+            while x % 4 != 0:
+                x += 1
+
+            xtick_offest = int(x / 4)
+
+            if percentage:
+                xlabs = [
+                    0,
+                    round(xtick_offest, 1),
+                    round(xtick_offest * 2, 1),
+                    round(xtick_offest * 3, 1),
+                    round(xtick_offest * 4, 1),
+                ]
+                xlabels = [
+                    str(0),
+                    str(round(xtick_offest, 1)) + "%",
+                    str(round(xtick_offest * 2, 1)) + "%",
+                    str(round(xtick_offest * 3, 1)) + "%",
+                    str(round(xtick_offest * 4, 1)) + "%",
+                ]
+            else:
+                xlabs = [
+                    0,
+                    xtick_offest,
+                    xtick_offest * 2,
+                    xtick_offest * 3,
+                    xtick_offest * 4,
+                ]
+                xlabels = [
+                    0,
+                    xtick_offest,
+                    xtick_offest * 2,
+                    xtick_offest * 3,
+                    xtick_offest * 4,
+                ]
+            if not percentage:
+                xlabels = ["{:,}".format(int(x)) for x in xlabels]
+                if len(xlabels[-1]) > 3:
+                    xlabels_temp = []
+                    if len(xlabels[-1]) > 7:
+                        for label in xlabels:
+                            if len(label) > 7:
+                                xlabels_temp.append(label[0:-8] + "m")
+                            elif len(label) > 3:
+                                xlabels_temp.append(label[0:-4] + "k")
+                            else:
+                                xlabels_temp.append(label)
+
+                    else:
+                        for label in xlabels:
+                            if len(label) > 3:
+                                xlabels_temp.append(label[0:-4] + "k")
+                            else:
+                                xlabels_temp.append(label)
+                    xlabels = xlabels_temp
+
+            panel1.set_xlim([0, x])
+            panel1.set_xticks(xlabs)
+            panel1.set_xticklabels(xlabels, fontsize=30)
+
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample
+                    + ": "
+                    + "{:,}".format(int(total_count))
+                    + " transcribed subs"
+                )
+
+            pp.savefig(plot1)
+        plt.close(plot1)
+        pp.close()
+
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "SBS_24_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
+
+
+def build_template(context):
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(15, 10))
+    plt.rc("axes", edgecolor="lightgray")
+    panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
+
+    ylabs = np.arange(2.15, 13, 2)
+    ylabels = ["T>G", "T>C", "T>A", "C>T", "C>G", "C>A"]
+    panel1.set_ylim([1.2524, 13.235])
+    panel1.set_yticks(ylabs)
+    panel1.set_yticklabels(ylabels, fontsize=30)
+    panel1.set_ylabel("")
+    panel1.spines["right"].set_visible(False)
+    panel1.spines["top"].set_visible(False)
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=True,
+        labelbottom=True,
+        left=False,
+        labelleft=True,
+        right=False,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        width=2,
+    )
+
+    return plot1
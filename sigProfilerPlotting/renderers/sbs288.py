@@ -0,0 +1,634 @@
+"""SBS288 plots of plotSBS and the SBS288 plot template."""
+
+import pickle
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    BarCollection,
+    FigureWriter,
+    _template_bytes,
+    clear_plotting_memory,
+    get_default_96labels,
+    getxlabels,
+    getylabels,
+    process_input,
+    reindex_sbs288,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    plot_custom_text = False
+    sig_probs = False
+    pcawg = False
+
+    data = process_input(matrix_path, plot_type)
+
+    sample_count = 0
+
+    data, tsb_mats = reindex_sbs288(data)
+    template = _template_bytes("SBS288", volume=volume)
+
+    writer = FigureWriter(savefig_format, output_path, project, "SBS_288", dpi=dpi)
+    ctx = data.index
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [1 / 256, 1 / 256, 1 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [203 / 256, 202 / 256, 202 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [236 / 256, 199 / 256, 197 / 256],
+    ]
+    colorsall = [[colors[j] for i in range(int(len(ctx) / 6))] for j in range(6)]
+    colors_flat_list = [item for sublist in colorsall for item in sublist]
+
+    for sample in data.columns:
+        fig = pickle.loads(template)
+        panel1 = fig.axes[0]
+        panel2 = fig.axes[1]
+
+        total_count = np.sum(data[sample].values)
+        muts = data[sample].values
+        x = 0.4
+        if percentage:
+            if total_count > 0:
+                BarCollection(
+                    panel1,
+                    np.arange(len(ctx)) + x,
+                    0.4,
+                    colors_flat_list,
+                    heights=muts / total_count * 100,
+                )
+                ymax = np.max(muts / total_count * 100)
+            sig_probs = True
+        else:
+            BarCollection(
+                panel1, np.arange(len(ctx)) + x, 0.4, colors_flat_list, heights=muts
+            )
+            ymax = np.max(muts)
+
+        y = int(ymax * 1.25)
+        if y <= 4:
+            y += 4
+
+        while y % 4 != 0:
+            y += 1
+        y = ymax / 1.025
+        ytick_offest = float(y / 3)
+
+        if percentage:
+            ylabs = [
+                0,
+                round(ytick_offest, 1),
+                round(ytick_offest * 2, 1),
+                round(ytick_offest * 3, 1),
+                round(ytick_offest * 4, 1),
+            ]
+            ylabels = [
+                str(0),
+                str(round(ytick_offest, 1)) + "%",
+                str(round(ytick_offest * 2, 1)) + "%",
+                str(round(ytick_offest * 3, 1)) + "%",
+                str(round(ytick_offest * 4, 1)) + "%",
+            ]
+
+        else:
+            ylabs = [
+                0,
+                ytick_offest,
+                ytick_offest * 2,
+                ytick_offest * 3,
+                ytick_offest * 4,
+            ]
+            ylabels = [
+                0,
+                ytick_offest,
+                ytick_offest * 2,
+                ytick_offest * 3,
+                ytick_offest * 4,
+            ]
+
+        font_label_size = 30
+        if not percentage:
+            if int(ylabels[3]) >= 1000:
+                font_label_size = 20
+
+        if percentage:
+            if len(ylabels) > 2:
+                font_label_size = 20
+
+        labs = np.arange(0.375, 96.375, 1)
+
+        if not percentage:
+            ylabels = getylabels(ylabels)
+
+        panel1.set_xlim([0, 96])
+        panel1.set_ylim([0, y])
+
+        panel1.set_yticks(ylabs)
+
+        if sig_probs:
+            plt.text(
+                0.045,
+                0.75,
+                sample,
+                fontsize=60,
+                weight="bold",
+                color="black",
+                fontname="Arial",
+                transform=plt.gcf().transFigure,
+            )
+        else:
+            plt.text(
+                0.045,
+                0.75,
+                sample + ": " + "{:,}".format(int(total_count)) + " subs",
+                fontsize=60,
+                weight="bold",
+                color="black",
+                fontname="Arial",
+                transform=plt.gcf().transFigure,
+            )
+
+        custom_text_upper_plot = ""
+        try:
+            custom_text_upper[sample_count]
+        except:
+            custom_text_upper = False
+        try:
+            custom_text_middle[sample_count]
+        except:
+            custom_text_middle = False
+        try:
+            custom_text_bottom[sample_count]
+        except:
+            custom_text_bottom = False
+
+        if custom_text_upper:
+            plot_custom_text = True
+            if len(custom_text_upper[sample_count]) > 40:
+                print(
+                    "To add a custom text, please limit the string to <40 characters including spaces."
+                )
+                plot_custom_text = False
+        if custom_text_middle:
+            if len(custom_text_middle[sample_count]) > 40:
+                print(
+                    "To add a custom text, please limit the string to <40 characters including spaces."
+                )
+                plot_custom_text = False
+
+        if plot_custom_text:
+            x_pos_custom = 0.73
+            if custom_text_upper and custom_text_middle:
+                custom_text_upper_plot = (
+                    custom_text_upper[sample_count]
+                    + "\n"
+                    + custom_text_middle[sample_count]
+                )
+                if custom_text_bottom:
+                    custom_text_upper_plot += "\n" + custom_text_bottom[sample_count]
+
+            if custom_text_upper and not custom_text_middle:
+                custom_text_upper_plot = custom_text_upper[sample_count]
+                panel1.text(
+                    x_pos_custom,
+                    0.78,
+                    custom_text_upper_plot,
+                    fontsize=40,
+                    weight="bold",
+                    color="black",
+                    fontname="Arial",
+                    transform=plt.gcf().transFigure,
+                    ha="right",
+                    zorder=1,
+                )
+
+            elif custom_text_upper and custom_text_middle:
+                if not custom_text_bottom:
+                    panel1.text(
+                        x_pos_custom,
+                        0.72,
+                        custom_text_upper_plot,
+                        fontsize=40,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                        ha="right",
+                    )
+                else:
+                    panel1.text(
+                        x_pos_custom,
+                        0.68,
+                        custom_text_upper_plot,
+                        fontsize=40,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plt.gcf().transFigure,
+                        ha="right",
+                    )
+
+            elif not custom_text_upper and custom_text_middle:
+                custom_text_upper_plot = custom_text_middle[sample_count]
+                panel1.text(
+                    x_pos_custom,
+                    0.78,
+                    custom_text_upper_plot,
+                    fontsize=40,
+                    weight="bold",
+                    color="black",
+                    fontname="Arial",
+                    transform=plt.gcf().transFigure,
+                    ha="right",
+                )
+
+        panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+        panel1.yaxis.grid(True)
+        panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+        panel1.set_xlabel("")
+        panel1.set_ylabel("")
+
+        if percentage:
+            panel1.set_ylabel(
+                "Percentage of Single Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_ylabel(
+                "Number of Single Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        panel1.tick_params(
+            axis="both",
+            which="both",
+            bottom=False,
+            labelbottom=False,
+            left=True,
+            labelleft=True,
+            right=True,
+            labelright=False,
+            top=False,
+            labeltop=False,
+            direction="in",
+            length=25,
+            colors="lightgray",
+            width=2,
+        )
+
+        [i.set_color("black") for i in panel1.get_yticklabels()]
+
+        yp2 = 28
+        labels = []
+        y2max = 0
+        tsbColors = [
+            [1 / 256, 70 / 256, 102 / 256],
+            [228 / 256, 41 / 256, 38 / 256],
+            "green",
+        ]
+
+        if percentage:
+            y2max = (
+                np.max(
+                    [
+                        tsb_mats["T"][sample]["All"],
+                        tsb_mats["U"][sample]["All"],
+                        tsb_mats["N"][sample]["All"],
+                    ]
+                )
+                / total_count
+                * 100
+            )
+
+            panel2.barh(
+                range(28, 1, -4),
+                tsb_mats["T"][sample].values / total_count * 100,
+                color=tsbColors[0],
+                label="Genic-transcribed",
+            )
+            panel2.barh(
+                range(27, 1, -4),
+                tsb_mats["U"][sample].values / total_count * 100,
+                color=tsbColors[1],
+                label="Genic-untranscribed",
+            )
+            panel2.barh(
+                range(26, 1, -4),
+                tsb_mats["N"][sample].values / total_count * 100,
+                color=tsbColors[2],
+                label="Intergenic",
+            )
+
+        else:
+            y2max = np.max(
+                [
+                    tsb_mats["T"][sample]["All"],
+                    tsb_mats["U"][sample]["All"],
+                    tsb_mats["N"][sample]["All"],
+                ]
+            )
+            panel2.barh(
+                range(28, 1, -4),
+                tsb_mats["T"][sample].values,
+                color=tsbColors[0],
+                label="Genic-transcribed",
+            )
+            panel2.barh(
+                range(27, 1, -4),
+                tsb_mats["U"][sample].values,
+                color=tsbColors[1],
+                label="Genic-untranscribed",
+            )
+            panel2.barh(
+                range(26, 1, -4),
+                tsb_mats["N"][sample].values,
+                color=tsbColors[2],
+                label="Intergenic",
+            )
+
+        labels = list(tsb_mats["T"][sample].index)
+
+        y = int(y2max * 1.1)
+        if y <= 4:
+            y += 4
+        while y % 4 != 0:
+            y += 1
+        ytick_offest = int(y / 4)
+
+        if percentage:
+            xlabs = [
+                0,
+                round(ytick_offest, 1),
+                round(ytick_offest * 2, 1),
+                round(ytick_offest * 3, 1),
+                round(ytick_offest * 4, 1),
+            ]
+            xlabels = [
+                str(0),
+                str(round(ytick_offest, 1)) + "%",
+                str(round(ytick_offest * 2, 1)) + "%",
+                str(round(ytick_offest * 3, 1)) + "%",
+                str(round(ytick_offest * 4, 1)) + "%",
+            ]
+        else:
+            xlabs = [
+                0,
+                ytick_offest,
+                ytick_offest * 2,
+                ytick_offest * 3,
+                ytick_offest * 4,
+            ]
+            xlabels = [
+                0,
+                ytick_offest,
+                ytick_offest * 2,
+                ytick_offest * 3,
+                ytick_offest * 4,
+            ]
+
+        if not percentage:
+            xlabels = getxlabels(xlabels)
+
+        panel2.spines["right"].set_visible(False)
+        panel2.spines["top"].set_visible(False)
+        labels.reverse()
+        panel2.set_yticks([3, 7, 11, 15, 19, 23, 27])
+        panel2.set_yticklabels(labels, fontsize=30, fontname="Arial", weight="bold")
+        panel2.set_xticks(xlabs)
+        panel2.set_xticklabels(xlabels, fontsize=30)
+        handles, labels = panel2.get_legend_handles_labels()
+        panel2.legend(handles[:3], labels[:3], loc="best", prop={"size": 30})
+        sample_count += 1
+
+        # save each figure as soon as it is drawn so that only one is in memory
+        writer.write(sample, fig)
+        plt.close(fig)
+
+    results = writer.close()
+    clear_plotting_memory()
+    return results
+
+
+def build_template(context):
+    plot_custom_text = False
+    sig_probs = False
+    pcawg = False
+
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(43.93, 9.92))
+    plt.rc("axes", edgecolor="lightgray")
+    panel1 = plt.axes([0.04, 0.09, 0.7, 0.77])
+    panel2 = plt.axes([0.77, 0.09, 0.21, 0.77])
+    xlabels = []
+
+    x = 0.4
+    ymax = 0
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [1 / 256, 1 / 256, 1 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [203 / 256, 202 / 256, 202 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [236 / 256, 199 / 256, 197 / 256],
+    ]
+    i = 0
+    result = get_default_96labels()
+    xlabels = [seq[0] + seq[2] + seq[6] for seq in result]
+    x = 0.043
+    y3 = 0.87
+    y = int(ymax * 1.25)
+    y2 = y + 2
+    for i in range(0, 6, 1):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y3),
+                0.11,
+                0.05,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        x += 0.117
+
+    yText = y3 + 0.06
+
+    plt.text(
+        0.082,
+        yText,
+        "C>A",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.1975,
+        yText,
+        "C>G",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.315,
+        yText,
+        "C>T",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.43,
+        yText,
+        "T>A",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.55,
+        yText,
+        "T>C",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.665,
+        yText,
+        "T>G",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+
+    if y <= 4:
+        y += 4
+
+    while y % 4 != 0:
+        y += 1
+    y = ymax / 1.025
+    ytick_offest = float(y / 3)
+    font_label_size = 30
+    labs = np.arange(0.375, 96.375, 1)
+
+    panel1.set_xlim([0, 96])
+    panel1.set_ylim([0, y])
+    panel1.set_xticks(labs)
+
+    count = 0
+    m = 0
+    for i in range(0, 96, 1):
+        plt.text(
+            i / 137 + 0.04,
+            0.02,
+            xlabels[i][0],
+            fontsize=25,
+            color="gray",
+            rotation="vertical",
+            verticalalignment="center",
+            fontname="Courier New",
+            transform=plt.gcf().transFigure,
+        )
+        plt.text(
+            i / 137 + 0.04,
+            0.044,
+            xlabels[i][1],
+            fontsize=25,
+            color=colors[m],
+            rotation="vertical",
+            verticalalignment="center",
+            fontname="Courier New",
+            fontweight="bold",
+            transform=plt.gcf().transFigure,
+        )
+        plt.text(
+            i / 137 + 0.04,
+            0.071,
+            xlabels[i][2],
+            fontsize=25,
+            color="gray",
+            rotation="vertical",
+            verticalalignment="center",
+            fontname="Courier New",
+            transform=plt.gcf().transFigure,
+        )
+        count += 1
+        if count == 16:
+            count = 0
+            m += 1
+
+    panel1.yaxis.grid(True)
+    panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=True,
+        labelleft=True,
+        right=True,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="lightgray",
+        width=2,
+    )
+
+    [i.set_color("black") for i in panel1.get_yticklabels()]
+
+    yp2 = 28
+    labels = []
+    y2max = 0
+    tsbColors = [
+        [1 / 256, 70 / 256, 102 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        "green",
+    ]
+
+    y = int(y2max * 1.1)
+    if y <= 4:
+        y += 4
+    while y % 4 != 0:
+        y += 1
+    ytick_offest = int(y / 4)
+
+    panel2.spines["right"].set_visible(False)
+    panel2.spines["top"].set_visible(False)
+    labels.reverse()
+    panel2.set_yticks([3, 7, 11, 15, 19, 23, 27])
+    panel2.set_yticklabels(labels, fontsize=30, fontname="Arial", weight="bold")
+    panel2.set_xticklabels(xlabels, fontsize=30)
+    handles, labels = panel2.get_legend_handles_labels()
+    panel2.legend(handles[:3], labels[:3], loc="best", prop={"size": 30})
+    return plot1
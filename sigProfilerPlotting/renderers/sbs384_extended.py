@@ -0,0 +1,342 @@
+"""extended SBS384 plots of plotSBS."""
+
+import os
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    BarCollection,
+    _pdf_pages,
+    getylabels,
+    load_matrix,
+    make_pickle_file,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    plot_custom_text = False
+    data = load_matrix(matrix_path, plot_type, percentage)
+    label = data.index[0]
+    if len(label) < 8 or label[7] != "]":
+        sys.exit(
+            "The matrix does not match the correct SBS288 format. Please check you formatting and rerun this plotting function."
+        )
+
+    file_path = os.path.join(output_path, f"SBS_384_extended_plots_{project}.pdf")
+    pp = _pdf_pages(file_path)
+
+    # the transcribed, untranscribed and remaining counts of every context,
+    # with shape (samples, contexts, strands). The contexts are grouped by
+    # substitution class and keep the order of the input rows within each
+    # class; every strand other than T and U adds to the last column.
+    classes = ["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"]
+    seqs = data.index.str[2:]
+    contexts = sorted(dict.fromkeys(seqs), key=lambda seq: classes.index(seq[2:5]))
+    positions = {seq: i for i, seq in enumerate(contexts)}
+    strands = data.index.str[0]
+    columns = np.where(strands == "T", 0, np.where(strands == "U", 1, 2))
+    values = data.to_numpy()
+    counts = np.zeros((len(contexts), 3, values.shape[1]), dtype=values.dtype)
+    np.add.at(counts, ([positions[seq] for seq in seqs], columns), values)
+    counts = counts.transpose(2, 0, 1)
+    sig_probs = percentage and bool(((counts > 0) & (counts < 1)).any())
+
+    try:
+        sample_count = 0
+        plt.rcParams["axes.linewidth"] = 2
+        plt.rc("axes", edgecolor="lightgray")
+        plot1 = make_pickle_file(
+            context="SBS384_extended", return_plot_template=True, volume=volume
+        )
+        panel1 = plot1.axes[0]
+        colors = [
+            [3 / 256, 189 / 256, 239 / 256],
+            [1 / 256, 1 / 256, 1 / 256],
+            [228 / 256, 41 / 256, 38 / 256],
+            [203 / 256, 202 / 256, 202 / 256],
+            [162 / 256, 207 / 256, 99 / 256],
+            [236 / 256, 199 / 256, 197 / 256],
+        ]
+        # the background patches of the six substitution classes
+        backgrounds = [patch for patch in panel1.patches if patch.get_zorder() == 0]
+
+        xlabels = []
+        bar_x = []
+        x = 0.7
+        for seq in contexts:
+            xlabels.append(seq[0] + seq[2] + seq[6])
+            bar_x.append(x)
+            x += 0.75
+            bar_x.append(x)
+            x += 0.75
+            bar_x.append(x)
+            x += 0.2475
+            x += 1
+        bars = BarCollection(
+            panel1,
+            bar_x,
+            0.75,
+            [[1 / 256, 70 / 256, 102 / 256], [228 / 256, 41 / 256, 38 / 256], "green"]
+            * len(contexts),
+        )
+
+        count = 0
+        m = 0
+        for i in range(0, 96, 1):
+            panel1.text(
+                i / 101 + 0.0415,
+                0.02,
+                xlabels[i][0],
+                fontsize=30,
+                color="gray",
+                rotation="vertical",
+                verticalalignment="center",
+                fontname="Courier New",
+                transform=plot1.transFigure,
+            )
+            panel1.text(
+                i / 101 + 0.0415,
+                0.044,
+                xlabels[i][1],
+                fontsize=30,
+                color=colors[m],
+                rotation="vertical",
+                verticalalignment="center",
+                fontname="Courier New",
+                fontweight="bold",
+                transform=plot1.transFigure,
+            )
+            panel1.text(
+                i / 101 + 0.0415,
+                0.071,
+                xlabels[i][2],
+                fontsize=30,
+                color="gray",
+                rotation="vertical",
+                verticalalignment="center",
+                fontname="Courier New",
+                transform=plot1.transFigure,
+            )
+            count += 1
+            if count == 16:
+                count = 0
+                m += 1
+
+        sample_text = panel1.text(
+            0.045,
+            0.75,
+            "",
+            fontsize=60,
+            weight="bold",
+            color="black",
+            fontname="Arial",
+            transform=plot1.transFigure,
+        )
+        custom_text = None
+
+        panel1.legend(
+            handles=bars.legend_handles(
+                "Genic-transcribed Strand", "Genic-untranscribed Strand", "Intergenic"
+            ),
+            prop={"size": 20},
+            loc="upper right",
+        )
+        if percentage:
+            panel1.set_ylabel(
+                "Percentage of Single Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel1.set_ylabel(
+                "Number of Single Base Substitutions",
+                fontsize=35,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        for sample, sample_counts in zip(data.columns, counts):
+            tsbs = sample_counts.tolist()
+            total_count = sum(sum(tsb) for tsb in tsbs)
+            total_trans = sum(sum(tsb[:-1]) for tsb in tsbs)
+            total_nontrans = sum(tsb[-1] for tsb in tsbs)
+            # the transcribed, untranscribed and intergenic bar of each
+            # context, in turn
+            heights = sample_counts.ravel()
+            if percentage:
+                if total_count > 0:
+                    heights = heights / total_count * 100
+                else:
+                    heights = np.zeros(len(heights))
+            bars.set_heights(heights)
+            ymax = max(0, np.max(heights))
+
+            y = ymax / 1.025
+
+            ytick_offest = float(y / 3)
+            for background in backgrounds:
+                background.set_height(round(ytick_offest * 4, 1))
+
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            font_label_size = 30
+            if not percentage:
+                if int(ylabels[3]) >= 1000:
+                    font_label_size = 20
+
+            if percentage:
+                if len(ylabels) > 2:
+                    font_label_size = 20
+
+            if not percentage:
+                ylabels = getylabels(ylabels)
+
+            panel1.set_ylim([0, y])
+            panel1.set_yticks(ylabs)
+
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample
+                    + ": "
+                    + "{:,}".format(int(total_nontrans))
+                    + " non-trans & "
+                    + "{:,}".format(int(total_trans))
+                    + " trans subs"
+                )
+
+            if custom_text is not None:
+                custom_text.remove()
+                custom_text = None
+            custom_text_upper_plot = ""
+            try:
+                custom_text_upper[sample_count]
+            except:
+                custom_text_upper = False
+            try:
+                custom_text_bottom[sample_count]
+            except:
+                custom_text_bottom = False
+
+            if custom_text_upper:
+                plot_custom_text = True
+                if len(custom_text_upper[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+            if custom_text_bottom:
+                if len(custom_text_bottom[sample_count]) > 40:
+                    print(
+                        "To add a custom text, please limit the string to <40 characters including spaces."
+                    )
+                    plot_custom_text = False
+
+            if plot_custom_text:
+                x_pos_custom = 0.84
+                if custom_text_upper and custom_text_bottom:
+                    custom_text_upper_plot = (
+                        custom_text_upper[sample_count]
+                        + "\n"
+                        + custom_text_bottom[sample_count]
+                    )
+
+                if custom_text_upper and not custom_text_bottom:
+                    custom_text_upper_plot = custom_text_upper[sample_count]
+                    custom_text = panel1.text(
+                        x_pos_custom,
+                        0.78,
+                        custom_text_upper_plot,
+                        fontsize=40,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plot1.transFigure,
+                        ha="right",
+                    )
+
+                elif custom_text_upper and custom_text_bottom:
+                    custom_text = panel1.text(
+                        x_pos_custom,
+                        0.72,
+                        custom_text_upper_plot,
+                        fontsize=40,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plot1.transFigure,
+                        ha="right",
+                    )
+
+                elif not custom_text_upper and custom_text_bottom:
+                    custom_text_upper_plot = custom_text_bottom[sample_count]
+                    custom_text = panel1.text(
+                        x_pos_custom,
+                        0.78,
+                        custom_text_upper_plot,
+                        fontsize=40,
+                        weight="bold",
+                        color="black",
+                        fontname="Arial",
+                        transform=plot1.transFigure,
+                        ha="right",
+                    )
+
+            panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+            [i.set_color("black") for i in panel1.get_yticklabels()]
+
+            pp.savefig(plot1)
+            sample_count += 1
+        plt.close(plot1)
+        pp.close()
+
+    except:
+        print("There may be an issue with the formatting of your matrix file.")
+        pdf_path = output_path + "SBS_384_extended_plots_" + project + ".pdf"
+        if os.path.isfile(pdf_path):
+            os.remove(pdf_path)
@@ -0,0 +1,683 @@
+"""SBS4608 plots of plotSBS and the SBS4608 plot template."""
+
+import os
+import sys
+
+import matplotlib.patches as mplpatches
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.renderers.sbs1536 import (
+    CLASSES,
+    FLANKS,
+    heat_levels,
+    heatmap,
+    heatmap_cells,
+    heatmap_paths,
+    pentanucleotide_counts,
+)
+from sigProfilerPlotting.sigProfilerPlotting import (
+    _pdf_pages,
+    getxlabels,
+    getylabels,
+    load_matrix,
+    make_pickle_file,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    data = load_matrix(matrix_path, plot_type, percentage)
+    label = data.index[0]
+    if len(label) < 9 or label[8] != "]":
+        sys.exit(
+            "The matrix does not match the correct SBS4608 format. Please check you formatting and rerun this plotting function."
+        )
+
+    file_path = os.path.join(output_path, f"SBS_4608_plots_{project}.pdf")
+    pp = _pdf_pages(file_path)
+
+    values = data.to_numpy()
+    # the strands of every context add up in the pentanucleotide plots
+    tris, counts, counts_96, counts_5, counts_3 = pentanucleotide_counts(
+        data.index.str[2:], values
+    )
+    # the strand counts of all mutations and of each substitution class, with
+    # shape (samples, classes, strands)
+    strand_index = {"T": 0, "U": 1, "N": 2}
+    rows = (
+        [CLASSES.index(mut_type) + 1 for mut_type in data.index.str[5:8]],
+        [strand_index[strand] for strand in data.index.str[0]],
+    )
+    counts_tsb = np.zeros((len(CLASSES) + 1, 3, values.shape[1]), values.dtype)
+    np.add.at(counts_tsb, rows, values)
+    np.add.at(counts_tsb, (0, rows[1]), values)
+    counts_tsb = counts_tsb.transpose(2, 0, 1)
+    sig_probs = percentage and bool(((values > 0) & (values < 1)).any())
+
+    # try:
+    if True:
+        sample_count = 0
+        plt.rcParams["axes.linewidth"] = 2
+        plt.rc("axes", edgecolor="lightgray")
+        plot1 = make_pickle_file(
+            context="SBS4608", return_plot_template=True, volume=volume
+        )
+        panel1, panel2, panel3, panel4, panel5 = plot1.axes
+        colors = [
+            [3 / 256, 189 / 256, 239 / 256],
+            [1 / 256, 1 / 256, 1 / 256],
+            [228 / 256, 41 / 256, 38 / 256],
+            [203 / 256, 202 / 256, 202 / 256],
+            [162 / 256, 207 / 256, 99 / 256],
+            [236 / 256, 199 / 256, 197 / 256],
+        ]
+        heatmap_1536 = panel1.collections[0]
+        heatmap_3 = panel3.collections[0]
+        heatmap_5 = panel4.collections[0]
+        cells = heatmap_cells(len(FLANKS))
+        cells_flank = heatmap_cells(4)
+        # the scale numbers of the bottom, top and middle heatmaps
+        scale_labels = [text for text in panel5.texts if text.get_text() == ""]
+
+        xlabels = [tri[0] + "-" + tri[1] for tri in tris] * len(FLANKS) * len(CLASSES)
+        bars = []
+        x = 0.5
+        for i in range(len(CLASSES)):
+            for _ in tris:
+                bar = panel2.bar(
+                    x,
+                    0,
+                    width=0.5,
+                    color=colors[i],
+                    align="center",
+                    zorder=1000,
+                )
+                bars.append(bar[0])
+                x += 1
+            x += 1
+
+        m = 0
+        count = 0
+        x_letter = 0
+        for i in range(0, 96, 1):
+            # Bottom and top labels
+            for y_letter in (0.04, 0.64):
+                panel5.text(
+                    x_letter / 101 + 0.031,
+                    y_letter,
+                    xlabels[i][0],
+                    fontsize=25,
+                    color="black",
+                    rotation="vertical",
+                    verticalalignment="center",
+                    fontname="Courier New",
+                    transform=plot1.transFigure,
+                )
+                panel5.text(
+                    x_letter / 101 + 0.031,
+                    y_letter + 0.01,
+                    xlabels[i][1],
+                    fontsize=25,
+                    color="black",
+                    rotation="vertical",
+                    verticalalignment="center",
+                    fontname="Courier New",
+                    fontweight="bold",
+                    transform=plot1.transFigure,
+                )
+                panel5.text(
+                    x_letter / 101 + 0.031,
+                    y_letter + 0.02,
+                    xlabels[i][2],
+                    fontsize=25,
+                    color="black",
+                    rotation="vertical",
+                    verticalalignment="center",
+                    fontname="Courier New",
+                    transform=plot1.transFigure,
+                )
+            count += 1
+            x_letter += 0.76
+            if (i + 1) % 16 == 0 and i != 0:
+                x_letter += 0.76
+            if count == 16:
+                count = 0
+                m += 1
+
+        sample_text = panel2.text(
+            0.04,
+            0.875,
+            "",
+            fontsize=50,
+            weight="bold",
+            fontname="Arial",
+            transform=plot1.transFigure,
+        )
+        custom_texts = []
+        # the strand bias bars of each mutation type, in the template order
+        tsb_bars = [panel5.patches[i : i + 3] for i in range(0, 21, 3)]
+
+        if percentage:
+            panel2.set_ylabel(
+                "Percentage of Single Base Substitutions",
+                fontsize=26,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+        else:
+            panel2.set_ylabel(
+                "Number of Single Base Substitutions",
+                fontsize=26,
+                fontname="Times New Roman",
+                weight="bold",
+            )
+
+        for sample, sample_counts, sample_5, sample_3, sample_96, sample_tsb in zip(
+            data.columns,
+            counts.reshape(len(data.columns), -1).tolist(),
+            counts_5.reshape(len(data.columns), -1).tolist(),
+            counts_3.reshape(len(data.columns), -1).tolist(),
+            counts_96.tolist(),
+            counts_tsb.tolist(),
+        ):
+            total_count_sample = sum(sum(tris) for tris in sample_96)
+            if total_count_sample == 0:
+                continue
+            total_count = max(0, *sample_counts) * 1.1
+            ratio = total_count / total_count_sample
+
+            # Color the 1536 matrix
+            heatmap_1536.set_paths(
+                heatmap_paths(
+                    cells, heat_levels(sample_counts, total_count_sample, ratio)
+                )
+            )
+
+            # Color the 5' and 3' context matrices
+            total_count_5 = max(0, *sample_5) * 1.1
+            total_count_3 = max(0, *sample_3) * 1.1
+            ratio_5 = total_count_5 / total_count_sample
+            ratio_3 = total_count_3 / total_count_sample
+            ratio_total = max(ratio_5, ratio_3)
+            heatmap_5.set_paths(
+                heatmap_paths(
+                    cells_flank,
+                    heat_levels(sample_5, total_count_sample, ratio_total),
+                )
+            )
+            heatmap_3.set_paths(
+                heatmap_paths(
+                    cells_flank,
+                    heat_levels(sample_3, total_count_sample, ratio_total),
+                )
+            )
+
+            # Update the 96 bar plot
+            ymax = 0
+            for bar, count in zip(
+                bars, (count for tris in sample_96 for count in tris)
+            ):
+                if percentage:
+                    height = count / total_count_sample * 100
+                else:
+                    height = count
+                bar.set_height(height)
+                if height > ymax:
+                    ymax = height
+
+            for scale_label, value in zip(
+                scale_labels,
+                [ratio / 2, ratio] + [ratio_total / 2, ratio_total] * 2,
+            ):
+                scale_label.set_text(str(value)[:5])
+
+            # Set up the parameters for the yscale ticks and labels
+            y = ymax / 1.025
+            ytick_offest = float(y / 3)
+
+            ylabels_96 = []
+            if percentage:
+                ylabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                ylabels_96 = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                ylabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                ylabels_96 = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            # Adjust fontsize if required due to large numbers on y-axis
+            font_label_size = 25
+            if not percentage:
+                if int(ylabels_96[3]) >= 1000:
+                    font_label_size = 20
+
+            if percentage:
+                if len(ylabels_96) > 2:
+                    font_label_size = 20
+
+            if not percentage:
+                ylabels_96 = getylabels(ylabels_96)
+
+            # the bar plot is autoscaled to the sample and then widened to its ticks
+            panel2.relim()
+            panel2.autoscale_view(scalex=False)
+            panel2.set_yticks(ylabs)
+
+            # Set up all parameters for custom text in upper righthand corner
+            for text in custom_texts:
+                text.remove()
+            custom_texts = []
+            try:
+                custom_text_upper[sample_count]
+            except:
+                custom_text_upper = False
+            try:
+                custom_text_middle[sample_count]
+            except:
+                custom_text_middle = False
+            try:
+                custom_text_bottom[sample_count]
+            except:
+                custom_text_bottom = False
+
+            x_pos_custom = 0.85
+            y_pos_upper = 0.125
+            y_pos_middle = 0.10
+            y_pos_bottom = 0.075
+            zorder_value = 10
+
+            fontsize_custom = 25
+            fontweight_custom = "bold"
+            fontcolor_custom = "black"
+            fontname_custom = "Arial"
+            ha_custom = "left"
+
+            for custom_text, y_pos_custom in (
+                (custom_text_upper, y_pos_upper),
+                (custom_text_middle, y_pos_middle),
+                (custom_text_bottom, y_pos_bottom),
+            ):
+                if custom_text:
+                    custom_texts.append(
+                        panel5.text(
+                            x_pos_custom,
+                            y_pos_custom,
+                            custom_text[sample_count],
+                            fontsize=fontsize_custom,
+                            weight=fontweight_custom,
+                            color=fontcolor_custom,
+                            fontname=fontname_custom,
+                            transform=plot1.transFigure,
+                            ha=ha_custom,
+                            zorder=zorder_value,
+                        )
+                    )
+
+            # Plot the sample name in upper left corner of plot
+            if sig_probs:
+                sample_text.set_text(sample)
+            else:
+                sample_text.set_text(
+                    sample + ": " + "{:,}".format(int(total_count_sample)) + " subs"
+                )
+
+            # Change axis depending if percentage parameter is selected
+            if percentage:
+                panel2.set_yticklabels(
+                    ylabels_96, fontsize=font_label_size - 1, color="black"
+                )
+            else:
+                panel2.set_yticklabels(
+                    ylabels_96, fontsize=font_label_size, color="black"
+                )
+
+            y2max = 0
+            for class_counts, tsb_bar in zip(sample_tsb, tsb_bars):
+                for count, bar in zip(class_counts, tsb_bar):
+                    if percentage:
+                        width = count / total_count_sample * 100
+                    else:
+                        width = count
+                    bar.set_width(width)
+                    if width > y2max:
+                        y2max = width
+            y = int(y2max * 1.1)
+            if y <= 4:
+                y += 4
+
+            while y % 4 != 0:
+                y += 1
+            ytick_offest = int(y / 4)
+            if percentage:
+                xlabs = [
+                    0,
+                    round(ytick_offest, 1),
+                    round(ytick_offest * 2, 1),
+                    round(ytick_offest * 3, 1),
+                    round(ytick_offest * 4, 1),
+                ]
+                xlabels = [
+                    str(0),
+                    str(round(ytick_offest, 1)) + "%",
+                    str(round(ytick_offest * 2, 1)) + "%",
+                    str(round(ytick_offest * 3, 1)) + "%",
+                    str(round(ytick_offest * 4, 1)) + "%",
+                ]
+            else:
+                xlabs = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+                xlabels = [
+                    0,
+                    ytick_offest,
+                    ytick_offest * 2,
+                    ytick_offest * 3,
+                    ytick_offest * 4,
+                ]
+
+            if not percentage:
+                xlabels = getxlabels(xlabels)
+
+            # the strand bias plot is autoscaled to the sample and then widened to its ticks
+            panel5.relim()
+            panel5.autoscale_view(scaley=False)
+            panel5.set_xticks(xlabs)
+            panel5.set_xticklabels(xlabels, fontsize=30)
+
+            pp.savefig(plot1)
+            sample_count += 1
+        plt.close(plot1)
+        pp.close()
+
+
+def build_template(context):
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(43.93, 18))
+    plt.rc("axes", edgecolor="lightgray")
+    panel1 = plt.axes([0.03, 0.0677, 0.76, 0.267])  # 1536 context panel
+    panel2 = plt.axes([0.03, 0.67, 0.76, 0.247])  # 96 context panel
+    panel3 = plt.axes([0.03, 0.35, 0.76, 0.1335])  # 3' context
+    panel4 = plt.axes([0.03, 0.5, 0.76, 0.1335])  # 5' context
+    panel5 = plt.axes([0.82, 0.67, 0.17, 0.247])  # SBS288 (TSB) context
+
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [1 / 256, 1 / 256, 1 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [203 / 256, 202 / 256, 202 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [236 / 256, 199 / 256, 197 / 256],
+    ]
+    colors_heat = [
+        np.linspace(56 / 255, 255 / 255, 5),
+        np.linspace(66 / 255, 225 / 255, 5),
+        np.linspace(157 / 255, 40 / 255, 5),
+    ]
+    pentas = [
+        five + three for five in ["T", "G", "C", "A"] for three in ["T", "G", "C", "A"]
+    ]
+
+    # the heatmap paths are replaced for each sample
+    heatmap(panel1, heatmap_paths(heatmap_cells(16), np.zeros(1536, dtype=int)))
+    for panel in (panel4, panel3):
+        heatmap(panel, heatmap_paths(heatmap_cells(4), np.zeros(384, dtype=int)))
+
+    # scale bars for the bottom, top and middle heatmaps
+    for y_start, height in ((0.0677, 0.267), (0.5, 0.1335), (0.35, 0.1335)):
+        y_grad = height / len(colors_heat[0])
+        for l in range(0, len(colors_heat[0]), 1):
+            rectangle = mplpatches.Rectangle(
+                (0.797, y_start),
+                0.02,
+                y_grad,
+                linewidth=1,
+                facecolor=(
+                    colors_heat[0][l],
+                    colors_heat[1][l],
+                    colors_heat[2][l],
+                ),
+                transform=plt.gcf().transFigure,
+                clip_on=False,
+                edgecolor=(
+                    colors_heat[0][l],
+                    colors_heat[1][l],
+                    colors_heat[2][l],
+                ),
+            )
+            panel1.add_patch(rectangle)
+            y_start += y_grad
+
+    # scale numbers; the empty ones are set for each sample
+    for y_pos, fontsize, label in (
+        (0.0677, 15, "0"),
+        (0.2012, 15, ""),
+        (0.325, 15, ""),
+        (0.5, 20, "0"),
+        (0.56675, 15, ""),
+        (0.625, 15, ""),
+        (0.35, 20, "0"),
+        (0.41675, 15, ""),
+        (0.475, 15, ""),
+    ):
+        plt.text(
+            0.82,
+            y_pos,
+            label,
+            fontsize=fontsize,
+            fontweight="bold",
+            transform=plt.gcf().transFigure,
+        )
+
+    x = 0.033
+    y3 = 0.92
+    for i in range(0, 6, 1):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y3),
+                0.117,
+                0.03,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        x += 0.1275
+
+    # Plot the labels for above the SBS96 bar plot
+    yText = 0.96
+    for x, label in (
+        (0.075, "C>A"),
+        (0.2025, "C>G"),
+        (0.33, "C>T"),
+        (0.455, "T>A"),
+        (0.585, "T>C"),
+        (0.71, "T>G"),
+    ):
+        plt.text(
+            x,
+            yText,
+            label,
+            fontsize=55,
+            fontweight="bold",
+            fontname="Arial",
+            transform=plt.gcf().transFigure,
+        )
+
+    panel1.set_xlim([0, 101])
+    panel1.set_ylim([0, 16])
+    panel2.set_xlim([0, 101])
+    panel1.set_yticks([])
+    panel1.set_xticks([])
+    panel2.set_xticks([])
+    panel4.set_xlim([0, 101])
+    panel4.set_ylim([0, 4])
+    panel3.set_xlim([0, 101])
+    panel3.set_ylim([0, 4])
+    panel4.set_yticks([])
+    panel3.set_yticks([])
+    panel3.set_xticks([])
+    panel4.set_xticks([])
+
+    # y-axis labels of the bottom, top and middle heatmaps
+    for y_letter, y_step, ylabels in (
+        (5.2, 0.2675, [penta[0] + "---" + penta[1] for penta in pentas]),
+        (9.85, 0.53, [five + "---N" for five in ["T", "G", "C", "A"]]),
+        (7.45, 0.53, ["N---" + three for three in ["T", "G", "C", "A"]]),
+    ):
+        for ylabel in ylabels:
+            plt.text(
+                0.003,
+                y_letter / 16,
+                ylabel[0],
+                fontsize=25,
+                color="black",
+                verticalalignment="center",
+                fontname="Courier New",
+                transform=plt.gcf().transFigure,
+            )
+            plt.text(
+                0.008,
+                y_letter / 16 + 0,
+                ylabel[1:4],
+                fontsize=25,
+                color="black",
+                verticalalignment="center",
+                fontname="Courier New",
+                fontweight="bold",
+                transform=plt.gcf().transFigure,
+            )
+            plt.text(
+                0.022,
+                y_letter / 16 + 0,
+                ylabel[4],
+                fontsize=25,
+                color="black",
+                verticalalignment="center",
+                fontname="Courier New",
+                transform=plt.gcf().transFigure,
+            )
+            y_letter -= y_step
+
+    panel2.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+    panel1.set_yticklabels([])
+    panel1.set_xticklabels([])
+    panel2.set_xticklabels([])
+
+    panel1.axis("off")
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=False,
+        labelleft=False,
+        right=False,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="white",
+        width=2,
+    )
+    panel2.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=True,
+        labelleft=True,
+        right=True,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="white",
+        width=2,
+    )
+    for panel in (panel3, panel4):
+        panel.axis("off")
+        panel.tick_params(
+            axis="both",
+            which="both",
+            bottom=False,
+            labelbottom=False,
+            left=False,
+            labelleft=False,
+            right=True,
+            labelright=False,
+            top=False,
+            labeltop=False,
+            direction="in",
+            length=25,
+            colors="white",
+            width=2,
+        )
+
+    # the widths of the strand bias bars are set for each sample
+    yp2 = 28
+    labels = []
+    tsbColors = [
+        [1 / 256, 70 / 256, 102 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        "green",
+    ]
+    for mut in ["All", "C>A", "C>G", "C>T", "T>A", "T>C", "T>G"]:
+        labels.append(mut)
+        for i, label in enumerate(
+            ["Genic-transcribed", "Genic-untranscribed", "Intergenic"]
+        ):
+            panel5.barh(yp2, 0, color=tsbColors[i], label=label)
+            yp2 -= 1
+        yp2 -= 1
+
+    panel5.spines["right"].set_visible(False)
+    panel5.spines["top"].set_visible(False)
+    labels.reverse()
+    panel5.set_yticks([3, 7, 11, 15, 19, 23, 27])
+    panel5.set_yticklabels(labels, fontsize=30, fontname="Arial", weight="bold")
+    handles, labels = panel5.get_legend_handles_labels()
+    panel5.legend(handles[:3], labels[:3], loc="best", prop={"size": 20})
+
+    return plot1
@@ -0,0 +1,555 @@
+"""SBS96 plots of plotSBS and the SBS96 plot template."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    BarCollection,
+    FigureWriter,
+    getylabels,
+    make_pickle_file,
+    process_input,
+    profile_keys,
+    reindex_sbs96,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage,
+    custom_text_upper,
+    custom_text_middle,
+    custom_text_bottom,
+    savefig_format,
+    volume,
+    dpi,
+):
+    plot_custom_text = False
+    sig_probs = False
+    data = process_input(matrix_path, plot_type)
+    data = reindex_sbs96(data)
+    sample_count = 0
+
+    writer = FigureWriter(savefig_format, output_path, project, "SBS_96", dpi=dpi)
+    fig = make_pickle_file(context="SBS96", return_plot_template=True, volume=volume)
+    panel1 = fig.axes[0]
+
+    ctx = data.index  # [seq[0]+seq[2]+seq[6] for seq in data.index]
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [1 / 256, 1 / 256, 1 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [203 / 256, 202 / 256, 202 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [236 / 256, 199 / 256, 197 / 256],
+    ]
+    colorsall = [[colors[j] for i in range(int(len(ctx) / 6))] for j in range(6)]
+    colors_flat_list = [item for sublist in colorsall for item in sublist]
+
+    # the bars and text of the template are created once and updated for
+    # every sample instead of being drawn on a new figure
+    bars = BarCollection(panel1, np.arange(len(ctx)) + 0.4, 0.4, colors_flat_list)
+    sample_text = panel1.text(
+        0.045,
+        0.75,
+        "",
+        fontsize=60,
+        weight="bold",
+        color="black",
+        fontname="Arial",
+        transform=fig.transFigure,
+    )
+    custom_text = panel1.text(
+        0.98,
+        0.78,
+        "",
+        fontsize=40,
+        weight="bold",
+        color="black",
+        fontname="Arial",
+        transform=fig.transFigure,
+        ha="right",
+    )
+
+    panel1.set_xlim([0, 96])
+    panel1.yaxis.grid(True)
+    panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    panel1.set_xlabel("")
+    if percentage:
+        panel1.set_ylabel(
+            "Percentage of Single Base Substitutions",
+            fontsize=35,
+            fontname="Times New Roman",
+            weight="bold",
+        )
+    else:
+        panel1.set_ylabel(
+            "Number of Single Base Substitutions",
+            fontsize=35,
+            fontname="Times New Roman",
+            weight="bold",
+        )
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=True,
+        labelleft=True,
+        right=True,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="lightgray",
+        width=2,
+    )
+
+    writer.set_raster_background(
+        fig,
+        [
+            panel1.yaxis,
+            *panel1.spines.values(),
+            sample_text,
+            custom_text,
+            bars.collection,
+        ],
+        cache_key=("SBS96", volume),
+        label_artists=[sample_text, custom_text],
+    )
+    profiles = profile_keys(data)
+    for sample in data.columns:
+        total_count = np.sum(data[sample].values)
+        x = 0.4
+        ymax = 0
+        i = 0
+        muts = data[sample].values
+        heights = np.zeros(len(ctx))
+        if percentage:
+            if total_count > 0:
+                heights = muts / total_count * 100
+                ymax = np.max(heights)
+            sig_probs = True
+        else:
+            heights = muts
+            ymax = np.max(muts)
+        bars.set_heights(heights)
+
+        x = 0.043
+        y3 = 0.87
+        y = int(ymax * 1.25)
+        y2 = y + 2
+
+        if y <= 4:
+            y += 4
+
+        while y % 4 != 0:
+            y += 1
+
+        y = ymax / 1.025
+        ytick_offest = float(y / 3)
+
+        if percentage:
+            ylabs = [
+                0,
+                round(ytick_offest, 1),
+                round(ytick_offest * 2, 1),
+                round(ytick_offest * 3, 1),
+                round(ytick_offest * 4, 1),
+            ]
+            ylabels = [
+                str(0),
+                str(round(ytick_offest, 1)) + "%",
+                str(round(ytick_offest * 2, 1)) + "%",
+                str(round(ytick_offest * 3, 1)) + "%",
+                str(round(ytick_offest * 4, 1)) + "%",
+            ]
+        else:
+            ylabs = [
+                0,
+                ytick_offest,
+                ytick_offest * 2,
+                ytick_offest * 3,
+                ytick_offest * 4,
+            ]
+            ylabels = [
+                0,
+                ytick_offest,
+                ytick_offest * 2,
+                ytick_offest * 3,
+                ytick_offest * 4,
+            ]
+
+        labs = np.arange(0.375, 96.375, 1)
+
+        font_label_size = 30
+        if not percentage:
+            if int(ylabels[3]) >= 1000:
+                font_label_size = 20
+
+        if percentage:
+            if len(ylabels) > 2:
+                font_label_size = 20
+
+        if not percentage:
+            ylabels = getylabels(ylabels)
+
+        panel1.set_ylim([0, y])
+        panel1.set_yticks(ylabs)
+        if sig_probs:
+            sample_text.set_text(sample)
+        else:
+            sample_text.set_text(
+                sample + ": " + "{:,}".format(int(total_count)) + " subs"
+            )
+
+        panel1.set_yticklabels(ylabels, fontsize=font_label_size)
+
+        custom_text_upper_plot = ""
+        custom_text.set_text("")
+        try:
+            custom_text_upper[sample_count]
+        except:
+            custom_text_upper = False
+        try:
+            custom_text_middle[sample_count]
+        except:
+            custom_text_middle = False
+        try:
+            custom_text_bottom[sample_count]
+        except:
+            custom_text_bottom = False
+
+        if custom_text_upper:
+            plot_custom_text = True
+            if len(custom_text_upper[sample_count]) > 40:
+                print(
+                    "To add a custom text, please limit the string to <40 characters including spaces."
+                )
+                plot_custom_text = False
+        if custom_text_middle:
+            if len(custom_text_middle[sample_count]) > 40:
+                print(
+                    "To add a custom text, please limit the string to <40 characters including spaces."
+                )
+                plot_custom_text = False
+
+        if plot_custom_text:
+            x_pos_custom = 0.98
+            if custom_text_upper and custom_text_middle:
+                custom_text_upper_plot = (
+                    custom_text_upper[sample_count]
+                    + "\n"
+                    + custom_text_middle[sample_count]
+                )
+                if custom_text_bottom:
+                    custom_text_upper_plot += "\n" + custom_text_bottom[sample_count]
+
+            if custom_text_upper and not custom_text_middle:
+                custom_text_upper_plot = custom_text_upper[sample_count]
+                custom_text.set_text(custom_text_upper_plot)
+                custom_text.set_y(0.78)
+
+            elif custom_text_upper and custom_text_middle:
+                if not custom_text_bottom:
+                    custom_text.set_text(custom_text_upper_plot)
+                    custom_text.set_y(0.72)
+                else:
+                    custom_text.set_text(custom_text_upper_plot)
+                    custom_text.set_y(0.68)
+
+            elif not custom_text_upper and custom_text_middle:
+                custom_text_upper_plot = custom_text_middle[sample_count]
+                custom_text.set_text(custom_text_upper_plot)
+                custom_text.set_y(0.78)
+
+        [i.set_color("black") for i in panel1.get_yticklabels()]
+        writer.write(sample, fig, profile=profiles[sample_count])
+        sample_count += 1
+
+    plt.close(fig)
+    return writer.close()
+
+
+def build_template(context):
+    plot_custom_text = False
+    sig_probs = False
+    pcawg = False
+
+    # total_count = sum(sum(nuc.values()) for nuc in mutations[sample].values())
+    # , extent=[-5, 80, -5, 30])
+    plt.rcParams["axes.linewidth"] = 2
+    plot1 = plt.figure(figsize=(43.93, 9.92))
+    plt.rc("axes", edgecolor="lightgray")
+    panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
+    seq96 = [
+        "A[C>A]A",
+        "A[C>A]C",
+        "A[C>A]G",
+        "A[C>A]T",
+        "C[C>A]A",
+        "C[C>A]C",
+        "C[C>A]G",
+        "C[C>A]T",
+        "G[C>A]A",
+        "G[C>A]C",
+        "G[C>A]G",
+        "G[C>A]T",
+        "T[C>A]A",
+        "T[C>A]C",
+        "T[C>A]G",
+        "T[C>A]T",
+        "A[C>G]A",
+        "A[C>G]C",
+        "A[C>G]G",
+        "A[C>G]T",
+        "C[C>G]A",
+        "C[C>G]C",
+        "C[C>G]G",
+        "C[C>G]T",
+        "G[C>G]A",
+        "G[C>G]C",
+        "G[C>G]G",
+        "G[C>G]T",
+        "T[C>G]A",
+        "T[C>G]C",
+        "T[C>G]G",
+        "T[C>G]T",
+        "A[C>T]A",
+        "A[C>T]C",
+        "A[C>T]G",
+        "A[C>T]T",
+        "C[C>T]A",
+        "C[C>T]C",
+        "C[C>T]G",
+        "C[C>T]T",
+        "G[C>T]A",
+        "G[C>T]C",
+        "G[C>T]G",
+        "G[C>T]T",
+        "T[C>T]A",
+        "T[C>T]C",
+        "T[C>T]G",
+        "T[C>T]T",
+        "A[T>A]A",
+        "A[T>A]C",
+        "A[T>A]G",
+        "A[T>A]T",
+        "C[T>A]A",
+        "C[T>A]C",
+        "C[T>A]G",
+        "C[T>A]T",
+        "G[T>A]A",
+        "G[T>A]C",
+        "G[T>A]G",
+        "G[T>A]T",
+        "T[T>A]A",
+        "T[T>A]C",
+        "T[T>A]G",
+        "T[T>A]T",
+        "A[T>C]A",
+        "A[T>C]C",
+        "A[T>C]G",
+        "A[T>C]T",
+        "C[T>C]A",
+        "C[T>C]C",
+        "C[T>C]G",
+        "C[T>C]T",
+        "G[T>C]A",
+        "G[T>C]C",
+        "G[T>C]G",
+        "G[T>C]T",
+        "T[T>C]A",
+        "T[T>C]C",
+        "T[T>C]G",
+        "T[T>C]T",
+        "A[T>G]A",
+        "A[T>G]C",
+        "A[T>G]G",
+        "A[T>G]T",
+        "C[T>G]A",
+        "C[T>G]C",
+        "C[T>G]G",
+        "C[T>G]T",
+        "G[T>G]A",
+        "G[T>G]C",
+        "G[T>G]G",
+        "G[T>G]T",
+        "T[T>G]A",
+        "T[T>G]C",
+        "T[T>G]G",
+        "T[T>G]T",
+    ]
+    xlabels = []
+
+    x = 0.4
+    ymax = 0
+    colors = [
+        [3 / 256, 189 / 256, 239 / 256],
+        [1 / 256, 1 / 256, 1 / 256],
+        [228 / 256, 41 / 256, 38 / 256],
+        [203 / 256, 202 / 256, 202 / 256],
+        [162 / 256, 207 / 256, 99 / 256],
+        [236 / 256, 199 / 256, 197 / 256],
+    ]
+    xlabels = [seq[0] + seq[2] + seq[6] for seq in seq96]
+    i = 0
+
+    x = 0.043
+    y3 = 0.87
+    y = int(ymax * 1.25)
+    y2 = y + 2
+    for i in range(0, 6, 1):
+        panel1.add_patch(
+            plt.Rectangle(
+                (x, y3),
+                0.15,
+                0.05,
+                facecolor=colors[i],
+                clip_on=False,
+                transform=plt.gcf().transFigure,
+            )
+        )
+        x += 0.159
+
+    yText = y3 + 0.06
+    plt.text(
+        0.1,
+        yText,
+        "C>A",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.255,
+        yText,
+        "C>G",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.415,
+        yText,
+        "C>T",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.575,
+        yText,
+        "T>A",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.735,
+        yText,
+        "T>C",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+    plt.text(
+        0.89,
+        yText,
+        "T>G",
+        fontsize=55,
+        fontweight="bold",
+        fontname="Arial",
+        transform=plt.gcf().transFigure,
+    )
+
+    if y <= 4:
+        y += 4
+
+    while y % 4 != 0:
+        y += 1
+    # ytick_offest = int(y/4)
+    y = ymax / 1.025
+    ytick_offest = float(y / 3)
+    labs = np.arange(0.375, 96.375, 1)
+
+    panel1.set_xlim([0, 96])
+    # panel1.set_ylim([0, y])
+    panel1.set_xticks(labs)
+    # panel1.set_yticks(ylabs)
+    count = 0
+    m = 0
+    for i in range(0, 96, 1):
+        plt.text(
+            i / 101 + 0.0415,
+            0.02,
+            xlabels[i][0],
+            fontsize=30,
+            color="gray",
+            rotation="vertical",
+            verticalalignment="center",
+            fontname="Courier New",
+            transform=plt.gcf().transFigure,
+        )
+        plt.text(
+            i / 101 + 0.0415,
+            0.044,
+            xlabels[i][1],
+            fontsize=30,
+            color=colors[m],
+            rotation="vertical",
+            verticalalignment="center",
+            fontname="Courier New",
+            fontweight="bold",
+            transform=plt.gcf().transFigure,
+        )
+        plt.text(
+            i / 101 + 0.0415,
+            0.071,
+            xlabels[i][2],
+            fontsize=30,
+            color="gray",
+            rotation="vertical",
+            verticalalignment="center",
+            fontname="Courier New",
+            transform=plt.gcf().transFigure,
+        )
+        count += 1
+        if count == 16:
+            count = 0
+            m += 1
+
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    panel1.set_xlabel("")
+    panel1.set_ylabel("")
+
+    panel1.tick_params(
+        axis="both",
+        which="both",
+        bottom=False,
+        labelbottom=False,
+        left=True,
+        labelleft=True,
+        right=True,
+        labelright=False,
+        top=False,
+        labeltop=False,
+        direction="in",
+        length=25,
+        colors="lightgray",
+        width=2,
+    )
+
+    [i.set_color("black") for i in plt.gca().get_yticklabels()]
+    return plot1
@@ -0,0 +1,436 @@
+"""SV32 plots of plotSV and the SV32 plot template."""
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as ticker
+import matplotlib.transforms as transforms
+import numpy as np
+
+from sigProfilerPlotting.sigProfilerPlotting import (
+    FigureWriter,
+    clear_plotting_memory,
+    make_pickle_file,
+    process_input,
+)
+
+
+def render(
+    matrix_path,
+    output_path,
+    project,
+    percentage,
+    aggregate,
+    savefig_format,
+    dpi,
+    volume,
+):
+    # To reindex the input data
+    df = process_input(matrix_path, "32")
+    df.reset_index(inplace=True)
+    label = df.columns[0]
+    labels = df[label]
+
+    color_mapping = {
+        "del": {
+            ">10Mb": "deeppink",
+            "1Mb-10Mb": "hotpink",
+            "10-100Kb": "lightpink",
+            "100Kb-1Mb": "palevioletred",
+            "1-10Kb": "lavenderblush",
+        },
+        "tds": {
+            ">10Mb": "saddlebrown",
+            "1Mb-10Mb": "sienna",
+            "10-100Kb": "sandybrown",
+            "100Kb-1Mb": "peru",
+            "1-10Kb": "linen",
+        },
+        "inv": {
+            ">10Mb": "rebeccapurple",
+            "1Mb-10Mb": "blueviolet",
+            "10-100Kb": "plum",
+            "100Kb-1Mb": "mediumorchid",
+            "1-10Kb": "thistle",
+        },
+    }
+
+    # Custom Formatting
+    plt.style.use("ggplot")
+    plt.rcParams["axes.facecolor"] = "white"
+    fig = make_pickle_file(context="SV32", return_plot_template=True, volume=volume)
+    ax = fig.axes[0]
+    trans = transforms.blended_transform_factory(ax.transData, ax.transAxes)
+
+    bars = []
+    for i, label in enumerate(labels):
+        categories = label.split("_")
+        if len(categories) > 2:
+            rearrangement_class = categories[1]
+            size_class = categories[2]
+
+        if (
+            len(categories) == 2
+        ):  # clustered translocation or non-clustered translocation
+            bar = ax.bar(
+                i, 0, color="dimgray", edgecolor="black"
+            )  # translocation only has one color
+        else:
+            bar = ax.bar(
+                i,
+                0,
+                color=color_mapping[rearrangement_class][size_class],
+                edgecolor="black",
+            )
+        bars.append(bar[0])
+
+    # y-axis titles
+    if aggregate and not percentage:
+        ax.set_ylabel(
+            "Number of events per sample",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+    elif aggregate and percentage:
+        ax.set_ylabel(
+            "Percentage of SV's",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+    elif not aggregate and not percentage:
+        ax.set_ylabel(
+            "Number of events",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+    elif not aggregate and percentage:
+        ax.set_ylabel(
+            "Percentage(%)",
+            fontsize=24,
+            fontname="Arial",
+            weight="bold",
+            labelpad=15,
+            color="black",
+        )
+
+    # TITLE
+    title = ax.text(
+        0,
+        0.90,
+        "",
+        fontsize=20,
+        fontname="Arial",
+        fontweight="bold",
+        color="black",
+        transform=trans,
+    )
+
+    # inner function to update the plot with the counts of a sample
+    def plot(counts, sample):
+        for bar, count in zip(bars, counts):
+            bar.set_height(count)
+
+        ax.yaxis.set_major_locator(ticker.LinearLocator(5))
+        tmp_max = max(counts)
+        ax.set_ylim(0, 1.25 * tmp_max)
+
+        # format the set_yticklabels labels
+        if percentage:
+            tmp_y_labels = [
+                "{0:0.1f}%".format(round(x, 1)) for x in ax.get_yticks().tolist()
+            ]
+        else:
+            tmp_y_labels = [round(x, 1) for x in ax.get_yticks().tolist()]
+
+        # set the y-axis ticks and labels
+        ax.set_yticks(ax.get_yticks())
+        ax.set_yticklabels(
+            tmp_y_labels, fontname="Arial", weight="bold", fontsize=16, color="black"
+        )
+
+        title.set_text(sample)
+        return fig
+
+    writer = FigureWriter(savefig_format, output_path, project, "SV_32", dpi=dpi)
+    if aggregate:
+        num_samples = len(df.columns) - 1
+        df["total_count"] = (
+            df.select_dtypes(include=[np.number]).sum(axis=1) / num_samples
+        )  # NORMALIZE BY # of SAMPLES
+        counts = list(df["total_count"])
+        if percentage and sum(counts) != 0:
+            counts = [(x / sum(counts)) * 100 for x in counts]
+        sample = ""
+        writer.write(sample, plot(counts, project))
+    else:
+        # each column vector in dataframe contains counts for a specific sample
+        samples = list(df)[1:]
+        for i, (col, sample) in enumerate(zip(df.columns[1:], samples)):
+            counts = list(df[col])
+            if percentage and sum(counts) != 0:
+                counts = [(x / sum(counts)) * 100 for x in counts]
+            assert (len(counts)) == 32
+            assert (len(labels)) == 32
+            writer.write(sample, plot(counts, sample))
+
+    plt.close(fig)
+    results = writer.close()
+    clear_plotting_memory()
+    return results
+
+
+def build_template(context):
+    x_labels = ["1-10kb", "10-100kb", "100kb-1Mb", "1Mb-10Mb", ">10Mb"]
+    N = 32
+
+    # Custom Formatting
+    plt.style.use("ggplot")
+    plt.rcParams["axes.facecolor"] = "white"
+    plot1, ax = plt.subplots(figsize=(16, 8))
+    plt.gca().yaxis.grid(True)
+    plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
+    ax.set_axisbelow(True)
+    ax.yaxis.set_major_locator(ticker.LinearLocator(5))
+    ax.spines["bottom"].set_color("black")
+    ax.spines["top"].set_color("black")
+    ax.spines["right"].set_color("black")
+    ax.spines["left"].set_color("black")
+    plt.xlim(xmin=-0.5, xmax=N - 0.5)
+    # Add light gray horizontal lines at y-ticks
+    ax.grid(linestyle="-", linewidth=1, color="#EDEDED", axis="y")
+
+    ax.set_xticks(list(range(N)))
+    ax.set_xticklabels(
+        x_labels * 3 + [" "] + x_labels * 3 + [" "],
+        rotation=90,
+        weight="bold",
+        fontsize=16,
+        fontname="Arial",
+        color="black",
+    )
+    ax.tick_params(labelleft=True, left=False, bottom=False)
+    ax.tick_params(axis="y", which="major", pad=0, labelsize=30)
+
+    # Set patch dimensions
+    patch_height = 0.05
+    patch_width = 2.8
+    loh_width = 2.5
+    loh_len = 4.8
+
+    trans = transforms.blended_transform_factory(ax.transData, ax.transAxes)
+
+    #### CLUSTERED PATCHES ####
+    ax.add_patch(
+        plt.Rectangle(
+            (-0.5, 1.095),
+            15.9,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="gray",
+            transform=trans,
+        )
+    )
+    plt.text(
+        6,
+        1.1125,
+        "Clustered",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (-0.5, 1.01),
+            loh_len + 0.1,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="maroon",
+            transform=trans,
+        )
+    )
+    plt.text(
+        1.3,
+        1.03,
+        "Del",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (4.6, 1.01),
+            loh_len,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="darkorange",
+            transform=trans,
+        )
+    )
+    plt.text(
+        6.27,
+        1.03,
+        "Tds",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (9.6, 1.01),
+            loh_len,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="slateblue",
+            transform=trans,
+        )
+    )
+    plt.text(
+        11.35,
+        1.03,
+        "Inv",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (14.6, 1.01),
+            0.8,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="dimgray",
+            transform=trans,
+        )
+    )
+    plt.text(
+        14.75,
+        1.03,
+        "T",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+
+    # add vertical black lines
+    ax.axvline(x=15.5, color="black", linewidth=1)
+
+    #### NON-CLUSTERED PATCHES ####
+    ax.add_patch(
+        plt.Rectangle(
+            (15.6, 1.095),
+            15.9,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="black",
+            transform=trans,
+        )
+    )
+    plt.text(
+        21,
+        1.1125,
+        "Non-Clustered",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (15.6, 1.01),
+            loh_len,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="maroon",
+            transform=trans,
+        )
+    )
+    plt.text(
+        17.35,
+        1.03,
+        "Del",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (20.6, 1.01),
+            loh_len,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="darkorange",
+            transform=trans,
+        )
+    )
+    plt.text(
+        22.25,
+        1.03,
+        "Tds",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (25.6, 1.01),
+            loh_len,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="slateblue",
+            transform=trans,
+        )
+    )
+    plt.text(
+        27.37,
+        1.03,
+        "Inv",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+    ax.add_patch(
+        plt.Rectangle(
+            (30.6, 1.01),
+            0.9,
+            patch_height * 1.5,
+            clip_on=False,
+            facecolor="dimgray",
+            transform=trans,
+        )
+    )
+    plt.text(
+        30.82,
+        1.03,
+        "T",
+        fontsize=23,
+        fontname="Arial",
+        fontweight="bold",
+        color="white",
+        transform=trans,
+    )
+
+    return plot1
@@ -17,8 +17,18 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.backends.backend_pdf import PdfPages
 
-
-def samplePortrait(sample_matrices_path, output_path, project, percentage=False):
+from sigProfilerPlotting import instrumentation
+from sigProfilerPlotting.renderers.sbs1536 import HEAT_COLORS, heatmap, heatmap_paths
+
+
+# timings is a PlotTimings object that receives the duration (and with
+# PlotTimings(memory=True), the memory) of reading the matrices, as
+# process_input, and of drawing and writing the page of each sample, and the
+# complexity of each page as the sample_portrait context.
+@instrumentation.instrumented
+def samplePortrait(
+    sample_matrices_path, output_path, project, percentage=False, timings=None
+):
     pcawg = False
     sig_probs = False
     if sample_matrices_path[-1] != "/":
@@ -1322,6 +1332,10 @@ def samplePortrait(sample_matrices_path, output_path, project, percentage=False)
         DBS312 = False
         print("No DBS312 provided")
 
+    timings = instrumentation.active()
+    if timings is not None:
+        timings.record_since_last("process_input")
+
     ########### plot through each sample ####################################################
     for sample in samples:
         plt.rcParams["axes.linewidth"] = 2
@@ -2287,6 +2301,9 @@ def samplePortrait(sample_matrices_path, output_path, project, percentage=False)
         total_count = max_all[sample] * 1.1
         ratio = total_count / total_count_sample
 
+        # the cells of the heatmaps are drawn as one path per color level
+        cells = []
+        levels = []
         i = 0
         x_pos = 0
         x_inter = 0
@@ -2329,19 +2346,8 @@ def samplePortrait(sample_matrices_path, output_path, project, percentage=False)
                     except:
                         mut_count = 0
                     xlabels.append(tri[0] + "-" + tri[1])
-                    rectangle = mplpatches.Rectangle(
-                        (x_pos, y_pos),
-                        1,
-                        1,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat[0][mut_count],
-                            colors_heat[1][mut_count],
-                            colors_heat[2][mut_count],
-                        ),
-                    )
-
-                    panel5.add_patch(rectangle)
+                    cells.append((x_pos, y_pos))
+                    levels.append(mut_count)
                     x_pos += 1
                 y_pos -= 1
                 x_pos = x_inter
@@ -2349,7 +2355,16 @@ def samplePortrait(sample_matrices_path, output_path, project, percentage=False)
             x_inter += 17
             x_pos = x_inter
             i += 1
+        heatmap(
+            panel5,
+            heatmap_paths(
+                np.array(cells, dtype=float), np.array(levels) % len(HEAT_COLORS)
+            ),
+        )
 
+        cells = []
+        levels_5 = []
+        levels_3 = []
         x_pos = 0
         x_inter = 0
         total_count_5 = max_5[sample] * 1.1
@@ -2390,38 +2405,18 @@ def samplePortrait(sample_matrices_path, output_path, project, percentage=False)
                         )
                         / 20
                     )
-                    rectangle = mplpatches.Rectangle(
-                        (x_pos, y_pos),
-                        1,
-                        1,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][mut_count],
-                            colors_heat_compact[1][mut_count],
-                            colors_heat_compact[2][mut_count],
-                        ),
-                    )
-
-                    panel13.add_patch(rectangle)
-                    rectangle = mplpatches.Rectangle(
-                        (x_pos, y_pos),
-                        1,
-                        1,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat[0][mut_count_3],
-                            colors_heat[1][mut_count_3],
-                            colors_heat[2][mut_count_3],
-                        ),
-                    )
-
-                    panel12.add_patch(rectangle)
+                    cells.append((x_pos, y_pos))
+                    levels_5.append(mut_count)
+                    levels_3.append(mut_count_3)
                     x_pos += 1
                 y_pos -= 1
                 x_pos = x_inter
             x_inter += 17
             x_pos = x_inter
             i += 1
+        cells = np.array(cells, dtype=float)
+        heatmap(panel13, heatmap_paths(cells, np.array(levels_5) % len(HEAT_COLORS)))
+        heatmap(panel12, heatmap_paths(cells, np.array(levels_3) % len(HEAT_COLORS)))
 
         x = 0.5
         ymax = 0
@@ -5312,9 +5307,14 @@ def samplePortrait(sample_matrices_path, output_path, project, percentage=False)
 
         panel8.set_xlim([0, 36])
 
-        pp.savefig(plot1)
+        if timings is not None:
+            timings.record_since_last("artists", sample)
+            timings.record_figure("sample_portrait", sample, plot1)
+        with instrumentation.stage("pdf", sample):
+            pp.savefig(plot1)
         plt.close()
-    pp.close()
+    with instrumentation.stage("pdf"):
+        pp.close()
 
 
 def main():
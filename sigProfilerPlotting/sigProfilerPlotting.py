@@ -4,39 +4,40 @@
 
 # Contact: ebergstr@eng.ucsd.edu
 
-import argparse
-import copy
-import errno
+import hashlib
 import io
+import contextlib
 import itertools
+import json
 import logging
 import os
 import pickle
 import re
-import string
-import sys
+import shutil
+import tempfile
+import uuid
 import warnings
-from bdb import set_trace
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 
 import matplotlib
+
+# the backend is selected before pyplot is imported
+matplotlib.use("Agg")
+
+import matplotlib.collections
+import matplotlib.colors
 import matplotlib.font_manager
-import matplotlib.lines as lines
-import matplotlib.patches as mplpatches
+import matplotlib.image
+import matplotlib.patches
+import matplotlib.path
 import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
-import matplotlib.transforms as transforms
 import numpy as np
 import pandas as pd
-import sklearn
-from matplotlib.backends.backend_pdf import PdfPages
-from matplotlib.ticker import LinearLocator
-from PIL import Image
-from sklearn.preprocessing import LabelEncoder
 
 import sigProfilerPlotting as spplt
-
-matplotlib.use("Agg")
+from sigProfilerPlotting import instrumentation, renderers
+from sigProfilerPlotting.instrumentation import DRAW_BUDGETS, PlotTimings
 
 MUTTYPE = "MutationType"
 INDEX_VALS = ["MutationType", "index", "Mutation Types", "classification"]
@@ -56,10 +57,18 @@ type_dict = {
     "sbs96": "SBS96.txt",
     "288": "SBS288.txt",
     "sbs288": "SBS288.txt",
+    "6": "SBS6.txt",
+    "sbs6": "SBS6.txt",
+    "24": "SBS24.txt",
+    "sbs24": "SBS24.txt",
+    "384": "SBS384.txt",
+    "sbs384": "SBS384.txt",
     "sbs1536": "SBS1536.txt",
     "1536": "SBS1536.txt",
     "sbs6144": "SBS6144.txt",
     "6144": "SBS6144.txt",
+    "4608": "SBS4608.txt",
+    "sbs4608": "SBS4608.txt",
     "78": "DBS78.txt",
     "dbs": "DBS78.txt",
     "dbs78": "DBS78.txt",
@@ -101,57 +110,1078 @@ def clear_plotting_memory():
         matplotlib.pyplot.close(fig)
 
 
+# Static backgrounds of template figures, keyed by (template, dpi). Each entry
+# is a full RGBA image, so only the most recently used ones are kept.
+_RASTER_BACKGROUNDS = OrderedDict()
+_RASTER_BACKGROUNDS_SIZE = 4
+
+# Number of rendered profiles (see _RasterBackground.render) kept by a plotting
+# call. Each one is a full RGBA image as well.
+_PROFILE_LAYERS_SIZE = 4
+
+
+def profile_keys(data):
+    """Returns a key for each sample of data whose profile is not unique.
+
+    Samples with identical counts get the same key, so that the figure of
+    the profile can be drawn once (see FigureWriter.write). The key of a
+    sample with a unique profile is None.
+    """
+    duplicated = data.T.duplicated(keep=False).to_numpy()
+    return [
+        data.iloc[:, i].to_numpy().tobytes() if is_duplicated else None
+        for i, is_duplicated in enumerate(duplicated)
+    ]
+
+
+class _RasterBackground:
+    """Raster fast path for figures that are updated and saved once per sample.
+
+    The figure is drawn once without its per-sample artists and the pixels are
+    kept. For every sample the background is copied back into the canvas and
+    only the per-sample artists are drawn on top of it, in the same order as a
+    full draw of the figure would use.
+
+    Samples that share a profile also share everything but their labels, the
+    artists that show the sample name and custom text. The canvas of a
+    profile without its labels is kept, and the labels of the next samples
+    with that profile are drawn on a copy of it.
+    """
+
+    def __init__(self, fig, dynamic_artists, dpi, cache_key=None, label_artists=()):
+        self.fig = fig
+        draw_order = {}
+        for ax in fig.axes:
+            for position, artist in enumerate(ax.get_children()):
+                draw_order[id(artist)] = position
+        self.artists = sorted(
+            dynamic_artists,
+            key=lambda artist: (artist.get_zorder(), draw_order.get(id(artist), 0)),
+        )
+        for artist in self.artists:
+            artist.set_animated(True)
+        label_ids = {id(artist) for artist in label_artists}
+        self.labels = [artist for artist in self.artists if id(artist) in label_ids]
+        self.profile_artists = [
+            artist for artist in self.artists if id(artist) not in label_ids
+        ]
+        self.profile_layers = OrderedDict()
+
+        fig.set_dpi(dpi)
+        renderer = fig.canvas.get_renderer()
+        shape = (int(renderer.height), int(renderer.width), 4)
+        key = None if cache_key is None else (cache_key, dpi)
+        self.pixels = _RASTER_BACKGROUNDS.get(key)
+        if self.pixels is None or self.pixels.shape != shape:
+            # animated artists are left out of a regular canvas draw
+            fig.canvas.draw()
+            self.pixels = np.array(fig.canvas.buffer_rgba())
+            if key is not None:
+                _RASTER_BACKGROUNDS[key] = self.pixels
+                while len(_RASTER_BACKGROUNDS) > _RASTER_BACKGROUNDS_SIZE:
+                    _RASTER_BACKGROUNDS.popitem(last=False)
+        elif key is not None:
+            _RASTER_BACKGROUNDS.move_to_end(key)
+
+    def render(self, profile=None):
+        renderer = self.fig.canvas.get_renderer()
+        canvas_pixels = np.asarray(renderer.buffer_rgba())
+        if profile is None or not self.labels or not self._labels_on_top(renderer):
+            canvas_pixels[...] = self.pixels
+            for artist in self.artists:
+                artist.draw(renderer)
+            return canvas_pixels
+
+        layer = self.profile_layers.get(profile)
+        if layer is None:
+            canvas_pixels[...] = self.pixels
+            for artist in self.profile_artists:
+                artist.draw(renderer)
+            self.profile_layers[profile] = canvas_pixels.copy()
+            while len(self.profile_layers) > _PROFILE_LAYERS_SIZE:
+                self.profile_layers.popitem(last=False)
+        else:
+            self.profile_layers.move_to_end(profile)
+            canvas_pixels[...] = layer
+        for artist in self.labels:
+            artist.draw(renderer)
+        return canvas_pixels
+
+    def _labels_on_top(self, renderer):
+        # Drawing the labels after every other artist only gives the same
+        # pixels if no artist that follows a label in the draw order overlaps
+        # it. The boxes are padded to cover antialiased edges.
+        position = {id(artist): i for i, artist in enumerate(self.artists)}
+        for label in self.labels:
+            label_box = label.get_window_extent(renderer).padded(2)
+            for artist in self.artists[position[id(label)] + 1 :]:
+                if artist in self.labels:
+                    continue
+                box = artist.get_tightbbox(renderer)
+                if box is not None and box.padded(2).overlaps(label_box):
+                    return False
+        return True
+
+    def close(self):
+        for artist in self.artists:
+            artist.set_animated(False)
+
+
+# The path codes of a bar: its four corners, from the bottom left, and back
+_BAR_CODES = [
+    matplotlib.path.Path.MOVETO,
+    matplotlib.path.Path.LINETO,
+    matplotlib.path.Path.LINETO,
+    matplotlib.path.Path.LINETO,
+    matplotlib.path.Path.CLOSEPOLY,
+]
+
+
+class BarCollection:
+    """Bars of a panel drawn as one PathCollection.
+
+    panel.bar adds a Rectangle for every bar, so a 96 context panel costs 96
+    artists to update and draw for each sample. Here the bars of each color
+    are one path of rectangles, built from the array of heights, and the
+    paths are drawn like the rectangles: without edges and snapped to the
+    pixel grid.
+
+    A legend at loc="best" avoids the bounding box of every Rectangle of its
+    axes, but not the bars of a collection. With legend_boxes, every bar also
+    keeps an invisible Rectangle of its size, so that such a legend is placed
+    as it was when the bars were rectangles.
+
+    Args:
+            panel: The axes of the bars.
+            x: The centers of the bars.
+            width: The width of the bars.
+            color: One color for every bar, or a single color for all of them.
+            heights: The heights of the bars (all 0 if None).
+            zorder: The zorder of the collection.
+            legend_boxes: Whether every bar keeps an invisible Rectangle.
+    """
+
+    def __init__(
+        self, panel, x, width, color, heights=None, zorder=1000, legend_boxes=False
+    ):
+        x = np.asarray(x, dtype=float)
+        self.left = x - width / 2
+        self.right = self.left + width
+        colors = matplotlib.colors.to_rgba_array(color)
+        if len(colors) == 1:
+            colors = np.repeat(colors, len(x), axis=0)
+        # the colors are drawn in the order they first appear
+        _, first, groups = np.unique(
+            colors, axis=0, return_index=True, return_inverse=True
+        )
+        order = np.argsort(first)
+        self.colors = colors[first[order]]
+        self.groups = [np.flatnonzero(groups.ravel() == group) for group in order]
+        self.collection = matplotlib.collections.PathCollection(
+            [],
+            facecolors=self.colors,
+            edgecolors="none",
+            linewidths=0,
+            snap=True,
+            zorder=zorder,
+            transform=panel.transData,
+        )
+        panel.add_collection(self.collection, autolim=False)
+        self.boxes = []
+        if legend_boxes:
+            for left in self.left:
+                box = matplotlib.patches.Rectangle((left, 0), width, 0, visible=False)
+                panel.add_patch(box)
+                self.boxes.append(box)
+        self.set_heights(np.zeros(len(x)) if heights is None else heights)
+
+    def set_heights(self, heights):
+        """Sets the heights of the bars, in the order of x."""
+        heights = np.asarray(heights, dtype=float)
+        verts = np.zeros((len(heights), 5, 2))
+        verts[:, [0, 3, 4], 0] = self.left[:, None]
+        verts[:, 1:3, 0] = self.right[:, None]
+        verts[:, 2:4, 1] = heights[:, None]
+        self.collection.set_paths(
+            [
+                matplotlib.path.Path(
+                    verts[group].reshape(-1, 2), _BAR_CODES * len(group)
+                )
+                for group in self.groups
+            ]
+        )
+        for box, height in zip(self.boxes, heights.tolist()):
+            box.set_height(height)
+
+    def legend_handles(self, *labels):
+        """Returns a legend handle for each color of the bars, with labels in
+        the order the colors first appear.
+        """
+        return [
+            matplotlib.patches.Patch(facecolor=color, label=label)
+            for color, label in zip(self.colors, labels)
+        ]
+
+
+class FigureWriter:
+    """Saves figures one at a time in the output format of a plotting call.
+
+    Figures are written as soon as write() is called, so a figure can be
+    updated and written again for the next sample. close() finishes the
+    output and returns the dictionary of PIL images for "PIL_Image", or None.
+
+    Args:
+            savefig_format: Format of the output plot (pdf, png, or PIL_Image)
+            output_path: Path to a directory for saving the output.
+            project: Name of unique sample set
+            context_type: Prefix of the output files (ie. SBS_96, ID_83)
+            dpi: The resolution of png and PIL_Image output.
+    """
+
+    def __init__(self, savefig_format, output_path, project, context_type, dpi=100):
+        self.savefig_format = savefig_format.lower()
+        if self.savefig_format not in ("pdf", "png", "pil_image"):
+            raise ValueError(
+                "ERROR: savefig_format must be 'pdf', 'png', or 'PIL_Image'."
+            )
+        self.output_path = output_path
+        self.context_type = context_type
+        self.dpi = dpi
+        self.savefig_kwargs = {}
+        if context_type in ("CNV_48", "SV_32"):
+            self.savefig_kwargs["bbox_inches"] = "tight"
+        self.image_list = {}
+        self.raster_background = None
+        self.pp = None
+        if self.savefig_format == "pdf":
+            file_path = os.path.join(output_path, f"{context_type}_plots_{project}.pdf")
+            # the pages are timed by write(), which knows their sample
+            self.pp = _pdf_pages(file_path, timed=False)
+
+    def set_raster_background(
+        self, fig, dynamic_artists, cache_key=None, label_artists=()
+    ):
+        """Renders fig from a cached background in png and PIL_Image output.
+
+        Args:
+                fig: The figure that is updated and written for every sample.
+                dynamic_artists: Artists of fig that change between samples,
+                        and any artist drawn above them.
+                cache_key: Identifies the template of fig so that its
+                        background can be reused by later calls.
+                label_artists: Artists of dynamic_artists that show the sample
+                        name and custom text, which differ between samples
+                        with the same profile.
+        """
+        if self.savefig_format == "pdf" or self.savefig_kwargs:
+            return
+        self.raster_background = _RasterBackground(
+            fig,
+            dynamic_artists,
+            self.dpi,
+            cache_key=cache_key,
+            label_artists=label_artists,
+        )
+
+    def write(self, name, fig, profile=None):
+        """Saves fig as the plot of sample name.
+
+        profile is the key of the sample's profile from profile_keys. In png
+        and PIL_Image output with a raster background, the figure of a
+        profile is drawn once and only the labels are drawn for the other
+        samples with that profile.
+        """
+        timings = instrumentation.active()
+        if timings is not None:
+            timings.record_since_last("artists", name)
+            timings.record_figure(self.context_type, name, fig)
+        if self.savefig_format == "pdf":
+            with instrumentation.stage("pdf", name):
+                self.pp.savefig(fig, **self.savefig_kwargs)
+            return
+
+        if self.savefig_format == "png":
+            target = self.output_path + self.context_type + "_plots_" + name + ".png"
+        else:
+            target = io.BytesIO()
+        if self.raster_background is not None and fig is self.raster_background.fig:
+            with instrumentation.stage("draw", name):
+                pixels = self.raster_background.render(profile)
+            with instrumentation.stage("encode", name):
+                matplotlib.image.imsave(target, pixels, format="png", dpi=self.dpi)
+        else:
+            with instrumentation.stage("encode", name):
+                fig.savefig(target, format="png", dpi=self.dpi, **self.savefig_kwargs)
+
+        if self.savefig_format == "pil_image":
+            # convert the buffer to a PIL image and add it to the image list
+            from PIL import Image
+
+            target.seek(0)
+            self.image_list[name] = Image.open(target)
+
+    def close(self):
+        if self.raster_background is not None:
+            self.raster_background.close()
+        if self.pp is not None:
+            with instrumentation.stage("pdf"):
+                self.pp.close()
+        if self.savefig_format == "pil_image":
+            return self.image_list
+        return None
+
+
 # Saves figures to files, unless savefig_format is "PIL_Image", in which case
-# the figures are saved to a dictionary of buffers
+# the figures are saved to a dictionary of buffers. figs is either a dictionary
+# of figures or an iterable of (name, figure) pairs, such as a generator that
+# draws the figures one at a time; each figure is closed once it is written.
 def output_results(savefig_format, output_path, project, figs, context_type, dpi=100):
-    if savefig_format.lower() == "pdf":
-        file_path = os.path.join(output_path, f"{context_type}_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-        for fig in figs:
-            if context_type in ("CNV_48", "SV_32"):
-                figs[fig].savefig(pp, format="pdf", bbox_inches="tight")
-            else:
-                figs[fig].savefig(pp, format="pdf")
-        pp.close()
-        clear_plotting_memory()
-    elif savefig_format.lower() == "png":
-        for fig in figs:
-            if context_type in ("CNV_48", "SV_32"):
-                figs[fig].savefig(
-                    output_path + context_type + "_plots_" + fig + ".png",
-                    dpi=dpi,
-                    bbox_inches="tight",
+    writer = FigureWriter(savefig_format, output_path, project, context_type, dpi=dpi)
+    if isinstance(figs, dict):
+        figs = figs.items()
+    for name, fig in figs:
+        writer.write(name, fig)
+        plt.close(fig)
+    results = writer.close()
+    clear_plotting_memory()
+    return results
+
+
+# Set inside worker processes of a parallel run (see _plot_in_parallel). When it
+# is not None, PDF pages are pickled and handed back to the parent process
+# instead of being written by the worker.
+_PDF_PAGE_COLLECTOR = None
+
+
+class _CollectedPdfPages:
+    """Stand-in for PdfPages used by parallel workers.
+
+    Figures are pickled in the order they are saved so that the parent process
+    can write them into the real PDF file in the same order as a serial run.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.pages = []
+
+    def savefig(self, figure, **kwargs):
+        self.pages.append((pickle.dumps(figure), kwargs))
+
+    def close(self):
+        pass
+
+
+# Set while a matrix is rendered in column chunks (see _plot_in_chunks). PDF
+# files stay open across the chunks, keyed by path, and are closed once every
+# chunk has been drawn.
+_STREAMED_PDFS = None
+
+
+class _StreamedPdfPages:
+    """Stand-in for PdfPages that adds the pages of a chunk to an open PDF."""
+
+    def __init__(self, pdf_pages):
+        self.pdf_pages = pdf_pages
+
+    def savefig(self, figure, **kwargs):
+        self.pdf_pages.savefig(figure, **kwargs)
+
+    def close(self):
+        pass
+
+
+class _TimedPdfPages:
+    """Records the pages written to a PDF in the running PlotTimings.
+
+    The n-th page is attributed to the n-th sample of the matrix being
+    rendered (see PlotTimings.page_samples).
+    """
+
+    def __init__(self, pdf_pages, timings, context):
+        self.pdf_pages = pdf_pages
+        self.timings = timings
+        self.context = context
+        self.samples = timings.page_samples or ()
+        self.page_count = 0
+
+    def savefig(self, figure, **kwargs):
+        sample = None
+        if self.page_count < len(self.samples):
+            sample = self.samples[self.page_count]
+        self.page_count += 1
+        self.timings.record_since_last("artists", sample)
+        self.timings.record_figure(self.context, sample, figure)
+        with instrumentation.stage("pdf", sample):
+            self.pdf_pages.savefig(figure, **kwargs)
+
+    def close(self):
+        with instrumentation.stage("pdf"):
+            self.pdf_pages.close()
+
+
+# Opens the multi-page PDF that a plotting function writes its figures into.
+# Unless timed is False, the pages are recorded in the running PlotTimings.
+def _pdf_pages(file_path, timed=True):
+    if _PDF_PAGE_COLLECTOR is not None:
+        pages = _CollectedPdfPages(file_path)
+        _PDF_PAGE_COLLECTOR.append(pages)
+    else:
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        if _STREAMED_PDFS is not None:
+            if file_path not in _STREAMED_PDFS:
+                _STREAMED_PDFS[file_path] = PdfPages(file_path)
+            pages = _StreamedPdfPages(_STREAMED_PDFS[file_path])
+        else:
+            pages = PdfPages(file_path)
+    timings = instrumentation.active()
+    if timed and timings is not None:
+        # the context of the figures prefixes the file name, as in
+        # SBS_1536_plots_<project>.pdf
+        context = os.path.basename(file_path).split("_plots_")[0]
+        return _TimedPdfPages(pages, timings, context)
+    return pages
+
+
+def _init_plot_worker():
+    # fonts are registered once per worker instead of once per chunk
+    load_custom_fonts()
+
+
+def _plot_worker(plot_function, matrix_chunk, args, kwargs, timings_options=None):
+    # Stages are recorded into a PlotTimings of the worker, created with the
+    # options of the parent's PlotTimings, which is merged into the parent's
+    global _PDF_PAGE_COLLECTOR
+    _PDF_PAGE_COLLECTOR = []
+    timed = timings_options is not None
+    timings = PlotTimings(**timings_options) if timed else None
+    try:
+        with instrumentation.activate(timings) if timed else contextlib.nullcontext():
+            result = plot_function(matrix_chunk, *args, **kwargs)
+        pdf_pages = [(pages.file_path, pages.pages) for pages in _PDF_PAGE_COLLECTOR]
+    finally:
+        _PDF_PAGE_COLLECTOR = None
+    return result, pdf_pages, timings
+
+
+# Largest number of samples handed to a parallel worker at once. PDF pages and
+# PIL images of a chunk are held in memory until the parent process merges them.
+_PARALLEL_CHUNK_SIZE = 32
+
+# Largest number of chunk files written in one pass over a text matrix
+_MAX_CHUNK_FILES = 128
+
+
+def _chunk_bounds(n_samples, n_chunks, chunk_size=None):
+    # Splits n_samples columns into at least n_chunks consecutive ranges, and
+    # into more if needed to keep each range at or below chunk_size samples.
+    if chunk_size is not None:
+        n_chunks = max(n_chunks, -(-n_samples // chunk_size))
+    bounds = np.linspace(0, n_samples, min(n_chunks, n_samples) + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _split_text_matrix(matrix_path, columns, bounds, tmp_dir):
+    # The chunk files are written in passes over the matrix, each of which
+    # writes at most _MAX_CHUNK_FILES files, so only one line of the matrix is
+    # held in memory. The first pass writes only the first chunk, so that it is
+    # drawn without waiting for the files of the other chunks.
+    firsts = [0] + list(range(1, len(bounds), _MAX_CHUNK_FILES))
+    for first, last in zip(firsts, firsts[1:] + [len(bounds)]):
+        group = bounds[first:last]
+        paths = [
+            os.path.join(tmp_dir, f"chunk_{first + i}.txt") for i in range(len(group))
+        ]
+        chunk_files = [open(path, "w") for path in paths]
+        try:
+            with open(matrix_path) as f:
+                for line in f:
+                    row = line.rstrip("\r\n").split("\t")
+                    for (start, stop), chunk_file in zip(group, chunk_files):
+                        fields = [row[column + 1] for column in columns[start:stop]]
+                        chunk_file.write("\t".join([row[0]] + fields) + "\n")
+        finally:
+            for chunk_file in chunk_files:
+                chunk_file.close()
+        for path, (start, stop) in zip(paths, group):
+            yield path, start, stop
+
+
+def _split_matrix(matrix_path, plot_type, samples, columns, bounds, tmp_dir):
+    """Splits the samples of an input matrix into column chunks.
+
+    samples holds the names of the samples to render and columns their
+    positions in the matrix. Yields a (matrix, start, stop) tuple for each
+    (start, stop) range of bounds over samples. Text matrices are split into
+    tab-separated files inside tmp_dir, only the samples of a chunk are read
+    from Parquet, Feather and .npy files, and DataFrames are sliced. Chunks
+    are read as they are requested.
+    """
+    matrix_format = _matrix_format(matrix_path)
+    if matrix_format == "text":
+        yield from _split_text_matrix(matrix_path, columns, bounds, tmp_dir)
+    elif matrix_format is not None:
+        for start, stop in bounds:
+            chunk = process_input(matrix_path, plot_type, samples[start:stop])
+            yield chunk, start, stop
+    else:
+        for start, stop in bounds:
+            yield matrix_path.iloc[:, columns[start:stop]], start, stop
+
+
+# Number of rows of a text matrix, or of samples of another matrix, that
+# _sample_totals reads at once
+_TOTALS_BLOCK_SIZE = 1024
+
+
+def _sample_totals(matrix_path, plot_type, samples):
+    # the total count of each sample, read in blocks to bound memory use
+    matrix_format = _matrix_format(matrix_path)
+    if matrix_format is None:
+        return matrix_path[samples].sum()
+    if matrix_format != "text":
+        return pd.concat(
+            [
+                process_input(matrix_path, plot_type, block).sum()
+                for block in (
+                    samples[i : i + _TOTALS_BLOCK_SIZE]
+                    for i in range(0, len(samples), _TOTALS_BLOCK_SIZE)
                 )
+            ]
+        )
+    with open(matrix_path) as f:
+        selected = set(samples + f.readline().rstrip("\r\n").split("\t")[:1])
+    totals = 0
+    for rows in pd.read_csv(
+        matrix_path,
+        sep="\t",
+        index_col=0,
+        usecols=lambda name: name in selected,
+        chunksize=_TOTALS_BLOCK_SIZE,
+    ):
+        totals = rows.sum() + totals
+    return totals[samples]
+
+
+def _filter_samples(
+    matrix_path, plot_type, names, samples=None, sample_regex=None, top_k_by_total=None
+):
+    """Returns the names of the samples kept by the sample selection options.
+
+    The options are applied in turn: the samples named by samples (in that
+    order), the samples whose name matches the regular expression
+    sample_regex, and the top_k_by_total samples with the largest total
+    count, in their original order.
+    """
+    selected = _select_samples(names, samples)
+    if sample_regex is not None:
+        pattern = re.compile(sample_regex)
+        selected = [name for name in selected if pattern.search(str(name))]
+    if top_k_by_total is not None and len(selected) > top_k_by_total:
+        totals = _sample_totals(matrix_path, plot_type, selected)
+        kept = set(totals.nlargest(top_k_by_total).index)
+        selected = [name for name in selected if name in kept]
+    if not selected:
+        raise ValueError("ERROR: no samples of the matrix match the selection.")
+    return selected
+
+
+def _prepare_chunks(matrix_path, plot_type, kwargs, select=None):
+    """Prepares a matrix to be rendered in column chunks.
+
+    select holds the samples, sample_regex and top_k_by_total arguments of the
+    plotting functions. The sample names of a file are read from its header,
+    so only the columns of the selected samples are read afterwards.
+
+    Returns the matrix, the names of the samples to render, their column
+    positions and the plotting arguments with the custom text of those
+    samples, or None if the matrix is rendered in one piece.
+    """
+    # DataFrames and ndarrays are processed once and sliced into chunks
+    if isinstance(matrix_path, (pd.DataFrame, np.ndarray)):
+        matrix_path = process_input(matrix_path, plot_type)
+    elif not isinstance(matrix_path, str):
+        return None
+    names = _matrix_samples(matrix_path)
+    if select is None or all(option is None for option in select.values()):
+        # PCAWG style comma-separated matrices are plotted in one piece
+        if names is None or len(names) < 2:
+            return None
+        return matrix_path, names, list(range(len(names))), kwargs
+
+    if names is None:
+        matrix_path = _read_pcawg_matrix(matrix_path)
+        names = list(matrix_path.columns)
+    samples = _filter_samples(matrix_path, plot_type, names, **select)
+    positions = {name: i for i, name in enumerate(names)}
+    columns = [positions[name] for name in samples]
+    # custom text is indexed by the position of the sample in the matrix
+    kwargs = dict(kwargs)
+    for key in ("custom_text_upper", "custom_text_middle", "custom_text_bottom"):
+        if kwargs.get(key) is not None:
+            text = kwargs[key]
+            kwargs[key] = [text[column] for column in columns if column < len(text)]
+    return matrix_path, samples, columns, kwargs
+
+
+def _chunk_kwargs(kwargs, start, stop):
+    # custom text is indexed by the position of the sample in the chunk
+    chunk_kwargs = dict(kwargs, n_jobs=1, chunk_size=None)
+    for key in ("custom_text_upper", "custom_text_middle", "custom_text_bottom"):
+        if chunk_kwargs.get(key) is not None:
+            chunk_kwargs[key] = chunk_kwargs[key][start:stop]
+    return chunk_kwargs
+
+
+def _plot_in_chunks(
+    plot_function,
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    chunk_size,
+    select=None,
+    **kwargs,
+):
+    """Renders the samples of a matrix chunk_size samples at a time.
+
+    Only the columns of one chunk are read, processed and drawn at a time, so
+    memory use is bounded by the chunk size instead of the number of samples.
+    PDF files stay open across the chunks and receive the pages in the
+    original sample order. If chunk_size is None, the selected samples are
+    rendered in one chunk.
+
+    Args:
+            plot_function: plotSBS, plotID or plotDBS.
+            matrix_path: The path to a matrix file, a pandas DataFrame or a np.ndarray.
+            output_path: Path to a directory for saving the output.
+            project: Name of unique sample set
+            plot_type: Context of the mutational matrix
+            chunk_size: Largest number of samples drawn at once.
+            select: The sample selection arguments of plot_function.
+    Returns:
+            The merged return value of plot_function.
+    """
+    global _STREAMED_PDFS
+    prepared = _prepare_chunks(matrix_path, plot_type, kwargs, select)
+    if prepared is None:
+        return plot_function(
+            matrix_path, output_path, project, plot_type, chunk_size=None, **kwargs
+        )
+    matrix_path, samples, columns, kwargs = prepared
+
+    tmp_dir = tempfile.mkdtemp(prefix="sigProfilerPlotting_")
+    _STREAMED_PDFS = {}
+    merged_result = None
+    try:
+        bounds = _chunk_bounds(len(samples), 1, chunk_size)
+        for matrix_chunk, start, stop in _split_matrix(
+            matrix_path, plot_type, samples, columns, bounds, tmp_dir
+        ):
+            result = plot_function(
+                matrix_chunk,
+                output_path,
+                project,
+                plot_type,
+                **_chunk_kwargs(kwargs, start, stop),
+            )
+            if isinstance(result, dict):
+                if merged_result is None:
+                    merged_result = {}
+                merged_result.update(result)
+            # the chunk is dropped once it is drawn
+            if isinstance(matrix_chunk, str):
+                os.remove(matrix_chunk)
+            del matrix_chunk
+    finally:
+        with instrumentation.stage("pdf"):
+            for pp in _STREAMED_PDFS.values():
+                pp.close()
+        _STREAMED_PDFS = None
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return merged_result
+
+
+def _plot_in_parallel(
+    plot_function,
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    n_jobs,
+    chunk_size=None,
+    select=None,
+    **kwargs,
+):
+    """Renders the samples of a matrix with a pool of worker processes.
+
+    The columns of the matrix are split into chunks of at most chunk_size
+    (by default _PARALLEL_CHUNK_SIZE) samples, and each worker calls
+    plot_function on one chunk at a time. PNG files are written by the workers
+    directly; PDF pages and PIL images are returned to this process and merged
+    in the original sample order, so the outputs match those of a serial call.
+    At most two chunks per worker are queued at once, which bounds the number
+    of pages held in memory.
+
+    Args:
+            plot_function: plotSBS, plotID or plotDBS.
+            matrix_path: The path to a matrix file, a pandas DataFrame or a np.ndarray.
+            output_path: Path to a directory for saving the output.
+            project: Name of unique sample set
+            plot_type: Context of the mutational matrix
+            n_jobs: Number of worker processes. -1 uses all available cores.
+            chunk_size: Largest number of samples handed to a worker at once.
+            select: The sample selection arguments of plot_function.
+    Returns:
+            The merged return value of plot_function.
+    """
+    if n_jobs is None or n_jobs < 1:
+        n_jobs = os.cpu_count() or 1
+    timings = instrumentation.active()
+
+    prepared = _prepare_chunks(matrix_path, plot_type, kwargs, select)
+    if prepared is None:
+        return plot_function(
+            matrix_path, output_path, project, plot_type, n_jobs=1, **kwargs
+        )
+    matrix_path, samples, columns, kwargs = prepared
+
+    tmp_dir = tempfile.mkdtemp(prefix="sigProfilerPlotting_")
+    try:
+        bounds = _chunk_bounds(len(samples), n_jobs, chunk_size or _PARALLEL_CHUNK_SIZE)
+        pending_chunks = _split_matrix(
+            matrix_path, plot_type, samples, columns, bounds, tmp_dir
+        )
+
+        def submit(executor, matrix_chunk, start, stop):
+            return executor.submit(
+                _plot_worker,
+                plot_function,
+                matrix_chunk,
+                (output_path, project, plot_type),
+                _chunk_kwargs(kwargs, start, stop),
+                None if timings is None else timings.options(),
+            )
+
+        n_workers = min(n_jobs, len(bounds))
+        futures = deque()
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_plot_worker
+        ) as executor:
+            merged_result = None
+            open_pdfs = {}
+            try:
+                while True:
+                    while len(futures) < 2 * n_workers:
+                        chunk = next(pending_chunks, None)
+                        if chunk is None:
+                            break
+                        futures.append(submit(executor, *chunk))
+                    if not futures:
+                        break
+                    result, pdf_pages, worker_timings = futures.popleft().result()
+                    if isinstance(result, dict):
+                        if merged_result is None:
+                            merged_result = {}
+                        merged_result.update(result)
+                    if worker_timings is not None:
+                        timings.merge(worker_timings)
+                    for file_path, pages in pdf_pages:
+                        if file_path not in open_pdfs:
+                            open_pdfs[file_path] = _pdf_pages(file_path, timed=False)
+                        with instrumentation.stage("pdf"):
+                            for page, savefig_kwargs in pages:
+                                fig = pickle.loads(page)
+                                open_pdfs[file_path].savefig(fig, **savefig_kwargs)
+                                plt.close(fig)
+            finally:
+                with instrumentation.stage("pdf"):
+                    for pp in open_pdfs.values():
+                        pp.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return merged_result
+
+
+def _import_pypdf():
+    try:
+        import pypdf
+    except ImportError:
+        raise ImportError(
+            "Reusing the pages of an incremental PDF requires pypdf. "
+            "Install it with: pip install pypdf"
+        ) from None
+    return pypdf
+
+
+def _manifest_path(output_path, kind, project, plot_type):
+    return os.path.join(output_path, f"{kind}_{plot_type}_manifest_{project}.json")
+
+
+def _read_manifest(manifest_path, savefig_format):
+    # A missing, damaged or foreign manifest is treated as an empty one
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest["savefig_format"] == savefig_format:
+            return manifest
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {"savefig_format": savefig_format, "pdfs": [], "samples": []}
+
+
+def _write_manifest(manifest_path, manifest):
+    # written to a temporary file and renamed, like the plot templates
+    tmp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+
+def _sample_keys(matrix_path, plot_type, samples, columns, settings, kwargs):
+    """Returns the content hash of each sample of a matrix.
+
+    The key of a sample hashes its processed counts, its custom text and
+    settings, which holds the options and versions that change the output.
+    A text matrix is hashed in one pass over blocks of _TOTALS_BLOCK_SIZE rows,
+    with the mutation types in the order of the file. The samples of other
+    matrices are read in blocks of _TOTALS_BLOCK_SIZE.
+    """
+    settings = json.dumps(settings, sort_keys=True).encode()
+    texts = [
+        kwargs.get(key)
+        for key in ("custom_text_upper", "custom_text_middle", "custom_text_bottom")
+    ]
+    digests = {}
+    for name, column in zip(samples, columns):
+        custom_text = [
+            str(text[column]) if text is not None and column < len(text) else None
+            for text in texts
+        ]
+        digests[name] = hashlib.sha256(settings)
+        digests[name].update(json.dumps(custom_text).encode())
+
+    matrix_format = _matrix_format(matrix_path)
+    if matrix_format == "text":
+        with open(matrix_path) as f:
+            selected = set(samples + f.readline().rstrip("\r\n").split("\t")[:1])
+        for rows in pd.read_csv(
+            matrix_path,
+            sep="\t",
+            index_col=0,
+            usecols=lambda name: name in selected,
+            chunksize=_TOTALS_BLOCK_SIZE,
+        ):
+            labels = "\t".join(map(str, rows.index)).encode()
+            values = rows[samples].to_numpy(dtype=np.float64).T.copy()
+            for name, counts in zip(samples, values):
+                digests[name].update(labels)
+                digests[name].update(counts.tobytes())
+        return {name: digest.hexdigest() for name, digest in digests.items()}
+
+    for first in range(0, len(samples), _TOTALS_BLOCK_SIZE):
+        block = samples[first : first + _TOTALS_BLOCK_SIZE]
+        if matrix_format is None:
+            counts = matrix_path[block]
+        else:
+            counts = process_input(matrix_path, plot_type, block)
+        for name in block:
+            digests[name].update(counts[name].to_numpy(dtype=np.float64).tobytes())
+    return {name: digest.hexdigest() for name, digest in digests.items()}
+
+
+def _merge_pdf_pages(output_path, tmp_dir, manifest, samples, current, changed):
+    """Writes the PDFs of an incremental run into tmp_dir/merged.
+
+    The pages of the samples in current are copied from the PDFs listed in
+    the manifest and the pages of the samples in changed from the PDFs just
+    rendered into tmp_dir, in the order of samples. Returns the PDF file
+    names, or None if the pages of a PDF do not match its samples.
+    """
+    pypdf = _import_pypdf()
+    old_positions = {entry["name"]: i for i, entry in enumerate(manifest["samples"])}
+    new_positions = {name: i for i, name in enumerate(changed)}
+    pdf_names = sorted(
+        set(manifest["pdfs"])
+        | {name for name in os.listdir(tmp_dir) if name.endswith(".pdf")}
+    )
+    merged_dir = os.path.join(tmp_dir, "merged")
+    os.makedirs(merged_dir)
+    for pdf_name in pdf_names:
+        old_path = os.path.join(output_path, pdf_name)
+        new_path = os.path.join(tmp_dir, pdf_name)
+        old_pages = pypdf.PdfReader(old_path).pages if current else []
+        new_pages = pypdf.PdfReader(new_path).pages if changed else []
+        expected_pages = len(manifest["samples"]) if current else 0
+        if len(old_pages) != expected_pages or len(new_pages) != len(changed):
+            return None
+        writer = pypdf.PdfWriter()
+        for name in samples:
+            if name in current:
+                writer.add_page(old_pages[old_positions[name]])
             else:
-                figs[fig].savefig(
-                    output_path + context_type + "_plots_" + fig + ".png", dpi=dpi
-                )
-        clear_plotting_memory()
-    elif savefig_format.lower() == "pil_image":
-        image_list = {}
-        for fig in figs:
-            tmp_buffer = io.BytesIO()
-            if context_type in ("CNV_48", "SV_32"):
-                figs[fig].savefig(
-                    tmp_buffer, format="png", bbox_inches="tight", dpi=dpi
+                writer.add_page(new_pages[new_positions[name]])
+        writer.write(os.path.join(merged_dir, pdf_name))
+    return pdf_names
+
+
+def _plot_incremental(
+    plot_function, matrix_path, output_path, project, plot_type, select, **kwargs
+):
+    """Renders only the samples whose output is out of date.
+
+    A manifest next to the outputs records a content hash of each rendered
+    sample (see _sample_keys). Samples whose hash is unchanged and whose
+    output files exist are skipped. The png files of the other samples are
+    replaced, and PDFs are rebuilt from the pages of the skipped samples and
+    the newly rendered pages (this requires pypdf).
+
+    Args:
+            plot_function: plotSBS, plotID or plotDBS.
+            matrix_path: The path to a matrix file, a pandas DataFrame or a np.ndarray.
+            output_path: Path to a directory for saving the output.
+            project: Name of unique sample set
+            plot_type: Context of the mutational matrix
+            select: The sample selection arguments of plot_function.
+    """
+    savefig_format = kwargs["savefig_format"].lower()
+    if isinstance(matrix_path, (pd.DataFrame, np.ndarray)):
+        matrix_path = process_input(matrix_path, plot_type)
+    names = _matrix_samples(matrix_path)
+    if names is None:
+        matrix_path = _read_pcawg_matrix(matrix_path)
+        names = list(matrix_path.columns)
+    samples = _filter_samples(matrix_path, plot_type, names, **select)
+    positions = {name: i for i, name in enumerate(names)}
+    columns = [positions[name] for name in samples]
+
+    settings = {
+        "function": plot_function.__name__,
+        "plot_type": plot_type,
+        "percentage": kwargs["percentage"],
+        "savefig_format": savefig_format,
+        "dpi": kwargs["dpi"],
+        "version": _template_tag(),
+    }
+    keys = _sample_keys(matrix_path, plot_type, samples, columns, settings, kwargs)
+
+    manifest_path = _manifest_path(
+        output_path, plot_function.__name__[4:], project, plot_type
+    )
+    manifest = _read_manifest(manifest_path, savefig_format)
+    entries = {entry["name"]: entry for entry in manifest["samples"]}
+    outputs_exist = all(
+        os.path.exists(os.path.join(output_path, name)) for name in manifest["pdfs"]
+    )
+    current = {
+        name
+        for name in samples
+        if name in entries
+        and entries[name]["key"] == keys[name]
+        and outputs_exist
+        and all(
+            os.path.exists(os.path.join(output_path, file_name))
+            for file_name in entries[name]["files"]
+        )
+    }
+    changed = [name for name in samples if name not in current]
+    if not changed and (
+        savefig_format == "png"
+        or [entry["name"] for entry in manifest["samples"]] == samples
+    ):
+        return None
+
+    tmp_dir = tempfile.mkdtemp(prefix="sigProfilerPlotting_", dir=output_path)
+    try:
+        if changed:
+            plot_function(
+                matrix_path,
+                tmp_dir + os.sep,
+                project,
+                plot_type,
+                samples=changed,
+                **kwargs,
+            )
+        if savefig_format == "pdf":
+            pdf_names = None
+            if current:
+                pdf_names = _merge_pdf_pages(
+                    output_path, tmp_dir, manifest, samples, current, changed
+                )
+            if pdf_names is None and current:
+                # the pages cannot be matched to the samples, render them all
+                shutil.rmtree(tmp_dir)
+                os.makedirs(tmp_dir)
+                plot_function(
+                    matrix_path,
+                    tmp_dir + os.sep,
+                    project,
+                    plot_type,
+                    samples=samples,
+                    **kwargs,
+                )
+            if pdf_names is None:
+                merged_dir = tmp_dir
+                pdf_names = sorted(
+                    name for name in os.listdir(tmp_dir) if name.endswith(".pdf")
                 )
             else:
-                figs[fig].savefig(tmp_buffer, format="png", dpi=dpi)
-            # convert tmp_buffer to a PIL and close buffer
-            tmp_buffer.seek(0)
-            tmp_image = Image.open(tmp_buffer)
-            # add the image to the image list for return
-            image_list[fig] = tmp_image
-        clear_plotting_memory()
-        return image_list
-    else:
-        raise ValueError("ERROR: savefig_format must be 'pdf', 'png', or 'PIL_Image'.")
+                merged_dir = os.path.join(tmp_dir, "merged")
+            for pdf_name in pdf_names:
+                os.replace(
+                    os.path.join(merged_dir, pdf_name),
+                    os.path.join(output_path, pdf_name),
+                )
+            manifest = {
+                "savefig_format": savefig_format,
+                "pdfs": pdf_names,
+                "samples": [
+                    {"name": name, "key": keys[name], "files": []} for name in samples
+                ],
+            }
+        else:
+            # png files are named <context>_plots_<sample>.png
+            files = {name: [] for name in changed}
+            for file_name in sorted(os.listdir(tmp_dir)):
+                os.replace(
+                    os.path.join(tmp_dir, file_name),
+                    os.path.join(output_path, file_name),
+                )
+                name = file_name.split("_plots_", 1)[-1][: -len(".png")]
+                if name in files:
+                    files[name].append(file_name)
+            for name in changed:
+                entries[name] = {"name": name, "key": keys[name], "files": files[name]}
+            manifest["samples"] = list(entries.values())
+        _write_manifest(manifest_path, manifest)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
     return None
 
 
 # Get corresponding reference index from our reference_format folder
-def get_context_reference(plot_type):
-    ref_index = []
+# Reference formats read by get_reference_format, keyed by file name
+_REFERENCE_FORMATS = {}
+
+# Strand matrices may hold only the transcribed and untranscribed strands,
+# which come first in their reference formats (ie. 192 of the 384 rows)
+_STRAND_SUBSETS = {"SBS384.txt": 192, "SBS24.txt": 12}
+
+
+def get_reference_format(plot_type):
+    """Returns the mutation types of the reference format of plot_type.
+
+    Each reference format file is read once per process.
+
+    Args:
+            plot_type: Context of the mutational matrix (ie. 96, 288, 78, 83)
+
+    Returns:
+            A tuple of the mutation types in the order of the reference format,
+            and a dictionary mapping each mutation type to its position.
+    """
     if plot_type.lower() in type_dict:
         SPP_TYPE = type_dict[plot_type.lower()]
     else:
@@ -159,13 +1189,232 @@ def get_context_reference(plot_type):
             "ERROR: SigProfilerPlotting is currently not supporting this input plot_type."
         )
 
-    ref_index = pd.read_csv(SPP_REFERENCE + SPP_TYPE, sep="\t", header=None)
-    ref_index = ref_index.iloc[:, 0].tolist()
+    if SPP_TYPE not in _REFERENCE_FORMATS:
+        ref_index = pd.read_csv(SPP_REFERENCE + SPP_TYPE, sep="\t", header=None)
+        labels = tuple(ref_index.iloc[:, 0].tolist())
+        positions = {label: position for position, label in enumerate(labels)}
+        _REFERENCE_FORMATS[SPP_TYPE] = (labels, positions)
+    return _REFERENCE_FORMATS[SPP_TYPE]
+
+
+def get_context_reference(plot_type):
+    return list(get_reference_format(plot_type)[0])
+
+
+def _order_by_reference(data, plot_type):
+    # Reorders the rows of data to the reference format of plot_type. The
+    # mutation types are checked against the reference format first, so that a
+    # mismatch is reported instead of reordering into rows of NaNs.
+    labels, positions = get_reference_format(plot_type)
+    if data.shape[0] == _STRAND_SUBSETS.get(type_dict[plot_type.lower()]):
+        labels = labels[: data.shape[0]]
+        positions = {label: positions[label] for label in labels}
+    if data.shape[0] != len(labels):
+        raise ValueError("Input matrix file should have " + str(len(labels)) + " rows")
+
+    index = data.index.tolist()
+    unexpected = set(index).difference(positions)
+    if unexpected or len(set(index)) != len(index):
+        missing = set(labels).difference(index)
+        duplicated = sorted(data.index[data.index.duplicated()].unique().map(str))
+        message = (
+            "ERROR: The mutation types of the input matrix do not match the "
+            + type_dict[plot_type.lower()][:-4]
+            + " reference format."
+        )
+        for name, values in (
+            ("Unexpected", unexpected),
+            ("Missing", missing),
+            ("Duplicated", duplicated),
+        ):
+            if values:
+                values = sorted(map(str, values))
+                message += " " + name + ": " + ", ".join(values[:10])
+                if len(values) > 10:
+                    message += " and " + str(len(values) - 10) + " more"
+                message += "."
+        raise ValueError(message)
+
+    order = np.empty(len(index), dtype=np.intp)
+    order[[positions[label] for label in index]] = np.arange(len(index))
+    if (order == np.arange(len(index))).all():
+        return data
+    return data.take(order)
+
+
+# Binary matrix formats read by process_input, by file extension
+MATRIX_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".npy": "npy",
+}
+
+
+def _matrix_format(matrix_path):
+    # the format of a matrix file, or None for DataFrames and ndarrays
+    if not isinstance(matrix_path, str):
+        return None
+    return MATRIX_FORMATS.get(os.path.splitext(matrix_path)[1].lower(), "text")
+
+
+def _select_samples(names, samples):
+    # the requested samples in the requested order, or every sample
+    if samples is None:
+        return list(names)
+    samples = list(samples)
+    name_set = set(names)
+    missing = [sample for sample in samples if sample not in name_set]
+    if missing:
+        raise ValueError(
+            "ERROR: samples not found in the matrix: "
+            + ", ".join(str(sample) for sample in missing)
+            + "."
+        )
+    return samples
+
+
+def _read_text_matrix(matrix_path, samples=None):
+    usecols = None
+    if samples is not None:
+        with open(matrix_path) as f:
+            header = f.readline().rstrip("\r\n").split("\t")
+        samples = _select_samples(header[1:], samples)
+        selected = set([header[0]] + samples)
+        usecols = lambda name: name in selected
+    data = pd.read_csv(matrix_path, sep="\t", index_col=0, usecols=usecols)
+    data = data.dropna(axis=1, how="all")
+    if samples is not None:
+        data = data[samples]
+    return data
+
+
+@contextlib.contextmanager
+def _parse_text_matrix(matrix_path):
+    """Opens a text matrix for the renderers that parse it line by line.
+
+    The block is recorded as the process_input stage and the read of the file
+    as its read_matrix stage, as for the matrices read by process_input.
+    """
+    with instrumentation.stage("process_input"):
+        with instrumentation.stage("read_matrix"), open(matrix_path) as f:
+            text = io.StringIO(f.read())
+        with text:
+            yield text
+
+
+def _import_pyarrow(matrix_format):
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            f"Reading {matrix_format} matrices requires pyarrow. "
+            "Install it with: pip install pyarrow"
+        ) from None
+    return pyarrow
+
+
+def _arrow_columns(matrix_path, matrix_format):
+    # Parquet and Feather matrices hold the mutation types in the pandas index
+    # or in the first column. Returns that column and the sample columns.
+    pyarrow = _import_pyarrow(matrix_format)
+    if matrix_format == "parquet":
+        schema = pyarrow.parquet.read_schema(matrix_path)
+    else:
+        with pyarrow.memory_map(matrix_path) as source:
+            schema = pyarrow.ipc.open_file(source).schema
+    metadata = schema.pandas_metadata or {}
+    index_columns = [
+        name for name in metadata.get("index_columns", []) if isinstance(name, str)
+    ]
+    label = (index_columns or schema.names)[0]
+    names = [
+        name for name in schema.names if name != label and name not in index_columns
+    ]
+    return label, names
+
+
+def _read_arrow_matrix(matrix_path, matrix_format, samples=None):
+    # only the label column and the selected samples are read
+    pyarrow = _import_pyarrow(matrix_format)
+    label, names = _arrow_columns(matrix_path, matrix_format)
+    columns = [label] + _select_samples(names, samples)
+    if matrix_format == "parquet":
+        table = pyarrow.parquet.read_table(
+            matrix_path, columns=columns, use_pandas_metadata=False
+        )
+    else:
+        table = pyarrow.feather.read_table(
+            matrix_path, columns=columns, memory_map=True
+        )
+    return table.to_pandas(ignore_metadata=True).set_index(label)
+
+
+def _npy_labels_path(matrix_path):
+    labels_path = os.path.splitext(matrix_path)[0] + ".labels"
+    if not os.path.exists(labels_path):
+        raise FileNotFoundError(
+            f"ERROR: the label file {labels_path} of {matrix_path} does not exist."
+        )
+    return labels_path
+
+
+def _read_npy_matrix(matrix_path, samples=None):
+    # The counts of a .npy matrix are memory-mapped. Its labels are read from a
+    # text file with the same name and a .labels extension (ie.
+    # cohort.SBS96.labels for cohort.SBS96.npy) that holds the header line and
+    # the first column of the equivalent tab-separated matrix.
+    labels_path = _npy_labels_path(matrix_path)
+    with open(labels_path) as f:
+        names = f.readline().rstrip("\r\n").split("\t")[1:]
+        index = [line.rstrip("\r\n") for line in f if line.strip()]
+    counts = np.load(matrix_path, mmap_mode="r")
+    if counts.shape != (len(index), len(names)):
+        raise ValueError(
+            f"ERROR: {matrix_path} has shape {counts.shape} but {labels_path} "
+            + f"lists {len(index)} mutation types and {len(names)} samples."
+        )
+    if samples is not None:
+        positions = {name: i for i, name in enumerate(names)}
+        names = _select_samples(names, samples)
+        counts = counts[:, [positions[name] for name in names]]
+    return pd.DataFrame(np.asarray(counts), index=index, columns=names)
+
 
-    return ref_index
+def _matrix_samples(matrix_path):
+    """Returns the sample names of a matrix without reading its counts.
 
+    Returns None for PCAWG matrices, which are not split into chunks.
+    """
+    matrix_format = _matrix_format(matrix_path)
+    if matrix_format is None:
+        return list(matrix_path.columns)
+    if matrix_format in ("parquet", "feather"):
+        return _arrow_columns(matrix_path, matrix_format)[1]
+    if matrix_format == "npy":
+        matrix_path = _npy_labels_path(matrix_path)
+    with open(matrix_path) as f:
+        header = f.readline().rstrip("\r\n")
+    if "\t" not in header and "," in header:
+        return None
+    return header.split("\t")[1:]
+
+
+@instrumentation.stage("process_input")
+def process_input(matrix_path, plot_type, samples=None):
+    """Reads a mutational matrix into a DataFrame with one column per sample.
 
-def process_input(matrix_path, plot_type):
+    Args:
+            matrix_path: A pandas DataFrame, an ndarray or the path to a
+                    tab-separated text file, a Parquet or Feather file (requires
+                    pyarrow) or a .npy array with a .labels file.
+            plot_type: Context of the mutational matrix (ie. 96, 288, 83, 78)
+            samples: Names of the samples to read, in the order they are
+                    returned. Files are read without the other samples.
+    """
     # input data is a DataFrame
     if isinstance(matrix_path, pd.DataFrame):
         # copy dataframe with deepcopy
@@ -187,8 +1436,14 @@ def process_input(matrix_path, plot_type):
             data.index.name = MUTTYPE
     # input data is a file path
     elif isinstance(matrix_path, str):
-        data = pd.read_csv(matrix_path, sep="\t", index_col=0)
-        data = data.dropna(axis=1, how="all")
+        matrix_format = _matrix_format(matrix_path)
+        with instrumentation.stage("read_matrix"):
+            if matrix_format == "npy":
+                data = _read_npy_matrix(matrix_path, samples)
+            elif matrix_format in ("parquet", "feather"):
+                data = _read_arrow_matrix(matrix_path, matrix_format, samples)
+            else:
+                data = _read_text_matrix(matrix_path, samples)
         data.index.name = MUTTYPE
     # input data is a numpy array
     elif isinstance(matrix_path, np.ndarray):
@@ -202,27 +1457,76 @@ def process_input(matrix_path, plot_type):
             "ERROR: matrix_path requires pd.DataFrame, path to file, or np.ndarray, not "
             + f"{type(matrix_path)}."
         )
+    # the samples of files are selected while they are read
+    if samples is not None and not isinstance(matrix_path, str):
+        data = data[_select_samples(data.columns, samples)]
 
     if data.isnull().values.any():
         raise ValueError("ERROR: matrix_path contains Nans.")
 
-    def order_input_context(plot_type, input_data):
-        if plot_type.lower() in type_dict:
-            if data.shape[0] != len(get_context_reference(plot_type)):
-                raise ValueError(
-                    "Input matrix file should have "
-                    + str(len(get_context_reference(plot_type)))
-                    + " rows"
-                )
-            else:
-                ref_format = get_context_reference(plot_type)
-                reindexed_data = input_data.reindex(ref_format)
-        else:
-            # If a non-standard context is used, no sort is applied
-            reindexed_data = input_data
-        return reindexed_data
+    if plot_type.lower() in type_dict:
+        return _order_by_reference(data, plot_type)
+    # If a non-standard context is used, no sort is applied
+    return data
+
+
+@instrumentation.stage("read_matrix")
+def _read_pcawg_matrix(matrix_path):
+    # PCAWG matrices are comma-separated and split each mutation type over
+    # label columns (ie. "Strand", "Mutation type", "Trinucleotide"). The label
+    # columns are joined into the SigProfiler format (ie. T:A[C>A]A).
+    data = pd.read_csv(matrix_path)
+    n_labels = 0
+    while not pd.api.types.is_numeric_dtype(data.dtypes.iloc[n_labels]):
+        n_labels += 1
+    labels = data.iloc[:, :n_labels].astype(str)
+    is_substitution = labels.apply(lambda column: column.str.contains(">").all())
+    substitution = labels.loc[:, is_substitution].iloc[:, 0]
+    context = labels.loc[:, ~is_substitution].iloc[:, -1]
+    middle = context.str.len() // 2
+    index = [
+        ctx[:i] + "[" + sub + "]" + ctx[i + 1 :]
+        for ctx, sub, i in zip(context, substitution, middle)
+    ]
+    if n_labels == 3:
+        strand = labels.iloc[:, 0].str[0] + ":"
+        index = strand + pd.Index(index)
+    data = data.iloc[:, n_labels:]
+    data.index = pd.Index(index, name=MUTTYPE)
+    return data
+
+
+def load_matrix(matrix_path, plot_type, percentage=False, samples=None):
+    """Loads a mutational matrix into a DataFrame of counts.
+
+    The separator of a text file is detected from its header line.
+    Comma-separated files are read as PCAWG matrices, and every other input as
+    in process_input, including the ordering of standard contexts.
+
+    Args:
+            matrix_path: The path to a text file, a pandas DataFrame or an ndarray.
+            plot_type: Context of the mutational matrix (ie. 384, 1536, 4608)
+            percentage: The matrix holds probabilities or percentages. The counts
+                    are returned as floats.
+            samples: Names of the samples to read, as in process_input.
 
-    return order_input_context(plot_type, data)
+    Returns:
+            A DataFrame with one row per mutation type and one column per sample.
+    """
+    if _matrix_format(matrix_path) == "text":
+        with open(matrix_path) as f:
+            header = f.readline()
+        if "\t" not in header and "," in header:
+            matrix_path = _read_pcawg_matrix(matrix_path)
+    data = process_input(matrix_path, plot_type, samples)
+
+    if percentage:
+        return data.astype(float)
+    if not all(pd.api.types.is_integer_dtype(dtype) for dtype in data.dtypes):
+        print(
+            "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True."
+        )
+    return data
 
 
 def get_default_96labels():
@@ -241,8 +1545,48 @@ def get_default_96labels():
     return result
 
 
-def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
+# Serialized plot templates read by make_pickle_file, keyed by
+# (context, volume, template tag). Each entry also holds the size and
+# modification time of the file it was read from, so a template that is rebuilt
+# on disk is read again. Only the most recently used templates are kept.
+_TEMPLATE_CACHE = OrderedDict()
+_TEMPLATE_CACHE_SIZE = 8
+_TEMPLATE_TAG = None
+
+
+def _template_tag():
+    """Returns the tag of the template files written by this installation.
 
+    The tag hashes the matplotlib version, the package version, the bundled
+    fonts and the renderers that build the templates. A template written by
+    another installation has a different file name, so it is rebuilt instead of
+    being unpickled into a broken figure.
+    """
+    global _TEMPLATE_TAG
+    if _TEMPLATE_TAG is None:
+        digest = hashlib.sha1()
+        digest.update(matplotlib.__version__.encode())
+        digest.update(spplt.__version__.encode())
+        for font_file in sorted(os.listdir(SPP_FONTS)):
+            if font_file.endswith(".ttf"):
+                digest.update(font_file.encode())
+                with open(os.path.join(SPP_FONTS, font_file), "rb") as f:
+                    digest.update(f.read())
+        renderers = os.path.join(SPP_PATH, "renderers")
+        for renderer_file in sorted(os.listdir(renderers)):
+            if renderer_file.endswith(".py"):
+                digest.update(renderer_file.encode())
+                with open(os.path.join(renderers, renderer_file), "rb") as f:
+                    digest.update(f.read())
+        _TEMPLATE_TAG = digest.hexdigest()[:12]
+    return _TEMPLATE_TAG
+
+
+def _template_path(context, volume):
+    return os.path.join(volume, context + "-" + _template_tag() + ".pkl")
+
+
+def _template_volume(volume=None):
     # The environmental variable takes precedence over the volume argument
     # If the environmental variable is not set, the volume argument is used
     volume = os.getenv("SIGPROFILERPLOTTING_VOLUME", volume)
@@ -250,1302 +1594,176 @@ def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
     # Use the default volume when no environmental variable or volume argument is provided
     if volume is None:
         volume = SPP_TEMPLATES
+    return volume
 
-    path = os.path.join(volume, context + ".pkl")
 
-    # if the pickle file already exists, return the template
-    if os.path.exists(path):
-        return pickle.load(open(path, "rb"))
+def _cached_template(context, volume):
+    """Returns the pickled bytes of the template file of context in volume.
 
-    # check if the template directory exists, create if not
-    if not os.path.exists(volume):
-        os.mkdir(volume)
-
-    if context == "SBS96":
-        plot_custom_text = False
-        sig_probs = False
-        pcawg = False
-
-        # total_count = sum(sum(nuc.values()) for nuc in mutations[sample].values())
-        # , extent=[-5, 80, -5, 30])
-        plt.rcParams["axes.linewidth"] = 2
-        plot1 = plt.figure(figsize=(43.93, 9.92))
-        plt.rc("axes", edgecolor="lightgray")
-        panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
-        seq96 = [
-            "A[C>A]A",
-            "A[C>A]C",
-            "A[C>A]G",
-            "A[C>A]T",
-            "C[C>A]A",
-            "C[C>A]C",
-            "C[C>A]G",
-            "C[C>A]T",
-            "G[C>A]A",
-            "G[C>A]C",
-            "G[C>A]G",
-            "G[C>A]T",
-            "T[C>A]A",
-            "T[C>A]C",
-            "T[C>A]G",
-            "T[C>A]T",
-            "A[C>G]A",
-            "A[C>G]C",
-            "A[C>G]G",
-            "A[C>G]T",
-            "C[C>G]A",
-            "C[C>G]C",
-            "C[C>G]G",
-            "C[C>G]T",
-            "G[C>G]A",
-            "G[C>G]C",
-            "G[C>G]G",
-            "G[C>G]T",
-            "T[C>G]A",
-            "T[C>G]C",
-            "T[C>G]G",
-            "T[C>G]T",
-            "A[C>T]A",
-            "A[C>T]C",
-            "A[C>T]G",
-            "A[C>T]T",
-            "C[C>T]A",
-            "C[C>T]C",
-            "C[C>T]G",
-            "C[C>T]T",
-            "G[C>T]A",
-            "G[C>T]C",
-            "G[C>T]G",
-            "G[C>T]T",
-            "T[C>T]A",
-            "T[C>T]C",
-            "T[C>T]G",
-            "T[C>T]T",
-            "A[T>A]A",
-            "A[T>A]C",
-            "A[T>A]G",
-            "A[T>A]T",
-            "C[T>A]A",
-            "C[T>A]C",
-            "C[T>A]G",
-            "C[T>A]T",
-            "G[T>A]A",
-            "G[T>A]C",
-            "G[T>A]G",
-            "G[T>A]T",
-            "T[T>A]A",
-            "T[T>A]C",
-            "T[T>A]G",
-            "T[T>A]T",
-            "A[T>C]A",
-            "A[T>C]C",
-            "A[T>C]G",
-            "A[T>C]T",
-            "C[T>C]A",
-            "C[T>C]C",
-            "C[T>C]G",
-            "C[T>C]T",
-            "G[T>C]A",
-            "G[T>C]C",
-            "G[T>C]G",
-            "G[T>C]T",
-            "T[T>C]A",
-            "T[T>C]C",
-            "T[T>C]G",
-            "T[T>C]T",
-            "A[T>G]A",
-            "A[T>G]C",
-            "A[T>G]G",
-            "A[T>G]T",
-            "C[T>G]A",
-            "C[T>G]C",
-            "C[T>G]G",
-            "C[T>G]T",
-            "G[T>G]A",
-            "G[T>G]C",
-            "G[T>G]G",
-            "G[T>G]T",
-            "T[T>G]A",
-            "T[T>G]C",
-            "T[T>G]G",
-            "T[T>G]T",
-        ]
-        xlabels = []
-
-        x = 0.4
-        ymax = 0
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
-        xlabels = [seq[0] + seq[2] + seq[6] for seq in seq96]
-        i = 0
-
-        x = 0.043
-        y3 = 0.87
-        y = int(ymax * 1.25)
-        y2 = y + 2
-        for i in range(0, 6, 1):
-            panel1.add_patch(
-                plt.Rectangle(
-                    (x, y3),
-                    0.15,
-                    0.05,
-                    facecolor=colors[i],
-                    clip_on=False,
-                    transform=plt.gcf().transFigure,
-                )
-            )
-            x += 0.159
-
-        yText = y3 + 0.06
-        plt.text(
-            0.1,
-            yText,
-            "C>A",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.255,
-            yText,
-            "C>G",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.415,
-            yText,
-            "C>T",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.575,
-            yText,
-            "T>A",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.735,
-            yText,
-            "T>C",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.89,
-            yText,
-            "T>G",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
+    The bytes are read from the in-process cache when the file has not changed
+    since it was cached. Returns None if the template file does not exist.
+    """
+    path = _template_path(context, volume)
+    key = (context, os.path.abspath(volume), _template_tag())
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        _TEMPLATE_CACHE.pop(key, None)
+        return None
+
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    entry = _TEMPLATE_CACHE.get(key)
+    if entry is not None and entry[0] == stamp:
+        _TEMPLATE_CACHE.move_to_end(key)
+        return entry[1]
+
+    with open(path, "rb") as f:
+        template = f.read()
+    _TEMPLATE_CACHE[key] = (stamp, template)
+    _TEMPLATE_CACHE.move_to_end(key)
+    while len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+        _TEMPLATE_CACHE.popitem(last=False)
+    return template
+
+
+def _write_template(fig, path):
+    """Pickles the template figure to path.
+
+    The figure is written to a temporary file in the same directory, which is
+    then renamed over path. Jobs sharing a template volume therefore read either
+    no template or a complete one, without any locking. The templates of the
+    same context with another tag are removed afterwards.
+    """
+    tmp_path = "%s.%s.tmp" % (path, uuid.uuid4().hex)
+    try:
+        with open(tmp_path, "xb") as f:
+            pickle.dump(fig, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _remove_stale_templates(path)
+
+
+def _remove_stale_templates(path):
+    # Removes the template files next to path that were written for the same
+    # context with another tag (ie. by an older matplotlib or package version)
+    volume, name = os.path.split(path)
+    stale = re.compile(re.escape(name.rsplit("-", 1)[0]) + r"-[0-9a-f]{12}\.pkl")
+    for other in os.listdir(volume or "."):
+        if other != name and stale.fullmatch(other):
+            try:
+                os.remove(os.path.join(volume, other))
+            except OSError:
+                # removed by another job, or the volume is read-only
+                pass
 
-        if y <= 4:
-            y += 4
-
-        while y % 4 != 0:
-            y += 1
-        # ytick_offest = int(y/4)
-        y = ymax / 1.025
-        ytick_offest = float(y / 3)
-        labs = np.arange(0.375, 96.375, 1)
-
-        panel1.set_xlim([0, 96])
-        # panel1.set_ylim([0, y])
-        panel1.set_xticks(labs)
-        # panel1.set_yticks(ylabs)
-        count = 0
-        m = 0
-        for i in range(0, 96, 1):
-            plt.text(
-                i / 101 + 0.0415,
-                0.02,
-                xlabels[i][0],
-                fontsize=30,
-                color="gray",
-                rotation="vertical",
-                verticalalignment="center",
-                fontname="Courier New",
-                transform=plt.gcf().transFigure,
-            )
-            plt.text(
-                i / 101 + 0.0415,
-                0.044,
-                xlabels[i][1],
-                fontsize=30,
-                color=colors[m],
-                rotation="vertical",
-                verticalalignment="center",
-                fontname="Courier New",
-                fontweight="bold",
-                transform=plt.gcf().transFigure,
-            )
-            plt.text(
-                i / 101 + 0.0415,
-                0.071,
-                xlabels[i][2],
-                fontsize=30,
-                color="gray",
-                rotation="vertical",
-                verticalalignment="center",
-                fontname="Courier New",
-                transform=plt.gcf().transFigure,
-            )
-            count += 1
-            if count == 16:
-                count = 0
-                m += 1
-
-        plt.gca().yaxis.grid(True)
-        plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-        panel1.set_xlabel("")
-        panel1.set_ylabel("")
-
-        panel1.tick_params(
-            axis="both",
-            which="both",
-            bottom=False,
-            labelbottom=False,
-            left=True,
-            labelleft=True,
-            right=True,
-            labelright=False,
-            top=False,
-            labeltop=False,
-            direction="in",
-            length=25,
-            colors="lightgray",
-            width=2,
-        )
 
-        [i.set_color("black") for i in plt.gca().get_yticklabels()]
-        if return_plot_template == False:
-            pickle.dump(plot1, open(path, "wb"))
-        else:
-            pickle.dump(plot1, open(path, "wb"))
-            return plot1
-    elif context == "SBS288":
-        plot_custom_text = False
-        sig_probs = False
-        pcawg = False
-
-        plt.rcParams["axes.linewidth"] = 2
-        plot1 = plt.figure(figsize=(43.93, 9.92))
-        plt.rc("axes", edgecolor="lightgray")
-        panel1 = plt.axes([0.04, 0.09, 0.7, 0.77])
-        panel2 = plt.axes([0.77, 0.09, 0.21, 0.77])
-        xlabels = []
-
-        x = 0.4
-        ymax = 0
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
-        i = 0
-        result = get_default_96labels()
-        xlabels = [seq[0] + seq[2] + seq[6] for seq in result]
-        x = 0.043
-        y3 = 0.87
-        y = int(ymax * 1.25)
-        y2 = y + 2
-        for i in range(0, 6, 1):
-            panel1.add_patch(
-                plt.Rectangle(
-                    (x, y3),
-                    0.11,
-                    0.05,
-                    facecolor=colors[i],
-                    clip_on=False,
-                    transform=plt.gcf().transFigure,
-                )
-            )
-            x += 0.117
-
-        yText = y3 + 0.06
-
-        plt.text(
-            0.082,
-            yText,
-            "C>A",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.1975,
-            yText,
-            "C>G",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.315,
-            yText,
-            "C>T",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.43,
-            yText,
-            "T>A",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.55,
-            yText,
-            "T>C",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.665,
-            yText,
-            "T>G",
-            fontsize=55,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
+def _template_bytes(context, volume=None):
+    # builds the template file first if it does not exist yet
+    volume = _template_volume(volume)
+    template = _cached_template(context, volume)
+    if template is None:
+        plt.close(
+            make_pickle_file(context=context, return_plot_template=True, volume=volume)
         )
+        template = _cached_template(context, volume)
+    return template
 
-        if y <= 4:
-            y += 4
-
-        while y % 4 != 0:
-            y += 1
-        y = ymax / 1.025
-        ytick_offest = float(y / 3)
-        font_label_size = 30
-        labs = np.arange(0.375, 96.375, 1)
-
-        panel1.set_xlim([0, 96])
-        panel1.set_ylim([0, y])
-        panel1.set_xticks(labs)
-
-        count = 0
-        m = 0
-        for i in range(0, 96, 1):
-            plt.text(
-                i / 137 + 0.04,
-                0.02,
-                xlabels[i][0],
-                fontsize=25,
-                color="gray",
-                rotation="vertical",
-                verticalalignment="center",
-                fontname="Courier New",
-                transform=plt.gcf().transFigure,
-            )
-            plt.text(
-                i / 137 + 0.04,
-                0.044,
-                xlabels[i][1],
-                fontsize=25,
-                color=colors[m],
-                rotation="vertical",
-                verticalalignment="center",
-                fontname="Courier New",
-                fontweight="bold",
-                transform=plt.gcf().transFigure,
-            )
-            plt.text(
-                i / 137 + 0.04,
-                0.071,
-                xlabels[i][2],
-                fontsize=25,
-                color="gray",
-                rotation="vertical",
-                verticalalignment="center",
-                fontname="Courier New",
-                transform=plt.gcf().transFigure,
-            )
-            count += 1
-            if count == 16:
-                count = 0
-                m += 1
-
-        panel1.yaxis.grid(True)
-        panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-        panel1.set_xlabel("")
-        panel1.set_ylabel("")
-
-        panel1.tick_params(
-            axis="both",
-            which="both",
-            bottom=False,
-            labelbottom=False,
-            left=True,
-            labelleft=True,
-            right=True,
-            labelright=False,
-            top=False,
-            labeltop=False,
-            direction="in",
-            length=25,
-            colors="lightgray",
-            width=2,
-        )
 
-        [i.set_color("black") for i in panel1.get_yticklabels()]
+def clear_template_cache(context=None, volume=None):
+    """Removes plot templates from the in-process template cache.
 
-        yp2 = 28
-        labels = []
-        y2max = 0
-        tsbColors = [
-            [1 / 256, 70 / 256, 102 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            "green",
-        ]
+    Templates are cached by make_pickle_file the first time they are loaded.
+    Call this function after replacing template files within the same
+    modification time, or to release the memory held by the cache.
 
-        y = int(y2max * 1.1)
-        if y <= 4:
-            y += 4
-        while y % 4 != 0:
-            y += 1
-        ytick_offest = int(y / 4)
-
-        panel2.spines["right"].set_visible(False)
-        panel2.spines["top"].set_visible(False)
-        labels.reverse()
-        panel2.set_yticks([3, 7, 11, 15, 19, 23, 27])
-        panel2.set_yticklabels(labels, fontsize=30, fontname="Arial", weight="bold")
-        panel2.set_xticklabels(xlabels, fontsize=30)
-        handles, labels = panel2.get_legend_handles_labels()
-        panel2.legend(handles[:3], labels[:3], loc="best", prop={"size": 30})
-        if return_plot_template == False:
-            pickle.dump(plot1, open(path, "wb"))
-        else:
-            pickle.dump(plot1, open(path, "wb"))
-            return plot1
-    elif context == "DBS78":
-        plot_custom_text = False
-        pcawg = False
-        sig_probs = False
-        plt.rcParams["axes.linewidth"] = 4
-        plot1 = plt.figure(figsize=(43.93, 9.92))
-        plt.rc("axes", edgecolor="grey")
-        panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
-        xlabels = []
-
-        x = 0.4
-        ymax = 0
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [3 / 256, 102 / 256, 204 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [1 / 256, 102 / 256, 1 / 256],
-            [255 / 256, 153 / 256, 153 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [255 / 256, 178 / 256, 102 / 256],
-            [255 / 256, 128 / 256, 1 / 256],
-            [204 / 256, 153 / 256, 255 / 256],
-            [76 / 256, 1 / 256, 153 / 256],
-        ]
-
-        x = 0.043
-        y3 = 0.87
-        y = int(ymax * 1.25)
-        y2 = y + 2
-        i = 0
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.043, y3),
-                0.101,
-                0.05,
-                facecolor=colors[0],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.151, y3),
-                0.067,
-                0.05,
-                facecolor=colors[1],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.225, y3),
-                0.102,
-                0.05,
-                facecolor=colors[2],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.334, y3),
-                0.067,
-                0.05,
-                facecolor=colors[3],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.408, y3),
-                0.102,
-                0.05,
-                facecolor=colors[4],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.517, y3),
-                0.067,
-                0.05,
-                facecolor=colors[5],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.591, y3),
-                0.067,
-                0.05,
-                facecolor=colors[6],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.665, y3),
-                0.102,
-                0.05,
-                facecolor=colors[7],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.774, y3),
-                0.102,
-                0.05,
-                facecolor=colors[8],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (0.883, y3),
-                0.102,
-                0.05,
-                facecolor=colors[9],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-
-        yText = y3 + 0.06
-        plt.text(
-            0.07,
-            yText,
-            "AC>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.163,
-            yText,
-            "AT>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.255,
-            yText,
-            "CC>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.345,
-            yText,
-            "CG>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.435,
-            yText,
-            "CT>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.527,
-            yText,
-            "GC>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.6,
-            yText,
-            "TA>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.69,
-            yText,
-            "TC>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.8,
-            yText,
-            "TG>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.915,
-            yText,
-            "TT>NN",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Arial",
-            transform=plt.gcf().transFigure,
-        )
-
-        if y <= 4:
-            y += 4
-
-        while y % 4 != 0:
-            y += 1
-        ytick_offest = int(y / 4)
-
-        labs = np.arange(0.44, 78.44, 1)
-        panel1.set_xlim([0, 78])
-        panel1.set_ylim([0, y])
-        panel1.set_xticks(labs)
-        panel1.set_xticklabels(
-            xlabels,
-            rotation="vertical",
-            fontsize=30,
-            color="grey",
-            fontname="Courier New",
-            verticalalignment="top",
-            fontweight="bold",
-        )
+    Args:
+            context: Only remove templates of this context (ie. SBS96, ID83).
+            volume: Only remove templates loaded from this directory.
+    """
+    if volume is not None:
+        volume = os.path.abspath(volume)
+    for key in list(_TEMPLATE_CACHE):
+        if (context is None or key[0] == context) and (
+            volume is None or key[1] == volume
+        ):
+            del _TEMPLATE_CACHE[key]
+    # the cached backgrounds were rendered from the removed templates
+    _RASTER_BACKGROUNDS.clear()
 
-        plt.gca().yaxis.grid(True)
-        plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-        panel1.set_xlabel("")
-        panel1.set_ylabel("")
-        panel1.tick_params(
-            axis="both",
-            which="both",
-            bottom=False,
-            labelbottom=True,
-            left=True,
-            labelleft=True,
-            right=True,
-            labelright=False,
-            top=False,
-            labeltop=False,
-            direction="in",
-            length=25,
-            colors="lightgray",
-            width=2,
-        )
 
-        [i.set_color("black") for i in plt.gca().get_yticklabels()]
-        [i.set_color("grey") for i in plt.gca().get_xticklabels()]
-        if return_plot_template == False:
-            pickle.dump(plot1, open(path, "wb"))
-        else:
-            pickle.dump(plot1, open(path, "wb"))
-            return plot1
-    elif context == "ID83":
-        plt.rcParams["axes.linewidth"] = 2
-        plot1 = plt.figure(figsize=(43.93, 12))
-        plt.rc("axes", edgecolor="black")
-        panel1 = plt.axes([0.045, 0.17, 0.92, 0.65])
-        xlabels = []
-
-        x = 0.4
-        ymax = 0
-        colors = [
-            [253 / 256, 190 / 256, 111 / 256],
-            [255 / 256, 128 / 256, 2 / 256],
-            [176 / 256, 221 / 256, 139 / 256],
-            [54 / 256, 161 / 256, 46 / 256],
-            [253 / 256, 202 / 256, 181 / 256],
-            [252 / 256, 138 / 256, 106 / 256],
-            [241 / 256, 68 / 256, 50 / 256],
-            [188 / 256, 25 / 256, 26 / 256],
-            [208 / 256, 225 / 256, 242 / 256],
-            [148 / 256, 196 / 256, 223 / 256],
-            [74 / 256, 152 / 256, 201 / 256],
-            [23 / 256, 100 / 256, 171 / 256],
-            [226 / 256, 226 / 256, 239 / 256],
-            [182 / 256, 182 / 256, 216 / 256],
-            [134 / 256, 131 / 256, 189 / 256],
-            [98 / 256, 64 / 256, 155 / 256],
-        ]
+# Every context that make_pickle_file can build a template for
+TEMPLATE_CONTEXTS = list(renderers.TEMPLATES)
 
-        x = 0.0475
-        y_top = 0.827
-        y_bottom = 0.114
-        y = int(ymax * 1.25)
-        y2 = y + 2
-        for i in range(0, 12, 1):
-            panel1.add_patch(
-                plt.Rectangle(
-                    (x, y_top),
-                    0.0595,
-                    0.05,
-                    facecolor=colors[i],
-                    clip_on=False,
-                    transform=plt.gcf().transFigure,
-                )
-            )
-            panel1.add_patch(
-                plt.Rectangle(
-                    (x, y_bottom),
-                    0.0595,
-                    0.05,
-                    facecolor=colors[i],
-                    clip_on=False,
-                    transform=plt.gcf().transFigure,
-                )
-            )
-            x += 0.0665
-
-        panel1.add_patch(
-            plt.Rectangle(
-                (x - 0.001, y_top),
-                0.006,
-                0.05,
-                facecolor=colors[12],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (x - 0.001, y_bottom),
-                0.006,
-                0.05,
-                facecolor=colors[12],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        x += 0.011
-        panel1.add_patch(
-            plt.Rectangle(
-                (x, y_top),
-                0.0155,
-                0.05,
-                facecolor=colors[13],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (x, y_bottom),
-                0.0155,
-                0.05,
-                facecolor=colors[13],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        x += 0.022
-        panel1.add_patch(
-            plt.Rectangle(
-                (x, y_top),
-                0.027,
-                0.05,
-                facecolor=colors[14],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (x, y_bottom),
-                0.027,
-                0.05,
-                facecolor=colors[14],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        x += 0.0335
-        panel1.add_patch(
-            plt.Rectangle(
-                (x, y_top),
-                0.049,
-                0.05,
-                facecolor=colors[15],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
-        panel1.add_patch(
-            plt.Rectangle(
-                (x, y_bottom),
-                0.049,
-                0.05,
-                facecolor=colors[15],
-                clip_on=False,
-                transform=plt.gcf().transFigure,
-            )
-        )
 
-        yText = y_top + 0.01
-        plt.text(
-            0.072,
-            yText,
-            "C",
-            fontsize=40,
-            fontname="Times New Roman",
-            fontweight="bold",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.1385,
-            yText,
-            "T",
-            fontsize=40,
-            fontname="Times New Roman",
-            fontweight="bold",
-            color="white",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.205,
-            yText,
-            "C",
-            fontsize=40,
-            fontname="Times New Roman",
-            fontweight="bold",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.2715,
-            yText,
-            "T",
-            fontsize=40,
-            fontname="Times New Roman",
-            fontweight="bold",
-            color="white",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.338,
-            yText,
-            "2",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.4045,
-            yText,
-            "3",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.471,
-            yText,
-            "4",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.5375,
-            yText,
-            "5+",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="white",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.604,
-            yText,
-            "2",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.6705,
-            yText,
-            "3",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.737,
-            yText,
-            "4",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.8035,
-            yText,
-            "5+",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="white",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.844,
-            yText,
-            "2",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.861,
-            yText,
-            "3",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.888,
-            yText,
-            "4",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.93,
-            yText,
-            "5+",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="white",
-            transform=plt.gcf().transFigure,
-        )
+def build_templates(volume=None, contexts=None):
+    """Builds the plot templates ahead of the first plotting call.
 
-        yText_labels_top = yText + 0.075
-        yText_labels_bottom = y_bottom - 0.03
-        yText_labels_bottom_sec = yText_labels_bottom - 0.045
-
-        plt.text(
-            0.08,
-            yText_labels_top,
-            "1bp Deletion",
-            fontsize=40,
-            fontname="Times New Roman",
-            weight="bold",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.21,
-            yText_labels_top,
-            "1bp Insertion",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.375,
-            yText_labels_top,
-            ">1bp Deletion at Repeats\n      (Deletion Length)",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.64,
-            yText_labels_top,
-            ">1bp Insertion at Repeats\n       (Insertion Length)",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.85,
-            yText_labels_top,
-            " Microhomology\n(Deletion Length)",
-            fontsize=40,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
+    Templates that already exist in the volume are kept, so a volume built in
+    advance (ie. in a Docker image) can be mounted read-only. Templates of the
+    same contexts written by another installation are removed.
 
-        plt.text(
-            0.058,
-            yText_labels_bottom_sec,
-            "Homopolymer Length",
-            fontsize=35,
-            fontname="Times New Roman",
-            weight="bold",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.19,
-            yText_labels_bottom_sec,
-            "Homopolymer Length",
-            fontsize=35,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.39,
-            yText_labels_bottom_sec,
-            "Number of Repeat Units",
-            fontsize=35,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.65,
-            yText_labels_bottom_sec,
-            "Number of Repeat Units",
-            fontsize=35,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        plt.text(
-            0.85,
-            yText_labels_bottom_sec,
-            "Microhomology Length",
-            fontsize=35,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
+    Args:
+            volume: Directory to write the templates to. The
+                    SIGPROFILERPLOTTING_VOLUME environment variable takes
+                    precedence, as for the plotting functions.
+            contexts: Contexts to build (ie. SBS96, ID83). Defaults to
+                    TEMPLATE_CONTEXTS.
 
-        x = 0.0477
-        for i in range(0, 8, 1):
-            if i != 2 and i != 3:
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1  2  3  4  5  6+",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-            else:
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "0  1  2  3  4  5+",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
+    Returns:
+            The paths of the template files, in the order of contexts.
+    """
+    load_custom_fonts()
+    volume = _template_volume(volume)
+    if contexts is None:
+        contexts = TEMPLATE_CONTEXTS
+    for context in contexts:
+        if context not in TEMPLATE_CONTEXTS:
+            raise ValueError(
+                "There is no plot template for context "
+                + context
+                + ". Available contexts: "
+                + ", ".join(TEMPLATE_CONTEXTS)
+            )
+
+    paths = []
+    for context in contexts:
+        # some templates change the matplotlib style while they are built
+        with plt.rc_context():
+            _template_bytes(context, volume)
+        paths.append(_template_path(context, volume))
+        _remove_stale_templates(paths[-1])
+    return paths
+
+
+@instrumentation.stage("template")
+def make_pickle_file(context="SBS96", return_plot_template=False, volume=None):
 
-            x += 0.0665
-
-        for i in range(0, 4, 1):
-            plt.text(
-                x,
-                yText_labels_bottom,
-                "0  1  2  3  4  5+",
-                fontsize=32,
-                fontweight="bold",
-                fontname="Times New Roman",
-                color="black",
-                transform=plt.gcf().transFigure,
-            )
-            x += 0.0665
-
-        plt.text(
-            x,
-            yText_labels_bottom,
-            "1",
-            fontsize=32,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        x += 0.011
-        plt.text(
-            x,
-            yText_labels_bottom,
-            "1  2",
-            fontsize=32,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        x += 0.022
-        plt.text(
-            x,
-            yText_labels_bottom,
-            "1  2  3",
-            fontsize=32,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
-        x += 0.0335
-        plt.text(
-            x,
-            yText_labels_bottom,
-            "1  2  3  4  5+",
-            fontsize=32,
-            fontweight="bold",
-            fontname="Times New Roman",
-            color="black",
-            transform=plt.gcf().transFigure,
-        )
+    volume = _template_volume(volume)
+    path = _template_path(context, volume)
 
-        labs = np.arange(0.375, 83.375, 1)
-        panel1.set_xlim([0, 83])
-        panel1.set_ylim([0, y])
-        panel1.set_xticks(labs)
-
-        plt.gca().yaxis.grid(True)
-        plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-        panel1.set_xlabel("")
-        panel1.set_ylabel("")
-
-        panel1.tick_params(
-            axis="both",
-            which="both",
-            bottom=False,
-            labelbottom=False,
-            left=False,
-            labelleft=True,
-            right=False,
-            labelright=False,
-            top=False,
-            labeltop=False,
-            direction="in",
-            length=25,
-            colors="gray",
-            width=2,
-        )
+    # if the pickle file already exists, return the template
+    template = _cached_template(context, volume)
+    if template is not None:
+        try:
+            return pickle.loads(template)
+        except Exception:
+            # a damaged template file is rebuilt and replaced below
+            clear_template_cache(context=context, volume=volume)
 
-        [i.set_color("black") for i in plt.gca().get_yticklabels()]
+    # check if the template directory exists, create if not
+    os.makedirs(volume, exist_ok=True)
 
-        if return_plot_template == False:
-            pickle.dump(plot1, open(path, "wb"))
-        else:
-            pickle.dump(plot1, open(path, "wb"))
-            return plot1
+    # the template is built from the default style, so that it does not take on
+    # the style left by the plots drawn before it (ie. ggplot by plotSV)
+    with plt.rc_context():
+        plt.rcdefaults()
+        plot1 = renderers.load(renderers.TEMPLATES[context]).build_template(context)
+    _write_template(plot1, path)
+    if return_plot_template:
+        return plot1
 
 
 def getylabels(ylabels):
@@ -1599,67 +1817,188 @@ def reindex_sbs96(data_f):
     return data_f
 
 
+def _strand_counts(data):
+    # Splits the strand prefix off the mutation types of data and scatters the
+    # counts into an array of shape (strands, base mutation types, samples).
+    # Strands and base mutation types are kept in the order they first appear.
+    prefixes = []
+    bases = []
+    for label in data.index:
+        prefix, _, base = label.partition(":")
+        prefixes.append(prefix)
+        bases.append(base)
+    strands = list(dict.fromkeys(prefixes))
+    base_labels = list(dict.fromkeys(bases))
+    strand_positions = {strand: i for i, strand in enumerate(strands)}
+    base_positions = {base: i for i, base in enumerate(base_labels)}
+
+    values = data.to_numpy()
+    counts = np.zeros((len(strands), len(base_labels), values.shape[1]), values.dtype)
+    counts[
+        [strand_positions[prefix] for prefix in prefixes],
+        [base_positions[base] for base in bases],
+    ] = values
+    return strands, base_labels, counts
+
+
 def reindex_sbs288(data_f):
     result = get_default_96labels()
-    mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-    T_mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-    U_mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-    N_mutations_df = pd.DataFrame(index=result, columns=data_f.columns)
-
-    for row in result:
-        T_mutations_df.loc[row] = data_f.loc["T:" + row]
-        U_mutations_df.loc[row] = data_f.loc["U:" + row]
-        N_mutations_df.loc[row] = data_f.loc["N:" + row]
-        mutations_df.loc[row] = (
-            data_f.loc["T:" + row] + data_f.loc["U:" + row] + data_f.loc["N:" + row]
-        )
+    strands, base_labels, counts = _strand_counts(data_f)
+    positions = {base: i for i, base in enumerate(base_labels)}
+    counts = counts[:, [positions[base] for base in result]]
 
-    mutations_TSB_df_T = pd.DataFrame(
-        T_mutations_df.values.reshape((-1, 16, len(data_f.columns))).sum(axis=1),
-        index=["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"],
-        columns=data_f.columns,
-    )
-    mutations_TSB_df_U = pd.DataFrame(
-        U_mutations_df.values.reshape((-1, 16, len(data_f.columns))).sum(axis=1),
-        index=["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"],
-        columns=data_f.columns,
-    )
-    mutations_TSB_df_N = pd.DataFrame(
-        N_mutations_df.values.reshape((-1, 16, len(data_f.columns))).sum(axis=1),
-        index=["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"],
-        columns=data_f.columns,
-    )
-    # Concatenate the sum row to the DataFrame
-    mutations_TSB_df_T = pd.concat(
-        [mutations_TSB_df_T, mutations_TSB_df_T.sum().rename("All").to_frame().T]
-    )
-    mutations_TSB_df_U = pd.concat(
-        [mutations_TSB_df_U, mutations_TSB_df_U.sum().rename("All").to_frame().T]
-    )
-    mutations_TSB_df_N = pd.concat(
-        [mutations_TSB_df_N, mutations_TSB_df_N.sum().rename("All").to_frame().T]
+    mutations_df = pd.DataFrame(
+        counts.sum(axis=0), index=result, columns=data_f.columns
     )
 
-    # Reindex the DataFrame to roll the index
-    mutations_TSB_df_T = mutations_TSB_df_T.reindex(
-        np.roll(mutations_TSB_df_T.index, shift=1)
-    )
-    mutations_TSB_df_U = mutations_TSB_df_U.reindex(
-        np.roll(mutations_TSB_df_U.index, shift=1)
+    # the 96 mutation types are ordered by class, 16 per class, and the sum of
+    # all classes is the first row of each strand
+    classes = ["C>A", "C>G", "C>T", "T>A", "T>C", "T>G"]
+    class_counts = counts.reshape((len(strands), len(classes), 16, -1)).sum(axis=2)
+    tsb_mats = {}
+    for strand in ("T", "U", "N"):
+        strand_counts = class_counts[strands.index(strand)]
+        tsb_mats[strand] = pd.DataFrame(
+            np.vstack([strand_counts.sum(axis=0), strand_counts]),
+            index=["All"] + classes,
+            columns=data_f.columns,
+        )
+    return mutations_df, tsb_mats
+
+
+def _render(renderer, matrix_path, output_path, project, plot_type, *args):
+    """Calls the render function of a plotSBS, plotID or plotDBS renderer.
+
+    The renderers in renderers.TEXT_INPUT parse a tab-separated file line by
+    line, so any other input is written to a temporary text file for them.
+    """
+    module = renderers.load(renderer)
+    timings = instrumentation.active()
+    if timings is not None and isinstance(matrix_path, (str, pd.DataFrame)):
+        timings.page_samples = _matrix_samples(matrix_path)
+    if renderer not in renderers.TEXT_INPUT or _matrix_format(matrix_path) == "text":
+        return module.render(matrix_path, output_path, project, plot_type, *args)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        text_path = os.path.join(tmp_dir, f"{project}.{plot_type}.txt")
+        process_input(matrix_path, plot_type).to_csv(text_path, sep="\t")
+        return module.render(text_path, output_path, project, plot_type, *args)
+
+
+def _plot_family(
+    family,
+    matrix_path,
+    output_path,
+    project,
+    plot_type,
+    percentage=False,
+    custom_text_upper=None,
+    custom_text_middle=None,
+    custom_text_bottom=None,
+    savefig_format="pdf",
+    volume=None,
+    dpi=100,
+    n_jobs=1,
+    chunk_size=None,
+    samples=None,
+    sample_regex=None,
+    top_k_by_total=None,
+    incremental=False,
+):
+    """Plots a matrix with the renderer of plot_type in renderers.PLOT_TYPES[family].
+
+    The body of plotSBS, plotID and plotDBS (family "SBS", "ID" or "DBS"). The
+    samples are rendered incrementally, in parallel or in chunks by calling the
+    public plotting function of the family again, or else by its renderer.
+    """
+    plot_function = globals()["plot" + family]
+
+    # load custom fonts for plotting
+    load_custom_fonts()
+
+    # create the output directory if it doesn't exist
+    if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
+        os.makedirs(output_path)
+
+    renderer = renderers.PLOT_TYPES[family].get(plot_type)
+    if renderer is None:
+        print(
+            "Error: The function plot" + family + " does not support plot_type",
+            plot_type,
+            "so no plot has been generated.",
+        )
+        return None
+
+    select = dict(
+        samples=samples, sample_regex=sample_regex, top_k_by_total=top_k_by_total
     )
-    mutations_TSB_df_N = mutations_TSB_df_N.reindex(
-        np.roll(mutations_TSB_df_N.index, shift=1)
+    options = dict(
+        percentage=percentage,
+        custom_text_upper=custom_text_upper,
+        custom_text_middle=custom_text_middle,
+        custom_text_bottom=custom_text_bottom,
+        savefig_format=savefig_format,
+        volume=volume,
+        dpi=dpi,
     )
-    return (
-        mutations_df,
-        {
-            "T": mutations_TSB_df_T,
-            "U": mutations_TSB_df_U,
-            "N": mutations_TSB_df_N,
-        },
+
+    # render only the samples whose output is out of date
+    if incremental and savefig_format.lower() != "pil_image":
+        return _plot_incremental(
+            plot_function,
+            matrix_path,
+            output_path,
+            project,
+            plot_type,
+            select,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            **options,
+        )
+
+    # render the samples with a pool of worker processes
+    if n_jobs != 1:
+        return _plot_in_parallel(
+            plot_function,
+            matrix_path,
+            output_path,
+            project,
+            plot_type,
+            n_jobs,
+            chunk_size=chunk_size,
+            select=select,
+            **options,
+        )
+
+    # render the selected samples chunk_size at a time
+    if chunk_size is not None or any(option is not None for option in select.values()):
+        return _plot_in_chunks(
+            plot_function,
+            matrix_path,
+            output_path,
+            project,
+            plot_type,
+            chunk_size,
+            select=select,
+            **options,
+        )
+
+    return _render(
+        renderer,
+        matrix_path,
+        output_path,
+        project,
+        plot_type,
+        percentage,
+        custom_text_upper,
+        custom_text_middle,
+        custom_text_bottom,
+        savefig_format,
+        volume,
+        dpi,
     )
 
 
+@instrumentation.instrumented
 def plotSV(
     matrix_path,
     output_path,
@@ -1668,6 +2007,9 @@ def plotSV(
     aggregate=False,
     savefig_format="pdf",
     dpi=100,
+    volume=None,
+    timings=None,
+    trace_file=None,
 ):
     """Outputs a pdf containing Rearrangement signature plots
 
@@ -1677,460 +2019,31 @@ def plotSV(
     :param plot_type: output type of plot (default:pdf)
     :param percentage: True if y-axis is displayed as percentage of CNV events, False if displayed as counts (default:False)
     :param aggregate: True if output is a single pdf of counts aggregated across samples(e.g for a given cancer type, y-axis will be counts per sample), False if output is a multi-page pdf of counts for each sample
+    :param volume: path to the directory of the .pkl plot templates. For Docker.
+    :param timings: PlotTimings object that receives the duration of each stage of the call and of each sample
+    :param trace_file: path of a JSON file to write the stages of the call to, in the Chrome trace event format
 
     # >>> plotSV()
 
     """
 
-    # inner function to construct plot
-    def plot(counts, labels, sample, project, percentage, aggregate=False):
-        color_mapping = {
-            "del": {
-                ">10Mb": "deeppink",
-                "1Mb-10Mb": "hotpink",
-                "10-100Kb": "lightpink",
-                "100Kb-1Mb": "palevioletred",
-                "1-10Kb": "lavenderblush",
-            },
-            "tds": {
-                ">10Mb": "saddlebrown",
-                "1Mb-10Mb": "sienna",
-                "10-100Kb": "sandybrown",
-                "100Kb-1Mb": "peru",
-                "1-10Kb": "linen",
-            },
-            "inv": {
-                ">10Mb": "rebeccapurple",
-                "1Mb-10Mb": "blueviolet",
-                "10-100Kb": "plum",
-                "100Kb-1Mb": "mediumorchid",
-                "1-10Kb": "thistle",
-            },
-        }
-
-        alpha_dict = dict(enumerate(string.ascii_lowercase))
-        x_labels = ["1-10kb", "10-100kb", "100kb-1Mb", "1Mb-10Mb", ">10Mb"]
-        super_class = ["clustered", "non-clustered"]
-        sub_class = ["del", "tds", "inv", "trans"]
-        N = 32
-        ticks = [
-            0,
-            1,
-            2,
-            3,
-            4,
-            5,
-            6,
-            7,
-            8,
-            9,
-            10,
-            11,
-            12,
-            13,
-            14,
-            15,
-            16,
-            17,
-            18,
-            19,
-            20,
-            21,
-            22,
-            23,
-            24,
-            25,
-            26,
-            27,
-            28,
-            29,
-            30,
-            31,
-        ]
-        width = 0.27
-        xticks = []
-        i = -1  # used to distinguish first bar from the rest
-        fig, ax = plt.subplots(figsize=(16, 8))
-
-        # Custom Formatting
-        plt.style.use("ggplot")
-        plt.rcParams["axes.facecolor"] = "white"
-        plt.gca().yaxis.grid(True)
-        plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-        ax.set_axisbelow(True)
-        ax.yaxis.set_major_locator(ticker.LinearLocator(5))
-        ax.spines["bottom"].set_color("black")
-        ax.spines["top"].set_color("black")
-        ax.spines["right"].set_color("black")
-        ax.spines["left"].set_color("black")
-        plt.xlim(xmin=-0.5, xmax=len(labels) - 0.5)
-        tmp_max = max(counts)
-        plt.ylim(ymax=1.25 * tmp_max)
-        # Add light gray horizontal lines at y-ticks
-        ax.grid(linestyle="-", linewidth=1, color="#EDEDED", axis="y")
-
-        for count, label in zip(counts, labels):
-            categories = label.split("_")
-            if len(categories) > 2:
-                rearrangement_class = categories[1]
-                size_class = categories[2]
-            i += 1  # position of bar
-            # print (categories)
-
-            if (
-                len(categories) == 2
-            ):  # clustered translocation or non-clustered translocation
-                ax.bar(
-                    ticks[i], count, color="dimgray", edgecolor="black"
-                )  # translocation only has one color
-            else:
-                ax.bar(
-                    ticks[i],
-                    count,
-                    color=color_mapping[rearrangement_class][size_class],
-                    edgecolor="black",
-                )
-
-            xticks.append(ticks[i])
-        ax.set_xticks(xticks)
-        ax.set_xticklabels(
-            x_labels * 3 + [" "] + x_labels * 3 + [" "],
-            rotation=90,
-            weight="bold",
-            fontsize=16,
-            fontname="Arial",
-            color="black",
-        )
-        ax.tick_params(labelleft=True, left=False, bottom=False)
-        ax.tick_params(axis="y", which="major", pad=0, labelsize=30)
-
-        # Set patch dimensions
-        patch_height = 0.05
-        patch_width = 2.8
-        loh_width = 2.5
-        loh_len = 4.8
-
-        trans = transforms.blended_transform_factory(ax.transData, ax.transAxes)
-
-        #### CLUSTERED PATCHES ####
-        ax.add_patch(
-            plt.Rectangle(
-                (-0.5, 1.095),
-                15.9,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="gray",
-                transform=trans,
-            )
-        )
-        plt.text(
-            6,
-            1.1125,
-            "Clustered",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (-0.5, 1.01),
-                loh_len + 0.1,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="maroon",
-                transform=trans,
-            )
-        )
-        plt.text(
-            1.3,
-            1.03,
-            "Del",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (4.6, 1.01),
-                loh_len,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="darkorange",
-                transform=trans,
-            )
-        )
-        plt.text(
-            6.27,
-            1.03,
-            "Tds",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (9.6, 1.01),
-                loh_len,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="slateblue",
-                transform=trans,
-            )
-        )
-        plt.text(
-            11.35,
-            1.03,
-            "Inv",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (14.6, 1.01),
-                0.8,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="dimgray",
-                transform=trans,
-            )
-        )
-        plt.text(
-            14.75,
-            1.03,
-            "T",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-
-        # add vertical black lines
-        ax.axvline(x=15.5, color="black", linewidth=1)
-
-        #### NON-CLUSTERED PATCHES ####
-        ax.add_patch(
-            plt.Rectangle(
-                (15.6, 1.095),
-                15.9,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="black",
-                transform=trans,
-            )
-        )
-        plt.text(
-            21,
-            1.1125,
-            "Non-Clustered",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (15.6, 1.01),
-                loh_len,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="maroon",
-                transform=trans,
-            )
-        )
-        plt.text(
-            17.35,
-            1.03,
-            "Del",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (20.6, 1.01),
-                loh_len,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="darkorange",
-                transform=trans,
-            )
-        )
-        plt.text(
-            22.25,
-            1.03,
-            "Tds",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (25.6, 1.01),
-                loh_len,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="slateblue",
-                transform=trans,
-            )
-        )
-        plt.text(
-            27.37,
-            1.03,
-            "Inv",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (30.6, 1.01),
-                0.9,
-                patch_height * 1.5,
-                clip_on=False,
-                facecolor="dimgray",
-                transform=trans,
-            )
-        )
-        plt.text(
-            30.82,
-            1.03,
-            "T",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-
-        # format the set_yticklabels labels
-        if percentage:
-            tmp_y_labels = [
-                "{0:0.1f}%".format(round(x, 1)) for x in ax.get_yticks().tolist()
-            ]
-        else:
-            tmp_y_labels = [round(x, 1) for x in ax.get_yticks().tolist()]
-        # ax.yaxis.labelpad = 300
-
-        # set the y-axis ticks and labels
-        ax.set_yticks(ax.get_yticks())
-        ax.set_yticklabels(
-            tmp_y_labels, fontname="Arial", weight="bold", fontsize=16, color="black"
-        )
-
-        # y-axis titles
-        if aggregate and not percentage:
-            ax.set_ylabel(
-                "Number of events per sample",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-        elif aggregate and percentage:
-            ax.set_ylabel(
-                "Percentage of SV's",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-        elif not aggregate and not percentage:
-            ax.set_ylabel(
-                "Number of events",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-        elif not aggregate and percentage:
-            ax.set_ylabel(
-                "Percentage(%)",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-
-        # TITLE
-        if not aggregate:
-            plt.text(
-                0,
-                0.90,
-                sample,
-                fontsize=20,
-                fontname="Arial",
-                fontweight="bold",
-                color="black",
-                transform=trans,
-            )
-        else:
-            plt.text(
-                0,
-                0.90,
-                project,
-                fontsize=20,
-                fontname="Arial",
-                fontweight="bold",
-                color="black",
-                transform=trans,
-            )
-
-        return fig
-
     # create the output directory if it doesn't exist
     if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
         os.makedirs(output_path)
 
-    # To reindex the input data
-    df = process_input(matrix_path, "32")
-    df.reset_index(inplace=True)
-    label = df.columns[0]
-    labels = df[label]
-
-    figs = {}
-    if aggregate:
-        num_samples = len(df.columns) - 1
-        df["total_count"] = df.select_dtypes(include=[np.number]).sum(axis=1) / num_samples  # NORMALIZE BY # of SAMPLES
-        counts = list(df["total_count"])
-        if percentage and sum(counts) != 0:
-            counts = [(x / sum(counts)) * 100 for x in counts]
-        sample = ""
-        figs[sample] = plot(counts, labels, sample, project, percentage, aggregate=True)
-    else:
-        # each column vector in dataframe contains counts for a specific sample
-        samples = list(df)[1:]
-        for i, (col, sample) in enumerate(zip(df.columns[1:], samples)):
-            counts = list(df[col])
-            if percentage and sum(counts) != 0:
-                counts = [(x / sum(counts)) * 100 for x in counts]
-            assert (len(counts)) == 32
-            assert (len(labels)) == 32
-            figs[sample] = plot(counts, labels, sample, project, percentage)
-
-    return output_results(savefig_format, output_path, project, figs, "SV_32", dpi=dpi)
+    return renderers.load("sv32").render(
+        matrix_path,
+        output_path,
+        project,
+        percentage,
+        aggregate,
+        savefig_format,
+        dpi,
+        volume,
+    )
 
 
+@instrumentation.instrumented
 def plotCNV(
     matrix_path,
     output_path,
@@ -2140,6 +2053,9 @@ def plotCNV(
     read_from_file=True,
     savefig_format="pdf",
     dpi=100,
+    volume=None,
+    timings=None,
+    trace_file=None,
 ):
     """Outputs a pdf containing CNV signature plots
 
@@ -2148,545 +2064,31 @@ def plotCNV(
     :param project: name of project
     :param percentage: True if y-axis is displayed as percentage of CNV events, False if displayed as counts (default:False)
     :param aggregate: True if output is a single pdf of counts aggregated across samples(e.g for a given cancer type, y-axis will be counts per sample), False if output is a multi-page pdf of counts for each sample
+    :param volume: path to the directory of the .pkl plot templates. For Docker.
+    :param timings: PlotTimings object that receives the duration of each stage of the call and of each sample
+    :param trace_file: path of a JSON file to write the stages of the call to, in the Chrome trace event format
     >>> plotCNV()
 
     """
 
-    # inner function to construct plot
-    def plot(counts, labels, sample, project, percentage, aggregate=False):
-        counts_ordered = list()
-        labels_ordered = list()
-        labels_updated = list()
-
-        # index order will be: homdel, LOH, then het
-        for i in range(0, len(labels)):
-            labels_ordered.append(str(counts[i]) + ":" + labels[i])
-        labels_ordered = pd.Series(labels_ordered)
-        l2 = pd.Series(sorted(labels_ordered.values, key=lambda x: x.split(":", 3)[2]))
-        lab_homdel = l2[l2.str.contains(":homdel:")]
-        lab_homdel.index = [homdel for homdel in range(0, len(lab_homdel))]
-        lab_LOH = l2[l2.str.contains(":LOH:")]
-        lab_LOH.index = [
-            loh for loh in range(len(lab_homdel), len(lab_homdel) + len(lab_LOH))
-        ]
-        lab_het = l2[l2.str.contains(":het:")]
-        lab_het.index = [
-            het
-            for het in range(
-                len(lab_homdel) + len(lab_LOH),
-                len(lab_homdel) + len(lab_LOH) + len(lab_het),
-            )
-        ]
-        labels_ordered = pd.concat([lab_homdel, lab_LOH, lab_het])
-        for i in labels_ordered:
-            tmp_count = i.split(":", 1)
-            counts_ordered.append(float(tmp_count[0]))
-            labels_updated.append(tmp_count[1])
-
-        labels = pd.Series(labels_updated)
-        counts = counts_ordered
-
-        super_class = ["Het", "LOH", "Hom del"]
-        hom_del_class = ["0 - 100kb", "100kb - 1Mb", ">1Mb"]
-        loh_subclass = ["1", "2", "3-4", "5-8", "9+"]
-        het_sub_class = ["2", "3-4", "5-8", "9+"]
-        x_labels = ["0 - 100kb", "100kb - 1Mb", "1Mb - 10Mb", "10Mb - 40Mb", ">40Mb"]
-        color_mapping = {
-            "0:0-100kb": "#F0F8FF",
-            "0:100kb-1Mb": "#787CE6",
-            "0:>1Mb": "#0000CD",
-            "1:0-100kb": "#EBEBEB",
-            "1:100kb-1Mb": "#C5C5C5",
-            "1:1Mb-10Mb": "#9F9F9F",
-            "1:10Mb-40Mb": "#797979",
-            "1:>40Mb": "#545454",
-            "2:0-100kb": "#F5FFFA",
-            "2:100kb-1Mb": "#C0E2C3",
-            "2:1Mb-10Mb": "#8BC48E",
-            "2:10Mb-40Mb": "#56A858",
-            "2:>40Mb": "#228B22",
-            "3-4:0-100kb": "#FFF0F5",
-            "3-4:100kb-1Mb": "#DEBDEB",
-            "3-4:1Mb-10Mb": "#BE8BE1",
-            "3-4:10Mb-40Mb": "#9D58D7",
-            "3-4:>40Mb": "#7D26CD",
-            "5-8:0-100kb": "#FFFAF0",
-            "5-8:100kb-1Mb": "#F2DCB3",
-            "5-8:1Mb-10Mb": "#E6BF78",
-            "5-8:10Mb-40Mb": "#D9A23C",
-            "5-8:>40Mb": "#CD8500",
-            "9+:0-100kb": "#FFE4E1",
-            "9+:100kb-1Mb": "#E2ADBC",
-            "9+:1Mb-10Mb": "#C47798",
-            "9+:10Mb-40Mb": "#A84074",
-            "9+:>40Mb": "#8B0A50",
-        }
-        colors = ["#0000CD", "#545454", "#228B22", "#7D26CD", "#CD8500", "#8B0A50"]
-
-        N = 48
-        ticks = np.arange(N)
-        width = 0.27
-        xticks = []
-        i = -1  # used to distinguish first bar from the rest
-
-        plt.style.use("ggplot")
-        plt.rcParams["axes.facecolor"] = "white"
-
-        # create the subplot
-        fig, ax = plt.subplots(figsize=(16, 10))
-        # Create the plot layout (axis and grid lines)
-        plt.gca().yaxis.grid(True)
-        plt.gca().grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-        plt.rcParams["axes.linewidth"] = 1
-        ax.yaxis.set_major_locator(ticker.LinearLocator(5))
-        ax.spines["bottom"].set_color("black")
-        ax.spines["top"].set_color("black")
-        ax.spines["right"].set_color("black")
-        ax.spines["left"].set_color("black")
-        # Add light gray horizontal lines at y-ticks
-        ax.grid(linestyle="-", linewidth=1, color="#EDEDED", axis="y")
-        plt.xlim(xmin=-0.5, xmax=len(labels) - 0.5)
-        tmp_max = max(counts)
-        # give buffer of space for title at top left of plot
-        plt.ylim(ymax=1.25 * tmp_max)
-
-        for count, label in zip(counts, labels):
-            tmp = label.split(":", 2)[1]
-            categories = label.split(":")
-            cnv_class = categories[0]
-            size_class = categories[2]
-            # hom del has different color scheme and size classification
-            hom_del = False
-            if categories[1] == "homdel":
-                hom_del = True
-            i += 1  # position of bar
-
-            ax.bar(
-                ticks[i],
-                count,
-                color=color_mapping[cnv_class + ":" + size_class],
-                edgecolor="black",
-                align="center",
-            )
+    # create the output directory if it doesn't exist
+    if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
+        os.makedirs(output_path)
 
-            xticks.append(ticks[i])
-
-        # ADD PATCHES AND TEXT
-        patch_height = 0.05
-        patch_width = 2.8
-        loh_width = 2.5
-        loh_len = 4.85
-
-        # add vertical black lines
-        ax.axvline(x=2.5, color="black", linewidth=1)
-        ax.axvline(x=patch_width + loh_len * 5.09, color="black", linewidth=1)
-
-        categories = het_sub_class + loh_subclass + ["Hom" + "\n" + "Del"]
-        trans = transforms.blended_transform_factory(ax.transData, ax.transAxes)
-
-        patch_locs = np.arange(0, 45, 5)  # position of patches in data coordinates
-        line_locs = (
-            []
-        )  # for recording positions of top evel patches and separation lines
-
-        # homdel patch
-        ax.add_patch(
-            plt.Rectangle(
-                (-0.5, 1.065),
-                2.925,
-                patch_height,
-                clip_on=False,
-                facecolor="#a9a9a9",
-                transform=trans,
-            )
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (-0.5, 1.01),
-                2.925,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[0],
-                transform=trans,
-            )
-        )
-        plt.text(
-            0.65,
-            1.02,
-            "0",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        plt.text(
-            0.15,
-            1.075,
-            "HD",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-
-        # LOH Patches
-        ax.add_patch(
-            plt.Rectangle(
-                (2.575, 1.065),
-                24.825,
-                patch_height,
-                clip_on=False,
-                facecolor="#a9a9a9",
-                transform=trans,
-            )
-        )
-        plt.text(
-            patch_width + loh_len * 2.25,
-            1.075,
-            "LOH",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (2.575, 1.01),
-                loh_len - 0.025,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[1],
-                transform=trans,
-            )
-        )
-        plt.text(
-            4.725,
-            1.02,
-            "1",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (7.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[2],
-                transform=trans,
-            )
-        )
-        plt.text(
-            9.725,
-            1.02,
-            "2",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (12.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[3],
-                transform=trans,
-            )
-        )
-        plt.text(
-            14,
-            1.02,
-            "3-4",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (17.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[4],
-                transform=trans,
-            )
-        )
-        plt.text(
-            19.025,
-            1.02,
-            "5-8",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (22.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[5],
-                transform=trans,
-            )
-        )
-        plt.text(
-            24.375,
-            1.02,
-            "9+",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-
-        # Heterozygous patches
-        ax.add_patch(
-            plt.Rectangle(
-                (27.55, 1.065),
-                loh_len * 4.0938,
-                patch_height,
-                clip_on=False,
-                facecolor="#a9a9a9",
-                transform=trans,
-            )
-        )
-        plt.text(
-            33.25,
-            1.075,
-            "Heterozygous",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (27.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[2],
-                transform=trans,
-            )
-        )
-        plt.text(
-            29.75,
-            1.02,
-            "2",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (32.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[3],
-                transform=trans,
-            )
-        )
-        plt.text(
-            34.25,
-            1.02,
-            "3-4",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (37.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[4],
-                transform=trans,
-            )
-        )
-        plt.text(
-            39.175,
-            1.02,
-            "5-8",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-        ax.add_patch(
-            plt.Rectangle(
-                (42.55, 1.01),
-                loh_len,
-                patch_height,
-                clip_on=False,
-                facecolor=colors[5],
-                transform=trans,
-            )
-        )
-        plt.text(
-            44.525,
-            1.02,
-            "9+",
-            fontsize=23,
-            fontname="Arial",
-            fontweight="bold",
-            color="white",
-            transform=trans,
-        )
-
-        # This is the x-axis
-        ax.set_xticks(xticks)
-        ax.set_xticklabels(
-            hom_del_class + x_labels * 9,
-            rotation=90,
-            weight="bold",
-            fontsize=16,
-            fontname="Arial",
-            color="black",
-        )
-        ax.tick_params(labelleft=True, left=False, bottom=False)
-        ax.tick_params(axis="y", which="major", pad=0, labelsize=60)
-
-        # format the y-axis labels
-        if percentage:
-            tmp_y_labels = [
-                "{0:0.1f}%".format(round(x, 1)) for x in ax.get_yticks().tolist()
-            ]
-        else:
-            tmp_y_labels = [round(x, 1) for x in ax.get_yticks().tolist()]
-
-        # set the y-axis ticks and labels
-        ax.set_yticks(ax.get_yticks())
-        ax.set_yticklabels(
-            tmp_y_labels, fontname="Arial", weight="bold", fontsize=16, color="black"
-        )
-
-        # y-axis title
-        if aggregate and not percentage:
-            ax.set_ylabel(
-                "Number of Events Per Sample",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-        elif not aggregate and percentage:
-            ax.set_ylabel(
-                "Percentage of Copy Number Segments",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-        elif not aggregate and not percentage:
-            ax.set_ylabel(
-                "Number of Events",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-        elif aggregate and percentage:
-            ax.set_ylabel(
-                "Percentage of Copy Number Segments",
-                fontsize=24,
-                fontname="Arial",
-                weight="bold",
-                labelpad=15,
-                color="black",
-            )
-
-        # Add the sample name
-        plt.text(
-            3,
-            0.90,
-            sample,
-            fontsize=20,
-            fontname="Arial",
-            fontweight="bold",
-            color="black",
-            transform=trans,
-        )
-
-        return fig
-
-    # create the output directory if it doesn't exist
-    if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
-        os.makedirs(output_path)
-
-    df = pd.DataFrame()
-    if read_from_file:
-        if not os.path.exists(matrix_path):
-            raise FileNotFoundError(
-                errno.ENOENT, os.strerror(errno.ENOENT), matrix_path
-            )
-        df = pd.read_csv(
-            matrix_path, sep=None, engine="python"
-        )  # flexible reading of tsv or csv
-    else:
-        df = matrix_path
-
-    # To reindex the input data
-    df = process_input(matrix_path, "48")
-    df.reset_index(inplace=True)
-    label = df.columns[0]
-    labels = df[label]
-    figs = {}
-    if aggregate:
-        num_samples = len(df.columns) - 1
-        df["total_count"] = df.sum(axis=1) / num_samples  # NORMALIZE BY # of SAMPLES
-        counts = list(df["total_count"])
-        if percentage and sum(counts) != 0:
-            counts = [(x / sum(counts)) * 100 for x in counts]
-        sample = ""
-        figs[sample] = plot(
-            counts,
-            labels,
-            sample,
-            project,
-            percentage,
-            aggregate=True,
-        )
-    else:
-        # each column vector in dataframe contains counts for a specific sample
-        samples = list(df)[1:]
-        for i, (col, sample) in enumerate(zip(df.columns[1:], samples)):
-            counts = list(df[col])
-            if percentage and sum(counts) != 0:
-                counts = [(x / sum(counts)) * 100 for x in counts]
-            assert len(counts) == 48
-            assert len(labels) == 48
-            figs[sample] = plot(
-                counts, labels, sample, project, percentage, aggregate=False
-            )
-
-    return output_results(savefig_format, output_path, project, figs, "CNV_48", dpi=dpi)
+    return renderers.load("cnv48").render(
+        matrix_path,
+        output_path,
+        project,
+        percentage,
+        aggregate,
+        read_from_file,
+        savefig_format,
+        dpi,
+        volume,
+    )
 
 
+@instrumentation.instrumented
 def plotSBS(
     matrix_path,
     output_path,
@@ -2699,5630 +2101,67 @@ def plotSBS(
     savefig_format="pdf",
     volume=None,
     dpi=100,
+    n_jobs=1,
+    chunk_size=None,
+    samples=None,
+    sample_regex=None,
+    top_k_by_total=None,
+    incremental=False,
+    timings=None,
+    trace_file=None,
 ):
     """Use an input matrix to create a SBS plot.
 
     Args:
-            matrix_path: The path to a text file or a pandas DataFrame.
+            matrix_path: The path to a text, Parquet, Feather or .npy matrix file,
+                    a pandas DataFrame or an ndarray (see process_input).
             output_path: Path to a directory for saving the output.
             project: Name of unique sample set
             plot_type: Context of the mutational matrix (ie. 96, 288, 384, 1536)
             savefig_format: Format of the output plot (pdf, png, or PIL_Image)
             volume: Path to the .pkl file containing the plot template. For Docker.
+            n_jobs: Number of worker processes used to render the samples. -1 uses all available cores.
+            chunk_size: Largest number of samples read and drawn at once. Very wide
+                    matrices are streamed in column chunks of this size, and
+                    parallel workers are handed chunks of this size.
+            samples: List of sample names to plot, in the order given.
+            sample_regex: Regular expression; only samples whose name matches it are plotted.
+            top_k_by_total: Only plot the top_k_by_total samples with the most mutations.
+                    The sample selection is applied before the matrix is read, so only
+                    the columns of the selected samples are loaded.
+            incremental: Only render the samples whose counts or plotting options
+                    changed since the last incremental run into output_path (see
+                    _plot_incremental). Ignored for PIL_Image output.
+            timings: A PlotTimings object that receives the duration of each
+                    stage of the call and of each sample.
+            trace_file: Path of a JSON file to write the stages of the call to, in
+                    the Chrome trace event format (see PlotTimings.chrome_trace).
     Returns:
             Plot of the given input matrix.
     """
-    plot_custom_text = False
-    sig_probs = False
-    pcawg = False
-
-    # load custom fonts for plotting
-    load_custom_fonts()
-
-    # create the output directory if it doesn't exist
-    if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
-        os.makedirs(output_path)
-
-    if plot_type == "96":
-        data = process_input(matrix_path, plot_type)
-        data = reindex_sbs96(data)
-        sample_count = 0
-
-        buf = io.BytesIO()
-        fig_orig = make_pickle_file(
-            context="SBS96", return_plot_template=True, volume=volume
-        )
-        pickle.dump(fig_orig, buf)
-
-        figs = {}
-        buff_list = {}
-        ctx = data.index  # [seq[0]+seq[2]+seq[6] for seq in data.index]
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
-        colorsall = [
-            [colors[j] for i in range(int(len(ctx) / 6))] for j in range(6)
-        ]
-        colors_flat_list = [item for sublist in colorsall for item in sublist]
-
-        for sample in data.columns:
-            buf.seek(0)
-            figs[sample] = pickle.load(buf)
-            panel1 = figs[sample].axes[0]
-
-            total_count = np.sum(data[sample].values)
-            x = 0.4
-            ymax = 0
-            i = 0
-            muts = data[sample].values
-            if percentage:
-                if total_count > 0:
-                    plt.bar(
-                        np.arange(len(ctx)) + x,
-                        muts / total_count * 100,
-                        width=0.4,
-                        color=colors_flat_list,
-                        align="center",
-                        zorder=1000,
-                    )
-                    ymax = np.max(muts / total_count * 100)
-                sig_probs = True
-            else:
-                plt.bar(
-                    np.arange(len(ctx)) + x,
-                    muts,
-                    width=0.4,
-                    color=colors_flat_list,
-                    align="center",
-                    zorder=1000,
-                )
-                ymax = np.max(muts)
-
-            x = 0.043
-            y3 = 0.87
-            y = int(ymax * 1.25)
-            y2 = y + 2
-
-            if y <= 4:
-                y += 4
-
-            while y % 4 != 0:
-                y += 1
-
-            y = ymax / 1.025
-            ytick_offest = float(y / 3)
-
-            if percentage:
-                ylabs = [
-                    0,
-                    round(ytick_offest, 1),
-                    round(ytick_offest * 2, 1),
-                    round(ytick_offest * 3, 1),
-                    round(ytick_offest * 4, 1),
-                ]
-                ylabels = [
-                    str(0),
-                    str(round(ytick_offest, 1)) + "%",
-                    str(round(ytick_offest * 2, 1)) + "%",
-                    str(round(ytick_offest * 3, 1)) + "%",
-                    str(round(ytick_offest * 4, 1)) + "%",
-                ]
-            else:
-                ylabs = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-                ylabels = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-
-            labs = np.arange(0.375, 96.375, 1)
-
-            font_label_size = 30
-            if not percentage:
-                if int(ylabels[3]) >= 1000:
-                    font_label_size = 20
-
-            if percentage:
-                if len(ylabels) > 2:
-                    font_label_size = 20
-
-            if not percentage:
-                ylabels = getylabels(ylabels)
-
-            panel1.set_xlim([0, 96])
-            panel1.set_ylim([0, y])
-            panel1.set_yticks(ylabs)
-            if sig_probs:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample,
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-            else:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-            panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-            plt.gca().yaxis.grid(True)
-            plt.gca().grid(
-                which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
-            )
-            panel1.set_xlabel("")
-            panel1.set_ylabel("")
-
-            custom_text_upper_plot = ""
-            try:
-                custom_text_upper[sample_count]
-            except:
-                custom_text_upper = False
-            try:
-                custom_text_middle[sample_count]
-            except:
-                custom_text_middle = False
-            try:
-                custom_text_bottom[sample_count]
-            except:
-                custom_text_bottom = False
-
-            if custom_text_upper:
-                plot_custom_text = True
-                if len(custom_text_upper[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-            if custom_text_middle:
-                if len(custom_text_middle[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-
-            if plot_custom_text:
-                x_pos_custom = 0.98
-                if custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = (
-                        custom_text_upper[sample_count]
-                        + "\n"
-                        + custom_text_middle[sample_count]
-                    )
-                    if custom_text_bottom:
-                        custom_text_upper_plot += (
-                            "\n" + custom_text_bottom[sample_count]
-                        )
-
-                if custom_text_upper and not custom_text_middle:
-                    custom_text_upper_plot = custom_text_upper[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                        ha="right",
-                    )
-
-                elif custom_text_upper and custom_text_middle:
-                    if not custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-                    else:
-                        panel1.text(
-                            x_pos_custom,
-                            0.68,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                elif not custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = custom_text_middle[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                        ha="right",
-                    )
-
-            if percentage:
-                plt.ylabel(
-                    "Percentage of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                )
-            else:
-                plt.ylabel(
-                    "Number of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                )
-
-            panel1.tick_params(
-                axis="both",
-                which="both",
-                bottom=False,
-                labelbottom=False,
-                left=True,
-                labelleft=True,
-                right=True,
-                labelright=False,
-                top=False,
-                labeltop=False,
-                direction="in",
-                length=25,
-                colors="lightgray",
-                width=2,
-            )
-
-            [i.set_color("black") for i in plt.gca().get_yticklabels()]
-            sample_count += 1
-
-        return output_results(
-            savefig_format, output_path, project, figs, "SBS_96", dpi=dpi
-        )
-
-    elif plot_type == "192" or plot_type == "96SB" or plot_type == "384":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][6] == ">" or first_line[0][3] == ">":
-                pcawg = True
-            if (
-                first_line[0][7] != "]"
-                and first_line[0][6] != ">"
-                and first_line[0][3] != ">"
-            ):
-                sys.exit(
-                    "The matrix does not match the correct SBS192 format. Please check you formatting and rerun this plotting function."
-                )
-        file_path = os.path.join(output_path, f"SBS_384_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-        mutations = OrderedDict()
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                if pcawg:
-                    samples = first_line.strip().split(",")
-                    samples = samples[3:]
-                    samples = [x.replace('"', "") for x in samples]
-                else:
-                    samples = first_line.strip().split("\t")
-                    samples = samples[1:]
-
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["C>A"] = OrderedDict()
-                    mutations[sample]["C>G"] = OrderedDict()
-                    mutations[sample]["C>T"] = OrderedDict()
-                    mutations[sample]["T>A"] = OrderedDict()
-                    mutations[sample]["T>C"] = OrderedDict()
-                    mutations[sample]["T>G"] = OrderedDict()
-
-                for lines in f:
-                    if pcawg:
-                        line = lines.strip().split(",")
-                        line = [x.replace('"', "") for x in line]
-                        nuc = line[2][0] + "[" + line[1] + "]" + line[2][2]
-                        bias = line[0][0]
-                    else:
-                        line = lines.strip().split()
-                        nuc = line[0][2:]
-                        bias = line[0][0]
-                    if bias == "N" or bias == "B":
-                        continue
-                    else:
-                        if pcawg:
-                            mut_type = line[1]
-                            sample_index = 3
-                        else:
-                            mut_type = line[0][4:7]
-                            sample_index = 1
-
-                        for sample in samples:
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                                # mutCount = int(line[sample_index])
-                            if nuc not in mutations[sample][mut_type].keys():
-                                mutations[sample][mut_type][nuc] = [0, 0]
-                            if bias == "T":
-                                mutations[sample][mut_type][nuc][0] = mutCount
-                            else:
-                                mutations[sample][mut_type][nuc][1] = mutCount
-                            sample_index += 1
-
-            sample_count = 0
-            for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
-                xlabels = []
-
-                x = 0.7
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    for seq in mutations[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count > 0:
-                                trans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][0] / total_count * 100,
-                                    width=0.75,
-                                    color=[1 / 256, 70 / 256, 102 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-transcribed Strand",
-                                )
-                                x += 0.75
-                                untrans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][1] / total_count * 100,
-                                    width=0.75,
-                                    color=[228 / 256, 41 / 256, 38 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-untranscribed Strand",
-                                )
-                                x += 0.2475
-                                if (
-                                    mutations[sample][key][seq][0] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][0]
-                                        / total_count
-                                        * 100
-                                    )
-                                if (
-                                    mutations[sample][key][seq][1] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][1]
-                                        / total_count
-                                        * 100
-                                    )
-
-                        else:
-                            trans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][0],
-                                width=0.75,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.75
-                            untrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][1],
-                                width=0.75,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            x += 0.2475
-                            if mutations[sample][key][seq][0] > ymax:
-                                ymax = mutations[sample][key][seq][0]
-                            if mutations[sample][key][seq][1] > ymax:
-                                ymax = mutations[sample][key][seq][1]
-                        x += 1
-                    i += 1
-
-                x = 0.0415
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                x_plot = 0
-
-                yText = y3 + 0.06
-                plt.text(
-                    0.1,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.255,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.415,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.575,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.735,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.89,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-
-                y = ymax / 1.025
-
-                ytick_offest = float(y / 3)
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.155,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x_plot, 0),
-                            32,
-                            round(ytick_offest * 4, 1),
-                            facecolor=colors[i],
-                            zorder=0,
-                            alpha=0.25,
-                            edgecolor="grey",
-                        )
-                    )
-                    x += 0.1585
-                    x_plot += 32
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                labs = np.arange(0.750, 192.750, 1)
-
-                font_label_size = 30
-                if not percentage:
-                    if int(ylabels[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels) > 2:
-                        font_label_size = 20
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 96])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                count = 0
-                m = 0
-                for i in range(0, 96, 1):
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.02,
-                        xlabels[i][0],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.044,
-                        xlabels[i][1],
-                        fontsize=30,
-                        color=colors[m],
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.071,
-                        xlabels[i][2],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                if sig_probs:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " transcribed subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_bottom:
-                    if len(custom_text_bottom[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.84
-                    if custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_bottom[sample_count]
-                        )
-
-                    if custom_text_upper and not custom_text_bottom:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif custom_text_upper and custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif not custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = custom_text_bottom[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                plt.legend(handles=[trans, untrans], prop={"size": 30})
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors=[0.6, 0.6, 0.6],
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-            pp.close()
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_384_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif (
-        plot_type == "192_extended"
-        or plot_type == "96SB_extended"
-        or plot_type == "384_extended"
-    ):
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][6] == ">" or first_line[0][3] == ">":
-                pcawg = True
-            if (
-                first_line[0][7] != "]"
-                and first_line[0][6] != ">"
-                and first_line[0][3] != ">"
-            ):
-                sys.exit(
-                    "The matrix does not match the correct SBS288 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"SBS_384_extended_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-        mutations = OrderedDict()
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                if pcawg:
-                    samples = first_line.strip().split(",")
-                    samples = samples[3:]
-                    samples = [x.replace('"', "") for x in samples]
-                else:
-                    samples = first_line.strip().split("\t")
-                    samples = samples[1:]
-
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["C>A"] = OrderedDict()
-                    mutations[sample]["C>G"] = OrderedDict()
-                    mutations[sample]["C>T"] = OrderedDict()
-                    mutations[sample]["T>A"] = OrderedDict()
-                    mutations[sample]["T>C"] = OrderedDict()
-                    mutations[sample]["T>G"] = OrderedDict()
-
-                for lines in f:
-                    if pcawg:
-                        line = lines.strip().split(",")
-                        line = [x.replace('"', "") for x in line]
-                        nuc = line[2][0] + "[" + line[1] + "]" + line[2][2]
-                        bias = line[0][0]
-                    else:
-                        line = lines.strip().split()
-                        nuc = line[0][2:]
-                        bias = line[0][0]
-
-                    if pcawg:
-                        mut_type = line[1]
-                        sample_index = 3
-                    else:
-                        mut_type = line[0][4:7]
-                        sample_index = 1
-
-                    for sample in samples:
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-
-                            # mutCount = int(line[sample_index])
-                        if nuc not in mutations[sample][mut_type].keys():
-                            mutations[sample][mut_type][nuc] = [0, 0, 0]
-                        if bias == "T":
-                            mutations[sample][mut_type][nuc][0] = mutCount
-                        elif bias == "U":
-                            mutations[sample][mut_type][nuc][1] = mutCount
-                        else:
-                            mutations[sample][mut_type][nuc][2] += mutCount
-                        sample_index += 1
-
-            sample_count = 0
-            for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                total_trans = sum(
-                    sum(sum(tsb[:-1]) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                total_nontrans = sum(
-                    sum(tsb[-1] for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.04, 0.09, 0.95, 0.77])
-                xlabels = []
-
-                x = 0.7
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    for seq in mutations[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count > 0:
-                                trans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][0] / total_count * 100,
-                                    width=0.75,
-                                    color=[1 / 256, 70 / 256, 102 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-transcribed Strand",
-                                )
-                                x += 0.75
-                                untrans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][1] / total_count * 100,
-                                    width=0.75,
-                                    color=[228 / 256, 41 / 256, 38 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-untranscribed Strand",
-                                )
-                                x += 0.75
-                                nontrans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][2] / total_count * 100,
-                                    width=0.75,
-                                    color="green",
-                                    align="center",
-                                    zorder=1000,
-                                    label="Intergenic",
-                                )
-                                x += 0.2475
-                                if (
-                                    mutations[sample][key][seq][0] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][0]
-                                        / total_count
-                                        * 100
-                                    )
-                                if (
-                                    mutations[sample][key][seq][1] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][1]
-                                        / total_count
-                                        * 100
-                                    )
-                                if (
-                                    mutations[sample][key][seq][2] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][2]
-                                        / total_count
-                                        * 100
-                                    )
-
-                        else:
-                            trans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][0],
-                                width=0.75,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.75
-                            untrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][1],
-                                width=0.75,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            x += 0.75
-                            nontrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][2],
-                                width=0.75,
-                                color="green",
-                                align="center",
-                                zorder=1000,
-                                label="Intergenic",
-                            )
-                            x += 0.2475
-                            if mutations[sample][key][seq][0] > ymax:
-                                ymax = mutations[sample][key][seq][0]
-                            if mutations[sample][key][seq][1] > ymax:
-                                ymax = mutations[sample][key][seq][1]
-                            if mutations[sample][key][seq][2] > ymax:
-                                ymax = mutations[sample][key][seq][2]
-                        x += 1
-                    i += 1
-
-                x = 0.0415
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                x_plot = 0
-
-                yText = y3 + 0.06
-                plt.text(
-                    0.1,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.255,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.415,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.575,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.735,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.89,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-
-                y = ymax / 1.025
-
-                ytick_offest = float(y / 3)
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.155,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x_plot, 0),
-                            44.1,
-                            round(ytick_offest * 4, 1),
-                            facecolor=colors[i],
-                            zorder=0,
-                            alpha=0.25,
-                            edgecolor="grey",
-                        )
-                    )
-                    x += 0.1585
-                    x_plot += 44.1
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                labs = np.arange(0.750, 192.750, 1)
-
-                font_label_size = 30
-                if not percentage:
-                    if int(ylabels[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels) > 2:
-                        font_label_size = 20
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 264])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                count = 0
-                m = 0
-                for i in range(0, 96, 1):
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.02,
-                        xlabels[i][0],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.044,
-                        xlabels[i][1],
-                        fontsize=30,
-                        color=colors[m],
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 101 + 0.0415,
-                        0.071,
-                        xlabels[i][2],
-                        fontsize=30,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                if sig_probs:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_nontrans))
-                        + " non-trans & "
-                        + "{:,}".format(int(total_trans))
-                        + " trans subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_bottom:
-                    if len(custom_text_bottom[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.84
-                    if custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_bottom[sample_count]
-                        )
-
-                    if custom_text_upper and not custom_text_bottom:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif custom_text_upper and custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif not custom_text_upper and custom_text_bottom:
-                        custom_text_upper_plot = custom_text_bottom[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                plt.legend(
-                    handles=[trans, untrans, nontrans],
-                    prop={"size": 20},
-                    loc="upper right",
-                )
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors=[0.6, 0.6, 0.6],
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-            pp.close()
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_384_extended_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif plot_type == "6":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if len(first_line[0]) > 3:
-                sys.exit(
-                    "The matrix does not match the correct SBS6 format. Please check you formatting and rerun this plotting function."
-                )
-        file_path = os.path.join(output_path, f"SBS_6_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        mutations = OrderedDict()
-        total_count = []
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                samples = first_line.strip().split("\t")
-                samples = samples[1:]
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["C>A"] = 0
-                    mutations[sample]["C>G"] = 0
-                    mutations[sample]["C>T"] = 0
-                    mutations[sample]["T>A"] = 0
-                    mutations[sample]["T>C"] = 0
-                    mutations[sample]["T>G"] = 0
-
-                for lines in f:
-                    line = lines.strip().split()
-                    nuc = line[0]
-                    mut_type = line[0]
-                    sample_index = 1
-
-                    for sample in samples:
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-
-                            # mutCount = int(line[sample_index])
-                        mutations[sample][mut_type] = mutCount
-                        sample_index += 1
-
-            for sample in mutations:
-                total_count = sum(mutations[sample].values())
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(15, 10))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
-                xlabels = []
-
-                y = -0.5
-                xmax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    xlabels.append(key)
-                    if percentage:
-                        if total_count > 0:
-                            plt.barh(
-                                y,
-                                mutations[sample][key] / total_count * 100,
-                                height=0.7,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if mutations[sample][key] / total_count * 100 > xmax:
-                                xmax = mutations[sample][key] / total_count * 100
-                    else:
-                        plt.barh(
-                            y,
-                            mutations[sample][key],
-                            height=0.7,
-                            color=colors[i],
-                            align="center",
-                            zorder=1000,
-                        )
-                        if mutations[sample][key] > xmax:
-                            xmax = mutations[sample][key]
-                    y -= 1
-                    i += 1
-
-                y = 0.043
-                x3 = 0.87
-                x = int(xmax * 1.1)
-
-                while x % 4 != 0:
-                    x += 1
-                xtick_offest = int(x / 4)
-
-                if percentage:
-                    xlabs = [
-                        0,
-                        round(xtick_offest, 1),
-                        round(xtick_offest * 2, 1),
-                        round(xtick_offest * 3, 1),
-                        round(xtick_offest * 4, 1),
-                    ]
-                    xlabels = [
-                        str(0),
-                        str(round(xtick_offest, 1)) + "%",
-                        str(round(xtick_offest * 2, 1)) + "%",
-                        str(round(xtick_offest * 3, 1)) + "%",
-                        str(round(xtick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    xlabs = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
-                    xlabels = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
-
-                # if not percentage:
-                #   xlabels = ['{:,}'.format(int(x)) for x in xlabels]
-
-                if not percentage:
-                    xlabels = ["{:,}".format(int(x)) for x in xlabels]
-                    if len(xlabels[-1]) > 3:
-                        xlabels_temp = []
-                        if len(xlabels[-1]) > 7:
-                            for label in xlabels:
-                                if len(label) > 7:
-                                    xlabels_temp.append(label[0:-8] + "m")
-                                elif len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
-
-                        else:
-                            for label in xlabels:
-                                if len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
-                        xlabels = xlabels_temp
-
-                ylabs = np.arange(-5.5, 0.5, 1)
-                ylabels = ["T>G", "T>C", "T>A", "C>T", "C>G", "C>A"]
-                panel1.set_xlim([0, x])
-                panel1.set_ylim([-6, 0])
-                panel1.set_xticks(xlabs)
-                panel1.set_yticks(ylabs)
-                panel1.set_xticklabels(xlabels, fontsize=30)
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                panel1.spines["right"].set_visible(False)
-                panel1.spines["top"].set_visible(False)
-
-                if sig_probs:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample,
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                if percentage:
-                    plt.xlabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.xlabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.set_ylabel("")
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=True,
-                    labelbottom=True,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    width=2,
-                )
-
-                pp.savefig(plot1)
-                plt.close()
-            pp.close()
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_6_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif plot_type == "12" or plot_type == "6SB" or plot_type == "24":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][1] != ":" or len(first_line[0]) != 5:
-                sys.exit(
-                    "The matrix does not match the correct SBS192 format. Please check you formatting and rerun this plotting function."
-                )
-        file_path = os.path.join(output_path, f"SBS_24_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-        mutations = OrderedDict()
-
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                samples = first_line.strip().split("\t")
-                samples = samples[1:]
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["C>A"] = [0, 0]
-                    mutations[sample]["C>G"] = [0, 0]
-                    mutations[sample]["C>T"] = [0, 0]
-                    mutations[sample]["T>A"] = [0, 0]
-                    mutations[sample]["T>C"] = [0, 0]
-                    mutations[sample]["T>G"] = [0, 0]
-
-                for lines in f:
-                    line = lines.strip().split()
-                    nuc = line[0][2:]
-                    bias = line[0][0]
-                    if bias == "N" or bias == "B":
-                        continue
-                    else:
-                        sample_index = 1
-                        for sample in samples:
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                                # mutCount = int(line[sample_index])
-                            if bias == "T":
-                                mutations[sample][nuc][0] = mutCount
-                            else:
-                                mutations[sample][nuc][1] = mutCount
-                            sample_index += 1
-            for sample in mutations:
-                total_count = sum(sum(tsb) for tsb in mutations[sample].values())
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(15, 10))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
-
-                y = 12.485
-                xmax = 0
-                for key in mutations[sample]:
-                    if percentage:
-                        if total_count > 0:
-                            trans = plt.barh(
-                                y,
-                                mutations[sample][key][0] / total_count * 100,
-                                height=0.75,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            y -= 0.75
-                            untrans = plt.barh(
-                                y,
-                                mutations[sample][key][1] / total_count * 100,
-                                height=0.75,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            y -= 0.2475
-                            if mutations[sample][key][0] / total_count * 100 > xmax:
-                                xmax = mutations[sample][key][0] / total_count * 100
-                            if mutations[sample][key][1] / total_count * 100 > xmax:
-                                xmax = mutations[sample][key][1] / total_count * 100
-
-                    else:
-                        trans = plt.barh(
-                            y,
-                            mutations[sample][key][0],
-                            height=0.75,
-                            color=[1 / 256, 70 / 256, 102 / 256],
-                            align="center",
-                            zorder=1000,
-                            label="Genic-transcribed Strand",
-                        )
-                        y -= 0.75
-                        untrans = plt.barh(
-                            y,
-                            mutations[sample][key][1],
-                            height=0.75,
-                            color=[228 / 256, 41 / 256, 38 / 256],
-                            align="center",
-                            zorder=1000,
-                            label="Genic-untranscribed Strand",
-                        )
-                        y -= 0.2475
-                        if mutations[sample][key][0] > xmax:
-                            xmax = mutations[sample][key][0]
-                        if mutations[sample][key][1] > xmax:
-                            xmax = mutations[sample][key][1]
-                    y -= 1
-
-                x = int(xmax * 1.1)
-
-                while x % 4 != 0:
-                    x += 1
-
-                xtick_offest = int(x / 4)
-
-                if percentage:
-                    xlabs = [
-                        0,
-                        round(xtick_offest, 1),
-                        round(xtick_offest * 2, 1),
-                        round(xtick_offest * 3, 1),
-                        round(xtick_offest * 4, 1),
-                    ]
-                    xlabels = [
-                        str(0),
-                        str(round(xtick_offest, 1)) + "%",
-                        str(round(xtick_offest * 2, 1)) + "%",
-                        str(round(xtick_offest * 3, 1)) + "%",
-                        str(round(xtick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    xlabs = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
-                    xlabels = [
-                        0,
-                        xtick_offest,
-                        xtick_offest * 2,
-                        xtick_offest * 3,
-                        xtick_offest * 4,
-                    ]
-                if not percentage:
-                    xlabels = ["{:,}".format(int(x)) for x in xlabels]
-                    if len(xlabels[-1]) > 3:
-                        xlabels_temp = []
-                        if len(xlabels[-1]) > 7:
-                            for label in xlabels:
-                                if len(label) > 7:
-                                    xlabels_temp.append(label[0:-8] + "m")
-                                elif len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
-
-                        else:
-                            for label in xlabels:
-                                if len(label) > 3:
-                                    xlabels_temp.append(label[0:-4] + "k")
-                                else:
-                                    xlabels_temp.append(label)
-                        xlabels = xlabels_temp
-
-                ylabs = np.arange(2.15, 13, 2)
-                ylabels = ["T>G", "T>C", "T>A", "C>T", "C>G", "C>A"]
-                panel1.set_xlim([0, x])
-                panel1.set_ylim([1.2524, 13.235])
-                panel1.set_yticks(ylabs)
-                panel1.set_xticks(xlabs)
-                panel1.set_xticklabels(xlabels, fontsize=30)
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.spines["right"].set_visible(False)
-                panel1.spines["top"].set_visible(False)
-
-                if sig_probs:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample,
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.125,
-                        0.9,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " transcribed subs",
-                        fontsize=40,
-                        fontweight="bold",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                if percentage:
-                    plt.xlabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.xlabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=True,
-                    labelbottom=True,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    width=2,
-                )
-
-                plt.legend(handles=[trans, untrans], prop={"size": 25})
-
-                pp.savefig(plot1)
-                plt.close()
-            pp.close()
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_24_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif plot_type == "1536":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][1] == ">":
-                pcawg = True
-            if first_line[0][6] != "]" and first_line[0][1] != ">":
-                sys.exit(
-                    "The matrix does not match the correct SBS1536 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"SBS_1536_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        mutations_96 = OrderedDict()
-        path_list = matrix_path.split("/")
-        extension = path_list[-1].split(".")
-        extension = extension[-1]
-        matrix_path_96 = (
-            "/".join([x for x in path_list[:-1]])
-            + "/"
-            + project
-            + ".SBS96."
-            + extension
-        )
-        mutations = OrderedDict()
-        mutations_5 = OrderedDict()
-        mutations_3 = OrderedDict()
-        max_count = {}
-        max_all = {}
-        max_5 = {}
-        max_3 = {}
-        total_count = []
-        total_counts = {
-            "TT": 0,
-            "TG": 0,
-            "TC": 0,
-            "TA": 0,
-            "GT": 0,
-            "GG": 0,
-            "GC": 0,
-            "GA": 0,
-            "CT": 0,
-            "CG": 0,
-            "CC": 0,
-            "CA": 0,
-            "AT": 0,
-            "AG": 0,
-            "AC": 0,
-            "AA": 0,
-        }
-        total_counts_5 = {"T": 0, "G": 0, "C": 0, "A": 0}
-        total_counts_3 = {"T": 0, "G": 0, "C": 0, "A": 0}
-
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                if pcawg:
-                    samples = first_line.strip().split(",")
-                    samples = samples[2:]
-                    samples = [x.replace('"', "") for x in samples]
-                else:
-                    samples = first_line.strip().split("\t")
-                    samples = samples[1:]
-
-                for sample in samples:
-                    max_all[sample] = 0
-                    max_5[sample] = 0
-                    max_3[sample] = 0
-                    total_counts[sample] = {
-                        "TT": 0,
-                        "TG": 0,
-                        "TC": 0,
-                        "TA": 0,
-                        "GT": 0,
-                        "GG": 0,
-                        "GC": 0,
-                        "GA": 0,
-                        "CT": 0,
-                        "CG": 0,
-                        "CC": 0,
-                        "CA": 0,
-                        "AT": 0,
-                        "AG": 0,
-                        "AC": 0,
-                        "AA": 0,
-                    }
-                    total_counts_5[sample] = {"T": 0, "G": 0, "C": 0, "A": 0}
-                    total_counts_3[sample] = {"T": 0, "G": 0, "C": 0, "A": 0}
-
-                    mutations_96[sample] = OrderedDict()
-                    mutations_96[sample]["C>A"] = OrderedDict()
-                    mutations_96[sample]["C>G"] = OrderedDict()
-                    mutations_96[sample]["C>T"] = OrderedDict()
-                    mutations_96[sample]["T>A"] = OrderedDict()
-                    mutations_96[sample]["T>C"] = OrderedDict()
-                    mutations_96[sample]["T>G"] = OrderedDict()
-
-                    max_count[sample] = 0
-                    mutations[sample] = OrderedDict()
-                    mutations_5[sample] = OrderedDict()
-                    mutations_3[sample] = OrderedDict()
-
-                    mutations[sample]["C>A"] = OrderedDict()
-                    mutations_5[sample]["C>A"] = OrderedDict()
-                    mutations_3[sample]["C>A"] = OrderedDict()
-                    mutations[sample]["C>A"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["C>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["C>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["C>G"] = OrderedDict()
-                    mutations_5[sample]["C>G"] = OrderedDict()
-                    mutations_3[sample]["C>G"] = OrderedDict()
-                    mutations[sample]["C>G"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["C>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["C>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["C>T"] = OrderedDict()
-                    mutations_5[sample]["C>T"] = OrderedDict()
-                    mutations_3[sample]["C>T"] = OrderedDict()
-                    mutations[sample]["C>T"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["C>T"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["C>T"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["T>A"] = OrderedDict()
-                    mutations_5[sample]["T>A"] = OrderedDict()
-                    mutations_3[sample]["T>A"] = OrderedDict()
-                    mutations[sample]["T>A"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["T>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["T>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["T>C"] = OrderedDict()
-                    mutations_5[sample]["T>C"] = OrderedDict()
-                    mutations_3[sample]["T>C"] = OrderedDict()
-                    mutations[sample]["T>C"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["T>C"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["T>C"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["T>G"] = OrderedDict()
-                    mutations_5[sample]["T>G"] = OrderedDict()
-                    mutations_3[sample]["T>G"] = OrderedDict()
-                    mutations[sample]["T>G"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["T>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["T>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                for lines in f:
-                    if pcawg:
-                        line = lines.strip().split(",")
-                        line = [x.replace('"', "") for x in line]
-                        nuc = line[1][0:2] + "[" + line[0] + "]" + line[1][3:]
-                        mut_type = line[0]
-                        penta_key = line[1][0] + line[1][-1]
-                        tri_key = line[1][1] + line[1][-2]
-                        sample_index = 2
-                    else:
-                        line = lines.strip().split()
-                        nuc = line[0]
-                        mut_type = line[0][3:6]
-                        penta_key = line[0][0] + line[0][-1]
-                        tri_key = line[0][1] + line[0][-2]
-                        sample_index = 1
-
-                        tri = line[0][1:8]
-
-                    for sample in samples:
-                        if tri not in mutations_96[sample][mut_type]:
-                            mutations_96[sample][mut_type][tri] = 0
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-
-                        if pcawg:
-                            sample_ref = sample_index - 2
-                        else:
-                            sample_ref = sample_index - 1
-                        if mutCount > max_count[samples[sample_ref]]:
-                            max_count[samples[sample_ref]] = mutCount
-
-                        if mutCount > max_all[sample]:
-                            max_all[sample] = mutCount
-
-                        mutations[sample][mut_type][penta_key][tri_key] = mutCount
-                        total_counts[sample][penta_key] += mutCount
-                        total_counts_5[sample][penta_key[0]] += mutCount
-                        total_counts_3[sample][penta_key[1]] += mutCount
-                        penta_key_short = penta_key[0]
-                        mutations_5[sample][mut_type][penta_key_short][tri_key] = 0
-                        mutations_3[sample][mut_type][penta_key_short][tri_key] = 0
-                        mutations_96[sample][mut_type][tri] += mutCount
-                        sample_index += 1
-
-            sample_count = 0
-            for sample in mutations.keys():
-                total_count_sample = sum(
-                    sum(nuc.values()) for nuc in mutations_96[sample].values()
-                )
-                if total_count_sample == 0:
-                    continue
-                total_count = max_all[sample] * 1.1
-                ratio = total_count / total_count_sample
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 22.5))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.03, 0.0677, 0.92, 0.267])  # 1536 context panel
-                panel2 = plt.axes([0.03, 0.67, 0.92, 0.247])  # 96 context panel
-                panel3 = plt.axes([0.03, 0.35, 0.92, 0.1335])  # 3' context
-                panel4 = plt.axes([0.03, 0.5, 0.92, 0.1335])  # 5' context
-                xlabels = []
-                ylabels = []
-                ylabels_5 = []
-                ylabels_3 = []
-
-                # Set up all of the color maps
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                colors_heat = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
-                colors_heat_compact = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
-
-                # Plot the 1536 matrix and collect the relevant info for the 96, 5' and 3' plots
-                i = 0
-                x_pos = 0
-                x_inter = 0
-                for key in mutations[sample]:
-                    y_pos = 15
-                    for penta in mutations[sample][key]:
-                        key_5 = penta[0]
-                        key_3 = penta[1]
-                        ylabels.append(penta[0] + "---" + penta[1])
-                        for tri in mutations[sample][key][penta]:
-                            tri_nuc = tri[0] + "[" + key + "]" + tri[1]
-                            normalized = mutations_96[sample][key][tri_nuc]
-                            try:
-                                mut_count = int(
-                                    int(
-                                        20
-                                        * round(
-                                            float(
-                                                mutations[sample][key][penta][tri]
-                                                / total_count_sample
-                                                / ratio
-                                                * 100
-                                            )
-                                        )
-                                        / 20
-                                    )
-                                    / 20
-                                )
-                                mutations_5[sample][key][key_5][tri] += float(
-                                    mutations[sample][key][penta][tri]
-                                )
-                                mutations_3[sample][key][key_3][tri] += float(
-                                    mutations[sample][key][penta][tri]
-                                )
-                                if mutations_5[sample][key][key_5][tri] > max_5[sample]:
-                                    max_5[sample] = mutations_5[sample][key][key_5][tri]
-                                if mutations_3[sample][key][key_3][tri] > max_3[sample]:
-                                    max_3[sample] = mutations_3[sample][key][key_3][tri]
-                            except:
-                                mut_count = 0
-                            xlabels.append(tri[0] + "-" + tri[1])
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count],
-                                    colors_heat[1][mut_count],
-                                    colors_heat[2][mut_count],
-                                ),
-                            )
-                            panel1.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
-                        x_pos = x_inter
-
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot 5' and 3' context matrices
-                x_pos = 0
-                x_inter = 0
-                total_count_5 = max_5[sample] * 1.1
-                total_count_3 = max_3[sample] * 1.1
-                ratio_5 = total_count_5 / total_count_sample
-                ratio_3 = total_count_3 / total_count_sample
-                ratio_total = max(ratio_5, ratio_3)
-                for key in mutations_5[sample]:
-                    y_pos = 3
-                    for penta in mutations_5[sample][key]:
-                        ylabels_5.append(penta + "---N")
-                        ylabels_3.append("N---" + penta)
-                        for tri in mutations_5[sample][key][penta]:
-                            mut_count = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_5[sample][key][penta][tri])
-                                        / total_count_sample
-                                        / ratio_total
-                                        * 100
-                                    )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            mut_count_3 = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_3[sample][key][penta][tri])
-                                        / total_count_sample
-                                        / ratio_total
-                                        * 100
-                                    )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat_compact[0][mut_count],
-                                    colors_heat_compact[1][mut_count],
-                                    colors_heat_compact[2][mut_count],
-                                ),
-                            )
-
-                            panel4.add_patch(rectangle)
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count_3],
-                                    colors_heat[1][mut_count_3],
-                                    colors_heat[2][mut_count_3],
-                                ),
-                            )
-                            panel3.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
-                        x_pos = x_inter
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot the 96 bar plot
-                x = 0.5
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-
-                for key in mutations_96[sample]:
-                    for seq in mutations_96[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count_sample > 0:
-                                panel2.bar(
-                                    x,
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100,
-                                    width=0.5,
-                                    color=colors[i],
-                                    align="center",
-                                    zorder=1000,
-                                )
-                                if (
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations_96[sample][key][seq]
-                                        / total_count_sample
-                                        * 100
-                                    )
-                        else:
-                            panel2.bar(
-                                x,
-                                mutations_96[sample][key][seq],
-                                width=0.5,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if mutations_96[sample][key][seq] > ymax:
-                                ymax = mutations_96[sample][key][seq]
-                        x += 1
-                    x += 1
-                    i += 1
-
-                # scale bar for bottom 1536 plot
-                y_grad = 0.267 / len(colors_heat[0])
-                y_start = 0.0677
-                for l in range(0, len(colors_heat[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.96, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for top 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.5
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.96, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for middle 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.35
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.96, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-                y_tick_grad = max_count[sample] / 2
-
-                # scale numbers for bottom 1536 plot
-                plt.text(
-                    0.9825,
-                    0.0677,
-                    "0",
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.2012,
-                    str(ratio / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.325,
-                    str(ratio)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for top 1536 plot
-                plt.text(
-                    0.9825,
-                    0.5,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.56675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.625,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for middle 1536 plot
-                plt.text(
-                    0.9825,
-                    0.35,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.41675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.9825,
-                    0.475,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                y = int(ymax * 1.25)
-
-                x = 0.033
-                y3 = 0.92
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.143,
-                            0.03,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    x += 0.154
-
-                # Plot the labels for above the SBS96 bar plot
-                y3 = 0.9
-                yText = y3 + 0.06
-                plt.text(
-                    0.085,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.24,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.395,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.552,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.705,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.86,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # Set up the parameters for the yscale ticks and labels
-                y = ymax / 1.025
-                ytick_offest = float(y / 3)
-
-                ylabels_96 = []
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels_96 = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels_96 = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                # Adjust fontsize if required due to large numbers on y-axis
-                font_label_size = 25
-                if not percentage:
-                    if int(ylabels_96[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels_96) > 2:
-                        font_label_size = 20
-
-                if not percentage:
-                    ylabels_96 = getylabels(ylabels_96)
-
-                # Set all panel limits
-                panel1.set_xlim([0, 101])
-                panel1.set_ylim([0, 16])
-                panel2.set_xlim([0, 101])
-                panel2.set_yticks(ylabs)
-                panel1.set_yticks([])
-                panel1.set_xticks([])
-                panel2.set_xticks([])
-                panel4.set_xlim([0, 101])
-                panel4.set_ylim([0, 4])
-                panel3.set_xlim([0, 101])
-                panel3.set_ylim([0, 4])
-                panel4.set_yticks([])
-                panel3.set_yticks([])
-                panel3.set_xticks([])
-                panel4.set_xticks([])
-
-                m = 0
-                count = 0
-                x_letter = 0
-                for i in range(0, 96, 1):
-                    # Bottom labels
-                    plt.text(
-                        x_letter / 101 + 0.032,
-                        0.04,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.032,
-                        0.05,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.032,
-                        0.06,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                    # Top labels
-                    plt.text(
-                        x_letter / 101 + 0.032,
-                        0.64,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.032,
-                        0.65,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.032,
-                        0.66,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    x_letter += 0.92
-                    if (i + 1) % 16 == 0 and i != 0:
-                        x_letter += 0.92
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 bottom plot
-                m = 0
-                count = 0
-                y_letter = 5.2
-                for i in range(0, 16, 1):
-                    plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    y_letter -= 0.2675
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 top matrix plot
-                m = 0
-                count = 0
-                y_letter = 9.85
-                for i in range(0, 4, 1):
-                    plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_5[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    y_letter -= 0.53
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 middle matrix plot
-                m = 0
-                count = 0
-                y_letter = 7.45
-                for i in range(0, 4, 1):
-                    plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_3[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    y_letter -= 0.53
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # Set up all parameters for custom text in upper righthand corner
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.94
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
-                        )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
-
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel2.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
-                            panel2.text(
-                                x_pos_custom,
-                                0.86,
-                                custom_text_upper_plot,
-                                fontsize=40,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-                        else:
-                            panel2.text(
-                                x_pos_custom,
-                                0.835,
-                                custom_text_upper_plot,
-                                fontsize=40,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel2.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                # Plot the sample name in upper left corner of plot
-                if sig_probs:
-                    panel2.text(
-                        0.04,
-                        0.875,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    panel2.text(
-                        0.04,
-                        0.875,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count_sample))
-                        + " subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                # Finish setting all axis grids and tick parameters
-                panel2.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.set_yticklabels([])
-                panel1.set_xticklabels([])
-                panel2.set_xticklabels([])
-
-                if percentage:
-                    panel2.set_ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=28,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    panel2.set_ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=28,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.axis("off")
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel2.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel3.axis("off")
-                panel3.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel4.axis("off")
-                panel4.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-
-                # Change axis depending if percentage parameter is selected
-                if percentage:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size - 1, color="black"
-                    )
-                else:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size, color="black"
-                    )
-
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-            pp.close()
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "SBS_1536_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif plot_type == "4608":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][1] == ">":
-                pcawg = True
-            if first_line[0][8] != "]" and first_line[0][6] != ">":
-                sys.exit(
-                    "The matrix does not match the correct SBS4608 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"SBS_4608_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        path_list = matrix_path.split("/")
-        extension = path_list[-1].split(".")
-        extension = extension[-1]
-        mutations = OrderedDict()
-        mutations_5 = OrderedDict()
-        mutations_3 = OrderedDict()
-        mutations_TSB = OrderedDict()
-        mutations_96 = OrderedDict()
-        max_count = {}
-        max_all = {}
-        max_5 = {}
-        max_3 = {}
-        total_count = []
-        total_counts = {
-            "TT": 0,
-            "TG": 0,
-            "TC": 0,
-            "TA": 0,
-            "GT": 0,
-            "GG": 0,
-            "GC": 0,
-            "GA": 0,
-            "CT": 0,
-            "CG": 0,
-            "CC": 0,
-            "CA": 0,
-            "AT": 0,
-            "AG": 0,
-            "AC": 0,
-            "AA": 0,
-        }
-        total_counts_5 = {"T": 0, "G": 0, "C": 0, "A": 0}
-        total_counts_3 = {"T": 0, "G": 0, "C": 0, "A": 0}
-
-        # try:
-        if True:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                if pcawg:
-                    samples = first_line.strip().split(",")
-                    samples = samples[2:]
-                    samples = [x.replace('"', "") for x in samples]
-                else:
-                    samples = first_line.strip().split("\t")
-                    samples = samples[1:]
-
-                for sample in samples:
-                    max_all[sample] = 0
-                    max_5[sample] = 0
-                    max_3[sample] = 0
-                    total_counts[sample] = {
-                        "TT": 0,
-                        "TG": 0,
-                        "TC": 0,
-                        "TA": 0,
-                        "GT": 0,
-                        "GG": 0,
-                        "GC": 0,
-                        "GA": 0,
-                        "CT": 0,
-                        "CG": 0,
-                        "CC": 0,
-                        "CA": 0,
-                        "AT": 0,
-                        "AG": 0,
-                        "AC": 0,
-                        "AA": 0,
-                    }
-                    total_counts_5[sample] = {"T": 0, "G": 0, "C": 0, "A": 0}
-                    total_counts_3[sample] = {"T": 0, "G": 0, "C": 0, "A": 0}
-
-                    mutations_96[sample] = OrderedDict()
-                    mutations_96[sample]["C>A"] = OrderedDict()
-                    mutations_96[sample]["C>G"] = OrderedDict()
-                    mutations_96[sample]["C>T"] = OrderedDict()
-                    mutations_96[sample]["T>A"] = OrderedDict()
-                    mutations_96[sample]["T>C"] = OrderedDict()
-                    mutations_96[sample]["T>G"] = OrderedDict()
-
-                    max_count[sample] = 0
-                    mutations[sample] = OrderedDict()
-                    mutations_5[sample] = OrderedDict()
-                    mutations_3[sample] = OrderedDict()
-
-                    mutations[sample]["C>A"] = OrderedDict()
-                    mutations_5[sample]["C>A"] = OrderedDict()
-                    mutations_3[sample]["C>A"] = OrderedDict()
-                    mutations[sample]["C>A"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["C>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["C>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["C>G"] = OrderedDict()
-                    mutations_5[sample]["C>G"] = OrderedDict()
-                    mutations_3[sample]["C>G"] = OrderedDict()
-                    mutations[sample]["C>G"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["C>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["C>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["C>T"] = OrderedDict()
-                    mutations_5[sample]["C>T"] = OrderedDict()
-                    mutations_3[sample]["C>T"] = OrderedDict()
-                    mutations[sample]["C>T"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["C>T"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["C>T"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["T>A"] = OrderedDict()
-                    mutations_5[sample]["T>A"] = OrderedDict()
-                    mutations_3[sample]["T>A"] = OrderedDict()
-                    mutations[sample]["T>A"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["T>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["T>A"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["T>C"] = OrderedDict()
-                    mutations_5[sample]["T>C"] = OrderedDict()
-                    mutations_3[sample]["T>C"] = OrderedDict()
-                    mutations[sample]["T>C"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["T>C"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["T>C"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations[sample]["T>G"] = OrderedDict()
-                    mutations_5[sample]["T>G"] = OrderedDict()
-                    mutations_3[sample]["T>G"] = OrderedDict()
-                    mutations[sample]["T>G"] = {
-                        "TT": OrderedDict(),
-                        "TG": OrderedDict(),
-                        "TC": OrderedDict(),
-                        "TA": OrderedDict(),
-                        "GT": OrderedDict(),
-                        "GG": OrderedDict(),
-                        "GC": OrderedDict(),
-                        "GA": OrderedDict(),
-                        "CT": OrderedDict(),
-                        "CG": OrderedDict(),
-                        "CC": OrderedDict(),
-                        "CA": OrderedDict(),
-                        "AT": OrderedDict(),
-                        "AG": OrderedDict(),
-                        "AC": OrderedDict(),
-                        "AA": OrderedDict(),
-                    }
-                    mutations_5[sample]["T>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-                    mutations_3[sample]["T>G"] = {
-                        "T": OrderedDict(),
-                        "G": OrderedDict(),
-                        "C": OrderedDict(),
-                        "A": OrderedDict(),
-                    }
-
-                    mutations_TSB[sample] = OrderedDict()
-                    mutations_TSB[sample]["All"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["C>A"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["C>G"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["C>T"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["T>A"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["T>C"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["T>G"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-
-                for lines in f:
-                    if pcawg:
-                        line = lines.strip().split(",")
-                        line = [x.replace('"', "") for x in line]
-                        nuc = line[2][0:2] + "[" + line[0] + "]" + line[1][3:]
-                        mut_type = line[0]
-                        penta_key = line[1][0] + line[1][-1]
-                        tri_key = line[1][1] + line[1][-2]
-                        sample_index = 2
-                    else:
-                        line = lines.strip().split()
-                        nuc = line[0]
-                        mut_type = line[0][5:8]
-                        penta_key = line[0][2] + line[0][-1]
-                        tri_key = line[0][3] + line[0][-2]
-                        sample_index = 1
-                        tsb = nuc[0]
-                        tri = line[0][3:10]
-
-                    for sample in samples:
-                        if tri not in mutations_96[sample][mut_type]:
-                            mutations_96[sample][mut_type][tri] = 0
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-                                print(
-                                    "There may be an issue with the formatting of your matrix file."
-                                )
-                                sys.exit(0)
-
-                        if pcawg:
-                            sample_ref = sample_index - 2
-                        else:
-                            sample_ref = sample_index - 1
-                        if mutCount > max_count[samples[sample_ref]]:
-                            max_count[samples[sample_ref]] = mutCount
-
-                        if mutCount > max_all[sample]:
-                            max_all[sample] = mutCount
-
-                        mutations[sample][mut_type][penta_key][tri_key] = mutCount
-                        total_counts[sample][penta_key] += mutCount
-                        total_counts_5[sample][penta_key[0]] += mutCount
-                        total_counts_3[sample][penta_key[1]] += mutCount
-                        penta_key_short = penta_key[0]
-                        mutations_5[sample][mut_type][penta_key_short][tri_key] = 0
-                        mutations_3[sample][mut_type][penta_key_short][tri_key] = 0
-                        mutations_96[sample][mut_type][tri] += mutCount
-                        mutations_TSB[sample][mut_type][tsb] += mutCount
-                        mutations_TSB[sample]["All"][tsb] += mutCount
-                        sample_index += 1
-
-            sample_count = 0
-            for sample in mutations.keys():
-                total_count_sample = sum(
-                    sum(nuc.values()) for nuc in mutations_96[sample].values()
-                )
-                if total_count_sample == 0:
-                    continue
-                total_count = max_all[sample] * 1.1
-                ratio = total_count / total_count_sample
-                plt.rcParams["axes.linewidth"] = 2
-                # plot1 = plt.figure(figsize=(43.93,22.5))
-                plot1 = plt.figure(figsize=(43.93, 18))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.03, 0.0677, 0.76, 0.267])  # 1536 context panel
-                panel2 = plt.axes([0.03, 0.67, 0.76, 0.247])  # 96 context panel
-                panel3 = plt.axes([0.03, 0.35, 0.76, 0.1335])  # 3' context
-                panel4 = plt.axes([0.03, 0.5, 0.76, 0.1335])  # 5' context
-                panel5 = plt.axes([0.82, 0.67, 0.17, 0.247])  # SBS288 (TSB) context
-                xlabels = []
-                ylabels = []
-                ylabels_5 = []
-                ylabels_3 = []
-
-                # Set up all of the color maps
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                colors_heat = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
-                colors_heat_compact = [
-                    np.linspace(56 / 255, 255 / 255, 5),
-                    np.linspace(66 / 255, 225 / 255, 5),
-                    np.linspace(157 / 255, 40 / 255, 5),
-                ]
-
-                # Plot the 1536 matrix and collect the relevant info for the 96, 5' and 3' plots
-                i = 0
-                x_pos = 0
-                x_inter = 0
-                for key in mutations[sample]:
-                    y_pos = 15
-                    for penta in mutations[sample][key]:
-                        key_5 = penta[0]
-                        key_3 = penta[1]
-                        ylabels.append(penta[0] + "---" + penta[1])
-                        for tri in mutations[sample][key][penta]:
-                            tri_nuc = tri[0] + "[" + key + "]" + tri[1]
-                            normalized = mutations_96[sample][key][tri_nuc]
-                            try:
-                                mut_count = int(
-                                    int(
-                                        20
-                                        * round(
-                                            float(
-                                                mutations[sample][key][penta][tri]
-                                                / total_count_sample
-                                                / ratio
-                                                * 100
-                                            )
-                                        )
-                                        / 20
-                                    )
-                                    / 20
-                                )
-                                mutations_5[sample][key][key_5][tri] += float(
-                                    mutations[sample][key][penta][tri]
-                                )
-                                mutations_3[sample][key][key_3][tri] += float(
-                                    mutations[sample][key][penta][tri]
-                                )
-                                if mutations_5[sample][key][key_5][tri] > max_5[sample]:
-                                    max_5[sample] = mutations_5[sample][key][key_5][tri]
-                                if mutations_3[sample][key][key_3][tri] > max_3[sample]:
-                                    max_3[sample] = mutations_3[sample][key][key_3][tri]
-                            except:
-                                mut_count = 0
-                            xlabels.append(tri[0] + "-" + tri[1])
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count],
-                                    colors_heat[1][mut_count],
-                                    colors_heat[2][mut_count],
-                                ),
-                            )
-                            panel1.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
-                        x_pos = x_inter
-
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot 5' and 3' context matrices
-                x_pos = 0
-                x_inter = 0
-                total_count_5 = max_5[sample] * 1.1
-                total_count_3 = max_3[sample] * 1.1
-                ratio_5 = total_count_5 / total_count_sample
-                ratio_3 = total_count_3 / total_count_sample
-                ratio_total = max(ratio_5, ratio_3)
-                for key in mutations_5[sample]:
-                    y_pos = 3
-                    for penta in mutations_5[sample][key]:
-                        ylabels_5.append(penta + "---N")
-                        ylabels_3.append("N---" + penta)
-                        for tri in mutations_5[sample][key][penta]:
-                            mut_count = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_5[sample][key][penta][tri])
-                                        / total_count_sample
-                                        / ratio_total
-                                        * 100
-                                    )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            mut_count_3 = int(
-                                int(
-                                    20
-                                    * round(
-                                        float(mutations_3[sample][key][penta][tri])
-                                        / total_count_sample
-                                        / ratio_total
-                                        * 100
-                                    )
-                                    / 20
-                                )
-                                / 20
-                            )
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat_compact[0][mut_count],
-                                    colors_heat_compact[1][mut_count],
-                                    colors_heat_compact[2][mut_count],
-                                ),
-                            )
-
-                            panel4.add_patch(rectangle)
-                            rectangle = mplpatches.Rectangle(
-                                (x_pos, y_pos),
-                                1,
-                                1,
-                                linewidth=1,
-                                facecolor=(
-                                    colors_heat[0][mut_count_3],
-                                    colors_heat[1][mut_count_3],
-                                    colors_heat[2][mut_count_3],
-                                ),
-                            )
-                            panel3.add_patch(rectangle)
-                            x_pos += 1
-                        y_pos -= 1
-                        x_pos = x_inter
-                    x_inter += 17
-                    x_pos = x_inter
-                    i += 1
-
-                # Plot the 96 bar plot
-                x = 0.5
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-
-                for key in mutations_96[sample]:
-                    for seq in mutations_96[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count_sample > 0:
-                                panel2.bar(
-                                    x,
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100,
-                                    width=0.5,
-                                    color=colors[i],
-                                    align="center",
-                                    zorder=1000,
-                                )
-                                if (
-                                    mutations_96[sample][key][seq]
-                                    / total_count_sample
-                                    * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations_96[sample][key][seq]
-                                        / total_count_sample
-                                        * 100
-                                    )
-                        else:
-                            panel2.bar(
-                                x,
-                                mutations_96[sample][key][seq],
-                                width=0.5,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if mutations_96[sample][key][seq] > ymax:
-                                ymax = mutations_96[sample][key][seq]
-                        x += 1
-                    x += 1
-                    i += 1
-
-                # scale bar for bottom 1536 plot
-                y_grad = 0.267 / len(colors_heat[0])
-                y_start = 0.0677
-                for l in range(0, len(colors_heat[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.797, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat[0][l],
-                            colors_heat[1][l],
-                            colors_heat[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for top 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.5
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.797, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-
-                # scale bar for middle 1536 plot
-                y_grad = 0.1335 / len(colors_heat_compact[0])
-                y_start = 0.35
-                for l in range(0, len(colors_heat_compact[0]), 1):
-                    rectangle = mplpatches.Rectangle(
-                        (0.797, y_start),
-                        0.02,
-                        y_grad,
-                        linewidth=1,
-                        facecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                        transform=plt.gcf().transFigure,
-                        clip_on=False,
-                        edgecolor=(
-                            colors_heat_compact[0][l],
-                            colors_heat_compact[1][l],
-                            colors_heat_compact[2][l],
-                        ),
-                    )
-                    panel1.add_patch(rectangle)
-                    y_start += y_grad
-                y_tick_grad = max_count[sample] / 2
-
-                # scale numbers for bottom 1536 plot
-                plt.text(
-                    0.82,
-                    0.0677,
-                    "0",
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.2012,
-                    str(ratio / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.325,
-                    str(ratio)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for top 1536 plot
-                plt.text(
-                    0.82,
-                    0.5,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.56675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.625,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # scale numbers for middle 1536 plot
-                plt.text(
-                    0.82,
-                    0.35,
-                    "0",
-                    fontsize=20,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.41675,
-                    str(ratio_total / 2)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.82,
-                    0.475,
-                    str(ratio_total)[:5],
-                    fontsize=15,
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                y = int(ymax * 1.25)
-
-                x = 0.033
-                y3 = 0.92
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.117,
-                            0.03,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    x += 0.1275
-
-                # Plot the labels for above the SBS96 bar plot
-                y3 = 0.9
-                yText = y3 + 0.06
-                plt.text(
-                    0.075,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.2025,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.33,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.455,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.585,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.71,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                # Set up the parameters for the yscale ticks and labels
-                y = ymax / 1.025
-                ytick_offest = float(y / 3)
-
-                ylabels_96 = []
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels_96 = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels_96 = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                # Adjust fontsize if required due to large numbers on y-axis
-                font_label_size = 25
-                if not percentage:
-                    if int(ylabels_96[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels_96) > 2:
-                        font_label_size = 20
-
-                if not percentage:
-                    ylabels_96 = getylabels(ylabels_96)
-
-                # Set all panel limits
-                panel1.set_xlim([0, 101])
-                panel1.set_ylim([0, 16])
-                panel2.set_xlim([0, 101])
-                panel2.set_yticks(ylabs)
-                panel1.set_yticks([])
-                panel1.set_xticks([])
-                panel2.set_xticks([])
-                panel4.set_xlim([0, 101])
-                panel4.set_ylim([0, 4])
-                panel3.set_xlim([0, 101])
-                panel3.set_ylim([0, 4])
-                panel4.set_yticks([])
-                panel3.set_yticks([])
-                panel3.set_xticks([])
-                panel4.set_xticks([])
-
-                # x-axis 1536 bottom plot
-                m = 0
-                count = 0
-                x_letter = 0
-                for i in range(0, 96, 1):
-                    # Bottom labels
-                    plt.text(
-                        x_letter / 101 + 0.031,
-                        0.04,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.031,
-                        0.05,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.031,
-                        0.06,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                    # Top labels
-                    plt.text(
-                        x_letter / 101 + 0.031,
-                        0.64,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.031,
-                        0.65,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        x_letter / 101 + 0.031,
-                        0.66,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="black",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    x_letter += 0.76
-
-                    if (i + 1) % 16 == 0 and i != 0:
-                        x_letter += 0.76
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 bottom plot
-                m = 0
-                count = 0
-                y_letter = 5.2
-                for i in range(0, 16, 1):
-                    plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    y_letter -= 0.2675
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 top matrix plot
-                m = 0
-                count = 0
-                y_letter = 9.85
-                for i in range(0, 4, 1):
-                    plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_5[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_5[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    y_letter -= 0.53
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # y-axis 1536 middle matrix plot
-                m = 0
-                count = 0
-                y_letter = 7.45
-                for i in range(0, 4, 1):
-                    plt.text(
-                        0.003,
-                        y_letter / 16,
-                        ylabels_3[i][0],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.008,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][1:4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        0.022,
-                        y_letter / 16 + 0,
-                        ylabels_3[i][4],
-                        fontsize=25,
-                        color="black",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    y_letter -= 0.53
-
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                # Set up all parameters for custom text in upper righthand corner
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                x_pos_custom = 0.85
-                y_pos_upper = 0.125
-                y_pos_middle = 0.10
-                y_pos_bottom = 0.075
-                zorder_value = 10
-
-                fontsize_custom = 25
-                fontweight_custom = "bold"
-                fontcolor_custom = "black"
-                fontname_custom = "Arial"
-                ha_custom = "left"
-
-                if custom_text_upper:
-                    plt.text(
-                        x_pos_custom,
-                        y_pos_upper,
-                        custom_text_upper[sample_count],
-                        fontsize=fontsize_custom,
-                        weight=fontweight_custom,
-                        color=fontcolor_custom,
-                        fontname=fontname_custom,
-                        transform=plt.gcf().transFigure,
-                        ha=ha_custom,
-                        zorder=zorder_value,
-                    )
-
-                if custom_text_middle:
-                    plt.text(
-                        x_pos_custom,
-                        y_pos_middle,
-                        custom_text_middle[sample_count],
-                        fontsize=fontsize_custom,
-                        weight=fontweight_custom,
-                        color=fontcolor_custom,
-                        fontname=fontname_custom,
-                        transform=plt.gcf().transFigure,
-                        ha=ha_custom,
-                        zorder=zorder_value,
-                    )
-
-                if custom_text_bottom:
-                    plt.text(
-                        x_pos_custom,
-                        y_pos_bottom,
-                        custom_text_bottom[sample_count],
-                        fontsize=fontsize_custom,
-                        weight=fontweight_custom,
-                        color=fontcolor_custom,
-                        fontname=fontname_custom,
-                        transform=plt.gcf().transFigure,
-                        ha=ha_custom,
-                        zorder=zorder_value,
-                    )
-
-                # Plot the sample name in upper left corner of plot
-                if sig_probs:
-                    panel2.text(
-                        0.04,
-                        0.875,
-                        sample,
-                        fontsize=50,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    panel2.text(
-                        0.04,
-                        0.875,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count_sample))
-                        + " subs",
-                        fontsize=50,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                # Finish setting all axis grids and tick parameters
-                panel2.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.set_yticklabels([])
-                panel1.set_xticklabels([])
-                panel2.set_xticklabels([])
-
-                if percentage:
-                    panel2.set_ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=26,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    panel2.set_ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=26,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.axis("off")
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel2.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel3.axis("off")
-                panel3.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-                panel4.axis("off")
-                panel4.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=False,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="white",
-                    width=2,
-                )
-
-                # Change axis depending if percentage parameter is selected
-                if percentage:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size - 1, color="black"
-                    )
-                else:
-                    panel2.set_yticklabels(
-                        ylabels_96, fontsize=font_label_size, color="black"
-                    )
-
-                yp2 = 28
-                labels = []
-                y2max = 0
-                tsbColors = [
-                    [1 / 256, 70 / 256, 102 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    "green",
-                ]
-                for mut in mutations_TSB[sample]:
-                    labels.append(mut)
-                    i = 0
-                    for tsb in mutations_TSB[sample][mut]:
-                        if tsb == "T":
-                            label = "Genic-transcribed"
-                        elif tsb == "U":
-                            label = "Genic-untranscribed"
-                        else:
-                            label = "Intergenic"
-                        if percentage:
-                            if total_count_sample > 0:
-                                panel5.barh(
-                                    yp2,
-                                    mutations_TSB[sample][mut][tsb]
-                                    / total_count_sample
-                                    * 100,
-                                    color=tsbColors[i],
-                                    label=label,
-                                )
-                                if (
-                                    mutations_TSB[sample][mut][tsb]
-                                    / total_count_sample
-                                    * 100
-                                    > y2max
-                                ):
-                                    y2max = (
-                                        mutations_TSB[sample][mut][tsb]
-                                        / total_count_sample
-                                        * 100
-                                    )
-                        else:
-                            if mutations_TSB[sample][mut][tsb] > y2max:
-                                y2max = mutations_TSB[sample][mut][tsb]
-
-                            panel5.barh(
-                                yp2,
-                                mutations_TSB[sample][mut][tsb],
-                                color=tsbColors[i],
-                                label=label,
-                            )
-                        yp2 -= 1
-                        i += 1
-                    yp2 -= 1
-                y = int(y2max * 1.1)
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-                if percentage:
-                    xlabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    xlabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    xlabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    xlabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                if not percentage:
-                    xlabels = getxlabels(xlabels)
-
-                panel5.spines["right"].set_visible(False)
-                panel5.spines["top"].set_visible(False)
-                labels.reverse()
-                panel5.set_yticks([3, 7, 11, 15, 19, 23, 27])
-                panel5.set_yticklabels(
-                    labels, fontsize=30, fontname="Arial", weight="bold"
-                )
-                panel5.set_xticklabels(xlabels, fontsize=30)
-                panel5.set_xticks(xlabs)
-                handles, labels = panel5.get_legend_handles_labels()
-                panel5.legend(handles[:3], labels[:3], loc="best", prop={"size": 20})
-
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-            pp.close()
-
-    elif plot_type == "288":
-        plot_custom_text = False
-        sig_probs = False
-        pcawg = False
-
-        data = process_input(matrix_path, plot_type)
-
-        sample_count = 0
-
-        data, tsb_mats = reindex_sbs288(data)
-        buf = io.BytesIO()
-        fig_orig = make_pickle_file(
-            context="SBS288", return_plot_template=True, volume=volume
-        )
-        pickle.dump(fig_orig, buf)
-
-        figs = {}
-        buff_list = {}
-        ctx = data.index
-        colors = [
-            [3 / 256, 189 / 256, 239 / 256],
-            [1 / 256, 1 / 256, 1 / 256],
-            [228 / 256, 41 / 256, 38 / 256],
-            [203 / 256, 202 / 256, 202 / 256],
-            [162 / 256, 207 / 256, 99 / 256],
-            [236 / 256, 199 / 256, 197 / 256],
-        ]
-        colorsall = [
-            [colors[j] for i in range(int(len(ctx) / 6))] for j in range(6)
-        ]
-        colors_flat_list = [item for sublist in colorsall for item in sublist]
-
-        for sample in data.columns:
-            buf.seek(0)
-            figs[sample] = pickle.load(buf)
-            panel1 = figs[sample].axes[0]
-            panel2 = figs[sample].axes[1]
-
-            total_count = np.sum(data[sample].values)
-            muts = data[sample].values
-            x = 0.4
-            if percentage:
-                if total_count > 0:
-                    panel1.bar(
-                        np.arange(len(ctx)) + x,
-                        muts / total_count * 100,
-                        width=0.4,
-                        color=colors_flat_list,
-                        align="center",
-                        zorder=1000,
-                    )
-                    ymax = np.max(muts / total_count * 100)
-                sig_probs = True
-            else:
-                panel1.bar(
-                    np.arange(len(ctx)) + x,
-                    muts,
-                    width=0.4,
-                    color=colors_flat_list,
-                    align="center",
-                    zorder=1000,
-                )
-                ymax = np.max(muts)
-
-            y = int(ymax * 1.25)
-            if y <= 4:
-                y += 4
-
-            while y % 4 != 0:
-                y += 1
-            y = ymax / 1.025
-            ytick_offest = float(y / 3)
-
-            if percentage:
-                ylabs = [
-                    0,
-                    round(ytick_offest, 1),
-                    round(ytick_offest * 2, 1),
-                    round(ytick_offest * 3, 1),
-                    round(ytick_offest * 4, 1),
-                ]
-                ylabels = [
-                    str(0),
-                    str(round(ytick_offest, 1)) + "%",
-                    str(round(ytick_offest * 2, 1)) + "%",
-                    str(round(ytick_offest * 3, 1)) + "%",
-                    str(round(ytick_offest * 4, 1)) + "%",
-                ]
-
-            else:
-                ylabs = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-                ylabels = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-
-            font_label_size = 30
-            if not percentage:
-                if int(ylabels[3]) >= 1000:
-                    font_label_size = 20
-
-            if percentage:
-                if len(ylabels) > 2:
-                    font_label_size = 20
-
-            labs = np.arange(0.375, 96.375, 1)
-
-            if not percentage:
-                ylabels = spplt.getylabels(ylabels)
-
-            panel1.set_xlim([0, 96])
-            panel1.set_ylim([0, y])
-
-            panel1.set_yticks(ylabs)
-
-            if sig_probs:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample,
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-            else:
-                plt.text(
-                    0.045,
-                    0.75,
-                    sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                    fontsize=60,
-                    weight="bold",
-                    color="black",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-            custom_text_upper_plot = ""
-            try:
-                custom_text_upper[sample_count]
-            except:
-                custom_text_upper = False
-            try:
-                custom_text_middle[sample_count]
-            except:
-                custom_text_middle = False
-            try:
-                custom_text_bottom[sample_count]
-            except:
-                custom_text_bottom = False
-
-            if custom_text_upper:
-                plot_custom_text = True
-                if len(custom_text_upper[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-            if custom_text_middle:
-                if len(custom_text_middle[sample_count]) > 40:
-                    print(
-                        "To add a custom text, please limit the string to <40 characters including spaces."
-                    )
-                    plot_custom_text = False
-
-            if plot_custom_text:
-                x_pos_custom = 0.73
-                if custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = (
-                        custom_text_upper[sample_count]
-                        + "\n"
-                        + custom_text_middle[sample_count]
-                    )
-                    if custom_text_bottom:
-                        custom_text_upper_plot += (
-                            "\n" + custom_text_bottom[sample_count]
-                        )
-
-                if custom_text_upper and not custom_text_middle:
-                    custom_text_upper_plot = custom_text_upper[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                        ha="right",
-                        zorder=1,
-                    )
-
-                elif custom_text_upper and custom_text_middle:
-                    if not custom_text_bottom:
-                        panel1.text(
-                            x_pos_custom,
-                            0.72,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-                    else:
-                        panel1.text(
-                            x_pos_custom,
-                            0.68,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                elif not custom_text_upper and custom_text_middle:
-                    custom_text_upper_plot = custom_text_middle[sample_count]
-                    panel1.text(
-                        x_pos_custom,
-                        0.78,
-                        custom_text_upper_plot,
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                        ha="right",
-                    )
-
-            panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-            panel1.yaxis.grid(True)
-            panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-            panel1.set_xlabel("")
-            panel1.set_ylabel("")
-
-            if percentage:
-                panel1.set_ylabel(
-                    "Percentage of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                )
-            else:
-                panel1.set_ylabel(
-                    "Number of Single Base Substitutions",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                )
-
-            panel1.tick_params(
-                axis="both",
-                which="both",
-                bottom=False,
-                labelbottom=False,
-                left=True,
-                labelleft=True,
-                right=True,
-                labelright=False,
-                top=False,
-                labeltop=False,
-                direction="in",
-                length=25,
-                colors="lightgray",
-                width=2,
-            )
-
-            [i.set_color("black") for i in panel1.get_yticklabels()]
-
-            yp2 = 28
-            labels = []
-            y2max = 0
-            tsbColors = [
-                [1 / 256, 70 / 256, 102 / 256],
-                [228 / 256, 41 / 256, 38 / 256],
-                "green",
-            ]
-
-            if percentage:
-                y2max = (
-                    np.max(
-                        [
-                            tsb_mats["T"][sample]["All"],
-                            tsb_mats["U"][sample]["All"],
-                            tsb_mats["N"][sample]["All"],
-                        ]
-                    )
-                    / total_count
-                    * 100
-                )
-
-                panel2.barh(
-                    range(28, 1, -4),
-                    tsb_mats["T"][sample].values / total_count * 100,
-                    color=tsbColors[0],
-                    label="Genic-transcribed",
-                )
-                panel2.barh(
-                    range(27, 1, -4),
-                    tsb_mats["U"][sample].values / total_count * 100,
-                    color=tsbColors[1],
-                    label="Genic-untranscribed",
-                )
-                panel2.barh(
-                    range(26, 1, -4),
-                    tsb_mats["N"][sample].values / total_count * 100,
-                    color=tsbColors[2],
-                    label="Intergenic",
-                )
-
-            else:
-                y2max = np.max(
-                    [
-                        tsb_mats["T"][sample]["All"],
-                        tsb_mats["U"][sample]["All"],
-                        tsb_mats["N"][sample]["All"],
-                    ]
-                )
-                panel2.barh(
-                    range(28, 1, -4),
-                    tsb_mats["T"][sample].values,
-                    color=tsbColors[0],
-                    label="Genic-transcribed",
-                )
-                panel2.barh(
-                    range(27, 1, -4),
-                    tsb_mats["U"][sample].values,
-                    color=tsbColors[1],
-                    label="Genic-untranscribed",
-                )
-                panel2.barh(
-                    range(26, 1, -4),
-                    tsb_mats["N"][sample].values,
-                    color=tsbColors[2],
-                    label="Intergenic",
-                )
-
-            labels = list(tsb_mats["T"][sample].index)
-
-            y = int(y2max * 1.1)
-            if y <= 4:
-                y += 4
-            while y % 4 != 0:
-                y += 1
-            ytick_offest = int(y / 4)
-
-            if percentage:
-                xlabs = [
-                    0,
-                    round(ytick_offest, 1),
-                    round(ytick_offest * 2, 1),
-                    round(ytick_offest * 3, 1),
-                    round(ytick_offest * 4, 1),
-                ]
-                xlabels = [
-                    str(0),
-                    str(round(ytick_offest, 1)) + "%",
-                    str(round(ytick_offest * 2, 1)) + "%",
-                    str(round(ytick_offest * 3, 1)) + "%",
-                    str(round(ytick_offest * 4, 1)) + "%",
-                ]
-            else:
-                xlabs = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-                xlabels = [
-                    0,
-                    ytick_offest,
-                    ytick_offest * 2,
-                    ytick_offest * 3,
-                    ytick_offest * 4,
-                ]
-
-            if not percentage:
-                xlabels = spplt.getxlabels(xlabels)
-
-            panel2.spines["right"].set_visible(False)
-            panel2.spines["top"].set_visible(False)
-            labels.reverse()
-            panel2.set_yticks([3, 7, 11, 15, 19, 23, 27])
-            panel2.set_yticklabels(
-                labels, fontsize=30, fontname="Arial", weight="bold"
-            )
-            panel2.set_xticks(xlabs)
-            panel2.set_xticklabels(xlabels, fontsize=30)
-            handles, labels = panel2.get_legend_handles_labels()
-            panel2.legend(handles[:3], labels[:3], loc="best", prop={"size": 30})
-            sample_count += 1
-
-        return output_results(
-            savefig_format, output_path, project, figs, "SBS_288", dpi=dpi
-        )
-
-    elif plot_type == "288_Normalized":
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            if first_line[0][6] == ">" or first_line[0][3] == ">":
-                pcawg = True
-            if (
-                first_line[0][7] != "]"
-                and first_line[0][6] != ">"
-                and first_line[0][3] != ">"
-            ):
-                sys.exit(
-                    "The matrix does not match the correct SBS288 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"SBS_288_Normalized_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        mutations = OrderedDict()
-        mutations_TSB = OrderedDict()
-        total_count = []
-        if True:
-            # try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                if pcawg:
-                    samples = first_line.strip().split(",")
-                    samples = samples[2:]
-                else:
-                    samples = first_line.strip().split("\t")
-                    samples = samples[1:]
-
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["C>A"] = OrderedDict()
-                    mutations[sample]["C>G"] = OrderedDict()
-                    mutations[sample]["C>T"] = OrderedDict()
-                    mutations[sample]["T>A"] = OrderedDict()
-                    mutations[sample]["T>C"] = OrderedDict()
-                    mutations[sample]["T>G"] = OrderedDict()
-
-                    mutations_TSB[sample] = OrderedDict()
-                    mutations_TSB[sample]["All"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["C>A"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["C>G"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["C>T"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["T>A"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["T>C"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-                    mutations_TSB[sample]["T>G"] = OrderedDict({"T": 0, "U": 0, "N": 0})
-
-                for lines in f:
-                    if pcawg:
-                        line = lines.strip().split(",")
-                        mut_type = line[0]
-                        nuc = line[1][0] + "[" + mut_type + "]" + line[1][2]
-                        sample_index = 2
-                    else:
-                        line = lines.strip().split()
-                        nuc = line[0]
-                        mut_type = line[0][4:7]
-                        sample_index = 1
-                        tsb = nuc[0]
-
-                    for sample in samples:
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-                        if nuc[2:] not in mutations[sample][mut_type]:
-                            mutations[sample][mut_type][nuc[2:]] = mutCount
-                        else:
-                            mutations[sample][mut_type][nuc[2:]] += mutCount
-                        mutations_TSB[sample][mut_type][tsb] += mutCount
-                        mutations_TSB[sample]["All"][tsb] += mutCount
-                        sample_index += 1
-
-            sample_count = 0
-
-            for sample in mutations.keys():
-                total_count = sum(
-                    sum(nuc.values()) for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.04, 0.09, 0.7, 0.77])
-                panel2 = plt.axes([0.77, 0.09, 0.21, 0.77])
-                xlabels = []
-
-                x = 0.4
-                ymax = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [1 / 256, 1 / 256, 1 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [203 / 256, 202 / 256, 202 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [236 / 256, 199 / 256, 197 / 256],
-                ]
-                i = 0
-                for key in mutations[sample]:
-                    for seq in mutations[sample][key]:
-                        xlabels.append(seq[0] + seq[2] + seq[6])
-                        if percentage:
-                            if total_count > 0:
-                                panel1.bar(
-                                    x,
-                                    mutations[sample][key][seq] / total_count * 100,
-                                    width=0.4,
-                                    color=colors[i],
-                                    align="center",
-                                    zorder=1000,
-                                )
-                                if (
-                                    mutations[sample][key][seq] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq] / total_count * 100
-                                    )
-                        else:
-                            panel1.bar(
-                                x,
-                                mutations[sample][key][seq],
-                                width=0.4,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if mutations[sample][key][seq] > ymax:
-                                ymax = mutations[sample][key][seq]
-                        x += 1
-                    i += 1
-
-                x = 0.043
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                y2 = y + 2
-                for i in range(0, 6, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y3),
-                            0.11,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    x += 0.117
-
-                yText = y3 + 0.06
-
-                plt.text(
-                    0.082,
-                    yText,
-                    "C>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.1975,
-                    yText,
-                    "C>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.315,
-                    yText,
-                    "C>T",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.43,
-                    yText,
-                    "T>A",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.55,
-                    yText,
-                    "T>C",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.665,
-                    yText,
-                    "T>G",
-                    fontsize=55,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                # ytick_offest = int(y/4)
-                y = ymax / 1.025
-                ytick_offest = float(y / 3)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                font_label_size = 30
-                if not percentage:
-                    if int(ylabels[3]) >= 1000:
-                        font_label_size = 20
-
-                if percentage:
-                    if len(ylabels) > 2:
-                        font_label_size = 20
-
-                labs = np.arange(0.375, 96.375, 1)
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 96])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                count = 0
-                m = 0
-                for i in range(0, 96, 1):
-                    plt.text(
-                        i / 137 + 0.04,
-                        0.02,
-                        xlabels[i][0],
-                        fontsize=25,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 137 + 0.04,
-                        0.044,
-                        xlabels[i][1],
-                        fontsize=25,
-                        color=colors[m],
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        fontweight="bold",
-                        transform=plt.gcf().transFigure,
-                    )
-                    plt.text(
-                        i / 137 + 0.04,
-                        0.071,
-                        xlabels[i][2],
-                        fontsize=25,
-                        color="gray",
-                        rotation="vertical",
-                        verticalalignment="center",
-                        fontname="Courier New",
-                        transform=plt.gcf().transFigure,
-                    )
-                    count += 1
-                    if count == 16:
-                        count = 0
-                        m += 1
-
-                if sig_probs:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample + ": " + "{:,}".format(int(total_count)) + " subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.73
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
-                        )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
-
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                            zorder=1,
-                        )
-
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
-                            panel1.text(
-                                x_pos_custom,
-                                0.72,
-                                custom_text_upper_plot,
-                                fontsize=40,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-                        else:
-                            panel1.text(
-                                x_pos_custom,
-                                0.68,
-                                custom_text_upper_plot,
-                                fontsize=40,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=40,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                panel1.set_yticklabels(ylabels, fontsize=font_label_size)
-                panel1.yaxis.grid(True)
-                panel1.grid(which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    panel1.set_ylabel(
-                        "Percentage of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    panel1.set_ylabel(
-                        "Number of Single Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="lightgray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in panel1.get_yticklabels()]
-
-                yp2 = 25.5
-                labels = []
-                y2max = 0
-                tsbColors = [
-                    [1 / 256, 70 / 256, 102 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    "green",
-                ]
-                for mut in mutations_TSB[sample]:
-                    labels.append(mut)
-                    if True:
-                        totalMuts = sum(
-                            [
-                                mutations_TSB[sample][mut][x]
-                                for x in mutations_TSB[sample][mut]
-                            ]
-                        )
-                        panel2.barh(
-                            yp2,
-                            mutations_TSB[sample][mut]["N"] / totalMuts * 100,
-                            1.25,
-                            color=tsbColors[2],
-                            label="Intergenic",
-                            zorder=0,
-                        )
-                        panel2.barh(
-                            yp2,
-                            (
-                                mutations_TSB[sample][mut]["N"]
-                                + mutations_TSB[sample][mut]["T"]
-                                + mutations_TSB[sample][mut]["U"]
-                            )
-                            / totalMuts
-                            * 100,
-                            1.25,
-                            color="purple",
-                            label="Genic-transcribed Regions",
-                            zorder=-1,
-                        )
-
-                        yp2 -= 1.25
-
-                        transcribedTotal = (
-                            mutations_TSB[sample][mut]["T"]
-                            + mutations_TSB[sample][mut]["U"]
-                        )
-                        panel2.barh(
-                            yp2,
-                            mutations_TSB[sample][mut]["T"] / transcribedTotal * 100,
-                            1.25,
-                            color=tsbColors[0],
-                            label="Transcribed strand",
-                            zorder=0,
-                        )
-                        panel2.barh(
-                            yp2,
-                            (
-                                mutations_TSB[sample][mut]["T"]
-                                + mutations_TSB[sample][mut]["U"]
-                            )
-                            / transcribedTotal
-                            * 100,
-                            1.25,
-                            color=tsbColors[1],
-                            label="Genic-untranscribed strand",
-                            zorder=-1,
-                        )
-
-                        yp2 -= 1.25
-                    yp2 -= 1.25
-                panel2.grid(
-                    which="major",
-                    axis="x",
-                    ls="--",
-                    color=[0.95, 0.95, 0.95],
-                    zorder=10000,
-                    lw=2,
-                )
-                xlabels = ["0%", "25%", "50%", "75", "100%"]
-                xlabs = [0, 25, 50, 75, 100]
-                panel2.spines["right"].set_visible(False)
-                panel2.spines["top"].set_visible(False)
-                labels.reverse()
-                panel2.set_yticks([2.5, 6.25, 10, 13.75, 17.75, 21.25, 25])
-                panel2.set_yticklabels(
-                    labels, fontsize=30, fontname="Arial", weight="bold"
-                )
-                panel2.set_xticks(xlabs)
-                panel2.set_xticklabels(xlabels, fontsize=30)
-                handles, labels = panel2.get_legend_handles_labels()
-                panel2.legend(
-                    handles[:4],
-                    labels[:4],
-                    loc="upper right",
-                    prop={"size": 15},
-                    bbox_to_anchor=(0.95, 1.15),
-                )
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-
-            pp.close()
-
-    else:
-        print(
-            "Error: The function plotSBS does not support plot_type",
-            plot_type,
-            "so no plot has been generated."
-        )
+    return _plot_family(
+        "SBS",
+        matrix_path,
+        output_path,
+        project,
+        plot_type,
+        percentage=percentage,
+        custom_text_upper=custom_text_upper,
+        custom_text_middle=custom_text_middle,
+        custom_text_bottom=custom_text_bottom,
+        savefig_format=savefig_format,
+        volume=volume,
+        dpi=dpi,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size,
+        samples=samples,
+        sample_regex=sample_regex,
+        top_k_by_total=top_k_by_total,
+        incremental=incremental,
+    )
 
 
+@instrumentation.instrumented
 def plotID(
     matrix_path,
     output_path,
@@ -8335,1972 +2174,38 @@ def plotID(
     savefig_format="pdf",
     volume=None,
     dpi=100,
+    n_jobs=1,
+    chunk_size=None,
+    samples=None,
+    sample_regex=None,
+    top_k_by_total=None,
+    incremental=False,
+    timings=None,
+    trace_file=None,
 ):
-    # create the output directory if it doesn't exist
-    if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
-        os.makedirs(output_path)
-
-    # load custom fonts for plotting
-    load_custom_fonts()
-
-    plot_custom_text = False
-    sig_probs = False
-    pcawg = False
-    if (
-        plot_type == "94"
-        or plot_type == "ID94"
-        or plot_type == "94ID"
-        or plot_type == "83"
-    ):
-        data = process_input(matrix_path, plot_type)
-
-        try:
-            sample_count = 0
-            buf = io.BytesIO()
-            fig_orig = make_pickle_file(
-                context="ID83", return_plot_template=True, volume=volume
-            )
-            pickle.dump(fig_orig, buf)
-            figs = {}
-            colors = [
-                [253 / 256, 190 / 256, 111 / 256],
-                [255 / 256, 128 / 256, 2 / 256],
-                [176 / 256, 221 / 256, 139 / 256],
-                [54 / 256, 161 / 256, 46 / 256],
-                [253 / 256, 202 / 256, 181 / 256],
-                [252 / 256, 138 / 256, 106 / 256],
-                [241 / 256, 68 / 256, 50 / 256],
-                [188 / 256, 25 / 256, 26 / 256],
-                [208 / 256, 225 / 256, 242 / 256],
-                [148 / 256, 196 / 256, 223 / 256],
-                [74 / 256, 152 / 256, 201 / 256],
-                [23 / 256, 100 / 256, 171 / 256],
-                [226 / 256, 226 / 256, 239 / 256],
-                [182 / 256, 182 / 256, 216 / 256],
-                [134 / 256, 131 / 256, 189 / 256],
-                [98 / 256, 64 / 256, 155 / 256],
-            ]
-            ctx = data.index
-            xlabels = [
-                i.split(":")[0] + i.split(":")[1] + i.split(":")[2]
-                for i in ctx.to_list()
-            ]
-            xlables_set = [
-                "1DelC",
-                "1DelT",
-                "1InsC",
-                "1InsT",
-                "2DelR",
-                "3DelR",
-                "4DelR",
-                "5DelR",
-                "2InsR",
-                "3InsR",
-                "4InsR",
-                "5InsR",
-                "2DelM",
-                "3DelM",
-                "4DelM",
-                "5DelM",
-            ]
-            colors_idx = copy.deepcopy(xlabels)
-            for ii in range(0, len(xlables_set)):
-                colors_idx = [ii if x == xlables_set[ii] else x for x in colors_idx]
-
-            colors_flat_list = [colors[i] for i in colors_idx]
-
-            for sample in data.columns:  # mutations.keys():
-                buf.seek(0)
-                figs[sample] = pickle.load(buf)
-                panel1 = figs[sample].axes[0]
-                muts = data[sample].values
-                total_count = np.sum(muts)
-                x = 0.4
-
-                if percentage:
-                    if total_count > 0:
-                        plt.bar(
-                            np.arange(len(ctx)) + x,
-                            muts / total_count * 100,
-                            width=0.4,
-                            color=colors_flat_list,
-                            align="center",
-                            zorder=1000,
-                        )
-                        ymax = np.max(muts / total_count * 100)
-                    sig_probs = True
-                else:
-                    plt.bar(
-                        np.arange(len(ctx)) + x,
-                        muts,
-                        width=0.4,
-                        color=colors_flat_list,
-                        align="center",
-                        zorder=1000,
-                    )
-                    ymax = np.max(muts)
-
-                x = 0.0475
-                y_top = 0.827
-                y_bottom = 0.114
-                y = int(ymax * 1.25)
-                y2 = y + 2
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                labs = np.arange(0.375, 83.375, 1)
-
-                if not percentage:
-                    ylabels = spplt.getylabels(ylabels)
-
-                panel1.set_xlim([0, 83])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                if sig_probs:
-                    plt.text(
-                        0.0475,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.0475,
-                        0.75,
-                        sample + ": " + "{:,}".format(int(total_count)) + " indels",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.95
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
-                        )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
-
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
-                            panel1.text(
-                                x_pos_custom,
-                                0.72,
-                                custom_text_upper_plot,
-                                fontsize=35,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-                        else:
-                            panel1.text(
-                                x_pos_custom,
-                                0.68,
-                                custom_text_upper_plot,
-                                fontsize=35,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="gray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-                sample_count += 1
-
-            return output_results(
-                savefig_format, output_path, project, figs, "ID_83", dpi=dpi
-            )
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "ID_83_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif (
-        plot_type == "INDEL_simple"
-        or plot_type == "simple_INDEL"
-        or plot_type == "ID_simple"
-        or plot_type == "simple_ID"
-        or plot_type == "28"
-    ):
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            mutation_type = first_line[0]
-            mutation_type_list = mutation_type.split(":")
-            if len(mutation_type_list) != 4:
-                sys.exit(
-                    "The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
-                )
-        file_path = os.path.join(output_path, f"ID_simple_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        indel_types = [
-            "1:Del:C:1",
-            "1:Del:C:2",
-            "1:Del:C:3",
-            "1:Del:C:4",
-            "1:Del:C:5",
-            "1:Del:C:6" "1:Del:T:1",
-            "1:Del:T:2",
-            "1:Del:T:3",
-            "1:Del:T:4",
-            "1:Del:T:5",
-            "1:Del:T:6" "1:Ins:C:0",
-            "1:Ins:C:1",
-            "1:Ins:C:2",
-            "1:Ins:C:3",
-            "1:Ins:C:4",
-            "1:Ins:C:5",
-            "1:Ins:T:0",
-            "1:Ins:T:1",
-            "1:Ins:T:2",
-            "1:Ins:T:3",
-            "1:Ins:T:4",
-            "1:Ins:T:5",
-            "long_Del",
-            "long_Ins",
-            "MH",
-            "complex",
-        ]
-
-        mutations = OrderedDict()
-
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                samples = first_line.strip().split("\t")
-                samples = samples[1:]
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["1DelC"] = [0, 0, 0, 0, 0, 0]
-                    mutations[sample]["1DelT"] = [0, 0, 0, 0, 0, 0]
-                    mutations[sample]["1InsC"] = [0, 0, 0, 0, 0, 0]
-                    mutations[sample]["1InsT"] = [0, 0, 0, 0, 0, 0]
-                    mutations[sample]["long_Del"] = [0]
-                    mutations[sample]["long_Ins"] = [0]
-                    mutations[sample]["MH"] = [0]
-                    mutations[sample]["complex"] = [0]
-
-                for lines in f:
-                    line = lines.strip().split()
-                    categories = line[0].split(":")
-                    if len(categories) < 2:
-                        mut_type = categories[0]
-                        repeat_size = 0
-                    else:
-                        mut_type = categories[0] + categories[1] + categories[2]
-                        repeat_size = int(categories[3])
-                    sample_index = 1
-
-                    for sample in samples:
-                        # if mut_type in mutations[sample].keys():
-                        if percentage:
-                            mutCount = float(line[sample_index])
-                            if mutCount < 1 and mutCount > 0:
-                                sig_probs = True
-                        else:
-                            try:
-                                mutCount = int(line[sample_index])
-                            except:
-                                print(
-                                    "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                    end="",
-                                )
-
-                            # mutCount = int(line[sample_index])
-                        mutations[sample][mut_type][repeat_size] = mutCount
-
-                        # else:
-                        #   if percentage:
-                        #       mutCount = float(line[sample_index])
-                        #   else:
-                        #       mutCount = int(line[sample_index])
-                        #   if int(mut_type[0]) > 1:
-                        #       repeat_size = 0
-                        #       if categories[2] == 'M':
-                        #           mut_type = 'MH'
-                        #           mutations[sample][mut_type][repeat_size] += mutCount
-                        #       else:
-                        #           if categories[1] == 'Del':
-                        #               mut_type = 'Del'
-                        #               mutations[sample][mut_type][repeat_size] += mutCount
-                        #           else:
-                        #               mut_type = 'Ins'
-                        #               mutations[sample][mut_type][repeat_size] += mutCount
-
-                        # continue
-                        sample_index += 1
-
-            for sample in mutations:
-                total_count = sum(sum(nuc) for nuc in mutations[sample].values())
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(15, 13))
-                plt.rc("axes", edgecolor="black")
-                panel1 = plt.axes([0.12, 0.12, 0.8, 0.77])
-                xlabels = []
-
-                x = 0.4
-                ymax = 0
-                colors = [
-                    [253 / 256, 190 / 256, 111 / 256],
-                    [255 / 256, 128 / 256, 2 / 256],
-                    [176 / 256, 221 / 256, 139 / 256],
-                    [54 / 256, 161 / 256, 46 / 256],
-                    # [188/256,25/256,26/256],
-                    [23 / 256, 100 / 256, 171 / 256],
-                    [98 / 256, 64 / 256, 155 / 256],
-                    [98 / 256, 64 / 256, 155 / 256],
-                ]
-
-                i = 0
-                for key in mutations[sample]:
-                    l = 1
-                    for seq in mutations[sample][key]:
-                        xlabels.append(l)
-                        if percentage:
-                            if total_count > 0:
-                                plt.bar(
-                                    x,
-                                    seq / total_count * 100,
-                                    width=0.4,
-                                    color=colors[i],
-                                    align="center",
-                                    zorder=1000,
-                                )
-                                if seq / total_count * 100 > ymax:
-                                    ymax = seq / total_count * 100
-                        else:
-                            plt.bar(
-                                x,
-                                seq,
-                                width=0.4,
-                                color=colors[i],
-                                align="center",
-                                zorder=1000,
-                            )
-                            if seq > ymax:
-                                ymax = seq
-                        x += 1
-                        l += 1
-                    if i < 4:
-                        i += 1
-                x = 0.126
-                y_top = 0.9
-                y_bottom = 0.075
-                y = int(ymax * 1.25)
-                y2 = y + 2
-
-                for i in range(0, 4, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y_top),
-                            0.154,
-                            0.037,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y_bottom),
-                            0.154,
-                            0.037,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    x += 0.1715
-
-                x -= 0.001
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.098,
-                        0.037,
-                        facecolor=colors[i + 1],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.098,
-                        0.037,
-                        facecolor=colors[i + 1],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-
-                yText = y_top + 0.0055
-                plt.text(
-                    0.185,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.36,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.53,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.705,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-
-                yText_labels_top = yText + 0.045
-                yText_labels_bottom = y_bottom - 0.03
-                yText_labels_bottom_sec = yText_labels_bottom - 0.025
-
-                plt.text(
-                    0.2,
-                    yText_labels_top,
-                    "1bp Deletion",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.54,
-                    yText_labels_top,
-                    "1bp Insertion",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.155,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=30,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.505,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=30,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.827,
-                    yText_labels_top,
-                    ">1bp",
-                    fontsize=30,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.83,
-                    yText_labels_bottom_sec,
-                    "Type",
-                    fontsize=30,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-
-                x = 0.127
-                yText_labels_bottom = y_bottom - 0.025
-
-                for l in range(0, 4, 1):
-                    if l < 2:
-                        for i in range(1, 6, 1):
-                            plt.text(
-                                x,
-                                yText_labels_bottom,
-                                str(i),
-                                fontsize=25,
-                                fontweight="bold",
-                                fontname="Times New Roman",
-                                color="black",
-                                transform=plt.gcf().transFigure,
-                            )
-                            x += 0.028
-                        x -= 0.005
-                        plt.text(
-                            x,
-                            yText_labels_bottom,
-                            "6+",
-                            fontsize=25,
-                            fontweight="bold",
-                            fontname="Times New Roman",
-                            color="black",
-                            transform=plt.gcf().transFigure,
-                        )
-                        x += 0.037
-                    else:
-                        if l == 2:
-                            x += 0
-                        for i in range(0, 5, 1):
-                            plt.text(
-                                x,
-                                yText_labels_bottom,
-                                str(i),
-                                fontsize=25,
-                                fontweight="bold",
-                                fontname="Times New Roman",
-                                color="black",
-                                transform=plt.gcf().transFigure,
-                            )
-                            x += 0.028
-                        x -= 0.005
-                        plt.text(
-                            x,
-                            yText_labels_bottom,
-                            "5+",
-                            fontsize=25,
-                            fontweight="bold",
-                            fontname="Times New Roman",
-                            color="black",
-                            transform=plt.gcf().transFigure,
-                        )
-                        x += 0.037
-
-                yText_labels_bottom += 0.0
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "Del",
-                    fontsize=17,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-                x += 0.026
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "Ins",
-                    fontsize=17,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-                x += 0.0295
-                yText_labels_bottom -= 0.001
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "MH",
-                    fontsize=17,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-                x += 0.0295
-                yText_labels_bottom -= 0.002
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "COMP",
-                    fontsize=10,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                    rotation="vertical",
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 28])
-                panel1.set_ylim([0, y])
-                panel1.set_yticks(ylabs)
-
-                if sig_probs:
-                    plt.text(
-                        0.13,
-                        0.85,
-                        sample,
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.13,
-                        0.85,
-                        sample + ": " + "{:,}".format(int(total_count)) + " indels",
-                        fontsize=40,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="gray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-
-                pp.savefig(plot1)
-                plt.close()
-            pp.close()
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "ID_simple_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif (
-        plot_type == "IDSB"
-        or plot_type == "415"
-    ):
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split("\t")
-            mutation_type = first_line[0]
-            mutation_type_list = mutation_type.split(":")
-            if len(mutation_type_list) != 5:
-                print(mutation_type_list)
-                sys.exit(
-                    "The matrix does not match the correct ID-96 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"ID_TSB_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        indel_types_tsb = []
-        tsb_I = ["T", "U", "N", "B", "Q"]
-        indel_types = [
-            "1:Del:C:0",
-            "1:Del:C:1",
-            "1:Del:C:2",
-            "1:Del:C:3",
-            "1:Del:C:4",
-            "1:Del:C:5",
-            "1:Del:T:0",
-            "1:Del:T:1",
-            "1:Del:T:2",
-            "1:Del:T:3",
-            "1:Del:T:4",
-            "1:Del:T:5",
-            "1:Ins:C:0",
-            "1:Ins:C:1",
-            "1:Ins:C:2",
-            "1:Ins:C:3",
-            "1:Ins:C:4",
-            "1:Ins:C:5",
-            "1:Ins:T:0",
-            "1:Ins:T:1",
-            "1:Ins:T:2",
-            "1:Ins:T:3",
-            "1:Ins:T:4",
-            "1:Ins:T:5",
-            # >1bp INDELS
-            "2:Del:R:0",
-            "2:Del:R:1",
-            "2:Del:R:2",
-            "2:Del:R:3",
-            "2:Del:R:4",
-            "2:Del:R:5",
-            "3:Del:R:0",
-            "3:Del:R:1",
-            "3:Del:R:2",
-            "3:Del:R:3",
-            "3:Del:R:4",
-            "3:Del:R:5",
-            "4:Del:R:0",
-            "4:Del:R:1",
-            "4:Del:R:2",
-            "4:Del:R:3",
-            "4:Del:R:4",
-            "4:Del:R:5",
-            "5:Del:R:0",
-            "5:Del:R:1",
-            "5:Del:R:2",
-            "5:Del:R:3",
-            "5:Del:R:4",
-            "5:Del:R:5",
-            "2:Ins:R:0",
-            "2:Ins:R:1",
-            "2:Ins:R:2",
-            "2:Ins:R:3",
-            "2:Ins:R:4",
-            "2:Ins:R:5",
-            "3:Ins:R:0",
-            "3:Ins:R:1",
-            "3:Ins:R:2",
-            "3:Ins:R:3",
-            "3:Ins:R:4",
-            "3:Ins:R:5",
-            "4:Ins:R:0",
-            "4:Ins:R:1",
-            "4:Ins:R:2",
-            "4:Ins:R:3",
-            "4:Ins:R:4",
-            "4:Ins:R:5",
-            "5:Ins:R:0",
-            "5:Ins:R:1",
-            "5:Ins:R:2",
-            "5:Ins:R:3",
-            "5:Ins:R:4",
-            "5:Ins:R:5",
-            # MicroHomology INDELS
-            "2:Del:M:1",
-            "3:Del:M:1",
-            "3:Del:M:2",
-            "4:Del:M:1",
-            "4:Del:M:2",
-            "4:Del:M:3",
-            "5:Del:M:1",
-            "5:Del:M:2",
-            "5:Del:M:3",
-            "5:Del:M:4",
-            "5:Del:M:5",
-        ]
-
-        for indels in indel_types:
-            for tsbs in tsb_I:
-                indel_types_tsb.append(tsbs + ":" + indels)
-
-        sig_probs = False
-        mutations = OrderedDict()
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                if pcawg:
-                    samples = first_line.strip().split(",")
-                    samples = samples[4:]
-                    samples = [x.replace('"', "") for x in samples]
-                else:
-                    samples = first_line.strip().split("\t")
-                    samples = samples[1:]
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["1DelC"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["1DelT"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["1InsC"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["1InsT"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["2DelR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["3DelR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["4DelR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["5DelR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["2InsR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["3InsR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["3InsR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["4InsR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["5InsR"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-                    mutations[sample]["2DelM"] = [[0, 0]]
-                    mutations[sample]["3DelM"] = [[0, 0], [0, 0]]
-                    mutations[sample]["4DelM"] = [[0, 0], [0, 0], [0, 0]]
-                    mutations[sample]["5DelM"] = [
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                        [0, 0],
-                    ]
-
-                for lines in f:
-                    if pcawg:
-                        line = lines.strip().split(",")
-                        line = [x.replace('"', "") for x in line]
-                        if line[1] == "repeats":
-                            mut_type = (
-                                line[2][0]
-                                + line[0][0]
-                                + line[0][1].lower()
-                                + line[0][2].lower()
-                                + "R"
-                            )
-                        else:
-                            mut_type = (
-                                line[2][0]
-                                + line[0][0]
-                                + line[0][1].lower()
-                                + line[0][2].lower()
-                                + line[1][0]
-                            )
-                        try:
-                            repeat_size = int(line[3])
-                        except:
-                            repeat_size = int(line[3][0])
-                        if line[1] == "MH":
-                            repeat_size -= 1
-                        sample_index = 4
-                    else:
-                        line = lines.strip().split()
-                        if line[0] not in indel_types_tsb:
-                            continue
-                        categories = line[0].split(":")
-                        bias = categories[0]
-                        if bias == "B" or bias == "N" or bias == "Q":
-                            continue
-                        mut_type = categories[1] + categories[2] + categories[3]
-
-                        repeat_size = int(categories[4])
-                        if categories[3] == "M":
-                            repeat_size -= 1
-                        sample_index = 1
-
-                    for sample in samples:
-                        if mut_type in mutations[sample].keys():
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                                # mutCount = int(line[sample_index])
-                            if bias == "T":
-                                mutations[sample][mut_type][repeat_size][0] = mutCount
-                            else:
-                                mutations[sample][mut_type][repeat_size][1] = mutCount
-                        else:
-                            continue
-                        sample_index += 1
-
-            sample_count = 0
-            for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc) for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(43.93, 12))
-                plt.rc("axes", edgecolor="black")
-                panel1 = plt.axes([0.045, 0.17, 0.92, 0.65])
-                xlabels = []
-
-                x = 0.4
-                ymax = 0
-                colors = [
-                    [253 / 256, 190 / 256, 111 / 256],
-                    [255 / 256, 128 / 256, 2 / 256],
-                    [176 / 256, 221 / 256, 139 / 256],
-                    [54 / 256, 161 / 256, 46 / 256],
-                    [253 / 256, 202 / 256, 181 / 256],
-                    [252 / 256, 138 / 256, 106 / 256],
-                    [241 / 256, 68 / 256, 50 / 256],
-                    [188 / 256, 25 / 256, 26 / 256],
-                    [208 / 256, 225 / 256, 242 / 256],
-                    [148 / 256, 196 / 256, 223 / 256],
-                    [74 / 256, 152 / 256, 201 / 256],
-                    [23 / 256, 100 / 256, 171 / 256],
-                    [226 / 256, 226 / 256, 239 / 256],
-                    [182 / 256, 182 / 256, 216 / 256],
-                    [134 / 256, 131 / 256, 189 / 256],
-                    [98 / 256, 64 / 256, 155 / 256],
-                ]
-
-                i = 0
-                for key in mutations[sample]:
-                    l = 1
-                    for seq in mutations[sample][key]:
-                        xlabels.append(l)
-                        if percentage:
-                            if total_count > 0:
-                                trans = plt.bar(
-                                    x,
-                                    seq[0] / total_count * 100,
-                                    width=0.2,
-                                    color=[1 / 256, 70 / 256, 102 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-transcribed Strand",
-                                )
-                                x += 0.2
-                                untrans = plt.bar(
-                                    x,
-                                    seq[1] / total_count * 100,
-                                    width=0.2,
-                                    color=[228 / 256, 41 / 256, 38 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-untranscribed Strand",
-                                )
-                                if seq[0] / total_count * 100 > ymax:
-                                    ymax = seq[0] / total_count * 100
-                                if seq[1] / total_count * 100 > ymax:
-                                    ymax = seq[1] / total_count * 100
-
-                        else:
-                            trans = plt.bar(
-                                x,
-                                seq[0],
-                                width=0.2,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.2
-                            untrans = plt.bar(
-                                x,
-                                seq[1],
-                                width=0.2,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            if seq[0] > ymax:
-                                ymax = seq[0]
-                            if seq[1] > ymax:
-                                ymax = seq[1]
-
-                        x += 0.799
-                        l += 1
-                    i += 1
-
-                x = 0.0475
-                y_top = 0.827
-                y_bottom = 0.114
-                y = int(ymax * 1.25)
-                y2 = y + 2
-                for i in range(0, 12, 1):
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y_top),
-                            0.0595,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    panel1.add_patch(
-                        plt.Rectangle(
-                            (x, y_bottom),
-                            0.0595,
-                            0.05,
-                            facecolor=colors[i],
-                            clip_on=False,
-                            transform=plt.gcf().transFigure,
-                        )
-                    )
-                    x += 0.0665
-
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x - 0.001, y_top),
-                        0.006,
-                        0.05,
-                        facecolor=colors[12],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x - 0.001, y_bottom),
-                        0.006,
-                        0.05,
-                        facecolor=colors[12],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                x += 0.011
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.0155,
-                        0.05,
-                        facecolor=colors[13],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.0155,
-                        0.05,
-                        facecolor=colors[13],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                x += 0.022
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.027,
-                        0.05,
-                        facecolor=colors[14],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.027,
-                        0.05,
-                        facecolor=colors[14],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                x += 0.0335
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_top),
-                        0.049,
-                        0.05,
-                        facecolor=colors[15],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x, y_bottom),
-                        0.049,
-                        0.05,
-                        facecolor=colors[15],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-
-                yText = y_top + 0.01
-                plt.text(
-                    0.072,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.1385,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.205,
-                    yText,
-                    "C",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.2715,
-                    yText,
-                    "T",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    fontweight="bold",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.338,
-                    yText,
-                    "2",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.4045,
-                    yText,
-                    "3",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.471,
-                    yText,
-                    "4",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.5375,
-                    yText,
-                    "5+",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.604,
-                    yText,
-                    "2",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.6705,
-                    yText,
-                    "3",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.737,
-                    yText,
-                    "4",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.8035,
-                    yText,
-                    "5+",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.844,
-                    yText,
-                    "2",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.861,
-                    yText,
-                    "3",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.888,
-                    yText,
-                    "4",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.93,
-                    yText,
-                    "5+",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="white",
-                    transform=plt.gcf().transFigure,
-                )
-
-                yText_labels_top = yText + 0.075
-                yText_labels_bottom = y_bottom - 0.03
-                yText_labels_bottom_sec = yText_labels_bottom - 0.045
-
-                plt.text(
-                    0.08,
-                    yText_labels_top,
-                    "1bp Deletion",
-                    fontsize=40,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.21,
-                    yText_labels_top,
-                    "1bp Insertion",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.375,
-                    yText_labels_top,
-                    ">1bp Deletion at Repeats\n      (Deletion Length)",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.64,
-                    yText_labels_top,
-                    ">1bp Insertion at Repeats\n       (Insertion Length)",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.85,
-                    yText_labels_top,
-                    " Microhomology\n(Deletion Length)",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-
-                plt.text(
-                    0.058,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=35,
-                    fontname="Times New Roman",
-                    weight="bold",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.19,
-                    yText_labels_bottom_sec,
-                    "Homopolymer Length",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.39,
-                    yText_labels_bottom_sec,
-                    "Number of Repeat Units",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.65,
-                    yText_labels_bottom_sec,
-                    "Number of Repeat Units",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.85,
-                    yText_labels_bottom_sec,
-                    "Microhomology Length",
-                    fontsize=35,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-
-                x = 0.0477
-                for i in range(0, 8, 1):
-                    if i != 2 and i != 3:
-                        plt.text(
-                            x,
-                            yText_labels_bottom,
-                            "1  2  3  4  5  6+",
-                            fontsize=32,
-                            fontweight="bold",
-                            fontname="Times New Roman",
-                            color="black",
-                            transform=plt.gcf().transFigure,
-                        )
-                    else:
-                        plt.text(
-                            x,
-                            yText_labels_bottom,
-                            "0  1  2  3  4  5+",
-                            fontsize=32,
-                            fontweight="bold",
-                            fontname="Times New Roman",
-                            color="black",
-                            transform=plt.gcf().transFigure,
-                        )
-
-                    x += 0.0665
-
-                for i in range(0, 4, 1):
-                    plt.text(
-                        x,
-                        yText_labels_bottom,
-                        "0  1  2  3  4  5+",
-                        fontsize=32,
-                        fontweight="bold",
-                        fontname="Times New Roman",
-                        color="black",
-                        transform=plt.gcf().transFigure,
-                    )
-                    x += 0.0665
-
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                x += 0.011
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1  2",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                x += 0.022
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1  2  3",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-                x += 0.0335
-                plt.text(
-                    x,
-                    yText_labels_bottom,
-                    "1  2  3  4  5+",
-                    fontsize=32,
-                    fontweight="bold",
-                    fontname="Times New Roman",
-                    color="black",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                labs = np.arange(0.375, 83.375, 1)
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                panel1.set_xlim([0, 83])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-
-                if sig_probs:
-                    plt.text(
-                        0.0475,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.0475,
-                        0.75,
-                        sample + ": " + "{:,}".format(int(total_count)) + " indels",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_middle:
-                    if len(custom_text_middle[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.95
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
-                        )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
-
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
-                            panel1.text(
-                                x_pos_custom,
-                                0.72,
-                                custom_text_upper_plot,
-                                fontsize=35,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-                        else:
-                            panel1.text(
-                                x_pos_custom,
-                                0.68,
-                                custom_text_upper_plot,
-                                fontsize=35,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                panel1.set_yticklabels(ylabels, fontsize=30)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(which="major", axis="y", color=[0.6, 0.6, 0.6], zorder=1)
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.legend(handles=[trans, untrans], prop={"size": 30})
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Indels",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=False,
-                    left=False,
-                    labelleft=True,
-                    right=False,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="gray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-
-                pp.savefig(plot1)
-                plt.close()
-                sample_count += 1
-            pp.close()
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "ID_TSB_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    else:
-        print(
-            "Error: The function plotID does not support plot_type",
-            plot_type,
-            "so no plot has been generated."
-        )
+    return _plot_family(
+        "ID",
+        matrix_path,
+        output_path,
+        project,
+        plot_type,
+        percentage=percentage,
+        custom_text_upper=custom_text_upper,
+        custom_text_middle=custom_text_middle,
+        custom_text_bottom=custom_text_bottom,
+        savefig_format=savefig_format,
+        volume=volume,
+        dpi=dpi,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size,
+        samples=samples,
+        sample_regex=sample_regex,
+        top_k_by_total=top_k_by_total,
+        incremental=incremental,
+    )
 
 
+@instrumentation.instrumented
 def plotDBS(
     matrix_path,
     output_path,
@@ -10313,918 +2218,32 @@ def plotDBS(
     savefig_format="pdf",
     volume=None,
     dpi=100,
+    n_jobs=1,
+    chunk_size=None,
+    samples=None,
+    sample_regex=None,
+    top_k_by_total=None,
+    incremental=False,
+    timings=None,
+    trace_file=None,
 ):
-    # create the output directory if it doesn't exist
-    if not os.path.exists(output_path) and savefig_format.lower() != "pil_image":
-        os.makedirs(output_path)
-
-    # load custom fonts for plotting
-    load_custom_fonts()
-
-    plot_custom_text = False
-    pcawg = False
-    sig_probs = False
-    if plot_type == "78" or plot_type == "78DBS" or plot_type == "DBS78":
-        data = process_input(matrix_path, plot_type)
-
-        dinucs = [
-            "TT>GG",
-            "TT>CG",
-            "TT>AG",
-            "TT>GC",
-            "TT>CC",
-            "TT>AC",
-            "TT>GA",
-            "TT>CA",
-            "TT>AA",
-            "AC>CA",
-            "AC>CG",
-            "AC>CT",
-            "AC>GA",
-            "AC>GG",
-            "AC>GT",
-            "AC>TA",
-            "AC>TG",
-            "AC>TT",
-            "CT>AA",
-            "CT>AC",
-            "CT>AG",
-            "CT>GA",
-            "CT>GC",
-            "CT>GG",
-            "CT>TG",
-            "CT>TC",
-            "CT>TA",
-            "AT>CA",
-            "AT>CC",
-            "AT>CG",
-            "AT>GA",
-            "AT>GC",
-            "AT>TA",
-            "TG>GT",
-            "TG>CT",
-            "TG>AT",
-            "TG>GC",
-            "TG>CC",
-            "TG>AC",
-            "TG>GA",
-            "TG>CA",
-            "TG>AA",
-            "CC>AA",
-            "CC>AG",
-            "CC>AT",
-            "CC>GA",
-            "CC>GG",
-            "CC>GT",
-            "CC>TA",
-            "CC>TG",
-            "CC>TT",
-            "CG>AT",
-            "CG>GC",
-            "CG>GT",
-            "CG>TC",
-            "CG>TA",
-            "CG>TT",
-            "TC>GT",
-            "TC>CT",
-            "TC>AT",
-            "TC>GG",
-            "TC>CG",
-            "TC>AG",
-            "TC>GA",
-            "TC>CA",
-            "TC>AA",
-            "GC>AA",
-            "GC>AG",
-            "GC>AT",
-            "GC>CA",
-            "GC>CG",
-            "GC>TA",
-            "TA>GT",
-            "TA>CT",
-            "TA>AT",
-            "TA>GG",
-            "TA>CG",
-            "TA>GC",
-        ]
-
-        revcompl = lambda x: "".join(
-            [{"A": "T", "C": "G", "G": "C", "T": "A"}[B] for B in x][::-1]
-        )
-        mutations = OrderedDict()
-
-        try:
-            vals = set(list(data.index)) - set(dinucs)
-            vals = sorted(list(vals))
-            for ech in vals:
-                ech_mod = ech.split(">")[0] + ">" + revcompl(ech.split(">")[1])
-                data.rename(index={ech: ech_mod}, inplace=True)
-
-            data = data.sort_index()
-            ctx = data.index
-            xlabels = [dn.split(">")[1] for dn in ctx]
-            colors = [
-                [3 / 256, 189 / 256, 239 / 256],
-                [3 / 256, 102 / 256, 204 / 256],
-                [162 / 256, 207 / 256, 99 / 256],
-                [1 / 256, 102 / 256, 1 / 256],
-                [255 / 256, 153 / 256, 153 / 256],
-                [228 / 256, 41 / 256, 38 / 256],
-                [255 / 256, 178 / 256, 102 / 256],
-                [255 / 256, 128 / 256, 1 / 256],
-                [204 / 256, 153 / 256, 255 / 256],
-                [76 / 256, 1 / 256, 153 / 256],
-            ]
-            mainlist = [dn.split(">")[0] for dn in ctx]
-            le = LabelEncoder()
-            colors_idxs = le.fit_transform(mainlist)
-            colors_flat_list = [colors[i] for i in colors_idxs]
-            sample_count = 0
-
-            buf = io.BytesIO()
-            fig_orig = make_pickle_file(
-                context="DBS78", return_plot_template=True, volume=volume
-            )
-            pickle.dump(fig_orig, buf)
-
-            figs = {}
-
-            for sample in data.columns:
-                buf.seek(0)
-                figs[sample] = pickle.load(buf)
-                panel1 = figs[sample].axes[0]
-                total_count = np.sum(
-                    data[sample].values
-                )  # sum(sum(nuc.values()) for nuc in mutations[sample].values())
-
-                x = 0.4
-                muts = data[sample].values
-                if percentage:
-                    if total_count > 0:
-                        plt.bar(
-                            np.asarray(range(len(ctx))) + x,
-                            muts / total_count * 100,
-                            width=0.4,
-                            color=colors_flat_list,
-                            align="center",
-                            zorder=1000,
-                        )
-                        ymax = np.max(muts / total_count * 100)
-                    sig_probs = True
-                else:
-                    plt.bar(
-                        np.asarray(range(len(ctx))) + x,
-                        muts,
-                        width=0.4,
-                        color=colors_flat_list,
-                        align="center",
-                        zorder=1000,
-                    )
-                    ymax = np.max(muts)
-                # for i in range(len(xlabels)):
-                #     print(xlabels[i],muts[i])
-
-                x = 0.043
-                y3 = 0.87
-                y = int(ymax * 1.25)
-                y2 = y + 2
-                i = 0
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                if sig_probs:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample,
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.045,
-                        0.75,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " double subs",
-                        fontsize=60,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                custom_text_upper_plot = ""
-                try:
-                    custom_text_upper[sample_count]
-                except:
-                    custom_text_upper = False
-                try:
-                    custom_text_middle[sample_count]
-                except:
-                    custom_text_middle = False
-                try:
-                    custom_text_bottom[sample_count]
-                except:
-                    custom_text_bottom = False
-
-                if custom_text_upper:
-                    plot_custom_text = True
-                    if len(custom_text_upper[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-                if custom_text_bottom:
-                    if len(custom_text_bottom[sample_count]) > 40:
-                        print(
-                            "To add a custom text, please limit the string to <40 characters including spaces."
-                        )
-                        plot_custom_text = False
-
-                if plot_custom_text:
-                    x_pos_custom = 0.98
-                    if custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = (
-                            custom_text_upper[sample_count]
-                            + "\n"
-                            + custom_text_middle[sample_count]
-                        )
-                        if custom_text_bottom:
-                            custom_text_upper_plot += (
-                                "\n" + custom_text_bottom[sample_count]
-                            )
-
-                    if custom_text_upper and not custom_text_middle:
-                        custom_text_upper_plot = custom_text_upper[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                    elif custom_text_upper and custom_text_middle:
-                        if not custom_text_bottom:
-                            panel1.text(
-                                x_pos_custom,
-                                0.75,
-                                custom_text_upper_plot,
-                                fontsize=35,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-                        else:
-                            panel1.text(
-                                x_pos_custom,
-                                0.7,
-                                custom_text_upper_plot,
-                                fontsize=35,
-                                weight="bold",
-                                color="black",
-                                fontname="Arial",
-                                transform=plt.gcf().transFigure,
-                                ha="right",
-                            )
-
-                    elif not custom_text_upper and custom_text_middle:
-                        custom_text_upper_plot = custom_text_middle[sample_count]
-                        panel1.text(
-                            x_pos_custom,
-                            0.78,
-                            custom_text_upper_plot,
-                            fontsize=35,
-                            weight="bold",
-                            color="black",
-                            fontname="Arial",
-                            transform=plt.gcf().transFigure,
-                            ha="right",
-                        )
-
-                if not percentage:
-                    ylabels = spplt.getylabels(ylabels)
-
-                labs = np.arange(0.44, 78.44, 1)
-                panel1.set_xlim([0, 78])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                panel1.set_xticklabels(
-                    xlabels,
-                    rotation="vertical",
-                    fontsize=30,
-                    color="grey",
-                    fontname="Courier New",
-                    verticalalignment="top",
-                    fontweight="bold",
-                )
-
-                panel1.set_yticklabels(ylabels, fontsize=25)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(
-                    which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
-                )
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=True,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="lightgray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-                [i.set_color("grey") for i in plt.gca().get_xticklabels()]
-                sample_count += 1
-
-            return output_results(
-                savefig_format, output_path, project, figs, "DBS_78", dpi=dpi
-            )
-
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "DBS_78_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    elif (
-        plot_type == "312"
-        or plot_type == "78SB"
-        or plot_type == "SB78"
-        or plot_type == "186"
-    ):
-        with open(matrix_path) as f:
-            next(f)
-            first_line = f.readline()
-            first_line = first_line.strip().split()
-            mutation_type = first_line[0]
-            if len(mutation_type) != 7 and mutation_type[1] != ":":
-                sys.exit(
-                    "The matrix does not match the correct SBS96 format. Please check you formatting and rerun this plotting function."
-                )
-
-        file_path = os.path.join(output_path, f"DBS_186_plots_{project}.pdf")
-        pp = PdfPages(file_path)
-
-        dinucs = [
-            "TT>GG",
-            "TT>CG",
-            "TT>AG",
-            "TT>GC",
-            "TT>CC",
-            "TT>AC",
-            "TT>GA",
-            "TT>CA",
-            "TT>AA",
-            "CT>AA",
-            "CT>AC",
-            "CT>AG",
-            "CT>GA",
-            "CT>GC",
-            "CT>GG",
-            "CT>TG",
-            "CT>TC",
-            "CT>TA",
-            "CC>AA",
-            "CC>AG",
-            "CC>AT",
-            "CC>GA",
-            "CC>GG",
-            "CC>GT",
-            "CC>TA",
-            "CC>TG",
-            "CC>TT",
-            "TC>GT",
-            "TC>CT",
-            "TC>AT",
-            "TC>GG",
-            "TC>CG",
-            "TC>AG",
-            "TC>GA",
-            "TC>CA",
-            "TC>AA",
-        ]
-
-        revcompl = lambda x: "".join(
-            [{"A": "T", "C": "G", "G": "C", "T": "A", ">": ">"}[B] for B in x][::-1]
-        )
-        mutations = OrderedDict()
-
-        try:
-            with open(matrix_path) as f:
-                first_line = f.readline()
-                samples = first_line.strip().split("\t")
-                samples = samples[1:]
-                for sample in samples:
-                    mutations[sample] = OrderedDict()
-                    mutations[sample]["CC"] = OrderedDict()
-                    mutations[sample]["CT"] = OrderedDict()
-                    mutations[sample]["TC"] = OrderedDict()
-                    mutations[sample]["TT"] = OrderedDict()
-
-                for lines in f:
-                    line = lines.strip().split()
-                    mut = line[0][2:]
-                    nuc = line[0][5:]
-                    mut_type = line[0][2:4]
-                    bias = line[0][0]
-                    if bias == "N" or bias == "B" or bias == "Q":
-                        continue
-                    else:
-                        if mut not in dinucs:
-                            if revcompl(mut) not in dinucs:
-                                continue
-                            nuc = revcompl(nuc)
-                            mut_type = revcompl(mut_type)
-                        sample_index = 1
-
-                        for sample in samples:
-                            if percentage:
-                                mutCount = float(line[sample_index])
-                                if mutCount < 1 and mutCount > 0:
-                                    sig_probs = True
-                            else:
-                                # mutCount = int(line[sample_index])
-                                try:
-                                    mutCount = int(line[sample_index])
-                                except:
-                                    print(
-                                        "It appears that the provided matrix does not contain mutation counts.\n\tIf you have provided a signature activity matrix, please change the percentage parameter to True.\n\tOtherwise, ",
-                                        end="",
-                                    )
-
-                            if nuc not in mutations[sample][mut_type]:
-                                mutations[sample][mut_type][nuc] = [0, 0]
-                            if bias == "T":
-                                mutations[sample][mut_type][nuc][0] = mutCount
-                            else:
-                                mutations[sample][mut_type][nuc][1] = mutCount
-                            sample_index += 1
-
-            for sample in mutations.keys():
-                total_count = sum(
-                    sum(sum(tsb) for tsb in nuc.values())
-                    for nuc in mutations[sample].values()
-                )
-                plt.rcParams["axes.linewidth"] = 2
-                plot1 = plt.figure(figsize=(21, 9.92))
-                plt.rc("axes", edgecolor="lightgray")
-                panel1 = plt.axes([0.07, 0.09, 0.92, 0.77])
-                xlabels = []
-
-                x = 0.3
-                ymax = 0
-                i = 0
-                colors = [
-                    [3 / 256, 189 / 256, 239 / 256],
-                    [3 / 256, 102 / 256, 204 / 256],
-                    [162 / 256, 207 / 256, 99 / 256],
-                    [1 / 256, 102 / 256, 1 / 256],
-                    [255 / 256, 153 / 256, 153 / 256],
-                    [228 / 256, 41 / 256, 38 / 256],
-                    [255 / 256, 178 / 256, 102 / 256],
-                    [255 / 256, 128 / 256, 1 / 256],
-                    [204 / 256, 153 / 256, 255 / 256],
-                    [76 / 256, 1 / 256, 153 / 256],
-                ]
-                for key in mutations[sample]:
-                    muts = mutations[sample][key].keys()
-                    muts = sorted(muts)
-                    for seq in muts:
-                        xlabels.append(seq)
-                        if percentage:
-                            try:
-                                trans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][0] / total_count * 100,
-                                    width=0.2,
-                                    color=[1 / 256, 70 / 256, 102 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-transcribed Strand",
-                                )
-                                x += 0.2
-                                untrans = plt.bar(
-                                    x,
-                                    mutations[sample][key][seq][1] / total_count * 100,
-                                    width=0.2,
-                                    color=[228 / 256, 41 / 256, 38 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-untranscribed Strand",
-                                )
-                                x += 0.8
-                                if (
-                                    mutations[sample][key][seq][0] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][0]
-                                        / total_count
-                                        * 100
-                                    )
-                                if (
-                                    mutations[sample][key][seq][1] / total_count * 100
-                                    > ymax
-                                ):
-                                    ymax = (
-                                        mutations[sample][key][seq][1]
-                                        / total_count
-                                        * 100
-                                    )
-                            except:
-                                trans = plt.bar(
-                                    x,
-                                    0,
-                                    width=0.2,
-                                    color=[1 / 256, 70 / 256, 102 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-transcribed Strand",
-                                )
-                                untrans = plt.bar(
-                                    x,
-                                    0,
-                                    width=0.2,
-                                    color=[228 / 256, 41 / 256, 38 / 256],
-                                    align="center",
-                                    zorder=1000,
-                                    label="Genic-untranscribed Strand",
-                                )
-
-                        else:
-                            trans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][0],
-                                width=0.2,
-                                color=[1 / 256, 70 / 256, 102 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-transcribed Strand",
-                            )
-                            x += 0.2
-                            untrans = plt.bar(
-                                x,
-                                mutations[sample][key][seq][1],
-                                width=0.2,
-                                color=[228 / 256, 41 / 256, 38 / 256],
-                                align="center",
-                                zorder=1000,
-                                label="Genic-untranscribed Strand",
-                            )
-                            x += 0.8
-                            if mutations[sample][key][seq][0] > ymax:
-                                ymax = mutations[sample][key][seq][0]
-                            if mutations[sample][key][seq][1] > ymax:
-                                ymax = mutations[sample][key][seq][1]
-                    i += 1
-
-                y3 = 0.87
-                y = int(ymax * 1.25)
-
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.075, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[0],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.302, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[2],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.532, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[4],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (0.765, y3),
-                        0.218,
-                        0.05,
-                        facecolor=colors[7],
-                        clip_on=False,
-                        transform=plt.gcf().transFigure,
-                    )
-                )
-
-                yText = y3 + 0.06
-                plt.text(
-                    0.13,
-                    yText,
-                    "CC>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.37,
-                    yText,
-                    "CT>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.59,
-                    yText,
-                    "TC>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-                plt.text(
-                    0.83,
-                    yText,
-                    "TT>NN",
-                    fontsize=40,
-                    fontweight="bold",
-                    fontname="Arial",
-                    transform=plt.gcf().transFigure,
-                )
-
-                if y <= 4:
-                    y += 4
-
-                while y % 4 != 0:
-                    y += 1
-                ytick_offest = int(y / 4)
-
-                x_shaded = 0
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        8.9,
-                        y,
-                        facecolor=colors[0],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
-                    )
-                )
-                x_shaded += 8.9
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        9,
-                        y,
-                        facecolor=colors[2],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
-                    )
-                )
-                x_shaded += 9
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        9,
-                        y,
-                        facecolor=colors[4],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
-                    )
-                )
-                x_shaded += 9
-                panel1.add_patch(
-                    plt.Rectangle(
-                        (x_shaded, 0),
-                        9.1,
-                        y,
-                        facecolor=colors[7],
-                        zorder=0,
-                        alpha=0.25,
-                        edgecolor="grey",
-                    )
-                )
-
-                if percentage:
-                    ylabs = [
-                        0,
-                        round(ytick_offest, 1),
-                        round(ytick_offest * 2, 1),
-                        round(ytick_offest * 3, 1),
-                        round(ytick_offest * 4, 1),
-                    ]
-                    ylabels = [
-                        str(0),
-                        str(round(ytick_offest, 1)) + "%",
-                        str(round(ytick_offest * 2, 1)) + "%",
-                        str(round(ytick_offest * 3, 1)) + "%",
-                        str(round(ytick_offest * 4, 1)) + "%",
-                    ]
-                else:
-                    if ytick_offest == 0:
-                        ytick_offest = 1
-                    ylabs = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-                    ylabels = [
-                        0,
-                        ytick_offest,
-                        ytick_offest * 2,
-                        ytick_offest * 3,
-                        ytick_offest * 4,
-                    ]
-
-                if sig_probs:
-                    plt.text(
-                        0.08,
-                        0.8,
-                        sample,
-                        fontsize=35,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-                else:
-                    plt.text(
-                        0.08,
-                        0.8,
-                        sample
-                        + ": "
-                        + "{:,}".format(int(total_count))
-                        + " transcribed double subs",
-                        fontsize=35,
-                        weight="bold",
-                        color="black",
-                        fontname="Arial",
-                        transform=plt.gcf().transFigure,
-                    )
-
-                if not percentage:
-                    ylabels = getylabels(ylabels)
-
-                labs = np.arange(0.55, 36.44, 1)
-                panel1.set_xlim([0, 36])
-                panel1.set_ylim([0, y])
-                panel1.set_xticks(labs)
-                panel1.set_yticks(ylabs)
-                panel1.set_xticklabels(
-                    xlabels,
-                    rotation="vertical",
-                    fontsize=30,
-                    color="grey",
-                    fontname="Courier New",
-                    verticalalignment="top",
-                    fontweight="bold",
-                )
-
-                panel1.set_yticklabels(ylabels, fontsize=25)
-                plt.gca().yaxis.grid(True)
-                plt.gca().grid(
-                    which="major", axis="y", color=[0.93, 0.93, 0.93], zorder=1
-                )
-                panel1.set_xlabel("")
-                panel1.set_ylabel("")
-                panel1.legend(handles=[trans, untrans], prop={"size": 30})
-
-                if percentage:
-                    plt.ylabel(
-                        "Percentage of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-                else:
-                    plt.ylabel(
-                        "Number of Double Base Substitutions",
-                        fontsize=35,
-                        fontname="Times New Roman",
-                        weight="bold",
-                    )
-
-                panel1.tick_params(
-                    axis="both",
-                    which="both",
-                    bottom=False,
-                    labelbottom=True,
-                    left=True,
-                    labelleft=True,
-                    right=True,
-                    labelright=False,
-                    top=False,
-                    labeltop=False,
-                    direction="in",
-                    length=25,
-                    colors="lightgray",
-                    width=2,
-                )
-
-                [i.set_color("black") for i in plt.gca().get_yticklabels()]
-                [i.set_color("grey") for i in plt.gca().get_xticklabels()]
-
-                panel1.set_xlim([0, 36])
-                pp.savefig(plot1)
-                plt.close()
-            pp.close()
-        except:
-            print("There may be an issue with the formatting of your matrix file.")
-            pdf_path = output_path + "DBS_186_plots_" + project + ".pdf"
-            if os.path.isfile(pdf_path):
-                os.remove(pdf_path)
-
-    else:
-        print(
-            "Error: The function plotDBS does not support plot_type",
-            plot_type,
-            "so no plot has been generated."
-        )
+    return _plot_family(
+        "DBS",
+        matrix_path,
+        output_path,
+        project,
+        plot_type,
+        percentage=percentage,
+        custom_text_upper=custom_text_upper,
+        custom_text_middle=custom_text_middle,
+        custom_text_bottom=custom_text_bottom,
+        savefig_format=savefig_format,
+        volume=volume,
+        dpi=dpi,
+        n_jobs=n_jobs,
+        chunk_size=chunk_size,
+        samples=samples,
+        sample_regex=sample_regex,
+        top_k_by_total=top_k_by_total,
+        incremental=incremental,
+    )
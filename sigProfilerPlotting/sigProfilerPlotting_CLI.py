@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import sys
-from sigProfilerPlotting import sigProfilerPlotting
 from sigProfilerPlotting.controllers import cli_controller
 
 
@@ -12,6 +11,7 @@ def main_function():
         "plotDBS": "Plot Doublet Base Substitutions.",
         "plotSV": "Plot Structural Variations.",
         "plotCNV": "Plot Copy Number Variations.",
+        "build-templates": "Build the plot templates ahead of plotting.",
     }
 
     if len(sys.argv) < 2 or sys.argv[1] not in commands.keys():
@@ -22,7 +22,14 @@ def main_function():
     args = sys.argv[1:]
 
     controller = cli_controller.CliController()
-    valid_commands = {"plotSBS", "plotID", "plotDBS", "plotSV", "plotCNV"}
+    valid_commands = {
+        "plotSBS",
+        "plotID",
+        "plotDBS",
+        "plotSV",
+        "plotCNV",
+        "build-templates",
+    }
 
     if command in valid_commands:
         controller.dispatch(args)
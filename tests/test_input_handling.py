@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import sigProfilerPlotting as sigPlt
 import pytest
@@ -5,7 +6,6 @@ import os
 from sigProfilerPlotting import process_input, get_context_reference
 import pkg_resources
 
-
 # Path to the tests directory
 SPP_TEST_PATH = os.path.dirname(os.path.abspath(__file__))
 
@@ -193,3 +193,186 @@ def test_process_input_SV(plot_type, path):
         ordered_input_data_index = ordered_input_data.index.tolist()
         expected_index = get_context_reference(plot_type)
         assert ordered_input_data_index == expected_index
+
+
+################Reference formats#############
+def test_reference_format_is_read_once(monkeypatch):
+    labels, positions = sigPlt.get_reference_format("96")
+    assert list(labels) == get_context_reference("sbs96")
+    assert all(labels[positions[label]] == label for label in labels)
+
+    def read_csv(*args, **kwargs):
+        raise AssertionError("the reference format was read again")
+
+    monkeypatch.setattr(pd, "read_csv", read_csv)
+    assert sigPlt.get_reference_format("SBS96") == (labels, positions)
+
+
+def test_process_input_label_mismatch():
+    file_path = os.path.join(SPP_SBS, "ordered", "example.SBS96.all")
+    input_data = pd.read_csv(file_path, sep="\t", index_col=0)
+    labels = input_data.index.tolist()
+    input_data.index = ["N" + labels[0]] + labels[1:]
+
+    with pytest.raises(
+        ValueError,
+        match=r"Unexpected: N\w\[C>A\]\w\. Missing: \w\[C>A\]\w\.",
+    ):
+        process_input(input_data, "96")
+
+    input_data.index = [labels[1]] + labels[1:]
+    with pytest.raises(ValueError, match=r"Duplicated: \w\[C>A\]\w\."):
+        process_input(input_data, "96")
+
+
+def test_reindex_sbs288():
+    file_path = os.path.join(SPP_SBS, "unordered", "example.SBS288.all")
+    data = process_input(file_path, "288")
+    by_strand = {
+        strand: data[data.index.str[0] == strand].rename(lambda label: label[2:])
+        for strand in "TUN"
+    }
+
+    mutations, tsb_mats = sigPlt.reindex_sbs288(data)
+    assert mutations.index.tolist() == sigPlt.get_default_96labels()
+    for label in mutations.index:
+        expected = sum(by_strand[strand].loc[label] for strand in "TUN")
+        assert (mutations.loc[label] == expected).all()
+    assert tsb_mats["T"].index.tolist() == [
+        "All",
+        "C>A",
+        "C>G",
+        "C>T",
+        "T>A",
+        "T>C",
+        "T>G",
+    ]
+    assert (tsb_mats["T"].loc["All"] == by_strand["T"].sum()).all()
+    assert (
+        tsb_mats["N"].loc["C>T"]
+        == by_strand["N"][by_strand["N"].index.str.contains("[C>T]", regex=False)].sum()
+    ).all()
+
+
+def test_load_matrix_pcawg(tmp_path):
+    file_path = tmp_path / "example.SBS384.csv"
+    file_path.write_text(
+        "Strand,Mutation type,Trinucleotide,S1,S2\nT,C>A,ACA,1,2\nU,T>G,TTT,3,4\n"
+    )
+    data = sigPlt.load_matrix(str(file_path), "192")
+    assert data.index.tolist() == ["T:A[C>A]A", "U:T[T>G]T"]
+    assert data.columns.tolist() == ["S1", "S2"]
+    assert data.loc["U:T[T>G]T"].tolist() == [3, 4]
+
+
+@pytest.mark.parametrize("plot_type", ["6", "384"])
+def test_plot_sbs_from_dataframe(plot_type, tmp_path):
+    file_path = os.path.join(SPP_SBS, "ordered", "example.SBS96.all")
+    data = pd.read_csv(file_path, sep="\t", index_col=0)
+    if plot_type == "6":
+        data = data.groupby(data.index.str[2:5]).sum()
+    else:
+        data = pd.concat(
+            [data.rename(lambda label: strand + ":" + label) for strand in "TUBN"]
+        )
+
+    sigPlt.plotSBS(
+        data.sample(frac=1, random_state=0), str(tmp_path) + "/", "test", plot_type
+    )
+    assert (tmp_path / f"SBS_{plot_type}_plots_test.pdf").stat().st_size > 0
+
+
+@pytest.mark.parametrize("plot_type", ["24", "384"])
+def test_plot_sbs_strand_subset(plot_type, tmp_path):
+    # matrices with only the transcribed and untranscribed strands
+    file_path = os.path.join(SPP_SBS, "ordered", "example.SBS96.all")
+    data = pd.read_csv(file_path, sep="\t", index_col=0)
+    if plot_type == "24":
+        data = data.groupby(data.index.str[2:5]).sum()
+    data = pd.concat(
+        [data.rename(lambda label: strand + ":" + label) for strand in "TU"]
+    )
+
+    sigPlt.plotSBS(
+        data.sample(frac=1, random_state=0), str(tmp_path) + "/", "test", plot_type
+    )
+    assert (tmp_path / f"SBS_{plot_type}_plots_test.pdf").stat().st_size > 0
+
+
+################Binary formats#############
+def write_matrix(data, file_path):
+    if file_path.suffix == ".parquet":
+        data.to_parquet(file_path)
+    elif file_path.suffix == ".feather":
+        data.reset_index().to_feather(file_path)
+    else:
+        np.save(file_path, data.to_numpy())
+        with open(file_path.with_suffix(".labels"), "w") as f:
+            f.write("\t".join([data.index.name] + data.columns.tolist()) + "\n")
+            f.writelines(label + "\n" for label in data.index)
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".feather", ".npy"])
+def test_process_input_binary_formats(extension, tmp_path):
+    if extension != ".npy":
+        pytest.importorskip("pyarrow")
+    text_path = os.path.join(SPP_SBS, "unordered", "example.SBS96.all")
+    file_path = tmp_path / ("example.SBS96" + extension)
+    write_matrix(pd.read_csv(text_path, sep="\t", index_col=0), file_path)
+
+    expected = process_input(text_path, "96")
+    pd.testing.assert_frame_equal(process_input(str(file_path), "96"), expected)
+
+    samples = expected.columns[::-2].tolist()
+    pd.testing.assert_frame_equal(
+        process_input(str(file_path), "96", samples=samples), expected[samples]
+    )
+    with pytest.raises(ValueError, match="samples not found in the matrix: S0"):
+        process_input(str(file_path), "96", samples=["S0"])
+
+
+def test_plot_id_from_npy(tmp_path):
+    text_path = os.path.join(SPP_ID, "ordered", "example.ID28.all")
+    file_path = tmp_path / "example.ID28.npy"
+    write_matrix(pd.read_csv(text_path, sep="\t", index_col=0), file_path)
+
+    sigPlt.plotID(str(file_path), str(tmp_path) + "/", "test", "28")
+    assert (tmp_path / "ID_simple_plots_test.pdf").stat().st_size > 0
+
+
+################Sample selection#############
+@pytest.mark.parametrize(
+    "selection, expected",
+    [
+        ({"samples": ["S3", "S1"]}, ["S3", "S1"]),
+        ({"sample_regex": "S[024]"}, ["S0", "S2", "S4"]),
+        ({"top_k_by_total": 2}, ["S3", "S4"]),
+        ({"sample_regex": "S[0-3]", "top_k_by_total": 2}, ["S2", "S3"]),
+    ],
+)
+def test_plot_sample_selection(selection, expected, tmp_path):
+    data = pd.read_csv(
+        os.path.join(SPP_SBS, "ordered", "example.SBS96.all"), sep="\t", index_col=0
+    )
+    data = pd.concat(
+        [data.iloc[:, 0].rename(f"S{i}") * (i + 1) for i in range(5)], axis=1
+    )
+    matrix_path = str(tmp_path / "example.SBS96.all")
+    data.to_csv(matrix_path, sep="\t")
+
+    for matrix in (matrix_path, data):
+        images = sigPlt.plotSBS(
+            matrix,
+            str(tmp_path) + "/",
+            "test",
+            "96",
+            savefig_format="PIL_Image",
+            **selection,
+        )
+        assert list(images) == expected
+
+
+def test_plot_sample_selection_empty(tmp_path):
+    text_path = os.path.join(SPP_SBS, "ordered", "example.SBS96.all")
+    with pytest.raises(ValueError, match="no samples of the matrix match"):
+        sigPlt.plotSBS(text_path, str(tmp_path) + "/", "test", "96", sample_regex="^$")
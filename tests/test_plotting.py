@@ -202,3 +202,710 @@ def test_plot_generation(config_key, input_data):
         assert (
             image_difference(cropped_test_image_path, standard_image_path) < 1e-4
         ), f"Images for {config_key}, {test_case} did not match."
+
+
+# Rendering with a process pool produces the same files as a serial run
+def test_parallel_plot_generation(tmp_path):
+    matrix_path = os.path.join(SPP_DBS, "ordered", "example.DBS78v2.all")
+    serial_directory = os.path.join(tmp_path, "serial") + os.sep
+    parallel_directory = os.path.join(tmp_path, "parallel") + os.sep
+
+    sigPlt.plotDBS(matrix_path, serial_directory, "test", "78", savefig_format="png")
+    sigPlt.plotDBS(
+        matrix_path, parallel_directory, "test", "78", savefig_format="png", n_jobs=2
+    )
+
+    serial_files = sorted(os.listdir(serial_directory))
+    assert serial_files == sorted(os.listdir(parallel_directory))
+    assert len(serial_files) == 2
+    for file_name in serial_files:
+        assert (
+            image_difference(
+                os.path.join(serial_directory, file_name),
+                os.path.join(parallel_directory, file_name),
+            )
+            == 0
+        )
+
+
+def test_output_results_streams_figures(tmp_path):
+    import matplotlib.pyplot as plt
+
+    output_directory = str(tmp_path) + os.sep
+
+    def figures():
+        for name in ("a", "b", "c"):
+            # the previous figure has been written and closed
+            assert plt.get_fignums() == []
+            yield name, plt.figure()
+
+    sigPlt.output_results("png", output_directory, "test", figures(), "SV_32")
+    assert sorted(os.listdir(output_directory)) == [
+        "SV_32_plots_a.png",
+        "SV_32_plots_b.png",
+        "SV_32_plots_c.png",
+    ]
+
+
+def test_template_cache(tmp_path, monkeypatch):
+    from sigProfilerPlotting import sigProfilerPlotting as spp
+
+    monkeypatch.delenv("SIGPROFILERPLOTTING_VOLUME", raising=False)
+    volume = str(tmp_path)
+    spp.plt.close(
+        sigPlt.make_pickle_file("DBS78", return_plot_template=True, volume=volume)
+    )
+    first = sigPlt.make_pickle_file("DBS78", return_plot_template=True, volume=volume)
+    cached = [key for key in spp._TEMPLATE_CACHE if key[1] == os.path.abspath(volume)]
+    assert [key[0] for key in cached] == ["DBS78"]
+
+    # templates are served from memory while the file is unchanged
+    template = spp._TEMPLATE_CACHE[cached[0]][1]
+    assert spp._cached_template("DBS78", volume) is template
+    second = sigPlt.make_pickle_file("DBS78", return_plot_template=True, volume=volume)
+    assert first is not second
+    spp.plt.close(first)
+    spp.plt.close(second)
+
+    sigPlt.clear_template_cache(context="DBS78", volume=volume)
+    assert cached[0] not in spp._TEMPLATE_CACHE
+
+
+@pytest.mark.parametrize(
+    "context",
+    [
+        "SBS6",
+        "SBS24",
+        "SBS384",
+        "SBS384_extended",
+        "SBS1536",
+        "SBS4608",
+        "ID28",
+        "ID415",
+        "DBS186",
+        "SV32",
+        "CNV48",
+    ],
+)
+def test_make_pickle_file_contexts(context, tmp_path, monkeypatch):
+    from sigProfilerPlotting import sigProfilerPlotting as spp
+
+    monkeypatch.delenv("SIGPROFILERPLOTTING_VOLUME", raising=False)
+    template = sigPlt.make_pickle_file(
+        context, return_plot_template=True, volume=str(tmp_path)
+    )
+    assert os.path.isfile(spp._template_path(context, str(tmp_path)))
+    assert len(template.axes) > 0
+    # the style of earlier plots is not built into the template
+    with spp.plt.style.context("ggplot"):
+        sigPlt.clear_template_cache(context=context, volume=str(tmp_path))
+        os.remove(spp._template_path(context, str(tmp_path)))
+        styled = sigPlt.make_pickle_file(
+            context, return_plot_template=True, volume=str(tmp_path)
+        )
+    complexity = spp.instrumentation.figure_complexity
+    assert complexity(styled) == complexity(template)
+    spp.plt.close(styled)
+    sigPlt.clear_template_cache(context=context, volume=str(tmp_path))
+    spp.plt.close(template)
+
+
+def test_template_store(tmp_path, monkeypatch):
+    from sigProfilerPlotting import sigProfilerPlotting as spp
+
+    monkeypatch.delenv("SIGPROFILERPLOTTING_VOLUME", raising=False)
+    volume = str(tmp_path)
+    # templates of other installations are not read
+    with open(os.path.join(volume, "DBS78.pkl"), "wb") as f:
+        f.write(b"stale")
+    spp.plt.close(
+        sigPlt.make_pickle_file("DBS78", return_plot_template=True, volume=volume)
+    )
+    path = spp._template_path("DBS78", volume)
+    assert sorted(os.listdir(volume)) == sorted(["DBS78.pkl", os.path.basename(path)])
+
+    # a damaged template is rebuilt instead of failing to unpickle
+    with open(path, "wb") as f:
+        f.write(b"damaged")
+    sigPlt.clear_template_cache(volume=volume)
+    template = sigPlt.make_pickle_file(
+        "DBS78", return_plot_template=True, volume=volume
+    )
+    assert len(template.axes) == 1
+    spp.plt.close(template)
+    with open(path, "rb") as f:
+        assert f.read() != b"damaged"
+    assert not [name for name in os.listdir(volume) if name.endswith(".tmp")]
+    sigPlt.clear_template_cache(volume=volume)
+
+
+def test_build_templates(tmp_path, monkeypatch):
+    from sigProfilerPlotting import sigProfilerPlotting as spp
+    from sigProfilerPlotting.controllers import cli_controller
+
+    monkeypatch.delenv("SIGPROFILERPLOTTING_VOLUME", raising=False)
+    volume = str(tmp_path)
+    style = dict(spp.plt.rcParams)
+    paths = sigPlt.build_templates(volume=volume, contexts=["SBS96", "SV32"])
+    assert paths == [
+        spp._template_path("SBS96", volume),
+        spp._template_path("SV32", volume),
+    ]
+    assert all(os.path.isfile(path) for path in paths)
+    # the templates of other tags are removed, other contexts are kept
+    stale = [
+        os.path.join(volume, name)
+        for name in ("SBS96-0123456789ab.pkl", "ID83-0123456789ab.pkl")
+    ]
+    for path in stale:
+        with open(path, "wb") as f:
+            f.write(b"stale")
+    sigPlt.build_templates(volume=volume, contexts=["SBS96"])
+    assert not os.path.exists(stale[0])
+    assert os.path.exists(stale[1])
+    # the ggplot style of the SV32 template does not leak into later plots
+    assert dict(spp.plt.rcParams) == style
+
+    with pytest.raises(ValueError):
+        sigPlt.build_templates(volume=volume, contexts=["SBS97"])
+
+    cli_controller.CliController().dispatch(
+        ["build-templates", "--volume", volume, "--contexts", "ID83"]
+    )
+    assert os.path.isfile(spp._template_path("ID83", volume))
+    sigPlt.clear_template_cache(volume=volume)
+
+
+def test_lazy_imports():
+    import subprocess
+    import sys
+
+    # importing the package or the CLI does not load the plotting dependencies
+    code = (
+        "import sys\n"
+        "from sigProfilerPlotting import sigProfilerPlotting_CLI\n"
+        "assert 'matplotlib.pyplot' not in sys.modules\n"
+        "assert 'pandas' not in sys.modules\n"
+        "import sigProfilerPlotting\n"
+        "sigProfilerPlotting.plotSBS\n"
+        "assert 'matplotlib.pyplot' in sys.modules\n"
+        "assert 'sklearn' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_star_import():
+    namespace = {}
+    exec("from sigProfilerPlotting import *", namespace)
+    for name in ("plotSBS", "plotID", "plotDBS", "plotSV", "plotCNV", "process_input"):
+        assert namespace[name] is getattr(sigPlt, name)
+    assert set(sigPlt.__all__) <= set(dir(sigPlt))
+
+
+def test_renderers_load_on_demand(tmp_path):
+    import subprocess
+    import sys
+    from sigProfilerPlotting import renderers
+
+    for family in renderers.PLOT_TYPES.values():
+        for name in family.values():
+            assert callable(renderers.load(name).render)
+    for name in renderers.TEMPLATES.values():
+        assert callable(renderers.load(name).build_template)
+
+    # plotting one context only imports the renderer of that context
+    code = (
+        "import sys\n"
+        "import sigProfilerPlotting as sigPlt\n"
+        "sigPlt.plotSBS(sys.argv[1], sys.argv[2], 'test', '96', "
+        "savefig_format='PIL_Image', volume=sys.argv[2])\n"
+        "loaded = [m for m in sys.modules if m.startswith('sigProfilerPlotting.renderers.')]\n"
+        "assert loaded == ['sigProfilerPlotting.renderers.sbs96'], loaded\n"
+    )
+    matrix_path = os.path.join(SPP_SBS, "ordered", "example.SBS96.all")
+    subprocess.run([sys.executable, "-c", code, matrix_path, str(tmp_path)], check=True)
+
+
+# Rendering in column chunks produces the same files as a single pass
+def test_chunked_plot_generation(tmp_path):
+    data = pd.read_csv(
+        os.path.join(SPP_SBS, "ordered", "example.SBS96.all"), sep="\t", index_col=0
+    )
+    data = pd.concat(
+        [data.iloc[:, 0].rename(f"S{i}") * (i + 1) for i in range(5)], axis=1
+    )
+    matrix_path = os.path.join(tmp_path, "example.SBS96.all")
+    data.to_csv(matrix_path, sep="\t")
+    custom_text = [f"text {i}" for i in range(5)]
+    serial_directory = os.path.join(tmp_path, "serial") + os.sep
+    chunked_directory = os.path.join(tmp_path, "chunked") + os.sep
+
+    for output_path, chunk_size in ((serial_directory, None), (chunked_directory, 2)):
+        sigPlt.plotSBS(
+            matrix_path,
+            output_path,
+            "test",
+            "96",
+            custom_text_upper=custom_text,
+            savefig_format="png",
+            chunk_size=chunk_size,
+        )
+    serial_files = sorted(os.listdir(serial_directory))
+    assert serial_files == sorted(os.listdir(chunked_directory))
+    assert len(serial_files) == 5
+    for file_name in serial_files:
+        assert (
+            image_difference(
+                os.path.join(serial_directory, file_name),
+                os.path.join(chunked_directory, file_name),
+            )
+            == 0
+        )
+
+    # the pages of every chunk are written into one PDF
+    sigPlt.plotSBS(matrix_path, chunked_directory, "test", "96", chunk_size=2)
+    with open(os.path.join(chunked_directory, "SBS_96_plots_test.pdf"), "rb") as f:
+        assert f.read().count(b"/Type /Page ") == 5
+
+
+# The first chunk of a text matrix is split off before the other chunks
+def test_split_text_matrix(tmp_path, monkeypatch):
+    from sigProfilerPlotting import sigProfilerPlotting as core
+
+    monkeypatch.setattr(core, "_MAX_CHUNK_FILES", 2)
+    data = pd.DataFrame(
+        [[i * 10 + j for j in range(5)] for i in range(3)],
+        index=pd.Index(["A", "B", "C"], name="MutationType"),
+        columns=[f"S{j}" for j in range(5)],
+    )
+    matrix_path = os.path.join(tmp_path, "example.txt")
+    data.to_csv(matrix_path, sep="\t")
+    chunk_dir = tmp_path / "chunks"
+    chunk_dir.mkdir()
+    bounds = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)]
+    chunks = core._split_text_matrix(matrix_path, [4, 3, 2, 1, 0], bounds, chunk_dir)
+
+    path, start, stop = next(chunks)
+    assert (start, stop) == (0, 1)
+    assert os.listdir(chunk_dir) == ["chunk_0.txt"]
+    assert pd.read_csv(path, sep="\t", index_col=0).equals(data[["S4"]])
+    assert [bound for _, *bound in chunks] == [[1, 2], [2, 3], [3, 4], [4, 5]]
+
+
+# Incremental runs only render new or changed samples
+@pytest.mark.parametrize("savefig_format", ["png", "pdf"])
+def test_incremental_plot_generation(savefig_format, tmp_path, monkeypatch):
+    if savefig_format == "pdf":
+        pypdf = pytest.importorskip("pypdf")
+    from sigProfilerPlotting import sigProfilerPlotting as core
+
+    rendered = []
+    render = core._render
+
+    def recording_render(renderer, matrix_path, *args):
+        rendered.append(list(core.process_input(matrix_path, "96").columns))
+        return render(renderer, matrix_path, *args)
+
+    monkeypatch.setattr(core, "_render", recording_render)
+    data = pd.read_csv(
+        os.path.join(SPP_SBS, "ordered", "example.SBS96.all"), sep="\t", index_col=0
+    )
+    data = pd.concat(
+        [data.iloc[:, 0].rename(f"S{i}") * (i + 1) for i in range(4)], axis=1
+    )
+    output_path = str(tmp_path) + os.sep
+
+    def plot(matrix):
+        rendered.clear()
+        sigPlt.plotSBS(
+            matrix,
+            output_path,
+            "test",
+            "96",
+            savefig_format=savefig_format,
+            incremental=True,
+        )
+        return rendered[0] if rendered else []
+
+    assert plot(data) == ["S0", "S1", "S2", "S3"]
+    assert plot(data) == []
+    data["S2"] += 1
+    data["S4"] = data["S0"]
+    assert plot(data) == ["S2", "S4"]
+    assert os.path.exists(os.path.join(tmp_path, "SBS_96_manifest_test.json"))
+    if savefig_format == "png":
+        assert len([f for f in os.listdir(tmp_path) if f.endswith(".png")]) == 5
+    else:
+        pdf_path = os.path.join(tmp_path, "SBS_96_plots_test.pdf")
+        assert len(pypdf.PdfReader(pdf_path).pages) == 5
+
+
+# The sample keys of a text matrix are hashed in one pass over the file
+def test_sample_keys_text_matrix(tmp_path, monkeypatch):
+    from sigProfilerPlotting import sigProfilerPlotting as core
+
+    data = pd.read_csv(
+        os.path.join(SPP_SBS, "ordered", "example.SBS96.all"), sep="\t", index_col=0
+    )
+    data = pd.concat(
+        [data.iloc[:, 0].rename(f"S{i}") * (i + 1) for i in range(3)], axis=1
+    )
+    matrix_path = str(tmp_path / "test.SBS96.all")
+    samples = list(data.columns)
+
+    def keys():
+        data.to_csv(matrix_path, sep="\t")
+        columns = list(range(len(samples)))
+        return core._sample_keys(matrix_path, "96", samples, columns, {}, {})
+
+    reads = []
+    read_csv = core.pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        reads.append(kwargs.get("chunksize"))
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(core, "_TOTALS_BLOCK_SIZE", 10)
+    monkeypatch.setattr(core.pd, "read_csv", counting_read_csv)
+    before = keys()
+    assert reads == [10]
+    data.iloc[50, 1] += 1
+    after = keys()
+    assert [before[name] == after[name] for name in samples] == [
+        i != 1 for i in range(len(samples))
+    ]
+
+
+# Samples with the same profile share its drawing but keep their own labels
+def test_duplicate_profiles(tmp_path):
+    data = pd.read_csv(
+        os.path.join(SPP_SBS, "ordered", "example.SBS96.all"), sep="\t", index_col=0
+    )
+    profile = data.iloc[:, 0]
+    data = pd.concat(
+        [profile.rename("S0"), (profile * 0).rename("Z0"), profile.rename("S1")]
+        + [(profile * 0).rename("Z1"), profile.rename("S2_with_a_longer_name")],
+        axis=1,
+    )
+    custom_text = ["a", "b", "c", "d", "e"]
+    sigPlt.plotSBS(
+        data,
+        str(tmp_path) + "/",
+        "test",
+        "96",
+        custom_text_upper=custom_text,
+        savefig_format="png",
+    )
+    for i, sample in enumerate(data.columns):
+        single_directory = os.path.join(tmp_path, sample) + os.sep
+        sigPlt.plotSBS(
+            data[[sample]],
+            single_directory,
+            "test",
+            "96",
+            custom_text_upper=custom_text[i : i + 1],
+            savefig_format="png",
+        )
+        file_name = f"SBS_96_plots_{sample}.png"
+        assert (
+            image_difference(
+                os.path.join(tmp_path, file_name),
+                os.path.join(single_directory, file_name),
+            )
+            == 0
+        )
+
+
+# Plotting calls report the duration of their stages and samples
+@pytest.mark.parametrize("savefig_format, n_jobs", [("png", 1), ("pdf", 1), ("pdf", 2)])
+def test_plot_timings(savefig_format, n_jobs, tmp_path, capsys):
+    from sigProfilerPlotting.controllers import cli_controller
+
+    matrix_path = os.path.join(SPP_ID, "ordered", "example.ID83.all")
+    recorded = []
+    timings = sigPlt.PlotTimings(callback=lambda *event: recorded.append(event))
+    sigPlt.plotID(
+        matrix_path,
+        str(tmp_path) + "/",
+        "test",
+        "83",
+        savefig_format=savefig_format,
+        n_jobs=n_jobs,
+        timings=timings,
+    )
+    output_stages = {"png": {"draw", "encode"}, "pdf": {"pdf"}}[savefig_format]
+    assert output_stages | {"process_input", "template", "total"} <= set(timings.stages)
+    samples = pd.read_csv(matrix_path, sep="\t", index_col=0).columns
+    assert sorted(timings.samples) == sorted(samples)
+    assert len(recorded) == len(timings.events)
+    assert "total" in timings.summary()
+
+    cli_controller.CliController().dispatch(
+        ["plotID", matrix_path, str(tmp_path) + "/", "test", "83", "--timings"]
+    )
+    assert "process_input" in capsys.readouterr().out
+
+
+# The stages of a plotting call can be written as a Chrome trace
+def test_plot_trace(tmp_path):
+    import json
+
+    from sigProfilerPlotting.controllers import cli_controller
+
+    matrix_path = os.path.join(SPP_DBS, "ordered", "example.DBS78.all")
+    trace_file = os.path.join(tmp_path, "trace.json")
+    sigPlt.plotDBS(
+        matrix_path, str(tmp_path) + "/", "test", "78", trace_file=trace_file
+    )
+    with open(trace_file) as f:
+        trace_events = json.load(f)["traceEvents"]
+    spans = [event for event in trace_events if event["ph"] == "X"]
+    assert {"process_input", "read_matrix", "template", "pdf", "total"} <= {
+        span["name"] for span in spans
+    }
+    samples = pd.read_csv(matrix_path, sep="\t", index_col=0).columns
+    assert {span.get("args", {}).get("sample") for span in spans} >= set(samples)
+    assert all(span["dur"] >= 0 for span in spans)
+
+    os.remove(trace_file)
+    cli_controller.CliController().dispatch(
+        ["plotDBS", matrix_path, str(tmp_path) + "/", "test", "78"]
+        + ["--trace", trace_file]
+    )
+    assert os.path.getsize(trace_file) > 0
+
+
+# Plotting calls made with PlotTimings(memory=True) report the memory of
+# their stages, also when the samples are plotted by worker processes
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_plot_memory(n_jobs, tmp_path, capsys):
+    import tracemalloc
+
+    from sigProfilerPlotting.controllers import cli_controller
+
+    matrix_path = os.path.join(SPP_SBS, "ordered", "example.SBS96.all")
+    timings = sigPlt.PlotTimings(memory=True)
+    sigPlt.plotSBS(
+        matrix_path,
+        str(tmp_path) + "/",
+        "test",
+        "96",
+        savefig_format="png",
+        n_jobs=n_jobs,
+        timings=timings,
+    )
+    assert not tracemalloc.is_tracing()
+    assert {"process_input", "template", "artists", "encode"} <= set(timings.memory)
+    assert timings.memory["total"]["peak"] > 0
+    groups = timings.memory_groups()
+    assert set(groups) == {"matrix", "parsed", "figures", "output"}
+    assert groups["figures"]["peak"] > 0
+    samples = pd.read_csv(matrix_path, sep="\t", index_col=0).columns
+    assert sorted(timings.sample_memory) == sorted(samples)
+    assert "peak MB" in timings.summary()
+    assert sigPlt.PlotTimings().memory_groups() is None
+
+    cli_controller.CliController().dispatch(
+        ["plotSBS", matrix_path, str(tmp_path) + "/", "test", "96", "--memory"]
+    )
+    assert "retained MB" in capsys.readouterr().out
+
+
+# Every context reports the memory of reading and parsing its matrix
+@pytest.mark.parametrize(
+    "plot_function, matrix_path, plot_type",
+    [
+        (sigPlt.plotSBS, os.path.join(SPP_SBS, "ordered", "example.SBS6.all"), "6"),
+        (sigPlt.plotSBS, os.path.join(SPP_SBS, "ordered", "example.SBS24.all"), "24"),
+        (sigPlt.plotSBS, os.path.join(SPP_SBS, "ordered", "example.SBS96.all"), "96"),
+        (sigPlt.plotSBS, os.path.join(SPP_SBS, "ordered", "example.SBS288.all"), "288"),
+        (
+            sigPlt.plotSBS,
+            os.path.join(SPP_SBS, "ordered", "example.SBS288.all"),
+            "288_Normalized",
+        ),
+        (sigPlt.plotSBS, os.path.join(SPP_SBS, "ordered", "example.SBS384.all"), "384"),
+        (
+            sigPlt.plotSBS,
+            os.path.join(SPP_SBS, "ordered", "example.SBS1536.all"),
+            "1536",
+        ),
+        (
+            sigPlt.plotSBS,
+            os.path.join(SPP_SBS, "ordered", "example.SBS4608.all"),
+            "4608",
+        ),
+        (sigPlt.plotID, os.path.join(SPP_ID, "ordered", "example.ID28.all"), "28"),
+        (sigPlt.plotID, os.path.join(SPP_ID, "ordered", "example.ID83.all"), "83"),
+        (sigPlt.plotID, os.path.join(SPP_ID, "ordered", "example.ID415.all"), "415"),
+        (sigPlt.plotDBS, os.path.join(SPP_DBS, "ordered", "example.DBS78.all"), "78"),
+        (sigPlt.plotDBS, None, "186"),
+        (sigPlt.plotSV, os.path.join(SPP_SV, "ordered", "example.SV32.tsv"), None),
+        (sigPlt.plotCNV, os.path.join(SPP_CNV, "ordered", "example.CNV48.tsv"), None),
+    ],
+)
+def test_matrix_memory(plot_function, matrix_path, plot_type, tmp_path):
+    if matrix_path is None:
+        # there is no example DBS186 matrix, so one is made from the reference
+        reference = os.path.join(sigPlt.__path__[0], "reference_formats", "DBS186.txt")
+        labels = pd.read_csv(reference, sep="\t", header=None).iloc[:, 0]
+        matrix_path = str(tmp_path / "example.DBS186.all")
+        pd.DataFrame(
+            {"S1": range(len(labels))}, index=pd.Index(labels, name="MutationType")
+        ).to_csv(matrix_path, sep="\t")
+    args = (matrix_path, str(tmp_path) + "/", "test")
+    if plot_type is not None:
+        args += (plot_type,)
+    timings = sigPlt.PlotTimings(memory=True)
+    plot_function(*args, timings=timings)
+    groups = timings.memory_groups()
+    assert groups["matrix"]["peak"] > 0
+    assert groups["parsed"]["peak"] > 0
+
+
+# The figures of every context stay within their draw budget
+@pytest.mark.parametrize(
+    "plot_function, matrix_file, plot_type, savefig_format",
+    [
+        (
+            sigPlt.plotSBS,
+            os.path.join(SPP_SBS, "ordered", "example.SBS96.all"),
+            "96",
+            "png",
+        ),
+        (
+            sigPlt.plotSBS,
+            os.path.join(SPP_SBS, "ordered", "example.SBS1536.all"),
+            "1536",
+            "pdf",
+        ),
+        (
+            sigPlt.plotSBS,
+            os.path.join(SPP_SBS, "ordered", "example.SBS384.all"),
+            "384",
+            "pdf",
+        ),
+        (
+            sigPlt.plotID,
+            os.path.join(SPP_ID, "ordered", "example.ID415.all"),
+            "415",
+            "pdf",
+        ),
+        (
+            sigPlt.plotDBS,
+            os.path.join(SPP_DBS, "ordered", "example.DBS78.all"),
+            "78",
+            "pdf",
+        ),
+    ],
+)
+def test_draw_budget(plot_function, matrix_file, plot_type, savefig_format, tmp_path):
+    timings = sigPlt.PlotTimings(budget=sigPlt.DRAW_BUDGETS, on_budget="error")
+    plot_function(
+        matrix_file,
+        str(tmp_path) + "/",
+        "test",
+        plot_type,
+        savefig_format=savefig_format,
+        timings=timings,
+    )
+    samples = pd.read_csv(matrix_file, sep="\t", index_col=0).columns
+    assert len(timings.figures) == len(samples)
+    (context,) = timings.complexity_by_context()
+    assert context in sigPlt.DRAW_BUDGETS
+    assert all(figure["artists"] > 0 for figure in timings.figures)
+    assert not timings.over_budget
+
+
+# Figures over budget are warned about, also when drawn by worker processes,
+# or raised as errors
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_draw_budget_exceeded(n_jobs, tmp_path):
+    matrix_path = os.path.join(SPP_ID, "ordered", "example.ID83.all")
+    budget = {"ID_83": {"patches": 10}}
+    timings = sigPlt.PlotTimings(budget=budget)
+    with pytest.warns(UserWarning, match="over its draw budget: patches"):
+        sigPlt.plotID(
+            matrix_path,
+            str(tmp_path) + "/",
+            "test",
+            "83",
+            n_jobs=n_jobs,
+            timings=timings,
+        )
+    samples = pd.read_csv(matrix_path, sep="\t", index_col=0).columns
+    assert len(timings.over_budget) == len(samples)
+    assert "over budget" in timings.summary()
+
+    with pytest.raises(RuntimeError):
+        sigPlt.plotID(
+            matrix_path,
+            str(tmp_path) + "/",
+            "test",
+            "83",
+            n_jobs=n_jobs,
+            timings=sigPlt.PlotTimings(budget=budget, on_budget="error"),
+        )
+
+
+# The heatmap cells are grouped into one path per color level, at the level
+# the cell had when it was colored as its own rectangle
+def test_heatmap_levels():
+    from sigProfilerPlotting.renderers import sbs1536
+
+    counts = [0, 3, 7, 12, 20, 33, 46, 50, float("nan")]
+    total_count_sample = sum(counts[:-1])
+    ratio = max(counts[:-1]) * 1.1 / total_count_sample
+    expected = []
+    for count in counts:
+        try:
+            scaled = round(count / total_count_sample / ratio * 100)
+            expected.append(int(int(20 * scaled / 20) / 20))
+        except ValueError:
+            expected.append(0)
+    levels = sbs1536.heat_levels(counts, total_count_sample, ratio)
+    assert levels.tolist() == expected
+
+    cells = sbs1536.heatmap_cells(1)[: len(counts)]
+    paths = sbs1536.heatmap_paths(cells, levels)
+    assert len(paths) == len(sbs1536.HEAT_COLORS)
+    for level, path in enumerate(paths):
+        corners = path.vertices[::5].tolist()
+        assert corners == cells[levels == level].tolist()
+
+
+# A BarCollection draws the same pixels as the rectangles of panel.bar, and
+# a legend at loc="best" avoids its bars as it avoids the rectangles
+def test_bar_collection():
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    from sigProfilerPlotting.sigProfilerPlotting import BarCollection
+
+    x = np.arange(24) + 0.4
+    colors = [[3 / 256, 189 / 256, 239 / 256], [228 / 256, 41 / 256, 38 / 256]] * 12
+    heights = np.random.default_rng(0).integers(0, 50, len(x))
+    heights[-2:] = 60
+
+    def draw(collection):
+        fig, panel = plt.subplots(figsize=(8, 3), dpi=50)
+        if collection:
+            bars = BarCollection(panel, x, 0.4, colors, legend_boxes=True)
+            bars.set_heights(heights)
+            handles = bars.legend_handles("first", "second")
+            # one path of bars for each color
+            assert len(bars.collection.get_paths()) == 2
+        else:
+            panel.bar(x, heights, width=0.4, color=colors, align="center", zorder=1000)
+            handles = panel.patches[:2]
+            handles[0].set_label("first")
+            handles[1].set_label("second")
+        panel.legend(handles=handles)
+        panel.set_xlim([0, 24])
+        panel.set_ylim([0, 64])
+        fig.canvas.draw()
+        pixels = np.array(fig.canvas.buffer_rgba())
+        plt.close(fig)
+        return pixels
+
+    assert (draw(False) == draw(True)).all()